@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 from backend.db.session import SessionLocal
 from backend.db.models.news import NewsArticle
 from backend.db.models.stock import Stock, StockPrice
-from backend.db.models.market_data import StockCurrentPrice, InvestorTrading
+from backend.db.models.market_data import StockMarketSnapshot, InvestorTrading
 from backend.db.models.prediction import Prediction
 from backend.db.models.user import User
 from backend.scheduler.crawler_scheduler import get_crawler_scheduler
@@ -342,6 +342,10 @@ async def check_data_availability(db: Session = Depends(get_db)):
         latest_price = db.query(StockPrice).order_by(StockPrice.date.desc()).first()
         latest_prediction = db.query(Prediction).order_by(Prediction.created_at.desc()).first()
         latest_investor = db.query(InvestorTrading).order_by(InvestorTrading.date.desc()).first()
+        snapshot_count, latest_snapshot_at = db.query(
+            func.count(StockMarketSnapshot.stock_code),
+            func.max(StockMarketSnapshot.snapshot_at),
+        ).one()
 
         # 최신 주가 데이터 샘플 (종목별 최신 데이터)
         subq = db.query(
@@ -378,6 +382,10 @@ async def check_data_availability(db: Session = Depends(get_db)):
                 "count": investor_count,
                 "latest_date": latest_investor.date.isoformat() if latest_investor else None
             },
+            "market_snapshot": {
+                "stocks": snapshot_count,
+                "latest_snapshot_at": latest_snapshot_at.isoformat() if latest_snapshot_at else None
+            },
             "sample_latest_prices": sample_prices,
             "total_latest_stocks": db.query(func.count(func.distinct(StockPrice.stock_code))).scalar()
         }
@@ -18,6 +18,7 @@ from backend.db.models.news import NewsArticle
 from backend.db.models.stock import StockPrice
 from backend.db.models.match import NewsStockMatch
 from backend.scheduler.crawler_scheduler import get_crawler_scheduler
+from backend.crawlers.kis_client import get_rate_limiter_stats, get_request_stats
 from backend.llm.vector_search import get_vector_search
 
 
@@ -209,6 +210,10 @@ async def get_stats():
                 "embeddings": embeddings_count,
             },
             "scheduler": scheduler_stats,
+            "kis": {
+                "rate_limiter": get_rate_limiter_stats(),  # 이 프로세스(API 서버)의 대기 시간
+                "requests": get_request_stats(),  # 현재가/호가 합치기·캐시로 아낀 호출 수
+            },
         }
 
     except Exception as e:
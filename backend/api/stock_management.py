@@ -14,6 +14,7 @@ import asyncio
 from backend.db.session import get_db, SessionLocal
 from backend.db.models.stock import Stock
 from backend.services.stock_analysis_service import trigger_initial_analysis
+from backend.utils.stock_mapping import get_stock_mapper
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ async def create_stock(stock: StockCreate, db: Session = Depends(get_db)):
     db.add(new_stock)
     db.commit()
     db.refresh(new_stock)
+    get_stock_mapper().reload()  # 기업명 매칭 오토마톤 재구성
 
     logger.info(f"✅ Stock saved: {stock.code}")
 
@@ -205,6 +207,7 @@ def update_stock(
 
     db.commit()
     db.refresh(stock)
+    get_stock_mapper().reload()  # 기업명 매칭 오토마톤 재구성
 
     return stock
 
@@ -227,5 +230,6 @@ def delete_stock(stock_code: str, db: Session = Depends(get_db)):
     # 소프트 삭제 (비활성화)
     stock.is_active = False
     db.commit()
+    get_stock_mapper().reload()  # 기업명 매칭 오토마톤 재구성
 
     return None
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     # 애플리케이션
     APP_NAME: str = "Azak"
     DEBUG: bool = False
+    SCHEDULER_WARM_START: bool = False  # 스케줄러 서버: 모델/인덱스를 백그라운드에서 로드 (헬스체크 즉시 응답)
 
     # PostgreSQL
     POSTGRES_HOST: str = "localhost"
@@ -27,11 +28,66 @@ class Settings(BaseSettings):
 
     # FAISS (Vector Search)
     FAISS_INDEX_PATH: str = "data/faiss/news_embeddings.index"
-    FAISS_METADATA_PATH: str = "data/faiss/news_metadata.pkl"
+    FAISS_METADATA_PATH: str = "data/faiss/news_metadata.pkl"  # 기존 pickle (컬럼형 변환 원본)
+    FAISS_METADATA_DIR: str = "data/faiss/news_metadata"  # 컬럼형 메타데이터 (memmap)
+    FAISS_WAL_PATH: str = "data/faiss/news_embeddings.wal"  # delta 세그먼트 (append-only)
+    FAISS_COMPACT_THRESHOLD: int = 2000  # delta 벡터가 이 수를 넘으면 임베딩 직후 컴팩션
+    FAISS_PARTITIONED_SEARCH: bool = False  # 종목별 파티션 인덱스로 종목 필터 검색 라우팅
+    FAISS_PARTITION_DIR: str = "data/faiss/partitions"  # 종목별 파티션 (rebalance_faiss_partitions.py로 생성)
+    FAISS_IVF_MIN_VECTORS: int = 1000  # 이 수 이상이면 Flat → IVF 승격
+    FAISS_IVF_NLIST_DRIFT: float = 2.0  # nlist가 sqrt(N)의 1/2배 미만 또는 2배 초과면 재학습
+    FAISS_IVF_RECALL_TARGET: float = 0.95  # nprobe 튜닝 목표 recall@10
+    FAISS_IVF_TUNE_QUERIES: int = 200  # nprobe 튜닝용 held-out 쿼리 수
+    FAISS_INDEX_TYPE: str = "ivf_flat"  # IVF 승격/재학습 시 인덱스 타입 (ivf_flat | ivf_sq8 | ivf_pq)
+    FAISS_PQ_M: int = 64  # IVF-PQ 서브벡터 수 (768차원 → 벡터당 64바이트)
+    FAISS_RERANK_FACTOR: int = 4  # 압축 인덱스 재정렬 후보 배수 (top_k x 배수)
+    FAISS_VECTORS_PATH: str = "data/faiss/news_vectors.f32"  # 원본 float32 벡터 (압축 인덱스 재정렬용 memmap)
+    FAISS_MMAP_INDEX: bool = False  # 메인 인덱스를 memory-map으로 로드 (시작 시 전체 읽기 생략, 읽기 전용)
+    FAISS_SYNC_INTERVAL_SECONDS: float = 1.0  # 검색 시 다른 프로세스의 인덱스 변경 확인 간격 (전체 재로드는 백그라운드)
+
+    # 유사 뉴스 주가 변동률 캐시 (뉴스-주가 매칭 작업 후 무효화)
+    PRICE_CHANGE_CACHE_SIZE: int = 4096
+    PRICE_CHANGE_CACHE_TTL_SECONDS: int = 600  # 다른 프로세스의 매칭 결과 반영 주기
+
+    # 제목 중복 검사 MinHash/LSH 인덱스 (NewsDuplicator)
+    DEDUP_MINHASH_PERMUTATIONS: int = 128  # MinHash 시그니처 길이
+    DEDUP_LSH_BANDS: int = 32  # band 수 (band당 4행, SequenceMatcher 0.8 이상 쌍 후보 recall 약 100%)
+    DEDUP_SHINGLE_SIZE: int = 2  # 문자 n-gram 길이 (한글 제목 기준)
+    DEDUP_INDEX_TTL_SECONDS: int = 600  # 인덱스 자동 재구성 주기 (다른 프로세스 저장분 반영)
+
+    # 뉴스 크롤링 파이프라인
+    CRAWL_MAX_CONCURRENT_JOBS: int = 8  # 동시에 실행할 수집 작업 수 (언론사/종목별 검색)
+    CRAWL_HOST_CONCURRENCY: int = 2  # 크롤러(호스트)별 동시 HTTP 요청 수 (요청 간격은 rate_limit_seconds 유지)
+    CRAWL_HTTP_CACHE_ENABLED: bool = True  # ETag/Last-Modified 조건부 요청 (304면 캐시 본문 재사용)
+    CRAWL_HTTP_CACHE_MAX_ENTRIES: int = 256  # 조건부 요청 캐시 URL 수 (목록 페이지 위주)
+    CRAWL_SEEN_URLS_PATH: str = "data/crawler/seen_urls.txt"  # 저장 완료 기사 URL (재시작 후에도 재수집 생략)
+    CRAWL_SEEN_URLS_MAX: int = 100000  # 초과 시 최근 절반만 유지
+    CRAWL_HTML_PARSER: str = "streaming"  # 목록 페이지 추출 백엔드 (streaming | selectolax)
+
+    # 종목 매핑 (StockMapper)
+    STOCK_MATCH_RANK_BY_FREQUENCY: bool = False  # 텍스트 내 여러 종목 발견 시 True: 최다 등장, False: 최초 등장
 
     # Embedding Model (Local)
     EMBEDDING_MODEL_NAME: str = "BM-K/KoSimCSE-roberta"
     EMBEDDING_DIM: int = 768
+    EMBEDDING_BACKEND: str = "torch"  # 추론 백엔드 (torch | onnx | onnx_int8)
+    EMBEDDING_ONNX_DIR: str = "data/onnx"  # ONNX export/양자화 모델 캐시
+    EMBEDDING_ONNX_THREADS: int = 0  # ONNX Runtime intra-op 스레드 수 (0=자동, OMP_NUM_THREADS와 별개)
+    EMBEDDING_BATCH_SIZE: int = 16  # embed_batch 마이크로 배치 크기 (forward 1회당 문서 수)
+    EMBEDDING_MAX_LENGTH: int = 512  # 모델 최대 토큰 수
+    EMBEDDING_TEXT_POLICY: str = "full"  # 입력 절단 정책 (full | lead_sentences | token_budget | head_tail), 변경 시 인덱스 재임베딩 권장
+    EMBEDDING_LEAD_SENTENCES: int = 5  # lead_sentences: 제목 + 본문 앞 N문장
+    EMBEDDING_TOKEN_BUDGET: int = 256  # token_budget / head_tail: 특수 토큰 포함 토큰 예산
+    EMBEDDING_TAIL_TOKENS: int = 64  # head_tail: 예산 중 본문 끝부분에 배정할 토큰 수
+    EMBEDDING_COALESCE_MS: float = 5.0  # 추론 워커 요청 병합 대기 시간
+    EMBEDDING_COALESCE_MAX_BATCH: int = 64  # 추론 워커 병합 배치 최대 텍스트 수
+
+    # Embedding Cache (텍스트 해시 기반, 메모리 LRU + 디스크 memmap)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DIR: str = "data/embedding_cache"
+    EMBEDDING_CACHE_MEMORY_SIZE: int = 2048  # 메모리 LRU 항목 수 (768차원 기준 약 6MB)
+    EMBEDDING_CACHE_DISK_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_DISK_ROWS: int = 200000  # 디스크 tier 최대 레코드 수 (약 600MB)
 
     # OpenAI (Backup - LLM only)
     OPENAI_API_KEY: str
@@ -61,6 +117,11 @@ class Settings(BaseSettings):
 
     # DART (금융감독원 공시)
     DART_API_KEY: str = ""  # 선택사항
+    DART_CURSOR_PATH: str = "data/crawler/dart_cursor.json"  # 마지막으로 확인한 접수번호 (증분 조회 기준)
+    DART_INITIAL_LOOKBACK_DAYS: int = 3  # 커서가 없을 때 조회할 기간 (일)
+    DART_MAX_CONCURRENCY: int = 4  # 동시 API 요청 수 (페이지/기업 상세 병렬 조회)
+    DART_RATE_LIMIT_SECONDS: float = 0.1  # 요청 시작 간 최소 간격 (분당 600회 이하, DART 과다 요청 차단 방지)
+    DART_BACKFILL_WINDOW_DAYS: int = 7  # 백필 시 한 번에 조회할 기간 (전체 시장 조회는 최대 3개월)
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -89,6 +150,13 @@ class Settings(BaseSettings):
     KIS_BASE_URL: str = "https://openapi.koreainvestment.com:9443"  # 실전투자
     KIS_WEBSOCKET_URL: str = "wss://openapi.koreainvestment.com:9443"
     KIS_MOCK_MODE: bool = True  # True: 모의투자, False: 실전투자
+    KIS_RATE_LIMIT_BURST: int = 1  # 최대 적립 토큰 수 (1이면 요청을 균등 간격으로 보냄, 키우면 1초 구간에 한도 초과 가능)
+    KIS_RATE_LIMIT_STATE_PATH: str = "data/kis/rate_limit.state"  # 호스트 내 프로세스(API/스케줄러/스크립트)가 공유하는 rate limit 상태 (빈 값이면 프로세스별)
+    KIS_RESPONSE_CACHE_ENABLED: bool = True  # 현재가/호가 짧은 TTL 캐시 (시장 단계별 TTL, 동시 요청 합치기는 항상 적용)
+    KIS_RESPONSE_CACHE_MAX_ENTRIES: int = 4096
+    KIS_COLLECTOR_WORKERS: int = 8  # 시장 데이터 수집 워커 수 (호출 속도는 RateLimiter가 조절, 응답 지연을 메울 만큼만)
+    KIS_COLLECTOR_MAX_ATTEMPTS: int = 3  # 종목당 최대 시도 횟수 (실패 시 큐 뒤에 다시 넣음)
+    KIS_COLLECTOR_RETRY_BASE_SECONDS: float = 1.0  # 재시도 대기 기준 (지수 백오프 × 0.5~1.5 jitter)
 
     # 프리뷰 (블로그 캡처용)
     PREVIEW_TOKEN: str = ""
@@ -5,12 +5,16 @@
 """
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 import httpx
 
+from backend.config import settings
+from backend.crawlers.http_cache import SeenUrlStore, get_http_cache, get_seen_url_store
+
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +66,15 @@ class BaseNewsCrawler(ABC):
         timeout: int = 10,
         max_retries: int = 3,
         rate_limit_seconds: float = 1.0,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Args:
             source_name: 언론사 이름
             timeout: HTTP 요청 타임아웃 (초)
             max_retries: 최대 재시도 횟수
-            rate_limit_seconds: Rate limiting 간격 (초)
+            rate_limit_seconds: Rate limiting 간격 (초, 요청 시작 간 최소 간격)
+            max_concurrency: 동시 요청 수 (None이면 settings.CRAWL_HOST_CONCURRENCY)
         """
         self.source_name = source_name
         self.timeout = timeout
@@ -77,6 +83,15 @@ class BaseNewsCrawler(ABC):
         self.last_request_time: Optional[float] = None
         self._client: Optional[httpx.AsyncClient] = None
 
+        # 크롤러 인스턴스 = 호스트 하나 → 동시 요청(종목별 검색 등)에도 호스트별 제한 유지
+        self.max_concurrency = max(1, max_concurrency or settings.CRAWL_HOST_CONCURRENCY)
+        self._rate_lock = asyncio.Lock()
+        self._host_slots = asyncio.Semaphore(self.max_concurrency)
+
+        # 조건부 요청 캐시 + 크롤러별 HTTP 통계 (크롤러 인스턴스 간 공유)
+        self.http_cache = get_http_cache()
+        self.use_http_cache = settings.CRAWL_HTTP_CACHE_ENABLED
+
     async def _get_client(self) -> httpx.AsyncClient:
         """
         비동기 HTTP 클라이언트를 반환합니다.
@@ -102,17 +117,20 @@ class BaseNewsCrawler(ABC):
         return self._client
 
     async def _apply_rate_limit(self) -> None:
-        """Rate limiting을 적용합니다."""
-        if self.last_request_time is not None:
-            import time
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_seconds:
-                sleep_time = self.rate_limit_seconds - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}초")
-                await asyncio.sleep(sleep_time)
-
-        import time
-        self.last_request_time = time.time()
+        """
+        Rate limiting을 적용합니다.
+
+        Lock 안에서 대기하므로 동시 호출자도 rate_limit_seconds 간격으로 차례대로 통과합니다.
+        """
+        async with self._rate_lock:
+            if self.last_request_time is not None:
+                elapsed = time.time() - self.last_request_time
+                if elapsed < self.rate_limit_seconds:
+                    sleep_time = self.rate_limit_seconds - elapsed
+                    logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}초")
+                    await asyncio.sleep(sleep_time)
+
+            self.last_request_time = time.time()
 
     async def fetch_html(self, url: str) -> Optional[str]:
         """
@@ -124,39 +142,42 @@ class BaseNewsCrawler(ABC):
         Returns:
             HTML 문자열 또는 None (실패 시)
         """
+        async with self._host_slots:
+            return await self._fetch_html(url)
+
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        fetch_html 본체 (호스트 동시 요청 슬롯 안에서 실행)
+
+        캐시된 검증자가 있으면 조건부 요청을 보내고, 304 응답이면 캐시 본문을 반환합니다.
+        """
         await self._apply_rate_limit()
 
         try:
             logger.info(f"Fetching: {url}")
             client = await self._get_client()
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # 한글 인코딩 처리
-            # 1. Content-Type 헤더에서 명시된 인코딩 확인
-            if response.encoding and response.encoding != 'ISO-8859-1':
-                return response.text
+            cached = self.http_cache.get(url) if self.use_http_cache else None
+            headers = self.http_cache.conditional_headers(url) if cached else None
+            response = await client.get(url, headers=headers)
 
-            # 2. HTML 메타 태그에서 charset 확인
-            content = response.content
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Not modified: {url}")
+                self._record_fetch(not_modified=1, bytes_saved=cached.size)
+                return cached.body
 
-            # UTF-8로 시도
-            try:
-                return content.decode('utf-8')
-            except UnicodeDecodeError:
-                pass
-
-            # charset 감지
-            try:
-                detected_encoding = response.charset_encoding or 'utf-8'
-                return content.decode(detected_encoding)
-            except (UnicodeDecodeError, LookupError):
-                # 마지막 시도: EUC-KR (한국어 사이트용)
-                try:
-                    return content.decode('euc-kr')
-                except UnicodeDecodeError:
-                    logger.warning(f"인코딩 변환 실패: {url}, UTF-8로 무시하고 진행")
-                    return content.decode('utf-8', errors='ignore')
+            response.raise_for_status()
+            self._record_fetch(bytes_downloaded=len(response.content))
+
+            html = self._decode_response(response, url)
+            if self.use_http_cache:
+                self.http_cache.store(
+                    url,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    body=html,
+                    size=len(response.content),
+                )
+            return html
 
         except httpx.TimeoutException:
             logger.error(f"Timeout error for {url}")
@@ -170,6 +191,69 @@ class BaseNewsCrawler(ABC):
             logger.error(f"Request error for {url}: {e}")
             return None
 
+    def _decode_response(self, response: httpx.Response, url: str) -> str:
+        """응답 본문을 문자열로 디코딩 (한글 인코딩 처리)"""
+        # 1. Content-Type 헤더에서 명시된 인코딩 확인
+        if response.encoding and response.encoding != 'ISO-8859-1':
+            return response.text
+
+        # 2. HTML 메타 태그에서 charset 확인
+        content = response.content
+
+        # UTF-8로 시도
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+
+        # charset 감지
+        try:
+            detected_encoding = response.charset_encoding or 'utf-8'
+            return content.decode(detected_encoding)
+        except (UnicodeDecodeError, LookupError):
+            # 마지막 시도: EUC-KR (한국어 사이트용)
+            try:
+                return content.decode('euc-kr')
+            except UnicodeDecodeError:
+                logger.warning(f"인코딩 변환 실패: {url}, UTF-8로 무시하고 진행")
+                return content.decode('utf-8', errors='ignore')
+
+    @property
+    def seen_urls(self) -> SeenUrlStore:
+        """저장 완료 기사 URL 집합 (첫 사용 시 파일 로드)"""
+        return get_seen_url_store()
+
+    def drop_seen(self, news_list: List[NewsArticleData]) -> List[NewsArticleData]:
+        """
+        이미 저장된 기사(URL 기준)를 목록에서 제외합니다.
+
+        Args:
+            news_list: 목록 페이지에서 파싱한 뉴스 리스트
+
+        Returns:
+            저장되지 않은 뉴스 리스트
+        """
+        unseen = [news for news in news_list if not news.url or news.url not in self.seen_urls]
+        if len(unseen) < len(news_list):
+            self._record_fetch(fetches_avoided=len(news_list) - len(unseen))
+            logger.info(f"{self.source_name}: 저장 완료 기사 {len(news_list) - len(unseen)}건 제외")
+        return unseen
+
+    def _record_fetch(self, **counts: int):
+        """HTTP 통계 누적 (요청 1회당 requests 증가)"""
+        if "fetches_avoided" not in counts:
+            counts["requests"] = 1
+        self.http_cache.record(self.source_name, **counts)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        크롤러 HTTP 통계 (같은 source_name의 이전 인스턴스 포함 누적)
+
+        Returns:
+            requests, not_modified, bytes_downloaded, bytes_saved, fetches_avoided
+        """
+        return self.http_cache.get_stats(self.source_name)
+
     @abstractmethod
     async def fetch_news(self, limit: int = 10) -> List[NewsArticleData]:
         """
@@ -0,0 +1,174 @@
+"""
+KIS 수집기 공용 작업 큐 실행기
+
+종목 목록을 큐에 넣고 N개의 워커가 하나씩 꺼내 처리합니다.
+배치 단위 gather + 고정 sleep 대신 KIS RateLimiter가 유일한 속도 조절 장치가 되므로,
+느린 종목 하나가 배치 전체를 붙잡지 않고 남는 호출 한도도 낭비하지 않습니다.
+실패한 종목은 지수 백오프 + jitter 후 큐 뒤에 다시 넣어 재시도합니다.
+"""
+import time
+import random
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepResult:
+    """전체 종목 1회 순회(sweep) 결과"""
+
+    name: str
+    total: int
+    success: int = 0
+    skipped: int = 0
+    failed: int = 0
+    retried: int = 0
+    elapsed_seconds: float = 0.0
+    finished_at: Optional[str] = None
+    results: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """통계용 딕셔너리 (개별 결과 제외)"""
+        return {
+            "total": self.total,
+            "success": self.success,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "retried": self.retried,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "items_per_second": round(self.total / self.elapsed_seconds, 2) if self.elapsed_seconds else None,
+            "finished_at": self.finished_at,
+        }
+
+
+class CollectorExecutor:
+    """
+    N개 워커가 공유 큐에서 종목을 꺼내 처리하는 실행기
+
+    작업 함수는 {"status": "success" | "skipped" | "failed", ...} 딕셔너리를 반환합니다.
+    "failed"를 반환하거나 예외가 발생하면 max_attempts까지 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            workers: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
+            max_attempts: 종목당 최대 시도 횟수 (None이면 settings.KIS_COLLECTOR_MAX_ATTEMPTS)
+            retry_base_seconds: 재시도 백오프 기준 시간 (None이면 settings.KIS_COLLECTOR_RETRY_BASE_SECONDS)
+        """
+        self.workers = max(1, workers or settings.KIS_COLLECTOR_WORKERS)
+        self.max_attempts = max(1, max_attempts or settings.KIS_COLLECTOR_MAX_ATTEMPTS)
+        self.retry_base_seconds = (
+            settings.KIS_COLLECTOR_RETRY_BASE_SECONDS if retry_base_seconds is None else retry_base_seconds
+        )
+
+    def _retry_delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (지수 백오프, 0.5~1.5배 jitter)"""
+        return self.retry_base_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    async def run(
+        self,
+        name: str,
+        items: Sequence[str],
+        task: Callable[[str], Awaitable[Dict[str, Any]]],
+    ) -> SweepResult:
+        """
+        전체 항목을 한 번 순회
+
+        Args:
+            name: 작업 이름 (로그/통계 키)
+            items: 처리할 항목 (종목 코드 등)
+            task: 항목 하나를 처리하는 코루틴 함수
+
+        Returns:
+            SweepResult (소요 시간, 성공/스킵/실패/재시도 건수)
+        """
+        sweep = SweepResult(name=name, total=len(items))
+        started = time.monotonic()
+
+        if items:
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+            remaining = len(items)
+            done = asyncio.Event()
+            retry_handles: List[asyncio.TimerHandle] = []
+
+            for item in items:
+                queue.put_nowait((item, 1))
+
+            def finish(result: Dict[str, Any]) -> None:
+                nonlocal remaining
+                sweep.results.append(result)
+                remaining -= 1
+                if remaining == 0:
+                    done.set()
+
+            async def worker() -> None:
+                while True:
+                    item, attempt = await queue.get()
+                    try:
+                        result = await task(item)
+                    except Exception as e:
+                        result = {"item": item, "status": "failed", "error": str(e)}
+
+                    status = result.get("status")
+                    if status == "failed" and attempt < self.max_attempts:
+                        delay = self._retry_delay(attempt)
+                        sweep.retried += 1
+                        logger.debug(f"🔁 {name} {item}: {attempt}회 실패, {delay:.2f}초 후 재시도")
+                        # 워커는 기다리지 않고 다음 종목으로 넘어감
+                        retry_handles.append(loop.call_later(delay, queue.put_nowait, (item, attempt + 1)))
+                        continue
+
+                    if status == "success":
+                        sweep.success += 1
+                    elif status == "skipped":
+                        sweep.skipped += 1
+                    else:
+                        sweep.failed += 1
+                    finish(result)
+
+            tasks = [asyncio.create_task(worker()) for _ in range(min(self.workers, len(items)))]
+            try:
+                await done.wait()
+            finally:
+                for handle in retry_handles:
+                    handle.cancel()
+                for worker_task in tasks:
+                    worker_task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        sweep.elapsed_seconds = time.monotonic() - started
+        sweep.finished_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        _last_sweeps[name] = sweep.to_dict()
+
+        logger.info(
+            f"⏱️  {name} 전체 순회: {sweep.total}건 {sweep.elapsed_seconds:.1f}초 "
+            f"(성공 {sweep.success}, 스킵 {sweep.skipped}, 실패 {sweep.failed}, 재시도 {sweep.retried})"
+        )
+        return sweep
+
+
+def get_sweep_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    작업별 마지막 전체 순회 통계
+
+    Returns:
+        {작업 이름: SweepResult.to_dict()}
+    """
+    return dict(_last_sweeps)
+
+
+# 작업별 마지막 순회 결과 (이 프로세스 기준)
+_last_sweeps: Dict[str, Dict[str, Any]] = {}
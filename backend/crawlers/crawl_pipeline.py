@@ -0,0 +1,112 @@
+"""
+동시 크롤링 파이프라인
+
+여러 크롤링 작업(언론사별 수집, 종목별 검색)을 asyncio.gather로 동시에 실행하고,
+결과를 단일 저장 단계(NewsSaver)로 전달합니다.
+
+- 수집 단계: 작업별 코루틴 (동시 실행 수는 max_concurrency로 제한)
+  호스트별 동시 요청 수/요청 간격은 각 크롤러(BaseNewsCrawler)가 보장
+- 저장 단계: asyncio.Queue를 소비하는 태스크 1개 (DB 세션 공유, 순차 저장)
+  수집과 저장이 겹쳐 실행되므로 먼저 끝난 소스부터 저장됨
+- 작업 하나의 실패는 다른 작업에 영향을 주지 않음
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.config import settings
+from backend.crawlers.base_crawler import NewsArticleData
+
+
+logger = logging.getLogger(__name__)
+
+
+# (작업 이름, 뉴스 리스트를 반환하는 코루틴 함수)
+CrawlJob = Tuple[str, Callable[[], Awaitable[List[NewsArticleData]]]]
+
+
+class CrawlPipelineResult:
+    """파이프라인 실행 결과"""
+
+    def __init__(self):
+        self.saved = 0
+        self.skipped = 0
+        self.failed_jobs: List[str] = []
+        self.per_job: Dict[str, Tuple[int, int]] = {}  # 작업 이름 → (저장, 스킵)
+        self.elapsed_seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<CrawlPipelineResult(saved={self.saved}, skipped={self.skipped}, "
+            f"failed={len(self.failed_jobs)}, elapsed={self.elapsed_seconds:.1f}s)>"
+        )
+
+
+async def run_crawl_pipeline(
+    jobs: List[CrawlJob],
+    saver,
+    max_concurrency: Optional[int] = None,
+) -> CrawlPipelineResult:
+    """
+    크롤링 작업을 동시에 실행하고 결과를 단일 저장 단계로 저장합니다.
+
+    Args:
+        jobs: (작업 이름, 수집 코루틴 함수) 리스트
+        saver: save_news_batch(news_list)를 제공하는 저장기 (NewsSaver)
+        max_concurrency: 동시에 실행할 수집 작업 수 (None이면 settings.CRAWL_MAX_CONCURRENT_JOBS)
+
+    Returns:
+        CrawlPipelineResult
+    """
+    result = CrawlPipelineResult()
+    start = time.perf_counter()
+
+    queue: asyncio.Queue = asyncio.Queue()
+    job_slots = asyncio.Semaphore(max(1, max_concurrency or settings.CRAWL_MAX_CONCURRENT_JOBS))
+
+    async def collect(name: str, fetch: Callable[[], Awaitable[List[NewsArticleData]]]):
+        async with job_slots:
+            try:
+                news_list = await fetch()
+            except Exception as e:
+                result.failed_jobs.append(name)
+                logger.error(f"   ❌ {name} 크롤링 실패: {e}")
+                return
+
+        if news_list:
+            await queue.put((name, news_list))
+        else:
+            logger.debug(f"   ℹ️  {name}: 뉴스 없음")
+
+    async def save():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            name, news_list = item
+            try:
+                saved, skipped = await saver.save_news_batch(news_list)
+            except Exception as e:
+                result.failed_jobs.append(name)
+                logger.error(f"   ❌ {name} 저장 실패: {e}")
+                continue
+
+            result.saved += saved
+            result.skipped += skipped
+            result.per_job[name] = (saved, skipped)
+            if saved > 0:
+                logger.info(f"   ✅ {name}: {saved}건 저장, {skipped}건 스킵")
+            else:
+                logger.debug(f"   ⏭️  {name}: 전부 중복 ({skipped}건)")
+
+    saver_task = asyncio.create_task(save())
+    try:
+        await asyncio.gather(*(collect(name, fetch) for name, fetch in jobs))
+    finally:
+        await queue.put(None)
+        await saver_task
+
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
@@ -3,9 +3,20 @@ DART (금융감독원 전자공시시스템) 크롤러
 
 전자공시시스템의 공시 정보를 수집합니다.
 DART Open API 사용: https://opendart.fss.or.kr/
+
+- 증분 조회: 마지막으로 확인한 접수번호(rcept_no, YYYYMMDD + 일련번호)를
+  DartCursor에 저장하고, 다음 조회에서는 그보다 새로운 공시만 가져옵니다.
+  종목별로 나눠 묻지 않고 전체 시장 목록 한 번으로 대상 종목의 공시를 걸러냅니다.
+- 백필: 과거 기간을 구간으로 나눠 페이지를 병렬 조회합니다.
+- 모든 요청은 동시 요청 수(DART_MAX_CONCURRENCY)와 요청 간격(DART_RATE_LIMIT_SECONDS)을 지킵니다.
 """
+import asyncio
+import json
 import logging
-from typing import List, Optional, Dict
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 import httpx
 
@@ -16,10 +27,96 @@ from backend.config import settings
 logger = logging.getLogger(__name__)
 
 
+# 프로세스 단위 캐시 (크롤러 인스턴스는 조회 주기마다 새로 만들어짐)
+_company_cache: Dict[str, Dict] = {}  # corp_code → company.json 응답
+_corp_codes_by_stock: Dict[str, str] = {}  # stock_code → corp_code (공시 목록에서 학습)
+
+
+class DartCursor:
+    """
+    공시 증분 조회 커서 (마지막으로 확인한 접수번호, JSON 파일 영속)
+
+    접수번호는 접수일(YYYYMMDD) + 일련번호라 문자열 비교로 선후를 판단합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 저장 파일 경로 (None이면 settings.DART_CURSOR_PATH, 빈 문자열이면 메모리 전용)
+        """
+        self.path = settings.DART_CURSOR_PATH if path is None else path
+        self._lock = threading.Lock()
+        self.rcept_no: Optional[str] = None
+
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.rcept_no = json.load(f).get("rcept_no") or None
+            except (OSError, ValueError) as e:
+                logger.warning(f"DART 커서 로드 실패 (처음부터 조회): {e}")
+
+    def advance(self, rcept_no: Optional[str]) -> bool:
+        """
+        커서를 앞으로 이동합니다 (현재보다 새 접수번호일 때만).
+
+        Returns:
+            이동 여부
+        """
+        with self._lock:
+            if not rcept_no or (self.rcept_no and rcept_no <= self.rcept_no):
+                return False
+            self.rcept_no = rcept_no
+
+            if self.path:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"rcept_no": rcept_no, "updated_at": datetime.now().isoformat()}, f)
+                os.replace(tmp_path, self.path)
+            return True
+
+
+def last_saved_rcept_no(
+    latest: Optional[str],
+    disclosures: List[NewsArticleData],
+    failed_urls: Iterable[Optional[str]],
+) -> Optional[str]:
+    """
+    저장 결과를 반영한 커서 이동 위치
+
+    저장에 실패한 공시가 있으면 그보다 앞선 공시 중 가장 새 접수번호까지만 이동해
+    실패한 공시부터 다음 주기에 다시 조회합니다 (이미 저장된 공시는 URL 충돌로 스킵).
+
+    Args:
+        latest: 조회 결과의 최신 접수번호 (fetch_new_disclosures 반환값)
+        disclosures: 저장을 시도한 공시 리스트
+        failed_urls: 저장에 실패한 공시 URL (NewsSaver.failed_urls)
+
+    Returns:
+        이동할 접수번호 (None이면 이동하지 않음)
+    """
+    failed_urls = set(failed_urls)
+    if not failed_urls:
+        return latest
+
+    rcept_nos = [disclosure.metadata.get("rcept_no", "") for disclosure in disclosures]
+    failed = [
+        rcept_no for disclosure, rcept_no in zip(disclosures, rcept_nos) if disclosure.url in failed_urls
+    ]
+    # 실패한 공시를 특정할 수 없으면 이동하지 않음
+    if len(failed) < len(failed_urls) or not all(failed):
+        return None
+
+    first_failed = min(failed)
+    return max((rcept_no for rcept_no in rcept_nos if rcept_no and rcept_no < first_failed), default=None)
+
+
 class DartCrawler:
     """DART 공시 크롤러 (비동기)"""
 
     BASE_URL = "https://opendart.fss.or.kr/api"
+    PAGE_COUNT = 100  # list.json 페이지당 최대 건수
+    MAX_MARKET_WINDOW_DAYS = 90  # corp_code 없이 조회할 수 있는 최대 기간 (3개월)
 
     # 공시 유형별 한글명
     DISCLOSURE_TYPES = {
@@ -33,14 +130,34 @@ class DartCrawler:
         "A008": "자산유동화",    # 자산유동화 관련
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    # 공시에 붙일 기업 상세 필드 (company.json)
+    COMPANY_FIELDS = ("corp_name_eng", "induty_code", "ceo_nm", "est_dt", "acc_mt")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit_seconds: Optional[float] = None,
+    ):
         """
         Args:
             api_key: DART API 키 (None이면 설정에서 로드)
+            max_concurrency: 동시 요청 수 (None이면 settings.DART_MAX_CONCURRENCY)
+            rate_limit_seconds: 요청 시작 간 최소 간격 (None이면 settings.DART_RATE_LIMIT_SECONDS)
         """
         self.api_key = api_key or getattr(settings, "DART_API_KEY", None)
         self._client: Optional[httpx.AsyncClient] = None
 
+        self.max_concurrency = max(1, max_concurrency or settings.DART_MAX_CONCURRENCY)
+        self.rate_limit_seconds = (
+            settings.DART_RATE_LIMIT_SECONDS if rate_limit_seconds is None else rate_limit_seconds
+        )
+        self.last_request_time: Optional[float] = None
+        self.request_count = 0
+        self.failed_requests = 0
+        self._rate_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
         if not self.api_key:
             logger.warning("DART API 키가 설정되지 않았습니다. 공시 크롤링을 사용하려면 DART_API_KEY 환경변수를 설정하세요.")
             logger.warning("API 키 발급: https://opendart.fss.or.kr/")
@@ -59,6 +176,15 @@ class DartCrawler:
             )
         return self._client
 
+    async def _apply_rate_limit(self) -> None:
+        """요청 시작 간격 유지 (동시 호출자도 차례대로 통과)"""
+        async with self._rate_lock:
+            if self.last_request_time is not None:
+                elapsed = time.monotonic() - self.last_request_time
+                if elapsed < self.rate_limit_seconds:
+                    await asyncio.sleep(self.rate_limit_seconds - elapsed)
+            self.last_request_time = time.monotonic()
+
     async def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """
         DART API 요청 (비동기)
@@ -68,37 +194,263 @@ class DartCrawler:
             params: 요청 파라미터
 
         Returns:
-            응답 데이터 또는 None
+            응답 데이터 또는 None (조회 결과 없음(013)은 빈 list)
         """
         if not self.api_key:
             logger.error("DART API 키가 없어 요청할 수 없습니다")
             return None
 
         url = f"{self.BASE_URL}/{endpoint}"
-        params["crtfc_key"] = self.api_key
+        params = {**params, "crtfc_key": self.api_key}
 
         try:
-            client = await self._get_client()
-            response = await client.get(url, params=params)
+            async with self._slots:
+                await self._apply_rate_limit()
+                self.request_count += 1
+                client = await self._get_client()
+                response = await client.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
 
             # 에러 체크
-            if data.get("status") != "000":
+            status = data.get("status")
+            if status == "013":  # 조회된 데이터가 없음
+                return {**data, "list": [], "total_page": 0}
+            if status != "000":
                 error_message = data.get("message", "알 수 없는 오류")
-                logger.error(f"DART API 오류: {error_message}")
+                logger.error(f"DART API 오류 ({status}): {error_message}")
+                self.failed_requests += 1
                 return None
 
             return data
 
         except httpx.HTTPStatusError as e:
             logger.error(f"DART API HTTP 오류: {e}")
+            self.failed_requests += 1
             return None
         except httpx.RequestError as e:
             logger.error(f"DART API 요청 실패: {e}")
+            self.failed_requests += 1
+            return None
+
+    def _list_params(self, start_date: datetime, end_date: datetime, **extra) -> Dict:
+        """list.json 파라미터 (접수일 내림차순, 최대 페이지 크기)"""
+        return {
+            "bgn_de": start_date.strftime("%Y%m%d"),
+            "end_de": end_date.strftime("%Y%m%d"),
+            "sort": "date",
+            "sort_mth": "desc",
+            "page_count": self.PAGE_COUNT,
+            **extra,
+        }
+
+    async def _fetch_list_pages(self, params: Dict) -> List[Dict]:
+        """
+        list.json 전체 페이지 조회 (첫 페이지로 페이지 수 확인 후 나머지 병렬 조회)
+
+        조회 중 새 공시가 접수되면 뒤 페이지로 밀린 항목이 중복될 수 있으므로
+        호출 측에서 rcept_no로 중복을 제거합니다 (내림차순이라 누락은 생기지 않음).
+        """
+        first = await self._make_request("list.json", {**params, "page_no": 1})
+        if not first:
+            return []
+
+        items = list(first.get("list", []))
+        total_page = int(first.get("total_page") or 1)
+        if total_page > 1:
+            pages = await asyncio.gather(*(
+                self._make_request("list.json", {**params, "page_no": page_no})
+                for page_no in range(2, total_page + 1)
+            ))
+            for data in pages:
+                if data:
+                    items.extend(data.get("list", []))
+        return items
+
+    async def _fetch_list_until(self, params: Dict, since_rcept_no: str) -> List[Dict]:
+        """
+        list.json을 한 페이지씩 조회하다 커서 이전 공시가 나오면 중단 (같은 날 증분 조회용)
+        """
+        items: List[Dict] = []
+        page_no = 1
+        while True:
+            data = await self._make_request("list.json", {**params, "page_no": page_no})
+            if not data:
+                break
+            page = data.get("list", [])
+            items.extend(page)
+            if not page or any(item.get("rcept_no", "") <= since_rcept_no for item in page):
+                break
+            if page_no >= int(data.get("total_page") or 1):
+                break
+            page_no += 1
+        return items
+
+    def _to_disclosures(
+        self,
+        items: Iterable[Dict],
+        since_rcept_no: Optional[str] = None,
+        stocks: Optional[Dict[str, str]] = None,
+    ) -> List[NewsArticleData]:
+        """
+        list.json 항목 → 공시 리스트 (중복 접수번호 제거, 커서 이후만, 대상 종목만)
+
+        Args:
+            items: list.json 항목
+            since_rcept_no: 이 접수번호 이하는 제외
+            stocks: 대상 종목 {종목코드: 종목명} (None이면 전체, 종목명이 있으면 company_name으로 사용)
+        """
+        disclosures = []
+        seen = set()
+        for item in items:
+            rcept_no = item.get("rcept_no", "")
+            stock_code = item.get("stock_code") or ""
+            if stock_code and item.get("corp_code"):
+                _corp_codes_by_stock[stock_code] = item["corp_code"]
+
+            if rcept_no in seen or (since_rcept_no and rcept_no <= since_rcept_no):
+                continue
+            seen.add(rcept_no)
+            if stocks is not None and stock_code not in stocks:
+                continue
+
+            disclosure = self._parse_item(item)
+            if disclosure is not None:
+                if stocks and stocks[stock_code]:
+                    disclosure.company_name = stocks[stock_code]
+                disclosures.append(disclosure)
+        return disclosures
+
+    def _parse_item(self, item: Dict) -> Optional[NewsArticleData]:
+        """list.json 항목 하나를 공시 데이터로 변환"""
+        try:
+            # 공시 정보 파싱
+            title = item.get("report_nm", "")
+            corp_name = item.get("corp_name", "")
+
+            # 공시 내용 요약
+            content = f"[{corp_name}] {title}\n\n"
+            content += f"공시일: {item.get('rcept_dt', '')}\n"
+            content += f"공시 제출인: {item.get('flr_nm', '')}\n"
+
+            # 상세 URL
+            rcept_no = item.get("rcept_no", "")
+            detail_url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
+            content += f"\n상세보기: {detail_url}"
+
+            # 공시일자 파싱
+            rcept_dt = item.get("rcept_dt", "")
+            try:
+                published_at = datetime.strptime(rcept_dt, "%Y%m%d")
+            except ValueError:
+                published_at = datetime.now()
+
+            return NewsArticleData(
+                title=f"[공시] {title}",
+                content=content,
+                published_at=published_at,
+                source="DART(금융감독원)",
+                url=detail_url if rcept_no else None,
+                company_name=corp_name,
+                metadata={
+                    "rcept_no": rcept_no,
+                    "corp_code": item.get("corp_code"),
+                    "stock_code": item.get("stock_code") or None,
+                    "corp_cls": item.get("corp_cls"),
+                },
+            )
+
+        except Exception as e:
+            logger.error(f"공시 파싱 실패: {e}")
             return None
 
+    async def fetch_new_disclosures(
+        self,
+        since_rcept_no: Optional[str] = None,
+        stocks: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[NewsArticleData], Optional[str]]:
+        """
+        커서 이후 새로 접수된 공시를 가져옵니다 (전체 시장 목록에서 대상 종목만).
+
+        - 커서가 오늘이면 첫 페이지부터 차례로 조회하다 커서를 만나면 중단 (보통 1페이지)
+        - 커서가 없거나 과거 날짜면 그 날짜부터 오늘까지 병렬 조회
+
+        Args:
+            since_rcept_no: 마지막으로 확인한 접수번호 (None이면 DART_INITIAL_LOOKBACK_DAYS일 전부터)
+            stocks: 대상 종목 {종목코드: 종목명} (None이면 전체)
+
+        Returns:
+            (공시 리스트, 새 커서) - 새 커서는 대상 종목과 무관하게 확인한 가장 최근 접수번호
+            (실패한 페이지가 있으면 누락을 막기 위해 기존 커서 유지)
+        """
+        failures_before = self.failed_requests
+        today = datetime.now()
+        if since_rcept_no:
+            start_date = datetime.strptime(since_rcept_no[:8], "%Y%m%d")
+        else:
+            start_date = today - timedelta(days=settings.DART_INITIAL_LOOKBACK_DAYS)
+
+        if since_rcept_no and start_date.date() >= today.date():
+            items = await self._fetch_list_until(self._list_params(start_date, today), since_rcept_no)
+        else:
+            items = await self._fetch_window_items(start_date, today)
+
+        latest = max((item.get("rcept_no", "") for item in items), default="") or since_rcept_no
+        if self.failed_requests > failures_before or (since_rcept_no and latest < since_rcept_no):
+            latest = since_rcept_no
+
+        disclosures = self._to_disclosures(items, since_rcept_no, stocks)
+        logger.info(f"DART 신규 공시: {len(disclosures)}건 (확인 {len(items)}건, 요청 {self.request_count}회)")
+        return disclosures, latest
+
+    async def _fetch_window_items(self, start_date: datetime, end_date: datetime, **extra) -> List[Dict]:
+        """
+        기간을 DART_BACKFILL_WINDOW_DAYS 구간으로 나눠 전체 페이지를 병렬 조회합니다.
+        """
+        window_days = max(1, min(settings.DART_BACKFILL_WINDOW_DAYS, self.MAX_MARKET_WINDOW_DAYS))
+        windows = []
+        window_end = end_date
+        while window_end.date() >= start_date.date():
+            window_start = max(start_date, window_end - timedelta(days=window_days - 1))
+            windows.append((window_start, window_end))
+            window_end = window_start - timedelta(days=1)
+
+        results = await asyncio.gather(*(
+            self._fetch_list_pages(self._list_params(window_start, window_end, **extra))
+            for window_start, window_end in windows
+        ))
+        return [item for items in results for item in items]
+
+    async def backfill(
+        self,
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        stocks: Optional[Dict[str, str]] = None,
+    ) -> List[NewsArticleData]:
+        """
+        과거 공시를 구간·페이지 단위로 병렬 수집합니다 (동시 요청 수/요청 간격 준수).
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜 (None이면 오늘)
+            stocks: 대상 종목 {종목코드: 종목명} (None이면 전체)
+
+        Returns:
+            공시 리스트 (접수번호 중복 제거)
+        """
+        end_date = end_date or datetime.now()
+        started = time.perf_counter()
+        items = await self._fetch_window_items(start_date, end_date)
+        disclosures = self._to_disclosures(items, stocks=stocks)
+
+        logger.info(
+            f"DART 백필 완료: {start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d}, "
+            f"{len(disclosures)}건 (확인 {len(items)}건, 요청 {self.request_count}회, "
+            f"{time.perf_counter() - started:.1f}초)"
+        )
+        return disclosures
+
     async def fetch_disclosures(
         self,
         corp_code: Optional[str] = None,
@@ -126,72 +478,30 @@ class DartCrawler:
         if not end_date:
             end_date = datetime.now()
 
-        params = {
-            "bgn_de": start_date.strftime("%Y%m%d"),
-            "end_de": end_date.strftime("%Y%m%d"),
-        }
-
-        # corp_code 또는 stock_code 중 하나만 사용
-        if corp_code:
-            params["corp_code"] = corp_code
-        elif stock_code:
-            params["corp_code"] = stock_code  # DART API는 corp_code 파라미터에 주식코드도 허용
-        else:
+        # list.json의 corp_code는 고유번호만 허용 → 종목코드는 학습한 고유번호로 변환
+        if not corp_code and stock_code:
+            corp_code = await self.search_company_by_stock_code(stock_code)
+        if not corp_code and not stock_code:
             logger.error("corp_code 또는 stock_code 중 하나는 필수입니다")
             return []
 
-        if disclosure_type:
-            params["pblntf_ty"] = disclosure_type
-
-        data = await self._make_request("list.json", params)
-
-        if not data or "list" not in data:
-            return []
-
-        disclosures = []
-
-        for item in data["list"]:
-            try:
-                # 공시 정보 파싱
-                title = item.get("report_nm", "")
-                corp_name = item.get("corp_name", "")
-
-                # 공시 내용 요약
-                content = f"[{corp_name}] {title}\n\n"
-                content += f"공시일: {item.get('rcept_dt', '')}\n"
-                content += f"공시 제출인: {item.get('flr_nm', '')}\n"
-
-                # 상세 URL
-                rcept_no = item.get("rcept_no", "")
-                detail_url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
-                content += f"\n상세보기: {detail_url}"
-
-                # 공시일자 파싱
-                rcept_dt = item.get("rcept_dt", "")
-                try:
-                    published_at = datetime.strptime(rcept_dt, "%Y%m%d")
-                except:
-                    published_at = datetime.now()
-
-                disclosure = NewsArticleData(
-                    title=f"[공시] {title}",
-                    content=content,
-                    published_at=published_at,
-                    source="DART(금융감독원)",
-                    company_name=corp_name,
-                )
-
-                disclosures.append(disclosure)
-
-            except Exception as e:
-                logger.error(f"공시 파싱 실패: {e}")
+        extra = {"pblntf_ty": disclosure_type} if disclosure_type else {}
+        if corp_code:
+            items = await self._fetch_list_pages(self._list_params(start_date, end_date, corp_code=corp_code, **extra))
+            disclosures = self._to_disclosures(items)
+        else:
+            # 고유번호를 모르면 전체 시장 목록에서 종목코드로 거름
+            items = await self._fetch_window_items(start_date, end_date, **extra)
+            disclosures = self._to_disclosures(items, stocks={stock_code: None})
 
-        logger.info(f"{corp_name} 공시 수집 완료: {len(disclosures)}건")
+        logger.info(f"{corp_code or stock_code} 공시 수집 완료: {len(disclosures)}건")
         return disclosures
 
     async def search_company_by_stock_code(self, stock_code: str) -> Optional[str]:
         """
-        주식 코드로 기업 고유번호(corp_code)를 검색합니다 (비동기).
+        주식 코드로 기업 고유번호(corp_code)를 찾습니다.
+
+        company.json은 고유번호로만 조회되므로, 공시 목록에서 학습한 매핑을 사용합니다.
 
         Args:
             stock_code: 주식 코드 (6자리)
@@ -199,16 +509,40 @@ class DartCrawler:
         Returns:
             기업 고유번호 (8자리) 또는 None
         """
-        params = {
-            "stock_code": stock_code,
-        }
+        return _corp_codes_by_stock.get(stock_code)
 
-        data = await self._make_request("company.json", params)
+    async def fetch_companies(self, corp_codes: Iterable[str]) -> Dict[str, Dict]:
+        """
+        기업 상세 정보(company.json)를 병렬 조회합니다 (프로세스 단위 캐시).
 
-        if not data:
-            return None
+        Args:
+            corp_codes: 기업 고유번호 목록 (중복 허용)
 
-        return data.get("corp_code")
+        Returns:
+            {고유번호: 기업 정보} (조회 실패한 기업은 제외)
+        """
+        codes = {code for code in corp_codes if code}
+        missing = sorted(codes - _company_cache.keys())
+        if missing:
+            results = await asyncio.gather(*(
+                self._make_request("company.json", {"corp_code": code}) for code in missing
+            ))
+            for code, data in zip(missing, results):
+                if data:
+                    _company_cache[code] = data
+            logger.debug(f"DART 기업 정보 조회: {len(missing)}개 (캐시 {len(codes) - len(missing)}개)")
+
+        return {code: _company_cache[code] for code in codes if code in _company_cache}
+
+    async def attach_company_details(self, disclosures: List[NewsArticleData]) -> None:
+        """공시 metadata에 기업 상세 정보(COMPANY_FIELDS)를 붙입니다."""
+        companies = await self.fetch_companies(d.metadata.get("corp_code") for d in disclosures)
+        for disclosure in disclosures:
+            company = companies.get(disclosure.metadata.get("corp_code"))
+            if company:
+                disclosure.metadata["company"] = {
+                    field: company.get(field) for field in self.COMPANY_FIELDS if company.get(field)
+                }
 
     async def fetch_disclosures_by_stock_code(
         self,
@@ -229,7 +563,6 @@ class DartCrawler:
         Returns:
             공시 리스트
         """
-        # 직접 주식 코드로 공시 조회
         return await self.fetch_disclosures(
             stock_code=stock_code,
             start_date=start_date,
@@ -249,3 +582,23 @@ class DartCrawler:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager 종료"""
         await self.close()
+
+
+# 싱글톤 인스턴스
+_dart_cursor: Optional[DartCursor] = None
+_cursor_lock = threading.Lock()
+
+
+def get_dart_cursor() -> DartCursor:
+    """
+    DartCursor 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        DartCursor 인스턴스
+    """
+    global _dart_cursor
+    if _dart_cursor is None:
+        with _cursor_lock:
+            if _dart_cursor is None:
+                _dart_cursor = DartCursor()
+    return _dart_cursor
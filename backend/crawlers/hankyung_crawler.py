@@ -4,12 +4,11 @@
 한국경제 증권 뉴스를 크롤링합니다.
 """
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from backend.crawlers.base_crawler import BaseNewsCrawler, NewsArticleData
+from backend.crawlers.html_extract import HtmlField, HtmlItemSpec, extract_items
 
 
 logger = logging.getLogger(__name__)
@@ -20,42 +19,48 @@ class HankyungNewsCrawler(BaseNewsCrawler):
 
     BASE_URL = "https://www.hankyung.com/finance/stock"
 
+    # 뉴스 아이템 추출 명세 (실제 사이트 구조에 맞게 조정 필요)
+    NEWS_ITEM_SPEC = HtmlItemSpec(
+        item_selector=".news-list li, article, .article-item",
+        fields={
+            "title": HtmlField(".news-tit, h3, .headline"),
+            "url": HtmlField("a", attr="href"),
+            "summary": HtmlField(".txt, .summary, p"),
+            "date": HtmlField(".date, .time, time"),
+        },
+    )
+
     def __init__(self):
         """한국경제 뉴스 크롤러 초기화"""
         super().__init__(source_name="한국경제")
 
-    def _parse_news_item(self, item: BeautifulSoup) -> Optional[NewsArticleData]:
+    def _parse_news_item(self, fields: Dict[str, Optional[str]]) -> Optional[NewsArticleData]:
         """
         뉴스 아이템을 파싱합니다.
 
         Args:
-            item: BeautifulSoup 뉴스 아이템
+            fields: NEWS_ITEM_SPEC으로 추출한 필드 (title, url, summary, date)
 
         Returns:
             NewsArticleData 또는 None (파싱 실패 시)
         """
         try:
-            # 제목 추출 (실제 사이트 구조에 맞게 조정 필요)
-            title_elem = item.select_one(".news-tit, h3, .headline")
-            if not title_elem:
+            # 제목 추출
+            title = fields["title"]
+            if title is None:
                 return None
-            title = title_elem.get_text(strip=True)
 
             # URL 추출
-            link_elem = item.select_one("a")
-            url = link_elem.get("href") if link_elem else None
+            url = fields["url"]
             if url and not url.startswith("http"):
                 url = f"https://www.hankyung.com{url}"
 
             # 본문 요약 추출
-            summary_elem = item.select_one(".txt, .summary, p")
-            content = summary_elem.get_text(strip=True) if summary_elem else title
+            content = fields["summary"] if fields["summary"] is not None else title
 
             # 발표 시간 추출
-            date_elem = item.select_one(".date, .time, time")
-            if date_elem:
-                date_str = date_elem.get_text(strip=True)
-                published_at = self._parse_date(date_str)
+            if fields["date"] is not None:
+                published_at = self._parse_date(fields["date"])
             else:
                 published_at = datetime.now()
 
@@ -122,22 +127,20 @@ class HankyungNewsCrawler(BaseNewsCrawler):
             logger.error("페이지 가져오기 실패")
             return news_list
 
-        # HTML 파싱
-        soup = BeautifulSoup(html, "html.parser")
-
-        # 뉴스 리스트 추출 (실제 사이트 구조에 맞게 조정 필요)
-        news_items = soup.select(".news-list li, article, .article-item")
+        # 뉴스 아이템 필드만 추출 (limit건까지만 파싱)
+        news_items = extract_items(html, self.NEWS_ITEM_SPEC, limit=limit)
 
         if not news_items:
             logger.warning("뉴스를 찾을 수 없습니다 (CSS 선택자 확인 필요)")
             return news_list
 
         # 각 뉴스 아이템 파싱
-        for item in news_items[:limit]:
-            news_data = self._parse_news_item(item)
+        for fields in news_items:
+            news_data = self._parse_news_item(fields)
             if news_data:
                 news_list.append(news_data)
                 logger.debug(f"뉴스 추가: {news_data.title[:50]}")
 
         logger.info(f"한국경제 뉴스 크롤링 완료: {len(news_list)}건")
-        return news_list
+        # 이미 저장된 기사는 저장 단계로 넘기지 않음
+        return self.drop_seen(news_list)
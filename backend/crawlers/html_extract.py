@@ -0,0 +1,434 @@
+"""
+뉴스 목록 HTML 추출 모듈
+
+크롤러는 목록 페이지에서 기사별 몇 개 노드(제목, 링크, 요약, 날짜)만 필요하므로,
+전체 DOM을 만드는 대신 HtmlItemSpec에 선언한 노드만 추출합니다.
+settings.CRAWL_HTML_PARSER로 백엔드를 선택합니다.
+
+백엔드:
+- streaming: 표준 라이브러리 HTMLParser 이벤트 스트림 (DOM 미생성, limit 도달 시 즉시 중단)
+- selectolax: lexbor C 파서 + CSS 선택자 (selectolax 패키지가 있을 때만 사용 가능)
+
+지원 선택자: 태그/클래스 조합(`dd.articleSubject`, `.news_ttl`)과 자손 결합자(공백),
+콤마로 구분한 선택자 목록. 목록의 선택자 중 문서 순서상 처음 나오는 노드를 사용합니다
+(BeautifulSoup select_one과 같은 의미).
+"""
+import html
+import logging
+import re
+from html.entities import html5 as HTML5_ENTITIES
+from html.parser import HTMLParser
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from backend.config import settings
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+logger = logging.getLogger(__name__)
+
+
+PARSER_BACKENDS = ("streaming", "selectolax")
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+# 텍스트에서 제외할 요소 (BeautifulSoup get_text와 동일)
+SKIP_TEXT_ELEMENTS = frozenset({"script", "style", "template"})
+# 같은 태그(그룹)가 새로 열리면 암묵적으로 닫히는 요소 → 범위를 제한하는 컨테이너
+IMPLICIT_CLOSE = {
+    "li": ({"li"}, {"ul", "ol"}),
+    "dt": ({"dt", "dd"}, {"dl"}),
+    "dd": ({"dt", "dd"}, {"dl"}),
+    "p": ({"p"}, {"div", "section", "article", "li", "td", "dd"}),
+    "tr": ({"tr"}, {"table", "tbody", "thead"}),
+    "td": ({"td", "th"}, {"tr"}),
+    "th": ({"td", "th"}, {"tr"}),
+    "option": ({"option"}, {"select"}),
+}
+
+_COMPOUND_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9-]*)?((?:\.[\w-]+)*)$")
+_ATTR_RE = re.compile(r"""([^\s/>"'=]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s>]+))?""")
+_CHAR_REF_RE = re.compile(r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[A-Za-z][A-Za-z0-9]*;?)")
+
+
+class HtmlField(NamedTuple):
+    """추출할 필드 (selector의 첫 노드에서 attr 값, attr가 None이면 텍스트)"""
+
+    selector: str
+    attr: Optional[str] = None
+
+
+class HtmlItemSpec(NamedTuple):
+    """
+    목록 아이템 추출 명세
+
+    Attributes:
+        item_selector: 기사 하나의 시작 노드 선택자
+        fields: 필드 이름 → HtmlField
+        following_siblings: True면 아이템 노드 다음 형제 노드들(다음 아이템 전까지)에서도 필드 검색
+            (네이버 dd.articleSubject + dd.articleSummary처럼 한 기사가 형제 노드로 나뉜 경우)
+    """
+
+    item_selector: str
+    fields: Dict[str, HtmlField]
+    following_siblings: bool = False
+
+
+# ==================== 선택자 ====================
+
+Compound = Tuple[Optional[str], frozenset]  # (태그 또는 None, 클래스 집합)
+
+
+def parse_selector(selector: str) -> List[List[Compound]]:
+    """
+    선택자 목록 파싱
+
+    Returns:
+        선택자별 compound 리스트 (자손 결합자 순서)
+
+    Raises:
+        ValueError: 지원하지 않는 문법 (>, +, [], :, # 등)
+    """
+    alternatives = []
+    for part in selector.split(","):
+        compounds = []
+        for token in part.split():
+            match = _COMPOUND_RE.match(token)
+            if not match or token == "":
+                raise ValueError(f"지원하지 않는 선택자: {selector!r}")
+            tag, classes = match.groups()
+            compounds.append((tag.lower() if tag else None, frozenset(filter(None, classes.split(".")))))
+        if not compounds:
+            raise ValueError(f"빈 선택자: {selector!r}")
+        alternatives.append(compounds)
+    return alternatives
+
+
+def _compound_matches(compound: Compound, tag: str, classes: frozenset) -> bool:
+    compound_tag, compound_classes = compound
+    return (compound_tag is None or compound_tag == tag) and compound_classes <= classes
+
+
+def _matches(alternatives: List[List[Compound]], stack: List[Tuple[str, frozenset]]) -> bool:
+    """스택의 마지막 요소가 선택자 목록 중 하나와 일치하는지 (조상은 스택 앞부분)"""
+    tag, classes = stack[-1]
+    for compounds in alternatives:
+        if not _compound_matches(compounds[-1], tag, classes):
+            continue
+        remaining = len(compounds) - 2
+        for ancestor_tag, ancestor_classes in reversed(stack[:-1]):
+            if remaining < 0:
+                break
+            if _compound_matches(compounds[remaining], ancestor_tag, ancestor_classes):
+                remaining -= 1
+        if remaining < 0:
+            return True
+    return False
+
+
+# ==================== 속성값 ====================
+
+def unescape_attribute(value: str) -> str:
+    """
+    HTML5 규칙으로 속성값의 문자 참조 해석
+
+    html.unescape는 세미콜론 없는 레거시 참조를 뒤 문자와 무관하게 해석하여
+    URL 쿼리 `&section_id=101`의 `&sect`를 `§`로 바꿉니다. 속성값에서는 세미콜론 없는
+    이름 참조 뒤에 영숫자나 `=`가 오면 해석하지 않아야 합니다.
+    """
+    def replace(match):
+        ref = match.group(1)
+        if ref.startswith("#"):
+            return html.unescape(match.group(0))
+        if ref.endswith(";"):
+            return HTML5_ENTITIES.get(ref, match.group(0))
+        next_char = value[match.end():match.end() + 1]
+        if ref in HTML5_ENTITIES and next_char != "=":
+            return HTML5_ENTITIES[ref]
+        return match.group(0)
+
+    return _CHAR_REF_RE.sub(replace, value) if "&" in value else value
+
+
+def _raw_attributes(starttag_text: str) -> Dict[str, str]:
+    """시작 태그 원문에서 속성 추출 (값은 unescape_attribute로 해석)"""
+    attrs = {}
+    body = starttag_text[1:].rstrip(">").rstrip("/")
+    for match in list(_ATTR_RE.finditer(body))[1:]:  # 첫 토큰은 태그 이름
+        name, value = match.group(1).lower(), match.group(2)
+        if name in attrs:
+            continue
+        if value is None:
+            attrs[name] = None
+        else:
+            if value[:1] in ("'", '"'):
+                value = value[1:-1]
+            attrs[name] = unescape_attribute(value)
+    return attrs
+
+
+# ==================== streaming 백엔드 ====================
+
+class _StopParsing(Exception):
+    """limit 도달 시 파싱 중단"""
+
+
+class _StreamingItemParser(HTMLParser):
+    """
+    HTMLParser 이벤트로 아이템 필드만 수집 (열린 요소 스택만 유지, DOM 미생성)
+
+    아이템은 item_selector 노드에서 시작하며, 그 노드가 닫힐 때
+    (following_siblings=True면 다음 아이템 시작 또는 부모가 닫힐 때) 끝납니다.
+    """
+
+    def __init__(self, spec: HtmlItemSpec, limit: Optional[int]):
+        super().__init__(convert_charrefs=True)
+        self.spec = spec
+        self.limit = limit
+        self.item_selector = parse_selector(spec.item_selector)
+        self.field_selectors = [
+            (name, parse_selector(field.selector), field.attr) for name, field in spec.fields.items()
+        ]
+
+        self.items: List[Dict[str, Optional[str]]] = []
+        self._stack: List[Tuple[str, frozenset]] = []
+        self._skip_text_depth = 0
+
+        # 현재 아이템 상태
+        self._item: Optional[Dict[str, Optional[str]]] = None
+        self._item_end_depth = 0  # 스택 길이가 이 값보다 작아지면 아이템 종료
+        self._captures: Dict[str, Tuple[int, List[str]]] = {}  # 필드 → (요소 깊이, 텍스트 조각)
+        self._pending_text: List[str] = []  # 현재 텍스트 노드 (feed 경계에서 나뉘어 들어올 수 있음)
+
+    # ---------- 아이템 ----------
+
+    def _start_item(self):
+        self._finish_item()
+        self._item = {name: None for name in self.spec.fields}
+        self._done = set()
+        depth = len(self._stack)
+        self._item_end_depth = depth - 1 if self.spec.following_siblings else depth
+
+    def _finish_item(self):
+        if self._item is None:
+            return
+        self._flush_text()
+        for name, (_, chunks) in self._captures.items():
+            self._item[name] = "".join(chunks)
+        self._captures.clear()
+        self.items.append(self._item)
+        self._item = None
+        if self.limit is not None and len(self.items) >= self.limit:
+            raise _StopParsing()
+
+    # ---------- 스택 ----------
+
+    def _pop(self):
+        tag, _ = self._stack.pop()
+        depth = len(self._stack) + 1
+        if tag in SKIP_TEXT_ELEMENTS and self._skip_text_depth:
+            self._skip_text_depth -= 1
+
+        for name, (capture_depth, chunks) in list(self._captures.items()):
+            if capture_depth == depth:
+                self._item[name] = "".join(chunks)
+                del self._captures[name]
+
+        if self._item is not None and len(self._stack) < self._item_end_depth:
+            self._finish_item()
+
+    def _close_implicit(self, tag: str):
+        """새 요소가 같은 그룹의 열린 요소를 암묵적으로 닫는 경우 처리 (<li>, <dd>, <p> 등)"""
+        closes, boundaries = IMPLICIT_CLOSE[tag]
+        for index in range(len(self._stack) - 1, -1, -1):
+            open_tag = self._stack[index][0]
+            if open_tag in boundaries:
+                return
+            if open_tag in closes:
+                while len(self._stack) > index:
+                    self._pop()
+                return
+
+    def _flush_text(self):
+        """텍스트 노드 하나를 strip하여 수집 중인 필드에 추가 (get_text(strip=True)와 동일)"""
+        if not self._pending_text:
+            return
+        text = "".join(self._pending_text).strip()
+        self._pending_text.clear()
+        if text:
+            for _, chunks in self._captures.values():
+                chunks.append(text)
+
+    # ---------- HTMLParser 이벤트 ----------
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in IMPLICIT_CLOSE:
+            self._close_implicit(tag)
+
+        classes = frozenset()
+        attr_map = dict(attrs)
+        if attr_map.get("class"):
+            classes = frozenset(attr_map["class"].split())
+
+        self._stack.append((tag, classes))
+
+        # 아이템 시작 (현재 아이템 노드 안에 중첩된 일치 노드는 같은 아이템으로 취급)
+        inside_item_node = (
+            self._item is not None
+            and not self.spec.following_siblings
+            and len(self._stack) > self._item_end_depth
+        )
+        if not inside_item_node and _matches(self.item_selector, self._stack):
+            self._start_item()
+
+        if self._item is not None:
+            depth = len(self._stack)
+            for name, selector, attr in self.field_selectors:
+                if name in self._done or not _matches(selector, self._stack):
+                    continue
+                self._done.add(name)
+                if attr is not None:
+                    # HTMLParser의 속성값 해석(html.unescape) 대신 원문에서 HTML5 규칙으로 해석
+                    self._item[name] = _raw_attributes(self.get_starttag_text()).get(attr)
+                elif tag not in VOID_ELEMENTS:
+                    self._captures[name] = (depth, [])
+                else:
+                    self._item[name] = ""
+
+        if tag in SKIP_TEXT_ELEMENTS:
+            self._skip_text_depth += 1
+        if tag in VOID_ELEMENTS:
+            self._pop()
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in VOID_ELEMENTS:
+            return
+        # 짝이 맞는 열린 요소까지 닫기 (짝이 없으면 무시)
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                while len(self._stack) > index:
+                    self._pop()
+                return
+
+    def handle_data(self, data):
+        if self._captures and not self._skip_text_depth:
+            self._pending_text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        while self._stack:
+            self._pop()
+        self._finish_item()
+
+
+def _extract_streaming(html: str, spec: HtmlItemSpec, limit: Optional[int], chunk_size: int = 16384):
+    parser = _StreamingItemParser(spec, limit)
+    try:
+        for start in range(0, len(html), chunk_size):
+            parser.feed(html[start:start + chunk_size])
+        parser.close()
+    except _StopParsing:
+        pass
+    return parser.items
+
+
+# ==================== selectolax 백엔드 ====================
+
+def _node_matches(node, selector: str) -> bool:
+    """노드 자신이 선택자와 일치하는지 (css_matches는 자손 일치도 True)"""
+    parent = node.parent
+    return parent is not None and any(match.mem_id == node.mem_id for match in parent.css(selector))
+
+
+def _extract_selectolax(html: str, spec: HtmlItemSpec, limit: Optional[int]):
+    if LexborHTMLParser is None:
+        raise ImportError("selectolax HTML 백엔드에는 selectolax 패키지가 필요합니다")
+
+    tree = LexborHTMLParser(html)
+    # 선택자 목록의 여러 선택자에 일치하는 노드는 한 번만 (문서 순서 유지)
+    nodes = list({node.mem_id: node for node in tree.css(spec.item_selector)}.values())
+    node_ids = {node.mem_id for node in nodes}
+
+    items = []
+    for node in nodes:
+        if limit is not None and len(items) >= limit:
+            break
+
+        # 다른 아이템 노드 안에 중첩된 노드는 건너뜀 (streaming 백엔드와 동일)
+        parent, nested = node.parent, False
+        while parent is not None and not spec.following_siblings:
+            if parent.mem_id in node_ids:
+                nested = True
+                break
+            parent = parent.parent
+        if nested:
+            continue
+
+        scope = [node]
+        if spec.following_siblings:
+            sibling = node.next
+            while sibling is not None and sibling.mem_id not in node_ids:
+                if sibling.is_element_node:
+                    scope.append(sibling)
+                sibling = sibling.next
+
+        item = {}
+        for name, field in spec.fields.items():
+            match = None
+            for scope_node in scope:
+                match = scope_node if _node_matches(scope_node, field.selector) else scope_node.css_first(field.selector)
+                if match is not None:
+                    break
+
+            if match is None:
+                item[name] = None
+            elif field.attr is not None:
+                item[name] = match.attributes.get(field.attr)
+            else:
+                item[name] = match.text(strip=True)
+        items.append(item)
+
+    return items
+
+
+def extract_items(
+    html: str,
+    spec: HtmlItemSpec,
+    limit: Optional[int] = None,
+    backend: Optional[str] = None,
+) -> List[Dict[str, Optional[str]]]:
+    """
+    목록 페이지에서 아이템 필드 추출
+
+    Args:
+        html: HTML 문자열
+        spec: 아이템 추출 명세
+        limit: 최대 아이템 수 (도달하면 나머지 문서는 파싱하지 않음)
+        backend: streaming / selectolax (None이면 settings.CRAWL_HTML_PARSER)
+
+    Returns:
+        아이템별 {필드 이름: 값} 리스트 (노드가 없는 필드는 None)
+    """
+    backend = backend or settings.CRAWL_HTML_PARSER
+    if backend == "streaming":
+        return _extract_streaming(html, spec, limit)
+    if backend == "selectolax":
+        return _extract_selectolax(html, spec, limit)
+    raise ValueError(f"지원하지 않는 HTML 파서 백엔드: {backend} (지원: {PARSER_BACKENDS})")
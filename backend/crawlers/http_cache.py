@@ -0,0 +1,276 @@
+"""
+크롤러 HTTP 캐시
+
+10분 주기 크롤링에서 바뀌지 않은 페이지를 다시 내려받지 않도록 합니다.
+
+- HttpResponseCache: URL별 ETag/Last-Modified + 본문 (메모리 LRU)
+  조건부 요청(If-None-Match / If-Modified-Since)에 304가 오면 캐시 본문을 재사용
+  크롤러 인스턴스는 사이클마다 새로 만들어지므로 프로세스 단위 싱글톤으로 공유
+- SeenUrlStore: 이미 저장된 기사 URL 집합 (append-only 텍스트 파일)
+  재시작 후에도 유지되며, 다른 프로세스가 추가한 URL은 파일 증가분만 다시 읽어 반영
+- 크롤러(source_name)별 통계: 요청 수, 304 수, 받은/절약한 바이트, 생략한 요청 수
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+from urllib.parse import urldefrag
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """캐시된 응답 (검증자 + 디코딩된 본문)"""
+
+    __slots__ = ("etag", "last_modified", "body", "size")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body: str, size: int):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.size = size  # 원본 응답 바이트 수 (304 시 절약한 바이트)
+
+
+class HttpResponseCache:
+    """
+    ETag/Last-Modified 기반 조건부 요청 캐시 (Thread-safe)
+
+    검증자(ETag 또는 Last-Modified)가 있는 응답만 저장합니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: 최대 캐시 URL 수 (None이면 settings.CRAWL_HTTP_CACHE_MAX_ENTRIES)
+        """
+        self.max_entries = max_entries or settings.CRAWL_HTTP_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """캐시된 응답 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """조건부 요청 헤더 (캐시가 없으면 빈 dict)"""
+        entry = self.get(url)
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str, size: int):
+        """응답 저장 (검증자가 없으면 기존 항목 제거)"""
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(url, None)
+                return
+
+            self._entries[url] = CachedResponse(etag, last_modified, body, size)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, source: str, **counts: int):
+        """크롤러별 통계 누적 (requests, not_modified, bytes_downloaded, bytes_saved, fetches_avoided)"""
+        with self._lock:
+            stats = self._stats.setdefault(source, {
+                "requests": 0,
+                "not_modified": 0,
+                "bytes_downloaded": 0,
+                "bytes_saved": 0,
+                "fetches_avoided": 0,
+            })
+            for key, value in counts.items():
+                stats[key] += value
+
+    def get_stats(self, source: Optional[str] = None) -> Dict:
+        """
+        크롤러별 통계
+
+        Args:
+            source: 크롤러 source_name (None이면 전체 크롤러)
+        """
+        with self._lock:
+            if source is not None:
+                return dict(self._stats.get(source, {}))
+            return {
+                "cached_urls": len(self._entries),
+                "crawlers": {name: dict(stats) for name, stats in self._stats.items()},
+            }
+
+    def clear(self):
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+def normalize_url(url: str) -> str:
+    """seen URL 키 (fragment 제거, 앞뒤 공백 제거)"""
+    return urldefrag((url or "").strip())[0]
+
+
+class SeenUrlStore:
+    """
+    저장 완료 기사 URL 집합 (Thread-safe, 파일 영속)
+
+    - 파일: URL 한 줄씩 append-only (한 번의 write로 기록 → 여러 프로세스 공유 가능)
+    - 조회 시 파일이 커졌으면 증가분만 읽어 다른 프로세스의 추가분 반영
+    - max_urls를 넘으면 최근 절반만 남겨 파일을 다시 씀
+    """
+
+    def __init__(self, path: Optional[str] = None, max_urls: Optional[int] = None):
+        """
+        Args:
+            path: 저장 파일 경로 (None이면 settings.CRAWL_SEEN_URLS_PATH, 빈 문자열이면 메모리 전용)
+            max_urls: 최대 URL 수 (None이면 settings.CRAWL_SEEN_URLS_MAX)
+        """
+        self.path = settings.CRAWL_SEEN_URLS_PATH if path is None else path
+        self.max_urls = max_urls or settings.CRAWL_SEEN_URLS_MAX
+
+        self._lock = threading.Lock()
+        self._urls: Dict[str, None] = {}  # 삽입 순서 유지 (오래된 URL부터 정리)
+        self._offset = 0  # 파일에서 읽은 바이트 수
+
+        if self.path:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with self._lock:
+                self._sync_locked()
+            logger.info(f"seen URL 로드: {len(self._urls)}건 ({self.path})")
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __contains__(self, url: str) -> bool:
+        key = normalize_url(url)
+        if not key:
+            return False
+
+        with self._lock:
+            if key in self._urls:
+                return True
+            self._sync_locked()
+            return key in self._urls
+
+    def add_many(self, urls: Iterable[Optional[str]]) -> int:
+        """
+        URL 추가 (None/빈 URL/기존 URL은 무시)
+
+        Returns:
+            새로 추가된 URL 수
+        """
+        with self._lock:
+            self._sync_locked()
+            new_urls = []
+            for url in urls:
+                key = normalize_url(url)
+                if key and "\n" not in key and key not in self._urls:
+                    self._urls[key] = None
+                    new_urls.append(key)
+
+            if new_urls and self.path:
+                payload = "".join(f"{url}\n" for url in new_urls).encode("utf-8")
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+                self._offset += len(payload)
+
+            if len(self._urls) > self.max_urls:
+                self._compact_locked()
+
+            return len(new_urls)
+
+    def _sync_locked(self):
+        """파일 증가분 반영 (파일이 줄었으면 다른 프로세스가 정리한 것 → 전체 재로드)"""
+        if not self.path:
+            return
+
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+
+        if size < self._offset:
+            self._urls.clear()
+            self._offset = 0
+        if size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # 쓰는 중인 마지막 줄은 다음 조회 때 읽음
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].decode("utf-8", errors="ignore").splitlines():
+            if line:
+                self._urls[line] = None
+        self._offset += complete
+
+    def _compact_locked(self):
+        """최근 max_urls // 2개만 남기고 파일 재작성 (원자적 교체)"""
+        keep = list(self._urls)[-(self.max_urls // 2):]
+        self._urls = dict.fromkeys(keep)
+
+        if self.path:
+            payload = "".join(f"{url}\n" for url in keep).encode("utf-8")
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+            self._offset = len(payload)
+
+        logger.info(f"seen URL 정리: {len(keep)}건 유지")
+
+
+# 싱글톤 인스턴스
+_http_cache: Optional[HttpResponseCache] = None
+_seen_urls: Optional[SeenUrlStore] = None
+_singleton_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpResponseCache:
+    """
+    HttpResponseCache 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        HttpResponseCache 인스턴스
+    """
+    global _http_cache
+    if _http_cache is None:
+        with _singleton_lock:
+            if _http_cache is None:
+                _http_cache = HttpResponseCache()
+    return _http_cache
+
+
+def get_seen_url_store() -> SeenUrlStore:
+    """
+    SeenUrlStore 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        SeenUrlStore 인스턴스
+    """
+    global _seen_urls
+    if _seen_urls is None:
+        with _singleton_lock:
+            if _seen_urls is None:
+                _seen_urls = SeenUrlStore()
+    return _seen_urls
@@ -5,28 +5,209 @@ OAuth 2.0 인증, Rate Limiting, Token 자동 갱신 기능 포함
 """
 import logging
 import asyncio
+import bisect
+import os
+import struct
+import threading
 import time
 import json
-from typing import Optional, Dict, Any
+import weakref
+import copy
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Optional, Deque, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 import httpx
 from backend.config import settings
 from backend.db.session import SessionLocal
 from backend.db.models.kis_token import KISToken
+from backend.utils.market_time import get_market_phase, is_market_open
 from sqlalchemy import text
 
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 공유 없이 동작
+    fcntl = None
+
 
 logger = logging.getLogger(__name__)
 
 
+class _WaitHistogram:
+    """대기 시간 히스토그램 (구간별 누적 건수, ms)"""
+
+    __slots__ = ("bounds_ms", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, bounds_ms: Tuple[int, ...]):
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)  # 마지막 칸: 최대 구간 초과
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, waited_ms: float):
+        self.counts[bisect.bisect_left(self.bounds_ms, waited_ms)] += 1
+        self.count += 1
+        self.total_ms += waited_ms
+        self.max_ms = max(self.max_ms, waited_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={bound}ms": n for bound, n in zip(self.bounds_ms, self.counts)}
+        buckets[f">{self.bounds_ms[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "buckets": buckets,
+        }
+
+
+class _PriorityLanes:
+    """이벤트 루프 하나의 우선순위별 대기열 + 토큰 분배 태스크"""
+
+    __slots__ = ("queues", "dispatcher")
+
+    def __init__(self, priorities: Tuple[str, ...]):
+        self.queues: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in priorities}
+        self.dispatcher: Optional[asyncio.Task] = None
+
+    def waiting(self) -> bool:
+        return any(self.queues.values())
+
+    def pop_next(self) -> Optional[asyncio.Future]:
+        """가장 높은 우선순위의 맨 앞 대기자 (취소된 대기자는 버림)"""
+        for queue in self.queues.values():
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    return future
+        return None
+
+
+class _TokenBucket:
+    """
+    프로세스 내 토큰 버킷 (GCRA: 다음 토큰이 생기는 시각 tat 하나만 저장)
+
+    tat - now가 (burst - 1) * interval 이하이면 토큰이 있는 것과 같습니다.
+    """
+
+    MAX_CLOCK_SKEW = 60.0  # tat가 이보다 미래면 시계가 뒤로 간 것으로 보고 초기화 (초)
+
+    def __init__(self, rate: float, burst: int):
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self._tat = 0.0
+
+    @contextmanager
+    def _locked(self):
+        yield  # 호출 측(RateLimiter._state_lock)이 스레드 간 직렬화
+
+    def _load(self) -> float:
+        return self._tat
+
+    def _store(self, tat: float):
+        self._tat = tat
+
+    def take(self, reserve: bool = False) -> float:
+        """
+        토큰 1개 획득
+
+        Args:
+            reserve: True면 토큰이 없어도 다음 토큰을 예약 (반환값만큼 기다린 뒤 사용)
+
+        Returns:
+            0.0이면 바로 사용 가능, 아니면 토큰까지 남은 시간 (초)
+            (reserve=False에서 0보다 크면 획득 실패)
+        """
+        with self._locked():
+            now = time.time()
+            tat = self._load()
+            if tat - now > self.MAX_CLOCK_SKEW:
+                tat = now
+            tat = max(tat, now)
+            wait = tat - self.tolerance - now
+            if wait > 0 and not reserve:
+                return wait
+            self._store(tat + self.interval)
+            return max(0.0, wait)
+
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수 (통계용)"""
+        with self._locked():
+            backlog = max(0.0, self._load() - time.time())
+        return max(0.0, (self.tolerance + self.interval - backlog) / self.interval)
+
+
+class _SharedTokenBucket(_TokenBucket):
+    """
+    호스트 내 모든 프로세스가 공유하는 토큰 버킷
+
+    tat(8바이트 double)를 상태 파일에 두고 flock으로 읽기-수정-쓰기를 직렬화합니다.
+    API 서버, 스케줄러, 백필 스크립트가 같은 파일을 보면 초당 한도를 함께 나눠 씁니다.
+    """
+
+    _STATE = struct.Struct("d")
+
+    def __init__(self, rate: float, burst: int, path: str):
+        super().__init__(rate, burst)
+        self.path = path
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def _file(self) -> int:
+        # fork 후 상속된 fd는 잠금을 부모와 공유하므로 프로세스마다 새로 엶
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    @contextmanager
+    def _locked(self):
+        fd = self._file()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _load(self) -> float:
+        data = os.pread(self._fd, self._STATE.size, 0)
+        return self._STATE.unpack(data)[0] if len(data) == self._STATE.size else 0.0
+
+    def _store(self, tat: float):
+        os.pwrite(self._fd, self._STATE.pack(tat), 0)
+
+
 class RateLimiter:
-    """Rate Limiter (Sliding Window 알고리즘) - Singleton Pattern"""
+    """
+    Rate Limiter (Token Bucket + 우선순위 대기열) - Singleton Pattern
+
+    - 토큰은 초당 max_requests / window_seconds개씩 채워지고 최대 burst개까지 쌓임
+      (burst=1이면 요청 시작이 균등 간격 → 어느 1초 구간에서도 max_requests 이하)
+    - 토큰이 없으면 우선순위별 대기열(high → normal → low)에 들어가고, 토큰이 생길 때마다
+      가장 높은 우선순위의 맨 앞 요청이 가져감 → 사용자 요청은 배치 작업보다 항상 먼저 다음 토큰을 받음
+    - acquire당 O(1): 토큰은 경과 시간으로 계산, 대기열은 deque
+    - 토큰 상태는 스레드 간 공유(threading.Lock), 대기열은 이벤트 루프별
+      (asyncio.run으로 도는 백그라운드 작업도 같은 한도를 나눠 씀)
+    - shared_path가 있으면 토큰 상태를 파일에 두고 호스트의 모든 프로세스가 공유
+      (대기열 분배 태스크는 토큰을 하나씩 예약하므로 프로세스 간에도 도착 순서대로 배분)
+    """
 
     _instance = None
     _lock_class = None  # Class-level lock for singleton creation
 
-    def __new__(cls, max_requests: int = 20, window_seconds: float = 1.0):
+    PRIORITIES = ("high", "normal", "low")
+    WAIT_BUCKETS_MS = (0, 10, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __new__(
+        cls,
+        max_requests: int = 20,
+        window_seconds: float = 1.0,
+        burst: Optional[int] = None,
+        shared_path: Optional[str] = None,
+    ):
         """싱글톤 패턴 구현"""
         if cls._instance is None:
             logger.info("🔧 Creating NEW RateLimiter singleton instance")
@@ -36,11 +217,20 @@ class RateLimiter:
             logger.debug("♻️  Reusing existing RateLimiter singleton instance")
         return cls._instance
 
-    def __init__(self, max_requests: int = 20, window_seconds: float = 1.0):
+    def __init__(
+        self,
+        max_requests: int = 20,
+        window_seconds: float = 1.0,
+        burst: Optional[int] = None,
+        shared_path: Optional[str] = None,
+    ):
         """
         Args:
             max_requests: 시간 창 내 최대 요청 수
             window_seconds: 시간 창 (초)
+            burst: 최대 적립 토큰 수 (None이면 1, 순간적으로 몰아 보낼 수 있는 요청 수)
+            shared_path: 프로세스 간 공유 상태 파일 (None이면 settings.KIS_RATE_LIMIT_STATE_PATH,
+                빈 문자열이면 프로세스 내에서만 제한)
         """
         # 이미 초기화되었으면 스킵
         if self._initialized:
@@ -48,11 +238,50 @@ class RateLimiter:
 
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = []
-        self._lock = None  # Lazy initialization to avoid event loop binding issues
+        self.rate = max_requests / window_seconds  # 초당 토큰
+        self.burst = max(1, int(burst)) if burst is not None else 1
+
+        self.shared_path = settings.KIS_RATE_LIMIT_STATE_PATH if shared_path is None else shared_path
+        if self.shared_path and fcntl is None:
+            logger.warning("⚠️  fcntl을 사용할 수 없어 KIS rate limit을 프로세스 내에서만 적용합니다")
+            self.shared_path = ""
+
+        self._state_lock = threading.Lock()
+        self._bucket = (
+            _SharedTokenBucket(self.rate, self.burst, self.shared_path)
+            if self.shared_path
+            else _TokenBucket(self.rate, self.burst)
+        )
+        self._lanes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PriorityLanes]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._wait_stats = {priority: _WaitHistogram(self.WAIT_BUCKETS_MS) for priority in self.PRIORITIES}
         self._initialized = True
 
-        logger.info(f"🔒 GlobalRateLimiter 초기화: 초당 {max_requests}건 제한")
+        logger.info(
+            f"🔒 GlobalRateLimiter 초기화: 초당 {self.rate:g}건 제한 (burst {self.burst}, "
+            f"{'공유: ' + self.shared_path if self.shared_path else '프로세스 내'})"
+        )
+
+    def _take_token(self, reserve: bool = False) -> float:
+        """
+        토큰 1개 획득 시도
+
+        Args:
+            reserve: True면 토큰이 없어도 다음 토큰을 예약
+
+        Returns:
+            0.0이면 획득 성공, 아니면 다음 토큰까지 남은 시간 (초)
+        """
+        with self._state_lock:
+            return self._bucket.take(reserve=reserve)
+
+    def _lanes_for_loop(self, loop: asyncio.AbstractEventLoop) -> _PriorityLanes:
+        with self._state_lock:
+            lanes = self._lanes.get(loop)
+            if lanes is None:
+                lanes = self._lanes[loop] = _PriorityLanes(self.PRIORITIES)
+            return lanes
 
     async def acquire(self, priority: str = "normal"):
         """
@@ -61,63 +290,72 @@ class RateLimiter:
         Args:
             priority: 우선순위 ("high" = 사용자 요청, "normal" = 일반, "low" = 배치 작업)
         """
-        # Lazy initialization: Lock 생성 (event loop가 실행 중일 때만)
-        # 이벤트 루프가 변경되면 Lock 재생성 필요
-        try:
-            loop = asyncio.get_running_loop()
+        lane = priority if priority in self._wait_stats else "normal"
+        loop = asyncio.get_running_loop()
+        lanes = self._lanes_for_loop(loop)
+        started = time.monotonic()
+
+        # 대기자가 없고 토큰이 있으면 바로 통과
+        if not lanes.waiting() and self._take_token() == 0.0:
+            self._record_wait(lane, 0.0)
+            return
 
-            # Lock이 없거나, 다른 이벤트 루프에 바인딩된 경우 재생성
-            if self._lock is None:
-                self._lock = asyncio.Lock()
+        future = loop.create_future()
+        lanes.queues[lane].append(future)
+        if lanes.dispatcher is None:
+            lanes.dispatcher = loop.create_task(self._dispatch(lanes))
+        await future
+
+        waited = time.monotonic() - started
+        self._record_wait(lane, waited)
+        if waited >= self.window_seconds:
+            if lane == "high":
+                logger.warning(f"⚠️  Rate limit 대기 (우선순위: {lane}): {waited:.2f}초")
             else:
-                # Lock의 이벤트 루프 확인 (안전하게)
-                try:
-                    lock_loop = getattr(self._lock, '_loop', None)
-                    if lock_loop is not None and lock_loop is not loop:
-                        # 이벤트 루프가 변경되면 새로운 Lock 생성
-                        self._lock = asyncio.Lock()
-                except (AttributeError, RuntimeError):
-                    # 속성 접근 실패 시 재생성
-                    self._lock = asyncio.Lock()
-        except RuntimeError:
-            # 이벤트 루프가 없는 경우
-            self._lock = asyncio.Lock()
+                logger.debug(f"⏳ Rate limit 대기 (우선순위: {lane}): {waited:.2f}초")
 
-        async with self._lock:
-            now = time.time()
-
-            # 시간 창 밖의 요청 제거
-            self.requests = [
-                req_time for req_time in self.requests
-                if now - req_time < self.window_seconds
-            ]
-
-            current_count = len(self.requests)
-            logger.debug(f"🔢 Rate limiter state: {current_count}/{self.max_requests} requests in window (priority: {priority})")
-
-            # 제한 확인
-            if current_count >= self.max_requests:
-                # 가장 오래된 요청이 만료될 때까지 대기
-                oldest = self.requests[0]
-                wait_time = self.window_seconds - (now - oldest)
-
-                if wait_time > 0:
-                    # Priority에 따라 로그 레벨 조정
-                    if priority == "high":
-                        logger.warning(f"⚠️  Rate limit 대기 (우선순위: {priority}): {wait_time:.2f}초")
-                    else:
-                        logger.info(f"⏳ Rate limit 대기 (우선순위: {priority}): {wait_time:.2f}초")
-                    await asyncio.sleep(wait_time)
-
-                # 재확인
-                now = time.time()
-                self.requests = [
-                    req_time for req_time in self.requests
-                    if now - req_time < self.window_seconds
-                ]
+    async def _dispatch(self, lanes: _PriorityLanes):
+        """토큰이 생길 때마다 가장 높은 우선순위 대기자에게 전달 (대기열이 빌 때까지)"""
+        try:
+            while lanes.waiting():
+                # 다음 토큰을 하나만 예약 (다른 프로세스와는 예약 순서대로 나눔)
+                wait = self._take_token(reserve=True)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                # 대기 중 새로 들어온 high 요청도 여기서 먼저 선택됨
+                future = lanes.pop_next()
+                if future is None:
+                    break  # 대기자가 모두 취소됨 (예약한 토큰은 버림)
+                future.set_result(None)
+        finally:
+            lanes.dispatcher = None
+
+    def _record_wait(self, priority: str, waited_seconds: float):
+        with self._state_lock:
+            self._wait_stats[priority].observe(waited_seconds * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Rate limiter 통계
 
-            # 현재 요청 추가
-            self.requests.append(now)
+        Returns:
+            rate_per_second, burst, tokens, 우선순위별 queued(현재 대기 수)와 wait_ms(대기 시간 히스토그램)
+        """
+        with self._state_lock:
+            tokens = self._bucket.available()
+            queued = {priority: 0 for priority in self.PRIORITIES}
+            for lanes in list(self._lanes.values()):
+                for priority, queue in lanes.queues.items():
+                    queued[priority] += sum(1 for future in queue if not future.done())
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "shared_path": self.shared_path or None,
+                "tokens": round(tokens, 2),
+                "queued": queued,
+                "wait_ms": {priority: stats.to_dict() for priority, stats in self._wait_stats.items()},
+            }
 
 
 class TokenManager:
@@ -420,9 +658,72 @@ class TokenManager:
             raise
 
 
+def _consume_future_exception(future: asyncio.Future):
+    """기다리는 호출자가 없을 때 'exception was never retrieved' 경고 방지"""
+    if not future.cancelled():
+        future.exception()
+
+
+class _ResponseCache:
+    """GET 응답 TTL 캐시 (LRU, Thread-safe)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Dict[str, Any], ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _InFlight:
+    """진행 중인 요청 (같은 요청의 후속 호출자가 결과를 기다림)"""
+
+    __slots__ = ("future", "priority", "sent")
+
+    def __init__(self, future: asyncio.Future, priority: str):
+        self.future = future
+        self.priority = priority
+        self.sent = False  # Rate limit 통과 후 HTTP 요청을 보냈는지
+
+
 class KISClient:
     """KIS API Client"""
 
+    # 시장 단계별 응답 캐시 TTL (초, get_market_phase 기준 / 휴장일 장중 시간은 after_hours)
+    # 여기 없는 TR은 캐시하지 않고, 동시에 들어온 같은 요청만 합칩니다
+    RESPONSE_CACHE_TTL = {
+        # 현재가 (get_current_price, get_current_price_detailed)
+        "FHKST01010100": {"pre_market": 10, "market_open": 1, "trading": 2, "market_close": 1, "after_hours": 60},
+        # 호가 (get_orderbook)
+        "FHKST01010200": {"pre_market": 5, "market_open": 1, "trading": 1, "market_close": 1, "after_hours": 60},
+    }
+    MARKET_PHASE_REFRESH_SECONDS = 10.0
+    PRIORITY_RANK = {"high": 0, "normal": 1, "low": 2}
+
     def __init__(self):
         """KIS API Client 초기화"""
         # 설정
@@ -442,14 +743,23 @@ class KISClient:
         # Rate Limiter
         if self.mock_mode:
             # 모의투자: 초당 5건
-            self.rate_limiter = RateLimiter(max_requests=5, window_seconds=1.0)
+            self.rate_limiter = RateLimiter(max_requests=5, window_seconds=1.0, burst=settings.KIS_RATE_LIMIT_BURST)
         else:
             # 실전투자: 초당 20건
-            self.rate_limiter = RateLimiter(max_requests=20, window_seconds=1.0)
+            self.rate_limiter = RateLimiter(max_requests=20, window_seconds=1.0, burst=settings.KIS_RATE_LIMIT_BURST)
 
         # HTTP Client (재사용 가능한 연결 풀)
         self._client: Optional[httpx.AsyncClient] = None
 
+        # 동시 요청 합치기 + 짧은 TTL 응답 캐시 (GET만)
+        self.response_cache_enabled = settings.KIS_RESPONSE_CACHE_ENABLED
+        self.response_cache = _ResponseCache(settings.KIS_RESPONSE_CACHE_MAX_ENTRIES)
+        self._inflight: Dict[tuple, _InFlight] = {}
+        self._market_phase: Optional[str] = None
+        self._market_phase_expires = 0.0
+        self._stats_lock = threading.Lock()
+        self._request_stats: Dict[str, Dict[str, int]] = {}
+
         logger.info(
             f"KIS API Client 초기화 완료 "
             f"(모드: {'모의투자' if self.mock_mode else '실전투자'})"
@@ -503,8 +813,77 @@ class KISClient:
         Returns:
             API 응답 (JSON)
         """
+        if method.upper() != "GET" or data is not None:
+            return await self._send(method, endpoint, tr_id, params, data, max_retries, priority)
+
+        key = (endpoint, tr_id, tuple(sorted((params or {}).items())))
+        self._count(tr_id, "requests")
+
+        # 1. 짧은 TTL 캐시 (현재가/호가 등)
+        if self.response_cache_enabled:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._count(tr_id, "cache_hits")
+                return copy.deepcopy(cached)
+
+        # 2. 같은 요청이 진행 중이면 그 결과를 기다림
+        #    (진행 중인 요청이 더 낮은 우선순위로 아직 rate limit 대기 중이면 합치지 않음)
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        flight = self._inflight.get(flight_key)
+        if flight is not None and (
+            flight.sent or self._rank(priority) >= self._rank(flight.priority)
+        ):
+            try:
+                result = await asyncio.shield(flight.future)
+            except asyncio.CancelledError:
+                if not flight.future.cancelled():
+                    raise
+                # 먼저 보낸 호출자가 취소됨 → 직접 요청
+                return await self.request(method, endpoint, tr_id, params, data, max_retries, priority)
+            self._count(tr_id, "coalesced")
+            return copy.deepcopy(result)
+
+        # 3. 직접 요청 (후속 호출자가 기다릴 수 있도록 등록)
+        flight = _InFlight(loop.create_future(), priority)
+        flight.future.add_done_callback(_consume_future_exception)
+        self._inflight.setdefault(flight_key, flight)
+        try:
+            result = await self._send(method, endpoint, tr_id, params, data, max_retries, priority, flight)
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except Exception as e:
+            flight.future.set_exception(e)  # 실패는 캐시하지 않고 기다리던 호출자에게만 전달
+            raise
+        else:
+            # 호출자가 결과를 수정해도 캐시/후속 호출자에게 영향이 없도록 복사본 공유
+            snapshot = copy.deepcopy(result)
+            ttl = self._cache_ttl(tr_id)
+            if ttl > 0:
+                self.response_cache.put(key, snapshot, ttl)
+            flight.future.set_result(snapshot)
+            return result
+        finally:
+            if self._inflight.get(flight_key) is flight:
+                del self._inflight[flight_key]
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        tr_id: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        max_retries: int,
+        priority: str,
+        flight: Optional[_InFlight] = None,
+    ) -> Dict[str, Any]:
+        """실제 HTTP 요청 (Rate Limiting + 자동 재시도)"""
         # Rate Limiting (우선순위 적용)
         await self.rate_limiter.acquire(priority)
+        if flight is not None:
+            flight.sent = True
 
         # Access Token 획득
         access_token = await self.token_manager.get_access_token()
@@ -593,6 +972,53 @@ class KISClient:
 
         raise Exception("API 요청 실패 (최대 재시도 횟수 초과)")
 
+    def _rank(self, priority: str) -> int:
+        return self.PRIORITY_RANK.get(priority, self.PRIORITY_RANK["normal"])
+
+    def _cache_ttl(self, tr_id: str) -> float:
+        """현재 시장 단계의 응답 캐시 TTL (초, 0이면 캐시 안 함)"""
+        ttl_by_phase = self.RESPONSE_CACHE_TTL.get(tr_id)
+        if not ttl_by_phase or not self.response_cache_enabled:
+            return 0.0
+
+        now = time.monotonic()
+        if self._market_phase is None or now >= self._market_phase_expires:
+            phase = get_market_phase()
+            if phase in ("market_open", "trading", "market_close") and not is_market_open():
+                phase = "after_hours"  # 주말/공휴일
+            self._market_phase = phase
+            self._market_phase_expires = now + self.MARKET_PHASE_REFRESH_SECONDS
+        return ttl_by_phase.get(self._market_phase, 0.0)
+
+    def _count(self, tr_id: str, name: str):
+        with self._stats_lock:
+            stats = self._request_stats.setdefault(tr_id, {"requests": 0, "cache_hits": 0, "coalesced": 0})
+            stats[name] += 1
+
+    def get_request_stats(self) -> Dict[str, Any]:
+        """
+        GET 요청 합치기/캐시 통계
+
+        Returns:
+            requests(GET 호출 수), cache_hits, coalesced, saved(아낀 API 호출 수), TR별 통계
+        """
+        with self._stats_lock:
+            by_tr_id = {tr_id: dict(stats) for tr_id, stats in self._request_stats.items()}
+
+        requests = sum(stats["requests"] for stats in by_tr_id.values())
+        saved = sum(stats["cache_hits"] + stats["coalesced"] for stats in by_tr_id.values())
+        return {
+            "cache_enabled": self.response_cache_enabled,
+            "cached_entries": len(self.response_cache),
+            "market_phase": self._market_phase,
+            "requests": requests,
+            "cache_hits": sum(stats["cache_hits"] for stats in by_tr_id.values()),
+            "coalesced": sum(stats["coalesced"] for stats in by_tr_id.values()),
+            "saved": saved,
+            "saved_rate": round(saved / requests * 100, 2) if requests else 0.0,
+            "by_tr_id": by_tr_id,
+        }
+
     async def get_daily_prices(
         self,
         stock_code: str,
@@ -1385,6 +1811,26 @@ class KISClient:
         logger.info("KIS API Client 종료")
 
 
+def get_request_stats() -> Optional[Dict[str, Any]]:
+    """
+    KIS 요청 합치기/응답 캐시 통계
+
+    Returns:
+        KISClient.get_request_stats() 결과 (아직 생성되지 않았으면 None)
+    """
+    return _kis_client.get_request_stats() if _kis_client is not None else None
+
+
+def get_rate_limiter_stats() -> Optional[Dict[str, Any]]:
+    """
+    KIS Rate limiter 통계 (우선순위별 대기 시간 히스토그램 포함)
+
+    Returns:
+        RateLimiter.get_stats() 결과 (아직 생성되지 않았으면 None)
+    """
+    return RateLimiter._instance.get_stats() if RateLimiter._instance is not None else None
+
+
 # 싱글톤 인스턴스
 _kis_client: Optional[KISClient] = None
 
@@ -2,13 +2,15 @@
 KIS API 시장 데이터 수집기
 
 호가, 현재가, 투자자매매동향, 종목정보, 업종지수 데이터를 수집하여 DB에 저장합니다.
+장중 5분 주기 작업은 MarketSnapshotCollector가 현재가·호가·업종지수를 한 번에 수집합니다.
 """
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Awaitable, Callable, Tuple
 from datetime import datetime, timedelta
 
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 from backend.db.session import SessionLocal
 from backend.db.models.stock import Stock
 from backend.db.models.market_data import (
@@ -16,31 +18,141 @@ from backend.db.models.market_data import (
     StockCurrentPrice,
     InvestorTrading,
     SectorIndex,
+    StockMarketSnapshot,
 )
 from backend.crawlers.kis_client import get_kis_client
+from backend.crawlers.collector_executor import CollectorExecutor, SweepResult
 
 
 logger = logging.getLogger(__name__)
 
 
-class OrderbookCollector:
+def build_orderbook_row(stock_code: str, data: Dict[str, Any], at: datetime) -> Dict[str, Any]:
+    """호가 API output1 → stock_orderbook 행"""
+    return {
+        "stock_code": stock_code,
+        "datetime": at,
+        # 매도 호가
+        "askp1": float(data.get("askp1", 0) or 0),
+        "askp2": float(data.get("askp2", 0) or 0),
+        "askp3": float(data.get("askp3", 0) or 0),
+        "askp4": float(data.get("askp4", 0) or 0),
+        "askp5": float(data.get("askp5", 0) or 0),
+        "askp6": float(data.get("askp6", 0) or 0),
+        "askp7": float(data.get("askp7", 0) or 0),
+        "askp8": float(data.get("askp8", 0) or 0),
+        "askp9": float(data.get("askp9", 0) or 0),
+        "askp10": float(data.get("askp10", 0) or 0),
+        # 매도 호가 잔량
+        "askp_rsqn1": int(data.get("askp_rsqn1", 0) or 0),
+        "askp_rsqn2": int(data.get("askp_rsqn2", 0) or 0),
+        "askp_rsqn3": int(data.get("askp_rsqn3", 0) or 0),
+        "askp_rsqn4": int(data.get("askp_rsqn4", 0) or 0),
+        "askp_rsqn5": int(data.get("askp_rsqn5", 0) or 0),
+        "askp_rsqn6": int(data.get("askp_rsqn6", 0) or 0),
+        "askp_rsqn7": int(data.get("askp_rsqn7", 0) or 0),
+        "askp_rsqn8": int(data.get("askp_rsqn8", 0) or 0),
+        "askp_rsqn9": int(data.get("askp_rsqn9", 0) or 0),
+        "askp_rsqn10": int(data.get("askp_rsqn10", 0) or 0),
+        # 매수 호가
+        "bidp1": float(data.get("bidp1", 0) or 0),
+        "bidp2": float(data.get("bidp2", 0) or 0),
+        "bidp3": float(data.get("bidp3", 0) or 0),
+        "bidp4": float(data.get("bidp4", 0) or 0),
+        "bidp5": float(data.get("bidp5", 0) or 0),
+        "bidp6": float(data.get("bidp6", 0) or 0),
+        "bidp7": float(data.get("bidp7", 0) or 0),
+        "bidp8": float(data.get("bidp8", 0) or 0),
+        "bidp9": float(data.get("bidp9", 0) or 0),
+        "bidp10": float(data.get("bidp10", 0) or 0),
+        # 매수 호가 잔량
+        "bidp_rsqn1": int(data.get("bidp_rsqn1", 0) or 0),
+        "bidp_rsqn2": int(data.get("bidp_rsqn2", 0) or 0),
+        "bidp_rsqn3": int(data.get("bidp_rsqn3", 0) or 0),
+        "bidp_rsqn4": int(data.get("bidp_rsqn4", 0) or 0),
+        "bidp_rsqn5": int(data.get("bidp_rsqn5", 0) or 0),
+        "bidp_rsqn6": int(data.get("bidp_rsqn6", 0) or 0),
+        "bidp_rsqn7": int(data.get("bidp_rsqn7", 0) or 0),
+        "bidp_rsqn8": int(data.get("bidp_rsqn8", 0) or 0),
+        "bidp_rsqn9": int(data.get("bidp_rsqn9", 0) or 0),
+        "bidp_rsqn10": int(data.get("bidp_rsqn10", 0) or 0),
+        # 총 호가 잔량
+        "total_askp_rsqn": int(data.get("total_askp_rsqn", 0) or 0),
+        "total_bidp_rsqn": int(data.get("total_bidp_rsqn", 0) or 0),
+    }
+
+
+def build_current_price_row(stock_code: str, data: Dict[str, Any], at: datetime) -> Dict[str, Any]:
+    """현재가 API output → stock_current_price 행"""
+    return {
+        "stock_code": stock_code,
+        "datetime": at,
+        "stck_prpr": float(data.get("stck_prpr", 0) or 0),
+        "prdy_vrss": float(data.get("prdy_vrss", 0) or 0),
+        "prdy_vrss_sign": data.get("prdy_vrss_sign"),
+        "prdy_ctrt": float(data.get("prdy_ctrt", 0) or 0),
+        "acml_vol": int(data.get("acml_vol", 0) or 0),
+        "acml_tr_pbmn": int(data.get("acml_tr_pbmn", 0) or 0),
+        "per": float(data.get("per", 0) or 0) if data.get("per") else None,
+        "pbr": float(data.get("pbr", 0) or 0) if data.get("pbr") else None,
+        "eps": float(data.get("eps", 0) or 0) if data.get("eps") else None,
+        "bps": float(data.get("bps", 0) or 0) if data.get("bps") else None,
+        "hts_avls": int(data.get("hts_avls", 0) or 0) if data.get("hts_avls") else None,
+    }
+
+
+def build_sector_index_row(sector_code: str, data: Dict[str, Any], at: datetime) -> Dict[str, Any]:
+    """업종 지수 API output → sector_index 행"""
+    return {
+        "sector_code": sector_code,
+        "datetime": at,
+        "bstp_nmix_prpr": float(data.get("bstp_nmix_prpr", 0) or 0),
+        "bstp_nmix_prdy_vrss": float(data.get("bstp_nmix_prdy_vrss", 0) or 0),
+        "bstp_nmix_prdy_ctrt": float(data.get("bstp_nmix_prdy_ctrt", 0) or 0),
+        "acml_vol": int(data.get("acml_vol", 0) or 0) if data.get("acml_vol") else None,
+        "acml_tr_pbmn": int(data.get("acml_tr_pbmn", 0) or 0) if data.get("acml_tr_pbmn") else None,
+    }
+
+
+class _SweepMixin:
+    """작업 큐 실행기로 전체 종목을 순회하는 공통 로직"""
+
+    async def _run_sweep(
+        self,
+        name: str,
+        codes: List[str],
+        task: Callable[[str], Awaitable[Dict[str, Any]]],
+    ) -> SweepResult:
+        """
+        executor로 전체 순회 후 last_sweep 갱신
+
+        collect_* 메서드는 실패할 때마다 failed_count를 올리므로,
+        재시도 끝에 처리된 종목은 실패 건수에서 다시 뺍니다.
+        """
+        self.last_sweep = await self.executor.run(name, codes, task)
+        self.failed_count -= self.last_sweep.retried
+        return self.last_sweep
+
+
+class OrderbookCollector(_SweepMixin):
     """호가 데이터 수집기"""
 
-    def __init__(self, batch_size: int = 10, max_concurrent: int = 5):
+    def __init__(self, batch_size: int = 10, max_concurrent: Optional[int] = None):
         """
         Args:
-            batch_size: 배치 크기 (한 번에 처리할 종목 수)
-            max_concurrent: 최대 동시 API 호출 수
+            batch_size: 하위 호환용 (작업 큐 방식에서는 사용하지 않음)
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
         """
         self.batch_size = batch_size
-        self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.executor = CollectorExecutor(workers=max_concurrent)
+        self.max_concurrent = self.executor.workers
         self.collected_count = 0
         self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
 
     async def collect_orderbook(self, stock_code: str) -> Dict[str, Any]:
         """
-        단일 종목의 호가 데이터 수집 (Semaphore로 동시 실행 제한)
+        단일 종목의 호가 데이터 수집
 
         Args:
             stock_code: 종목 코드
@@ -48,94 +160,43 @@ class OrderbookCollector:
         Returns:
             수집 결과 딕셔너리
         """
-        async with self.semaphore:
-            try:
-                client = await get_kis_client()
-                result = await client.get_orderbook(stock_code=stock_code, priority="low")
-
-                output1 = result.get("output1", {})
-                if not output1:
-                    logger.warning(f"⚠️  {stock_code}: 호가 데이터 없음")
-                    return {
-                        "stock_code": stock_code,
-                        "status": "skipped",
-                        "error": "No data"
-                    }
-
-                # DB 저장
-                await self._save_to_db(stock_code, output1)
-                self.collected_count += 1
-                logger.info(f"✅ {stock_code}: 호가 저장 완료")
+        try:
+            client = await get_kis_client()
+            result = await client.get_orderbook(stock_code=stock_code, priority="low")
 
+            output1 = result.get("output1", {})
+            if not output1:
+                logger.warning(f"⚠️  {stock_code}: 호가 데이터 없음")
                 return {
                     "stock_code": stock_code,
-                    "status": "success"
+                    "status": "skipped",
+                    "error": "No data"
                 }
 
-            except Exception as e:
-                self.failed_count += 1
-                logger.error(f"❌ {stock_code}: 호가 수집 실패 - {e}")
-                return {
-                    "stock_code": stock_code,
-                    "status": "failed",
-                    "error": str(e)
-                }
+            # DB 저장
+            await self._save_to_db(stock_code, output1)
+            self.collected_count += 1
+            logger.info(f"✅ {stock_code}: 호가 저장 완료")
+
+            return {
+                "stock_code": stock_code,
+                "status": "success"
+            }
+
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"❌ {stock_code}: 호가 수집 실패 - {e}")
+            return {
+                "stock_code": stock_code,
+                "status": "failed",
+                "error": str(e)
+            }
 
     async def _save_to_db(self, stock_code: str, data: Dict[str, Any]) -> None:
         """호가 데이터를 DB에 저장"""
         db = SessionLocal()
         try:
-            orderbook = StockOrderbook(
-                stock_code=stock_code,
-                datetime=datetime.now(),
-                # 매도 호가
-                askp1=float(data.get("askp1", 0) or 0),
-                askp2=float(data.get("askp2", 0) or 0),
-                askp3=float(data.get("askp3", 0) or 0),
-                askp4=float(data.get("askp4", 0) or 0),
-                askp5=float(data.get("askp5", 0) or 0),
-                askp6=float(data.get("askp6", 0) or 0),
-                askp7=float(data.get("askp7", 0) or 0),
-                askp8=float(data.get("askp8", 0) or 0),
-                askp9=float(data.get("askp9", 0) or 0),
-                askp10=float(data.get("askp10", 0) or 0),
-                # 매도 호가 잔량
-                askp_rsqn1=int(data.get("askp_rsqn1", 0) or 0),
-                askp_rsqn2=int(data.get("askp_rsqn2", 0) or 0),
-                askp_rsqn3=int(data.get("askp_rsqn3", 0) or 0),
-                askp_rsqn4=int(data.get("askp_rsqn4", 0) or 0),
-                askp_rsqn5=int(data.get("askp_rsqn5", 0) or 0),
-                askp_rsqn6=int(data.get("askp_rsqn6", 0) or 0),
-                askp_rsqn7=int(data.get("askp_rsqn7", 0) or 0),
-                askp_rsqn8=int(data.get("askp_rsqn8", 0) or 0),
-                askp_rsqn9=int(data.get("askp_rsqn9", 0) or 0),
-                askp_rsqn10=int(data.get("askp_rsqn10", 0) or 0),
-                # 매수 호가
-                bidp1=float(data.get("bidp1", 0) or 0),
-                bidp2=float(data.get("bidp2", 0) or 0),
-                bidp3=float(data.get("bidp3", 0) or 0),
-                bidp4=float(data.get("bidp4", 0) or 0),
-                bidp5=float(data.get("bidp5", 0) or 0),
-                bidp6=float(data.get("bidp6", 0) or 0),
-                bidp7=float(data.get("bidp7", 0) or 0),
-                bidp8=float(data.get("bidp8", 0) or 0),
-                bidp9=float(data.get("bidp9", 0) or 0),
-                bidp10=float(data.get("bidp10", 0) or 0),
-                # 매수 호가 잔량
-                bidp_rsqn1=int(data.get("bidp_rsqn1", 0) or 0),
-                bidp_rsqn2=int(data.get("bidp_rsqn2", 0) or 0),
-                bidp_rsqn3=int(data.get("bidp_rsqn3", 0) or 0),
-                bidp_rsqn4=int(data.get("bidp_rsqn4", 0) or 0),
-                bidp_rsqn5=int(data.get("bidp_rsqn5", 0) or 0),
-                bidp_rsqn6=int(data.get("bidp_rsqn6", 0) or 0),
-                bidp_rsqn7=int(data.get("bidp_rsqn7", 0) or 0),
-                bidp_rsqn8=int(data.get("bidp_rsqn8", 0) or 0),
-                bidp_rsqn9=int(data.get("bidp_rsqn9", 0) or 0),
-                bidp_rsqn10=int(data.get("bidp_rsqn10", 0) or 0),
-                # 총 호가 잔량
-                total_askp_rsqn=int(data.get("total_askp_rsqn", 0) or 0),
-                total_bidp_rsqn=int(data.get("total_bidp_rsqn", 0) or 0),
-            )
+            orderbook = StockOrderbook(**build_orderbook_row(stock_code, data, datetime.now()))
             db.add(orderbook)
             db.commit()
         except Exception as e:
@@ -163,14 +224,8 @@ class OrderbookCollector:
 
             logger.info(f"🎯 호가 수집 시작: {len(stock_codes)}개 종목")
 
-            # 배치 단위로 수집
-            for i in range(0, len(stock_codes), self.batch_size):
-                batch = stock_codes[i:i + self.batch_size]
-                tasks = [self.collect_orderbook(code) for code in batch]
-                await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Rate limiting
-                await asyncio.sleep(0.5)
+            # 작업 큐로 수집 (속도는 KIS RateLimiter가 조절)
+            await self._run_sweep("orderbook", stock_codes, self.collect_orderbook)
 
             logger.info(
                 f"📊 호가 수집 완료: "
@@ -180,81 +235,69 @@ class OrderbookCollector:
 
             return {
                 "collected": self.collected_count,
-                "failed": self.failed_count
+                "failed": self.failed_count,
+                "retried": self.last_sweep.retried,
+                "elapsed_seconds": round(self.last_sweep.elapsed_seconds, 3),
             }
 
         finally:
             db.close()
 
 
-class CurrentPriceCollector:
+class CurrentPriceCollector(_SweepMixin):
     """현재가 데이터 수집기"""
 
-    def __init__(self, batch_size: int = 10, max_concurrent: int = 5):
+    def __init__(self, batch_size: int = 10, max_concurrent: Optional[int] = None):
         """
         Args:
-            batch_size: 배치 크기 (한 번에 처리할 종목 수)
-            max_concurrent: 최대 동시 API 호출 수
+            batch_size: 하위 호환용 (작업 큐 방식에서는 사용하지 않음)
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
         """
         self.batch_size = batch_size
-        self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.executor = CollectorExecutor(workers=max_concurrent)
+        self.max_concurrent = self.executor.workers
         self.collected_count = 0
         self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
 
     async def collect_current_price(self, stock_code: str) -> Dict[str, Any]:
-        """단일 종목의 현재가 데이터 수집 (Semaphore로 동시 실행 제한)"""
-        async with self.semaphore:
-            try:
-                client = await get_kis_client()
-                result = await client.get_current_price(stock_code=stock_code, priority="low")
-
-                output = result.get("output", {})
-                if not output:
-                    logger.warning(f"⚠️  {stock_code}: 현재가 데이터 없음")
-                    return {
-                        "stock_code": stock_code,
-                        "status": "skipped",
-                        "error": "No data"
-                    }
-
-                await self._save_to_db(stock_code, output)
-                self.collected_count += 1
-                logger.info(f"✅ {stock_code}: 현재가 저장 완료")
+        """단일 종목의 현재가 데이터 수집"""
+        try:
+            client = await get_kis_client()
+            result = await client.get_current_price(stock_code=stock_code, priority="low")
 
+            output = result.get("output", {})
+            if not output:
+                logger.warning(f"⚠️  {stock_code}: 현재가 데이터 없음")
                 return {
                     "stock_code": stock_code,
-                    "status": "success"
+                    "status": "skipped",
+                    "error": "No data"
                 }
 
-            except Exception as e:
-                self.failed_count += 1
-                logger.error(f"❌ {stock_code}: 현재가 수집 실패 - {e}")
-                return {
-                    "stock_code": stock_code,
-                    "status": "failed",
-                    "error": str(e)
-                }
+            await self._save_to_db(stock_code, output)
+            self.collected_count += 1
+            logger.info(f"✅ {stock_code}: 현재가 저장 완료")
+
+            return {
+                "stock_code": stock_code,
+                "status": "success"
+            }
+
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"❌ {stock_code}: 현재가 수집 실패 - {e}")
+            return {
+                "stock_code": stock_code,
+                "status": "failed",
+                "error": str(e)
+            }
 
     async def _save_to_db(self, stock_code: str, data: Dict[str, Any]) -> None:
         """현재가 데이터를 DB에 저장"""
         db = SessionLocal()
         try:
-            current_price = StockCurrentPrice(
-                stock_code=stock_code,
-                datetime=datetime.now(),
-                stck_prpr=float(data.get("stck_prpr", 0) or 0),
-                prdy_vrss=float(data.get("prdy_vrss", 0) or 0),
-                prdy_vrss_sign=data.get("prdy_vrss_sign"),
-                prdy_ctrt=float(data.get("prdy_ctrt", 0) or 0),
-                acml_vol=int(data.get("acml_vol", 0) or 0),
-                acml_tr_pbmn=int(data.get("acml_tr_pbmn", 0) or 0),
-                per=float(data.get("per", 0) or 0) if data.get("per") else None,
-                pbr=float(data.get("pbr", 0) or 0) if data.get("pbr") else None,
-                eps=float(data.get("eps", 0) or 0) if data.get("eps") else None,
-                bps=float(data.get("bps", 0) or 0) if data.get("bps") else None,
-                hts_avls=int(data.get("hts_avls", 0) or 0) if data.get("hts_avls") else None,
-            )
+            current_price = StockCurrentPrice(**build_current_price_row(stock_code, data, datetime.now()))
             db.add(current_price)
             db.commit()
         except Exception as e:
@@ -274,11 +317,7 @@ class CurrentPriceCollector:
 
             logger.info(f"🎯 현재가 수집 시작: {len(stock_codes)}개 종목")
 
-            for i in range(0, len(stock_codes), self.batch_size):
-                batch = stock_codes[i:i + self.batch_size]
-                tasks = [self.collect_current_price(code) for code in batch]
-                await asyncio.gather(*tasks, return_exceptions=True)
-                await asyncio.sleep(0.5)
+            await self._run_sweep("current_price", stock_codes, self.collect_current_price)
 
             logger.info(
                 f"📊 현재가 수집 완료: "
@@ -288,27 +327,30 @@ class CurrentPriceCollector:
 
             return {
                 "collected": self.collected_count,
-                "failed": self.failed_count
+                "failed": self.failed_count,
+                "retried": self.last_sweep.retried,
+                "elapsed_seconds": round(self.last_sweep.elapsed_seconds, 3),
             }
 
         finally:
             db.close()
 
 
-class InvestorTradingCollector:
+class InvestorTradingCollector(_SweepMixin):
     """투자자별 매매동향 수집기"""
 
-    def __init__(self, batch_size: int = 5, max_concurrent: int = 5):
+    def __init__(self, batch_size: int = 5, max_concurrent: Optional[int] = None):
         """
         Args:
-            batch_size: 배치 크기 (한 번에 처리할 종목 수)
-            max_concurrent: 최대 동시 API 호출 수
+            batch_size: 하위 호환용 (작업 큐 방식에서는 사용하지 않음)
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
         """
         self.batch_size = batch_size
-        self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.executor = CollectorExecutor(workers=max_concurrent)
+        self.max_concurrent = self.executor.workers
         self.collected_count = 0
         self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
 
     async def collect_investor_trading(
         self,
@@ -316,44 +358,43 @@ class InvestorTradingCollector:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
     ) -> Dict[str, Any]:
-        """단일 종목의 투자자별 매매동향 수집 (Semaphore로 동시 실행 제한)"""
-        async with self.semaphore:
-            try:
-                client = await get_kis_client()
-                result = await client.get_investor_trading(
-                    priority="low",
-                    stock_code=stock_code,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-
-                output = result.get("output", [])
-                if not output:
-                    logger.warning(f"⚠️  {stock_code}: 투자자 데이터 없음")
-                    return {
-                        "stock_code": stock_code,
-                        "status": "skipped",
-                        "error": "No data"
-                    }
-
-                saved = await self._save_to_db(stock_code, output)
-                self.collected_count += saved
-                logger.info(f"✅ {stock_code}: 투자자 데이터 {saved}건 저장")
+        """단일 종목의 투자자별 매매동향 수집"""
+        try:
+            client = await get_kis_client()
+            result = await client.get_investor_trading(
+                priority="low",
+                stock_code=stock_code,
+                start_date=start_date,
+                end_date=end_date
+            )
 
+            output = result.get("output", [])
+            if not output:
+                logger.warning(f"⚠️  {stock_code}: 투자자 데이터 없음")
                 return {
                     "stock_code": stock_code,
-                    "status": "success",
-                    "saved": saved
+                    "status": "skipped",
+                    "error": "No data"
                 }
 
-            except Exception as e:
-                self.failed_count += 1
-                logger.error(f"❌ {stock_code}: 투자자 데이터 수집 실패 - {e}")
-                return {
-                    "stock_code": stock_code,
-                    "status": "failed",
-                    "error": str(e)
-                }
+            saved = await self._save_to_db(stock_code, output)
+            self.collected_count += saved
+            logger.info(f"✅ {stock_code}: 투자자 데이터 {saved}건 저장")
+
+            return {
+                "stock_code": stock_code,
+                "status": "success",
+                "saved": saved
+            }
+
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"❌ {stock_code}: 투자자 데이터 수집 실패 - {e}")
+            return {
+                "stock_code": stock_code,
+                "status": "failed",
+                "error": str(e)
+            }
 
     async def _save_to_db(self, stock_code: str, data: List[Dict[str, Any]]) -> int:
         """투자자별 매매동향을 DB에 저장"""
@@ -420,14 +461,11 @@ class InvestorTradingCollector:
                 f"({start_date} ~ {end_date})"
             )
 
-            for i in range(0, len(stock_codes), self.batch_size):
-                batch = stock_codes[i:i + self.batch_size]
-                tasks = [
-                    self.collect_investor_trading(code, start_date, end_date)
-                    for code in batch
-                ]
-                await asyncio.gather(*tasks, return_exceptions=True)
-                await asyncio.sleep(1.0)  # More conservative rate limiting
+            await self._run_sweep(
+                "investor_trading",
+                stock_codes,
+                lambda code: self.collect_investor_trading(code, start_date, end_date),
+            )
 
             logger.info(
                 f"📊 투자자 매매동향 수집 완료: "
@@ -437,14 +475,16 @@ class InvestorTradingCollector:
 
             return {
                 "collected": self.collected_count,
-                "failed": self.failed_count
+                "failed": self.failed_count,
+                "retried": self.last_sweep.retried,
+                "elapsed_seconds": round(self.last_sweep.elapsed_seconds, 3),
             }
 
         finally:
             db.close()
 
 
-class SectorIndexCollector:
+class SectorIndexCollector(_SweepMixin):
     """업종 지수 수집기"""
 
     # 주요 업종 코드 매핑
@@ -463,9 +503,15 @@ class SectorIndexCollector:
         "0059": "KOSPI 건설",
     }
 
-    def __init__(self):
+    def __init__(self, max_concurrent: Optional[int] = None):
+        """
+        Args:
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
+        """
+        self.executor = CollectorExecutor(workers=max_concurrent)
         self.collected_count = 0
         self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
 
     async def collect_sector_index(self, sector_code: str) -> Dict[str, Any]:
         """단일 업종 지수 수집"""
@@ -506,15 +552,7 @@ class SectorIndexCollector:
         """업종 지수 데이터를 DB에 저장"""
         db = SessionLocal()
         try:
-            sector_index = SectorIndex(
-                sector_code=sector_code,
-                datetime=datetime.now(),
-                bstp_nmix_prpr=float(data.get("bstp_nmix_prpr", 0) or 0),
-                bstp_nmix_prdy_vrss=float(data.get("bstp_nmix_prdy_vrss", 0) or 0),
-                bstp_nmix_prdy_ctrt=float(data.get("bstp_nmix_prdy_ctrt", 0) or 0),
-                acml_vol=int(data.get("acml_vol", 0) or 0) if data.get("acml_vol") else None,
-                acml_tr_pbmn=int(data.get("acml_tr_pbmn", 0) or 0) if data.get("acml_tr_pbmn") else None,
-            )
+            sector_index = SectorIndex(**build_sector_index_row(sector_code, data, datetime.now()))
             db.add(sector_index)
             db.commit()
         except Exception as e:
@@ -528,10 +566,7 @@ class SectorIndexCollector:
         """전체 업종 지수 수집"""
         logger.info(f"🎯 업종 지수 수집 시작: {len(self.SECTOR_CODES)}개 업종")
 
-        # 순차적으로 수집 (rate limiting 고려)
-        for sector_code in self.SECTOR_CODES.keys():
-            await self.collect_sector_index(sector_code)
-            await asyncio.sleep(0.5)  # Rate limiting
+        await self._run_sweep("sector_index", list(self.SECTOR_CODES.keys()), self.collect_sector_index)
 
         logger.info(
             f"📊 업종 지수 수집 완료: "
@@ -541,63 +576,65 @@ class SectorIndexCollector:
 
         return {
             "collected": self.collected_count,
-            "failed": self.failed_count
+            "failed": self.failed_count,
+            "retried": self.last_sweep.retried,
+            "elapsed_seconds": round(self.last_sweep.elapsed_seconds, 3),
         }
 
 
-class OvertimePriceCollector:
+class OvertimePriceCollector(_SweepMixin):
     """시간외 거래 가격 수집기"""
 
-    def __init__(self, batch_size: int = 10, max_concurrent: int = 5):
+    def __init__(self, batch_size: int = 10, max_concurrent: Optional[int] = None):
         """
         Args:
-            batch_size: 배치 크기 (한 번에 처리할 종목 수)
-            max_concurrent: 최대 동시 API 호출 수
+            batch_size: 하위 호환용 (작업 큐 방식에서는 사용하지 않음)
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
         """
         self.batch_size = batch_size
-        self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.executor = CollectorExecutor(workers=max_concurrent)
+        self.max_concurrent = self.executor.workers
         self.collected_count = 0
         self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
 
     async def collect_overtime_prices(self, stock_code: str) -> Dict[str, Any]:
-        """단일 종목의 시간외 거래 가격 수집 (과거 30일, Semaphore로 동시 실행 제한)"""
-        async with self.semaphore:
-            try:
-                client = await get_kis_client()
-                result = await client.get_overtime_daily_prices(stock_code=stock_code, priority="low")
-
-                # output2에 일자별 데이터 있음
-                output2 = result.get("output2", [])
-                if not output2:
-                    logger.warning(f"⚠️  {stock_code}: 시간외 거래 데이터 없음")
-                    return {
-                        "stock_code": stock_code,
-                        "status": "skipped",
-                        "saved": 0,
-                        "error": "No data"
-                    }
-
-                saved_count = await self._save_to_db(stock_code, output2)
-                self.collected_count += 1
-                logger.info(f"✅ {stock_code}: 시간외 거래 데이터 {saved_count}건 저장")
-
-                return {
-                    "stock_code": stock_code,
-                    "status": "success",
-                    "saved": saved_count
-                }
+        """단일 종목의 시간외 거래 가격 수집 (과거 30일)"""
+        try:
+            client = await get_kis_client()
+            result = await client.get_overtime_daily_prices(stock_code=stock_code, priority="low")
 
-            except Exception as e:
-                self.failed_count += 1
-                logger.error(f"❌ {stock_code}: 시간외 거래 데이터 수집 실패 - {e}")
+            # output2에 일자별 데이터 있음
+            output2 = result.get("output2", [])
+            if not output2:
+                logger.warning(f"⚠️  {stock_code}: 시간외 거래 데이터 없음")
                 return {
                     "stock_code": stock_code,
-                    "status": "failed",
+                    "status": "skipped",
                     "saved": 0,
-                    "error": str(e)
+                    "error": "No data"
                 }
 
+            saved_count = await self._save_to_db(stock_code, output2)
+            self.collected_count += 1
+            logger.info(f"✅ {stock_code}: 시간외 거래 데이터 {saved_count}건 저장")
+
+            return {
+                "stock_code": stock_code,
+                "status": "success",
+                "saved": saved_count
+            }
+
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"❌ {stock_code}: 시간외 거래 데이터 수집 실패 - {e}")
+            return {
+                "stock_code": stock_code,
+                "status": "failed",
+                "saved": 0,
+                "error": str(e)
+            }
+
     async def _save_to_db(self, stock_code: str, data: List[Dict[str, Any]]) -> int:
         """시간외 거래 데이터를 DB에 저장 (일자별)"""
         from backend.db.models.market_data import StockOvertimePrice
@@ -667,12 +704,7 @@ class OvertimePriceCollector:
 
             logger.info(f"🎯 시간외 거래 데이터 수집 시작: {len(stock_codes)}개 종목")
 
-            # 배치 처리
-            for i in range(0, len(stock_codes), self.batch_size):
-                batch = stock_codes[i:i + self.batch_size]
-                tasks = [self.collect_overtime_prices(code) for code in batch]
-                await asyncio.gather(*tasks, return_exceptions=True)
-                await asyncio.sleep(0.5)  # Rate limiting
+            await self._run_sweep("overtime_price", stock_codes, self.collect_overtime_prices)
 
             logger.info(
                 f"📊 시간외 거래 데이터 수집 완료: "
@@ -682,8 +714,184 @@ class OvertimePriceCollector:
 
             return {
                 "collected": self.collected_count,
-                "failed": self.failed_count
+                "failed": self.failed_count,
+                "retried": self.last_sweep.retried,
+                "elapsed_seconds": round(self.last_sweep.elapsed_seconds, 3),
             }
 
         finally:
             db.close()
+
+
+class MarketSnapshotCollector(_SweepMixin):
+    """
+    시장 스냅샷 수집기 (현재가 + 호가 + 업종 지수)
+
+    종목마다 현재가와 호가를 함께 조회하고, 순회가 끝나면 이력 행(stock_current_price,
+    stock_orderbook, sector_index)과 종목별 최신 스냅샷(stock_market_snapshot)을
+    한 트랜잭션으로 저장합니다. 같은 순회의 모든 행은 같은 스냅샷 시각을 가집니다.
+    """
+
+    # stock_market_snapshot에 남길 호가 요약 컬럼
+    ORDERBOOK_SUMMARY_FIELDS = (
+        "askp1", "bidp1", "askp_rsqn1", "bidp_rsqn1", "total_askp_rsqn", "total_bidp_rsqn",
+    )
+
+    def __init__(self, max_concurrent: Optional[int] = None, sector_codes: Optional[List[str]] = None):
+        """
+        Args:
+            max_concurrent: 동시 워커 수 (None이면 settings.KIS_COLLECTOR_WORKERS)
+            sector_codes: 수집할 업종 코드 (None이면 SectorIndexCollector.SECTOR_CODES 전체)
+        """
+        self.executor = CollectorExecutor(workers=max_concurrent)
+        self.sector_codes = list(SectorIndexCollector.SECTOR_CODES) if sector_codes is None else sector_codes
+        self.collected_count = 0
+        self.failed_count = 0
+        self.last_sweep: Optional[SweepResult] = None
+        self._stock_outputs: Dict[str, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = {}
+        self._sector_outputs: Dict[str, Dict[str, Any]] = {}
+
+    async def collect_stock(self, stock_code: str) -> Dict[str, Any]:
+        """단일 종목의 현재가 + 호가 조회 (저장은 순회 끝에 한 번에)"""
+        try:
+            client = await get_kis_client()
+            results = await asyncio.gather(
+                client.get_current_price(stock_code=stock_code, priority="low"),
+                client.get_orderbook(stock_code=stock_code, priority="low"),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            results = [e]
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.failed_count += 1
+            logger.warning(f"⚠️  {stock_code}: 스냅샷 조회 실패 - {errors[0]}")
+            return {"stock_code": stock_code, "status": "failed", "error": str(errors[0])}
+
+        price_output = results[0].get("output", {})
+        orderbook_output = results[1].get("output1", {})
+        if not price_output:
+            logger.warning(f"⚠️  {stock_code}: 스냅샷 데이터 없음")
+            return {"stock_code": stock_code, "status": "skipped", "error": "No data"}
+        if not orderbook_output:
+            # 호가만 비어 있으면 현재가는 저장하고 호가 요약 컬럼은 NULL로 둠
+            logger.warning(f"⚠️  {stock_code}: 호가 데이터 없음 (현재가만 저장)")
+            orderbook_output = None
+
+        self._stock_outputs[stock_code] = (price_output, orderbook_output)
+        return {"stock_code": stock_code, "status": "success"}
+
+    async def collect_sector(self, sector_code: str) -> Dict[str, Any]:
+        """단일 업종 지수 조회 (저장은 순회 끝에 한 번에)"""
+        try:
+            client = await get_kis_client()
+            result = await client.get_sector_index(sector_code=sector_code, priority="low")
+        except Exception as e:
+            logger.warning(f"⚠️  {sector_code}: 업종 지수 조회 실패 - {e}")
+            return {"sector_code": sector_code, "status": "failed", "error": str(e)}
+
+        output = result.get("output", {})
+        if not output:
+            return {"sector_code": sector_code, "status": "skipped", "error": "No data"}
+
+        self._sector_outputs[sector_code] = output
+        return {"sector_code": sector_code, "status": "success"}
+
+    def build_records(self, snapshot_at: datetime) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        수집한 응답으로 스냅샷 레코드 세트 생성
+
+        Returns:
+            {"current_price": [...], "orderbook": [...], "sector_index": [...], "snapshot": [...]}
+        """
+        records = {"current_price": [], "orderbook": [], "sector_index": [], "snapshot": []}
+
+        for stock_code, (price_output, orderbook_output) in self._stock_outputs.items():
+            price_row = build_current_price_row(stock_code, price_output, snapshot_at)
+            records["current_price"].append(price_row)
+
+            snapshot_row = {key: value for key, value in price_row.items() if key != "datetime"}
+            if orderbook_output is None:
+                snapshot_row.update({field: None for field in self.ORDERBOOK_SUMMARY_FIELDS})
+            else:
+                orderbook_row = build_orderbook_row(stock_code, orderbook_output, snapshot_at)
+                records["orderbook"].append(orderbook_row)
+                snapshot_row.update({field: orderbook_row[field] for field in self.ORDERBOOK_SUMMARY_FIELDS})
+            snapshot_row["snapshot_at"] = snapshot_at
+            snapshot_row["updated_at"] = datetime.now()
+            records["snapshot"].append(snapshot_row)
+
+        for sector_code, output in self._sector_outputs.items():
+            records["sector_index"].append(build_sector_index_row(sector_code, output, snapshot_at))
+
+        return records
+
+    def _write_records(self, records: Dict[str, List[Dict[str, Any]]]) -> None:
+        """레코드 세트를 한 트랜잭션으로 저장 (이력은 다중 행 INSERT, 최신 스냅샷은 UPSERT)"""
+        db = SessionLocal()
+        try:
+            for model, key in (
+                (StockCurrentPrice, "current_price"),
+                (StockOrderbook, "orderbook"),
+                (SectorIndex, "sector_index"),
+            ):
+                if records[key]:
+                    db.execute(insert(model), records[key])
+
+            if records["snapshot"]:
+                stmt = insert(StockMarketSnapshot)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[StockMarketSnapshot.stock_code],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in records["snapshot"][0]
+                        if column != "stock_code"
+                    },
+                )
+                db.execute(stmt, records["snapshot"])
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"스냅샷 저장 실패: {e}")
+            raise
+        finally:
+            db.close()
+
+    async def collect_all(self, stock_codes: Optional[List[str]] = None) -> Dict[str, Any]:
+        """전체 종목 스냅샷 1회 수집"""
+        if stock_codes is None:
+            db = SessionLocal()
+            try:
+                stocks = db.query(Stock).filter(Stock.is_active == True).all()
+                stock_codes = [s.code for s in stocks]
+            finally:
+                db.close()
+
+        snapshot_at = datetime.now()
+        self._stock_outputs = {}
+        self._sector_outputs = {}
+        logger.info(f"🎯 시장 스냅샷 수집 시작: {len(stock_codes)}개 종목, {len(self.sector_codes)}개 업종")
+
+        sector_sweep = await self.executor.run("market_snapshot_sector", self.sector_codes, self.collect_sector)
+        await self._run_sweep("market_snapshot", stock_codes, self.collect_stock)
+
+        records = self.build_records(snapshot_at)
+        # 동기 DB 쓰기는 스레드에서 실행 (이벤트 루프의 다른 KIS 호출을 막지 않도록)
+        await asyncio.to_thread(self._write_records, records)
+        self.collected_count += len(records["snapshot"])
+
+        logger.info(
+            f"📊 시장 스냅샷 저장 완료: 종목 {len(records['snapshot'])}건, "
+            f"업종 {len(records['sector_index'])}건, 실패 {self.failed_count}건 "
+            f"({self.last_sweep.elapsed_seconds + sector_sweep.elapsed_seconds:.1f}초)"
+        )
+
+        return {
+            "snapshot_at": snapshot_at.isoformat(),
+            "collected": len(records["snapshot"]),
+            "sectors": len(records["sector_index"]),
+            "failed": self.failed_count,
+            "retried": self.last_sweep.retried,
+            "elapsed_seconds": round(self.last_sweep.elapsed_seconds + sector_sweep.elapsed_seconds, 3),
+        }
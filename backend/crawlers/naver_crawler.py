@@ -4,12 +4,11 @@
 네이버 금융 증권 뉴스를 크롤링합니다.
 """
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from backend.crawlers.base_crawler import BaseNewsCrawler, NewsArticleData
+from backend.crawlers.html_extract import HtmlField, HtmlItemSpec, extract_items
 
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,19 @@ class NaverNewsCrawler(BaseNewsCrawler):
     # 네이버 증권 뉴스 URL
     BASE_URL = "https://finance.naver.com/news/news_list.naver"
 
+    # 기사 = dd.articleSubject + 바로 다음 형제 dd.articleSummary
+    NEWS_ITEM_SPEC = HtmlItemSpec(
+        item_selector=".newsList .articleSubject",
+        fields={
+            "title": HtmlField("a"),
+            "url": HtmlField("a", attr="href"),
+            "summary": HtmlField("dd.articleSummary"),
+            "wdate": HtmlField(".articleSummary .wdate"),
+            "press": HtmlField(".articleSummary .press"),
+        },
+        following_siblings=True,
+    )
+
     def __init__(self):
         """네이버 뉴스 크롤러 초기화"""
         super().__init__(source_name="네이버")
@@ -41,42 +53,34 @@ class NaverNewsCrawler(BaseNewsCrawler):
         # section_id2=258: 종목
         return f"{self.BASE_URL}?mode=LSS2D&section_id=101&section_id2=258&page={page}"
 
-    def _parse_news_item(self, article_dd: BeautifulSoup) -> Optional[NewsArticleData]:
+    def _parse_news_item(self, fields: Dict[str, Optional[str]]) -> Optional[NewsArticleData]:
         """
         뉴스 아이템을 파싱합니다.
 
         Args:
-            article_dd: dd.articleSubject 요소
+            fields: NEWS_ITEM_SPEC으로 추출한 필드 (title, url, summary, wdate, press)
 
         Returns:
             NewsArticleData 또는 None (파싱 실패 시)
         """
         try:
             # 제목 및 URL 추출
-            link_elem = article_dd.select_one("a")
-            if not link_elem:
+            title = fields["title"]
+            if title is None:
                 return None
 
-            title = link_elem.get_text(strip=True)
-            url = link_elem.get("href")
+            url = fields["url"]
             if url and not url.startswith("http"):
                 url = f"https://finance.naver.com{url}"
 
-            # 바로 다음 형제 요소인 dd.articleSummary 찾기
-            summary_dd = article_dd.find_next_sibling("dd", class_="articleSummary")
-            content = summary_dd.get_text(strip=True) if summary_dd else title
-
-            # 날짜 및 언론사 정보는 summary_dd 안에 있음
-            if summary_dd:
-                wdate_elem = summary_dd.select_one(".wdate")
-                if wdate_elem:
-                    date_str = wdate_elem.get_text(strip=True)
-                    published_at = self._parse_date(date_str)
-                else:
-                    published_at = datetime.now()
-
-                press_elem = summary_dd.select_one(".press")
-                press = press_elem.get_text(strip=True) if press_elem else "네이버"
+            # dd.articleSummary (요약 + 날짜 + 언론사)
+            summary = fields["summary"]
+            content = summary if summary is not None else title
+
+            # 날짜 및 언론사 정보는 summary 안에 있음
+            if summary is not None:
+                published_at = self._parse_date(fields["wdate"]) if fields["wdate"] is not None else datetime.now()
+                press = fields["press"] if fields["press"] is not None else "네이버"
             else:
                 published_at = datetime.now()
                 press = "네이버"
@@ -146,22 +150,19 @@ class NaverNewsCrawler(BaseNewsCrawler):
                 logger.warning(f"페이지 {page} 가져오기 실패")
                 break
 
-            # HTML 파싱
-            soup = BeautifulSoup(html, "html.parser")
-
-            # 뉴스 리스트 추출
-            news_items = soup.select(".newsList .articleSubject")
+            # 뉴스 아이템 필드만 추출 (남은 개수만큼만 파싱)
+            news_items = extract_items(html, self.NEWS_ITEM_SPEC, limit=limit - len(news_list))
 
             if not news_items:
                 logger.info(f"페이지 {page}에 더 이상 뉴스가 없습니다")
                 break
 
-            # 각 뉴스 아이템 파싱 (dd.articleSubject를 직접 파싱)
-            for article_dd in news_items:
+            # 각 뉴스 아이템 파싱
+            for fields in news_items:
                 if len(news_list) >= limit:
                     break
 
-                news_data = self._parse_news_item(article_dd)
+                news_data = self._parse_news_item(fields)
                 if news_data:
                     news_list.append(news_data)
                     logger.debug(f"뉴스 추가: {news_data.title[:50]}")
@@ -174,4 +175,5 @@ class NaverNewsCrawler(BaseNewsCrawler):
                 break
 
         logger.info(f"네이버 뉴스 크롤링 완료: {len(news_list)}건")
-        return news_list
+        # 이미 저장된 기사는 저장 단계로 넘기지 않음
+        return self.drop_seen(news_list)
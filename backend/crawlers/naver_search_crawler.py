@@ -214,7 +214,8 @@ class NaverNewsSearchCrawler(BaseNewsCrawler):
             await asyncio.sleep(0.5)
 
         logger.info(f"네이버 뉴스 검색 완료: {len(news_list)}건")
-        return news_list
+        # 이미 저장된 기사는 저장 단계로 넘기지 않음
+        return self.drop_seen(news_list)
 
     async def fetch_news(self, limit: int = 10) -> List[NewsArticleData]:
         """
@@ -5,12 +5,14 @@
 """
 import logging
 import asyncio
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from backend.crawlers.base_crawler import NewsArticleData
+from backend.crawlers.http_cache import get_seen_url_store
 from backend.db.models.news import NewsArticle, ContentType
 from backend.db.models.prediction import Prediction
 from backend.utils.stock_mapping import get_stock_mapper
@@ -39,6 +41,8 @@ class NewsSaver:
         self.deduplicator = get_deduplicator()
         self.embedding_deduplicator = get_embedding_deduplicator()
         self.encoding_normalizer = get_encoding_normalizer()
+        self.seen_urls = get_seen_url_store()
+        self.failed_urls: List[Optional[str]] = []  # 마지막 save_news_batch에서 저장에 실패한 뉴스 URL (중복 스킵 제외)
 
         # 자동 예측이 활성화되어 있으면 싱글톤 predictor 사용
         self.predictor = None
@@ -105,17 +109,17 @@ class NewsSaver:
         logger.debug("종목코드를 찾을 수 없음")
         return None
 
-    async def save_news(self, news_data: NewsArticleData) -> Optional[NewsArticle]:
+    def _build_row(self, news_data: NewsArticleData) -> Optional[Dict[str, Any]]:
         """
-        뉴스를 데이터베이스에 저장합니다.
+        뉴스 데이터를 news_articles 행(컬럼 → 값)으로 변환합니다.
 
-        중복 검사를 수행하고, 중복이 아닌 경우에만 저장합니다.
+        인코딩 검증/정규화, 종목코드 추출, content_type 결정을 수행합니다.
 
         Args:
             news_data: 뉴스 데이터
 
         Returns:
-            저장된 NewsArticle 또는 None (중복인 경우)
+            NewsArticle 컬럼 dict 또는 None (제목 복구 실패 시)
         """
         # 인코딩 검증 및 정규화
         title = news_data.title
@@ -132,49 +136,69 @@ class NewsSaver:
             logger.warning(f"깨진 본문 감지, 복구 시도")
             content = self.encoding_normalizer.try_fix_broken_encoding(content)
 
-        # 중복 검사
-        is_duplicate, duplicate_id = self.deduplicator.find_duplicate_in_db(
-            title, self.db
-        )
-
-        if is_duplicate:
-            logger.info(f"중복 뉴스 스킵: {title[:50]}")
-            return None
-
-        # 종목코드 추출
+        # 종목코드 추출 (news_data.title 기준, 기존 동작 유지)
         stock_code = self._extract_stock_code(news_data)
 
-        # content_type 결정
-        content_type = self._determine_content_type(news_data.source)
-
-        # Reddit/Twitter 전용 필드 추출
-        upvotes = news_data.metadata.get('upvotes')
-        num_comments = news_data.metadata.get('num_comments')
-        subreddit = news_data.metadata.get('subreddit')
-
-        # NewsArticle 모델 인스턴스 생성
-        news_article = NewsArticle(
+        return dict(
             title=title,
             content=content,
             published_at=news_data.published_at,
             source=news_data.source,
             stock_code=stock_code,
             # Multi-platform 필드
-            content_type=content_type,
+            content_type=self._determine_content_type(news_data.source),
             url=news_data.url,
             author=news_data.author,
-            upvotes=upvotes,
-            num_comments=num_comments,
-            subreddit=subreddit,
+            # Reddit/Twitter 전용 필드
+            upvotes=news_data.metadata.get('upvotes'),
+            num_comments=news_data.metadata.get('num_comments'),
+            subreddit=news_data.metadata.get('subreddit'),
             extra_metadata=news_data.metadata,
         )
 
+    async def save_news(self, news_data: NewsArticleData) -> Optional[NewsArticle]:
+        """
+        뉴스를 데이터베이스에 저장합니다.
+
+        중복 검사를 수행하고, 중복이 아닌 경우에만 저장합니다.
+        여러 건을 저장할 때는 save_news_batch (일괄 INSERT)를 사용하세요.
+
+        Args:
+            news_data: 뉴스 데이터
+
+        Returns:
+            저장된 NewsArticle 또는 None (중복인 경우)
+        """
+        row = self._build_row(news_data)
+        if row is None:
+            return None
+        title = row["title"]
+        stock_code = row["stock_code"]
+
+        # 중복 검사
+        is_duplicate, duplicate_id = self.deduplicator.find_duplicate_in_db(
+            title, self.db
+        )
+
+        if is_duplicate:
+            logger.info(f"중복 뉴스 스킵: {title[:50]}")
+            self.seen_urls.add_many([row["url"]])
+            return None
+
+        # NewsArticle 모델 인스턴스 생성
+        news_article = NewsArticle(**row)
+
         # DB에 저장
         try:
             self.db.add(news_article)
             self.db.commit()
             self.db.refresh(news_article)
 
+            # 같은 크롤링 사이클의 후속 뉴스 중복 검사에 즉시 반영
+            self.deduplicator.add_title(news_article.id, title, news_article.created_at)
+            # 다음 크롤링부터 같은 URL은 수집 단계에서 제외
+            self.seen_urls.add_many([news_article.url])
+
             logger.info(
                 f"뉴스 저장 완료: ID={news_article.id}, "
                 f"제목='{news_article.title[:50]}', "
@@ -210,12 +234,19 @@ class NewsSaver:
         try:
             logger.info(f"🔮 비동기 멀티 모델 예측 시작: 뉴스 ID={news_article.id}, 종목={stock_code}")
 
-            # 0. 임베딩 기반 중복 검사 (예측 skip 여부 확인)
+            # 0. 유사 뉴스 검색 (임베딩 + 검색 1회를 중복 검사와 예측 컨텍스트가 함께 사용)
             news_text = f"{news_article.title} {news_article.content}"
-            should_skip, similar_id, similarity = await self.embedding_deduplicator.should_skip_prediction(
+            vector_search = await get_vector_search()
+            similar_hits = await vector_search.search_similar_news(
                 news_text=news_text,
                 stock_code=stock_code,
-                db=self.db,
+                top_k=5,
+                similarity_threshold=0.7
+            )
+
+            # 1. 임베딩 기반 중복 검사 (예측 skip 여부 확인)
+            should_skip, similar_id, similarity = self.embedding_deduplicator.check_prediction_candidates(
+                similar_hits, stock_code, self.db
             )
 
             if should_skip:
@@ -225,15 +256,8 @@ class NewsSaver:
                 )
                 return
 
-            # 1. 유사 뉴스 검색
-            vector_search = await get_vector_search()
-            similar_news = await vector_search.get_news_with_price_changes(
-                news_text=news_text,
-                stock_code=stock_code,
-                db=self.db,
-                top_k=5,
-                similarity_threshold=0.7
-            )
+            # 중복이 아닐 때만 뉴스 상세/주가 변동률 조회
+            similar_news = vector_search.attach_price_changes(similar_hits, self.db)
 
             logger.info(f"유사 뉴스 검색 완료: {len(similar_news)}건")
 
@@ -276,21 +300,76 @@ class NewsSaver:
         """
         여러 뉴스를 배치로 저장합니다.
 
+        1. 건별 전처리 + 중복 검사 (메모리): 최근 제목 LSH 인덱스 + 같은 배치의 앞선 제목
+        2. 남은 뉴스를 다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING 1회로 저장
+           (실패 시 건별 INSERT로 재시도하여 문제 행만 제외)
+        3. 저장된 뉴스의 중복 인덱스 / seen URL 반영 및 자동 예측 태스크 생성
+
+        전처리나 INSERT에 실패한 뉴스는 스킵 수에 포함되며, URL을 self.failed_urls에 기록합니다.
+
         Args:
             news_list: 뉴스 데이터 리스트
 
         Returns:
             (저장 성공 수, 중복 스킵 수) 튜플
         """
-        saved_count = 0
-        skipped_count = 0
+        self.failed_urls = []
+        rows: List[Dict[str, Any]] = []
+        batch_titles: List[str] = []
+        duplicate_urls: List[Optional[str]] = []
 
         for news_data in news_list:
-            result = await self.save_news(news_data)
-            if result:
-                saved_count += 1
-            else:
-                skipped_count += 1
+            try:
+                row = self._build_row(news_data)
+                if row is None:
+                    continue
+
+                title = row["title"]
+                is_duplicate, _ = self.deduplicator.find_duplicate_in_db(title, self.db)
+                if not is_duplicate:
+                    is_duplicate = any(self.deduplicator.is_duplicate(title, other) for other in batch_titles)
+
+                if is_duplicate:
+                    logger.info(f"중복 뉴스 스킵: {title[:50]}")
+                    duplicate_urls.append(row["url"])
+                    continue
+
+                rows.append(row)
+                batch_titles.append(title)
+
+            except Exception as e:
+                logger.error(f"뉴스 전처리 실패: {news_data.title[:50]}, {e}")
+                self.failed_urls.append(news_data.url)
+
+        inserted = self._insert_rows(rows) if rows else []
+        rows_by_title = {row["title"]: row for row in rows}
+
+        for news_id, title, created_at in inserted:
+            # 같은 크롤링 사이클의 후속 뉴스 중복 검사에 즉시 반영
+            self.deduplicator.add_title(news_id, title, created_at)
+
+            stock_code = rows_by_title[title]["stock_code"]
+            logger.info(
+                f"뉴스 저장 완료: ID={news_id}, "
+                f"제목='{title[:50]}', "
+                f"종목코드={stock_code or 'N/A'}"
+            )
+
+            # 자동 예측 실행 (종목코드가 있을 때만, 백그라운드 태스크)
+            if self.auto_predict and self.predictor and stock_code:
+                news_article = NewsArticle(id=news_id, created_at=created_at, **rows_by_title[title])
+                asyncio.create_task(
+                    self._run_prediction_async(news_article, stock_code)
+                )
+                logger.info(f"📤 비동기 예측 태스크 생성: 뉴스 ID={news_id}")
+
+        # 저장/중복 판정된 URL은 다음 크롤링부터 수집 단계에서 제외
+        self.seen_urls.add_many(
+            duplicate_urls + [rows_by_title[title]["url"] for _, title, _ in inserted]
+        )
+
+        saved_count = len(inserted)
+        skipped_count = len(news_list) - saved_count
 
         logger.info(
             f"배치 저장 완료: 총 {len(news_list)}건 -> "
@@ -298,3 +377,42 @@ class NewsSaver:
         )
 
         return (saved_count, skipped_count)
+
+    def _insert_rows(self, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING (트랜잭션 1회)
+
+        일괄 INSERT가 실패하면 건별로 다시 INSERT하여 실패한 행만 제외합니다.
+        이미 존재하는 URL(uq_news_articles_url) 등 충돌 행은 RETURNING에서 빠집니다.
+
+        Args:
+            rows: NewsArticle 컬럼 dict 리스트
+
+        Returns:
+            저장된 (뉴스 ID, 제목, 생성 시각) 리스트
+        """
+        created_at = datetime.utcnow()
+        stmt = (
+            insert(NewsArticle)
+            .values([{**row, "created_at": created_at} for row in rows])
+            .on_conflict_do_nothing()
+            .returning(NewsArticle.id, NewsArticle.title, NewsArticle.created_at)
+        )
+
+        try:
+            inserted = [tuple(record) for record in self.db.execute(stmt).all()]
+            self.db.commit()
+            return inserted
+
+        except Exception as e:
+            self.db.rollback()
+            if len(rows) == 1:
+                logger.error(f"뉴스 저장 실패: {rows[0]['title'][:50]}, {e}")
+                self.failed_urls.append(rows[0]["url"])
+                return []
+
+            logger.warning(f"일괄 INSERT 실패, 건별 INSERT로 재시도 ({len(rows)}건): {e}")
+            inserted = []
+            for row in rows:
+                inserted.extend(self._insert_rows([row]))
+            return inserted
@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from backend.db.models.news import NewsArticle
 from backend.db.models.stock import StockPrice
 from backend.db.models.match import NewsStockMatch
+from backend.llm.vector_search import invalidate_price_change_cache
 from backend.utils.business_days import add_business_days
 
 
@@ -252,6 +253,7 @@ def run_daily_matching(db: Session, lookback_days: int = 7) -> Tuple[int, int]:
 
     최근 N일 이내의 뉴스 중 아직 매칭되지 않았거나
     변동률이 불완전한 뉴스를 대상으로 매칭을 수행합니다.
+    작업이 끝나면 (중간에 실패해도) 유사 뉴스 주가 변동률 캐시를 비웁니다.
 
     Args:
         db: 데이터베이스 세션
@@ -299,3 +301,7 @@ def run_daily_matching(db: Session, lookback_days: int = 7) -> Tuple[int, int]:
     except Exception as e:
         logger.error(f"일일 뉴스-주가 매칭 중 에러 발생: {e}", exc_info=True)
         return 0, 0
+
+    finally:
+        # 일부 뉴스만 매칭된 경우에도 이미 커밋된 변동률이 있으므로 캐시 갱신
+        invalidate_price_change_cache()
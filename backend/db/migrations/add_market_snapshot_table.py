@@ -0,0 +1,137 @@
+"""
+종목별 최신 시장 스냅샷 테이블 추가 Migration
+
+kis_market_data_job이 현재가·호가를 한 번에 수집해 종목당 1행으로 덮어쓰는 테이블입니다.
+생성 후 기존 stock_current_price / stock_orderbook 이력에서 종목별 최신 행으로 초기값을 채웁니다.
+
+Usage:
+    uv run python backend/db/migrations/add_market_snapshot_table.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: stock_market_snapshot 테이블 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        # 테이블 생성
+        logger.info("\n1. 테이블 생성 중...")
+        db.execute(text("""
+            CREATE TABLE IF NOT EXISTS stock_market_snapshot (
+                stock_code VARCHAR(10) PRIMARY KEY,
+                snapshot_at TIMESTAMP NOT NULL,
+
+                -- 현재가 시세
+                stck_prpr FLOAT,
+                prdy_vrss FLOAT,
+                prdy_vrss_sign VARCHAR(1),
+                prdy_ctrt FLOAT,
+                acml_vol BIGINT,
+                acml_tr_pbmn BIGINT,
+                per FLOAT,
+                pbr FLOAT,
+                eps FLOAT,
+                bps FLOAT,
+                hts_avls BIGINT,
+
+                -- 호가 요약
+                askp1 FLOAT,
+                bidp1 FLOAT,
+                askp_rsqn1 BIGINT,
+                bidp_rsqn1 BIGINT,
+                total_askp_rsqn BIGINT,
+                total_bidp_rsqn BIGINT,
+
+                -- 메타데이터
+                updated_at TIMESTAMP DEFAULT NOW() NOT NULL
+            );
+        """))
+        logger.info("   ✅ stock_market_snapshot 테이블 생성 완료")
+
+        # 인덱스 생성
+        logger.info("\n2. 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_stock_market_snapshot_snapshot_at
+            ON stock_market_snapshot(snapshot_at DESC);
+        """))
+        logger.info("   ✅ ix_stock_market_snapshot_snapshot_at 인덱스 생성")
+
+        # 기존 이력에서 초기값 채우기 (종목별 최신 현재가 + 최신 호가)
+        logger.info("\n3. 기존 이력으로 초기값 채우는 중...")
+        result = db.execute(text("""
+            INSERT INTO stock_market_snapshot (
+                stock_code, snapshot_at,
+                stck_prpr, prdy_vrss, prdy_vrss_sign, prdy_ctrt, acml_vol, acml_tr_pbmn,
+                per, pbr, eps, bps, hts_avls,
+                askp1, bidp1, askp_rsqn1, bidp_rsqn1, total_askp_rsqn, total_bidp_rsqn
+            )
+            SELECT
+                cp.stock_code, cp.datetime,
+                cp.stck_prpr, cp.prdy_vrss, cp.prdy_vrss_sign, cp.prdy_ctrt, cp.acml_vol, cp.acml_tr_pbmn,
+                cp.per, cp.pbr, cp.eps, cp.bps, cp.hts_avls,
+                ob.askp1, ob.bidp1, ob.askp_rsqn1, ob.bidp_rsqn1, ob.total_askp_rsqn, ob.total_bidp_rsqn
+            FROM (
+                SELECT DISTINCT ON (stock_code) *
+                FROM stock_current_price
+                ORDER BY stock_code, datetime DESC
+            ) cp
+            LEFT JOIN (
+                SELECT DISTINCT ON (stock_code) *
+                FROM stock_orderbook
+                ORDER BY stock_code, datetime DESC
+            ) ob ON ob.stock_code = cp.stock_code
+            ON CONFLICT (stock_code) DO NOTHING;
+        """))
+        logger.info(f"   ✅ {result.rowcount}개 종목 초기화")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: stock_market_snapshot 테이블 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP TABLE IF EXISTS stock_market_snapshot CASCADE;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,94 @@
+"""
+news_articles.url 부분 유니크 인덱스 추가
+
+NewsSaver.save_news_batch의 일괄 INSERT ... ON CONFLICT DO NOTHING이
+같은 URL의 재저장(다른 프로세스/재시도)을 건너뛰도록 충돌 기준을 제공합니다.
+"""
+import logging
+from sqlalchemy import text
+from backend.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade():
+    """
+    news_articles (url) WHERE url IS NOT NULL 유니크 인덱스 추가
+
+    기존 데이터에 중복 URL이 있으면 인덱스를 만들지 않고 중복 건수만 보고합니다.
+    """
+    db = SessionLocal()
+
+    try:
+        logger.info("=== Migration 시작: news_articles.url 유니크 인덱스 추가 ===")
+
+        # 1. 기존 중복 URL 확인
+        duplicate_urls = db.execute(text("""
+            SELECT COUNT(*) FROM (
+                SELECT url FROM news_articles
+                WHERE url IS NOT NULL
+                GROUP BY url
+                HAVING COUNT(*) > 1
+            ) duplicates;
+        """)).scalar()
+
+        if duplicate_urls:
+            logger.warning(
+                f"⚠️ 중복 URL {duplicate_urls}개가 있어 인덱스를 생성하지 않습니다. "
+                f"중복 행 정리 후 다시 실행하세요."
+            )
+            return
+
+        # 2. 부분 유니크 인덱스 추가
+        db.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_news_articles_url
+            ON news_articles (url)
+            WHERE url IS NOT NULL;
+        """))
+
+        db.commit()
+
+        logger.info("✅ 인덱스 추가 완료")
+        logger.info("=== Migration 완료 ===")
+
+    except Exception as e:
+        logger.error(f"❌ Migration 실패: {e}")
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """
+    유니크 인덱스 제거 (롤백)
+    """
+    db = SessionLocal()
+
+    try:
+        logger.info("=== Rollback 시작: news_articles.url 유니크 인덱스 제거 ===")
+
+        db.execute(text("""
+            DROP INDEX IF EXISTS uq_news_articles_url;
+        """))
+
+        db.commit()
+
+        logger.info("✅ 인덱스 제거 완료")
+        logger.info("=== Rollback 완료 ===")
+
+    except Exception as e:
+        logger.error(f"❌ Rollback 실패: {e}")
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    # Migration 실행
+    upgrade()
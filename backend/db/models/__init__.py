@@ -14,6 +14,7 @@ from backend.db.models.market_data import (
     SectorIndex,
     IndexDailyPrice,
     StockOvertimePrice,
+    StockMarketSnapshot,
 )
 from backend.db.models.financial import ProductInfo, FinancialRatio
 from backend.db.models.public_preview_link import PublicPreviewLink
@@ -34,6 +35,7 @@ __all__ = [
     "SectorIndex",
     "IndexDailyPrice",
     "StockOvertimePrice",
+    "StockMarketSnapshot",
     "ProductInfo",
     "FinancialRatio",
     "PublicPreviewLink",
@@ -1,5 +1,5 @@
 """
-KIS 시장 데이터 모델 (호가, 투자자매매동향, 종목정보, 업종지수).
+KIS 시장 데이터 모델 (호가, 투자자매매동향, 종목정보, 업종지수, 최신 스냅샷).
 """
 from sqlalchemy import Column, Integer, String, Float, DateTime, Date, BigInteger, Index
 from datetime import datetime
@@ -352,3 +352,54 @@ class StockOvertimePrice(Base):
             f"<StockOvertimePrice(stock_code='{self.stock_code}', date={self.date}, "
             f"price={self.ovtm_untp_prpr}, volume={self.acml_vol})>"
         )
+
+
+class StockMarketSnapshot(Base):
+    """
+    종목별 최신 시장 스냅샷 (현재가 + 호가 요약, 종목당 1행).
+
+    kis_market_data_job이 한 번의 순회로 현재가·호가를 함께 조회해 한 트랜잭션으로 덮어씁니다.
+    최신 값이 필요한 조회는 이력 테이블을 ORDER BY ... LIMIT 1 하지 않고 PK로 바로 읽습니다.
+
+    Attributes:
+        stock_code: 종목 코드 (PK)
+        snapshot_at: 스냅샷 시각 (같은 순회의 모든 종목이 동일)
+        stck_prpr ~ hts_avls: 현재가 시세 (StockCurrentPrice와 동일)
+        askp1, bidp1, askp_rsqn1, bidp_rsqn1: 최우선 매도/매수 호가와 잔량
+        total_askp_rsqn, total_bidp_rsqn: 총 매도/매수 잔량
+        updated_at: 갱신일시
+    """
+
+    __tablename__ = "stock_market_snapshot"
+
+    stock_code = Column(String(10), primary_key=True)
+    snapshot_at = Column(DateTime, nullable=False, index=True)
+
+    # 현재가 시세
+    stck_prpr = Column(Float, nullable=True)  # 주식 현재가
+    prdy_vrss = Column(Float, nullable=True)  # 전일 대비
+    prdy_vrss_sign = Column(String(1), nullable=True)  # 전일 대비 부호
+    prdy_ctrt = Column(Float, nullable=True)  # 전일 대비율
+    acml_vol = Column(BigInteger, nullable=True)  # 누적 거래량
+    acml_tr_pbmn = Column(BigInteger, nullable=True)  # 누적 거래대금
+    per = Column(Float, nullable=True)  # PER
+    pbr = Column(Float, nullable=True)  # PBR
+    eps = Column(Float, nullable=True)  # EPS
+    bps = Column(Float, nullable=True)  # BPS
+    hts_avls = Column(BigInteger, nullable=True)  # 시가총액
+
+    # 호가 요약
+    askp1 = Column(Float, nullable=True)  # 매도 1호가
+    bidp1 = Column(Float, nullable=True)  # 매수 1호가
+    askp_rsqn1 = Column(BigInteger, nullable=True)  # 매도 1호가 잔량
+    bidp_rsqn1 = Column(BigInteger, nullable=True)  # 매수 1호가 잔량
+    total_askp_rsqn = Column(BigInteger, nullable=True)  # 총 매도 잔량
+    total_bidp_rsqn = Column(BigInteger, nullable=True)  # 총 매수 잔량
+
+    updated_at = Column(DateTime, default=lambda: datetime.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<StockMarketSnapshot(stock_code='{self.stock_code}', snapshot_at={self.snapshot_at}, "
+            f"price={self.stck_prpr}, bid1={self.bidp1}, ask1={self.askp1})>"
+        )
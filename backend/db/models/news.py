@@ -3,7 +3,7 @@ NewsArticle model for storing news articles and other content sources.
 """
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import JSONB
 from backend.db.base import Base
 
@@ -83,6 +83,11 @@ class NewsArticle(Base):
         Index("idx_news_articles_subreddit", "subreddit"),
         Index("idx_news_articles_source_type", "source", "content_type"),
         Index("idx_news_articles_predicted_at", "predicted_at"),
+        # 일괄 저장(INSERT ... ON CONFLICT DO NOTHING)의 충돌 기준: 같은 URL은 한 번만 저장
+        Index(
+            "uq_news_articles_url", "url",
+            unique=True, postgresql_where=text("url IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
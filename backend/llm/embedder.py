@@ -6,21 +6,22 @@ HuggingFace Transformers (BM-K/KoSimCSE-roberta)를 사용하여 뉴스를 벡
 """
 import logging
 import threading
-import pickle
-from typing import List, Optional, Dict, Tuple, Any
+from typing import Callable, List, Optional, Dict, Tuple
 from datetime import datetime
 import time
 import os
 
-import torch
-import faiss
-from transformers import AutoTokenizer, AutoModel
 import numpy as np
+from transformers import AutoTokenizer
 from sqlalchemy.orm import Session
 
 from backend.config import settings
 from backend.db.models.news import NewsArticle
 from backend.db.session import SessionLocal
+from backend.llm.embedding_backends import create_embedding_backend
+from backend.llm.embedding_cache import EmbeddingCache
+from backend.llm.embedding_text import EmbeddingTextPolicy
+from backend.llm.faiss_store import get_faiss_store
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,25 @@ class NewsEmbedder:
         self._tokenizer = None
         self._model = None
         self._inference_lock = threading.Lock()  # PyTorch 동시 추론 방지
+        self._cache: Optional[EmbeddingCache] = None
+        self._cache_lock = threading.Lock()
+        self.text_policy = EmbeddingTextPolicy()  # 입력 절단 정책 (settings.EMBEDDING_TEXT_POLICY)
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """임베딩 캐시 lazy loading (비활성화 시 None)"""
+        if self._cache is None and settings.EMBEDDING_CACHE_ENABLED:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = EmbeddingCache(
+                        self.model_name, self.embedding_dim, namespace=self.text_policy.signature
+                    )
+        return self._cache
+
+    @property
+    def loaded_cache(self) -> Optional[EmbeddingCache]:
+        """이미 생성된 임베딩 캐시 (생성하지 않음, 아직 없으면 None)"""
+        return self._cache
 
     @property
     def tokenizer(self):
@@ -53,31 +73,25 @@ class NewsEmbedder:
 
     @property
     def model(self):
-        """모델 lazy loading (Thread-safe)"""
+        """임베딩 백엔드 lazy loading (Thread-safe, settings.EMBEDDING_BACKEND)"""
         if self._model is None:
             with self._inference_lock:
                 if self._model is None:
-                    logger.info(f"임베딩 모델 로드 중: {self.model_name}")
+                    logger.info(
+                        f"임베딩 모델 로드 중: {self.model_name} (backend={settings.EMBEDDING_BACKEND})"
+                    )
                     start = time.time()
-                    self._model = AutoModel.from_pretrained(self.model_name)
-                    self._model.eval()  # 평가 모드로 설정
+                    self._model = create_embedding_backend(self.model_name)
                     load_time = time.time() - start
                     logger.info(f"임베딩 모델 로드 완료 ({load_time:.2f}초)")
         return self._model
 
-    def _mean_pooling(self, model_output, attention_mask):
-        """Mean Pooling - 모든 토큰의 임베딩 평균"""
-        token_embeddings = model_output[0]
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        return torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(
-            input_mask_expanded.sum(1), min=1e-9
-        )
-
     def embed_text(self, text: str) -> Optional[List[float]]:
         """
         텍스트를 로컬 임베딩 모델로 벡터화합니다.
 
         Thread-safe: PyTorch 모델 동시 추론 방지를 위해 Lock 사용
+        동일 텍스트는 임베딩 캐시에서 반환하여 forward pass를 생략합니다.
 
         Args:
             text: 임베딩할 텍스트
@@ -85,31 +99,39 @@ class NewsEmbedder:
         Returns:
             768차원 임베딩 벡터 또는 None (실패 시)
         """
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(text)
+            if cached is not None:
+                return cached
+
+        embedding = self._embed_text_uncached(text)
+        if embedding is not None and cache is not None:
+            cache.put(text, embedding)
+        return embedding
+
+    def _embed_text_uncached(self, text: str) -> Optional[List[float]]:
+        """캐시를 거치지 않고 단일 텍스트를 임베딩합니다."""
+        # Lazy loading은 _inference_lock을 사용하므로 Lock 획득 전에 트리거
+        tokenizer = self.tokenizer
+        backend = self.model
+
         with self._inference_lock:  # PyTorch 동시 추론 방지
             try:
-                # 토크나이징
-                encoded_input = self.tokenizer(
-                    text,
+                # 토크나이징 (텍스트 정책에 따라 절단)
+                encoded_input = tokenizer.pad(
+                    [self.text_policy.encode(tokenizer, text)],
                     padding=True,
-                    truncation=True,
-                    max_length=512,
-                    return_tensors='pt'
+                    return_tensors=backend.tensor_type,
                 )
 
-                # 임베딩 생성 (gradient 계산 비활성화)
-                with torch.no_grad():
-                    logger.debug(f"PyTorch 추론 시작: {len(text)}자")
-                    model_output = self.model(**encoded_input)
-                    logger.debug("PyTorch 추론 완료")
+                # 임베딩 생성 (no_grad forward + mean pooling + L2 정규화)
+                logger.debug(f"임베딩 추론 시작: {len(text)}자")
+                embedding = self._forward(encoded_input)
+                logger.debug("임베딩 추론 완료")
 
-                # Mean pooling
-                embedding = self._mean_pooling(model_output, encoded_input['attention_mask'])
-
-                # 정규화 (L2 normalization)
-                embedding = torch.nn.functional.normalize(embedding, p=2, dim=1)
-
-                # numpy 배열로 변환 후 리스트로 반환
-                embedding_list = embedding.cpu().numpy()[0].tolist()
+                # 리스트로 반환
+                embedding_list = embedding[0].tolist()
 
                 logger.debug(f"임베딩 생성 완료: {len(embedding_list)}차원")
 
@@ -119,54 +141,134 @@ class NewsEmbedder:
                 logger.error(f"임베딩 생성 실패: {e}")
                 return None
 
-    def embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+    def _forward(self, encoded_input) -> np.ndarray:
+        """
+        토크나이즈된 배치를 한 번의 forward pass로 임베딩합니다 (백엔드 위임).
+
+        호출자가 _inference_lock을 잡고 있어야 합니다.
+
+        Returns:
+            L2 정규화된 (batch, dim) float32 배열
+        """
+        return self._model.forward(encoded_input)
+
+    def embed_batch(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[Optional[List[float]]]:
         """
         여러 텍스트를 배치로 임베딩합니다.
 
+        토큰 길이 순으로 정렬한 뒤 micro-batch 단위로 묶어 패딩을 최소화하고,
+        micro-batch마다 forward pass를 한 번만 수행합니다.
+        배치 추론이 실패하면 해당 micro-batch만 embed_text로 개별 재시도합니다.
+
         Args:
             texts: 임베딩할 텍스트 리스트
+            batch_size: micro-batch 크기 (None이면 settings.EMBEDDING_BATCH_SIZE)
 
         Returns:
-            임베딩 벡터 리스트 (실패한 항목은 None)
+            임베딩 벡터 리스트 (입력 순서 유지, 실패한 항목은 None)
         """
-        embeddings = []
+        if not texts:
+            return []
+
+        batch_size = max(1, batch_size or settings.EMBEDDING_BATCH_SIZE)
+
+        # 캐시 hit는 바로 채우고 miss만 추론
+        cache = self.cache
+        if cache is not None:
+            embeddings = cache.get_many(texts)
+        else:
+            embeddings = [None] * len(texts)
+
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not pending:
+            return embeddings
+
+        # Lazy loading은 _inference_lock을 사용하므로 Lock 획득 전에 트리거
+        tokenizer = self.tokenizer
+        backend = self.model
+
+        # 1. 패딩 없이 한 번만 토크나이징 (텍스트 정책 절단 + 길이 측정 + 재사용)
+        encoded_items: List[Optional[Dict[str, List[int]]]] = [None] * len(texts)
+        for i in pending:
+            try:
+                encoded_items[i] = self.text_policy.encode(tokenizer, texts[i])
+            except Exception as e:
+                logger.error(f"토크나이징 실패 (index={i}): {e}")
+
+        # 2. 토큰 길이 기준 정렬 → 비슷한 길이끼리 버킷팅
+        order = sorted(
+            (i for i, item in enumerate(encoded_items) if item is not None),
+            key=lambda i: len(encoded_items[i]["input_ids"]),
+        )
 
-        for text in texts:
-            embedding = self.embed_text(text)
-            embeddings.append(embedding)
+        # 3. 버킷별 단일 forward pass
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            try:
+                with self._inference_lock:  # PyTorch 동시 추론 방지
+                    encoded_input = tokenizer.pad(
+                        [encoded_items[i] for i in bucket],
+                        padding=True,
+                        return_tensors=backend.tensor_type,
+                    )
+                    logger.debug(
+                        f"임베딩 배치 추론: {len(bucket)}건, "
+                        f"seq_len={encoded_input['input_ids'].shape[1]}"
+                    )
+                    vectors = self._forward(encoded_input)
+
+                for i, vector in zip(bucket, vectors):
+                    embeddings[i] = vector.tolist()
+                    if cache is not None:
+                        cache.put(texts[i], embeddings[i])
 
-            # 로컬 모델이므로 rate limit 없음 (sleep 제거)
+            except Exception as e:
+                logger.warning(f"배치 임베딩 실패, 개별 처리로 재시도 ({len(bucket)}건): {e}")
+                for i in bucket:
+                    embeddings[i] = self.embed_text(texts[i])
 
         return embeddings
 
-    def _load_faiss_metadata(self) -> List[Dict[str, Any]]:
+    def _get_indexed_news_ids(self) -> np.ndarray:
         """
-        FAISS 메타데이터 파일을 직접 로드합니다 (동기).
+        FAISS에 이미 인덱싱된 뉴스 ID 배열을 조회합니다 (동기, 메인 + delta 세그먼트).
 
         Returns:
-            메타데이터 리스트
+            인덱싱된 뉴스 ID 배열 (int64)
         """
-        metadata_path = settings.FAISS_METADATA_PATH
+        return get_faiss_store().indexed_news_id_array()
 
-        if not os.path.exists(metadata_path):
-            return []
-
-        try:
-            with open(metadata_path, 'rb') as f:
-                return pickle.load(f)
-        except Exception as e:
-            logger.warning(f"FAISS 메타데이터 로드 실패: {e}")
-            return []
-
-    def _get_indexed_news_ids(self) -> set:
+    @staticmethod
+    def _select_unembedded_ids(db: Session, indexed_ids: np.ndarray, limit: int) -> List[int]:
         """
-        FAISS에 이미 인덱싱된 뉴스 ID 목록을 직접 조회합니다 (동기).
+        최신순 뉴스 ID를 청크 단위로 읽어 np.isin으로 인덱싱된 ID를 걸러냅니다.
+
+        인덱싱된 ID 전체를 NOT IN 파라미터로 보내지 않고, 미임베딩 뉴스를 limit개
+        찾을 때까지만 ID 컬럼을 조회합니다.
 
         Returns:
-            인덱싱된 뉴스 ID 집합
+            미임베딩 뉴스 ID 리스트 (최신순, 최대 limit개)
         """
-        metadata = self._load_faiss_metadata()
-        return set(meta["news_article_id"] for meta in metadata)
+        chunk_size = max(limit * 4, 1000)
+        selected: List[int] = []
+        offset = 0
+        while len(selected) < limit:
+            rows = (
+                db.query(NewsArticle.id)
+                .order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
+                .offset(offset)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                break
+            ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            missing = ids[~np.isin(ids, indexed_ids)]
+            selected.extend(missing[: limit - len(selected)].tolist())
+            offset += chunk_size
+        return selected
 
     def get_unembedded_news(self, db: Session, limit: int = 100) -> List[NewsArticle]:
         """
@@ -186,17 +288,17 @@ class NewsEmbedder:
 
         except Exception as e:
             logger.warning(f"FAISS 조회 실패 (모든 뉴스를 대상으로 처리): {e}")
-            embedded_news_ids = set()
+            embedded_news_ids = np.empty(0, dtype=np.int64)
 
         # PostgreSQL에서 미임베딩 뉴스 조회
-        if embedded_news_ids:
+        if len(embedded_news_ids):
+            news_ids = self._select_unembedded_ids(db, embedded_news_ids, limit)
             unembedded_news = (
                 db.query(NewsArticle)
-                .filter(NewsArticle.id.notin_(embedded_news_ids))
-                .order_by(NewsArticle.published_at.desc())
-                .limit(limit)
+                .filter(NewsArticle.id.in_(news_ids))
+                .order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
                 .all()
-            )
+            ) if news_ids else []
         else:
             unembedded_news = (
                 db.query(NewsArticle)
@@ -212,7 +314,7 @@ class NewsEmbedder:
         self, news_list: List[NewsArticle], embeddings: List[List[float]]
     ) -> int:
         """
-        뉴스 임베딩을 FAISS에 직접 저장합니다 (동기).
+        뉴스 임베딩을 FAISS delta 세그먼트에 저장합니다 (동기, O(k) I/O).
 
         Args:
             news_list: 뉴스 리스트
@@ -226,52 +328,39 @@ class NewsEmbedder:
             return 0
 
         try:
-            index_path = settings.FAISS_INDEX_PATH
-            metadata_path = settings.FAISS_METADATA_PATH
-
-            # 디렉토리 생성
-            os.makedirs(os.path.dirname(index_path), exist_ok=True)
-            os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
-
-            # 기존 인덱스 로드 또는 새로 생성
-            if os.path.exists(index_path):
-                index = faiss.read_index(index_path)
-            else:
-                index = faiss.IndexFlatL2(settings.EMBEDDING_DIM)
-
-            # 기존 메타데이터 로드
-            metadata = self._load_faiss_metadata()
-
-            # 임베딩을 numpy 배열로 변환
-            embeddings_np = np.array(embeddings, dtype=np.float32)
-
-            # FAISS 인덱스에 추가
-            index.add(embeddings_np)
-
-            # 메타데이터 추가
-            for news in news_list:
-                metadata.append({
-                    "news_article_id": news.id,
-                    "stock_code": news.stock_code or "",
-                    "published_at": int(news.published_at.timestamp()),
-                })
+            store = get_faiss_store()
+
+            # 메인 인덱스 재작성 없이 delta 세그먼트(WAL)에 append
+            saved_count = store.append(
+                news_ids=[news.id for news in news_list],
+                embeddings=embeddings,
+                stock_codes=[news.stock_code or "" for news in news_list],
+                published_timestamps=[
+                    int(news.published_at.timestamp()) if news.published_at else None
+                    for news in news_list
+                ],
+            )
 
-            # 인덱스 저장
-            faiss.write_index(index, index_path)
+            logger.info(
+                f"💾 FAISS에 {saved_count}건 저장 완료 "
+                f"(총 {store.ntotal}개 벡터, delta {store.delta_count}개)"
+            )
 
-            # 메타데이터 저장
-            with open(metadata_path, 'wb') as f:
-                pickle.dump(metadata, f)
+            # delta가 임계값을 넘으면 메인 인덱스로 병합
+            if store.delta_count >= settings.FAISS_COMPACT_THRESHOLD:
+                store.compact()
 
-            logger.info(f"💾 FAISS에 {len(news_list)}건 저장 완료 (총 {index.ntotal}개 벡터)")
-            return len(news_list)
+            return saved_count
 
         except Exception as e:
             logger.error(f"FAISS 저장 실패: {e}")
             return 0
 
     def embed_and_save_news(
-        self, db: Session, batch_size: int = 100
+        self,
+        db: Session,
+        batch_size: int = 100,
+        embed_fn: Optional[Callable[[List[str]], List[Optional[List[float]]]]] = None,
     ) -> Tuple[int, int]:
         """
         미임베딩 뉴스를 임베딩하여 Milvus에 저장합니다.
@@ -279,6 +368,7 @@ class NewsEmbedder:
         Args:
             db: 데이터베이스 세션
             batch_size: 배치 크기
+            embed_fn: 텍스트 리스트 임베딩 함수 (None이면 self.embed_batch)
 
         Returns:
             (성공 건수, 실패 건수) 튜플
@@ -302,7 +392,7 @@ class NewsEmbedder:
 
             # 임베딩 생성
             logger.info("로컬 임베딩 모델로 벡터 생성 중...")
-            embeddings = self.embed_batch(texts)
+            embeddings = (embed_fn or self.embed_batch)(texts)
 
             # 성공/실패 분류
             success_news = []
@@ -370,10 +460,16 @@ def run_daily_embedding(batch_size: int = 100) -> Tuple[int, int]:
     Returns:
         (성공 건수, 실패 건수) 튜플
     """
+    # 순환 import 방지 (inference_worker가 embedder를 import)
+    from backend.llm.inference_worker import get_inference_worker
+
     db = SessionLocal()
     embedder = get_news_embedder()
 
     try:
-        return embedder.embed_and_save_news(db, batch_size=batch_size)
+        # 추론 워커로 제출하여 동시 검색/중복 검사 요청과 배치 공유
+        return embedder.embed_and_save_news(
+            db, batch_size=batch_size, embed_fn=get_inference_worker().embed_sync
+        )
     finally:
         db.close()
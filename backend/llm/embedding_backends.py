@@ -0,0 +1,200 @@
+"""
+임베딩 추론 백엔드 모듈
+
+NewsEmbedder의 forward pass(모델 실행 + mean pooling + L2 정규화)를 백엔드로 분리합니다.
+settings.EMBEDDING_BACKEND로 선택합니다.
+
+백엔드:
+- torch: HuggingFace AutoModel (float32, 기존 동작)
+- onnx: ONNX Runtime (float32, torch 모델을 최초 1회 ONNX로 export)
+- onnx_int8: ONNX Runtime + 동적 int8 양자화 (Linear 가중치 int8, CPU 처리량 개선)
+
+ONNX 모델은 EMBEDDING_ONNX_DIR/{모델명}/model(.int8).onnx에 캐시되며,
+onnxruntime은 ONNX 백엔드를 선택한 경우에만 필요합니다.
+"""
+import logging
+import os
+import re
+import time
+from typing import Any, Optional
+
+import numpy as np
+import torch
+from transformers import AutoModel
+
+from backend.config import settings
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+
+logger = logging.getLogger(__name__)
+
+
+BACKEND_TYPES = ("torch", "onnx", "onnx_int8")
+
+
+def mean_pool_and_normalize(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Mean Pooling (패딩 제외 토큰 평균) + L2 정규화 (numpy)"""
+    mask = attention_mask[..., np.newaxis].astype(np.float32)
+    pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+    norms = np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+    return (pooled / norms).astype(np.float32)
+
+
+class TorchEmbeddingBackend:
+    """PyTorch float32 백엔드"""
+
+    name = "torch"
+    tensor_type = "pt"  # 토크나이저 return_tensors
+
+    def __init__(self, model_name: str):
+        """
+        Args:
+            model_name: HuggingFace 모델명 또는 로컬 경로
+        """
+        self.model_name = model_name
+        self.model = AutoModel.from_pretrained(model_name)
+        self.model.eval()  # 평가 모드로 설정
+
+    def forward(self, encoded_input) -> np.ndarray:
+        """
+        토크나이즈된 배치를 한 번의 forward pass로 임베딩합니다.
+
+        Returns:
+            L2 정규화된 (batch, dim) float32 배열
+        """
+        with torch.no_grad():
+            model_output = self.model(**encoded_input)
+
+        token_embeddings = model_output[0]
+        mask = encoded_input["attention_mask"].unsqueeze(-1).expand(token_embeddings.size()).float()
+        embedding = torch.sum(token_embeddings * mask, 1) / torch.clamp(mask.sum(1), min=1e-9)
+        return torch.nn.functional.normalize(embedding, p=2, dim=1).cpu().numpy()
+
+
+class _LastHiddenState(torch.nn.Module):
+    """ONNX export용 래퍼 (키워드 인자 호출 + last_hidden_state만 출력)"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+
+class OnnxEmbeddingBackend:
+    """ONNX Runtime 백엔드 (선택적으로 동적 int8 양자화)"""
+
+    tensor_type = "np"
+
+    def __init__(
+        self,
+        model_name: str,
+        quantize: bool = True,
+        model_dir: Optional[str] = None,
+        num_threads: Optional[int] = None,
+    ):
+        """
+        Args:
+            model_name: HuggingFace 모델명 또는 로컬 경로
+            quantize: 동적 int8 양자화 사용 여부
+            model_dir: ONNX 모델 캐시 디렉토리 (None이면 settings.EMBEDDING_ONNX_DIR)
+            num_threads: intra-op 스레드 수 (None이면 settings.EMBEDDING_ONNX_THREADS, 0은 자동)
+        """
+        if onnxruntime is None:
+            raise ImportError("ONNX 임베딩 백엔드에는 onnxruntime 패키지가 필요합니다")
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.name = "onnx_int8" if quantize else "onnx"
+
+        model_dir = model_dir or settings.EMBEDDING_ONNX_DIR
+        safe_model_name = re.sub(r"[^A-Za-z0-9._-]", "_", model_name)
+        self.export_dir = os.path.join(model_dir, safe_model_name)
+        self.fp32_path = os.path.join(self.export_dir, "model.onnx")
+        self.int8_path = os.path.join(self.export_dir, "model.int8.onnx")
+
+        if not os.path.exists(self.fp32_path):
+            self.export(model_name, self.fp32_path)
+        if quantize and not os.path.exists(self.int8_path):
+            self.quantize_model(self.fp32_path, self.int8_path)
+        self.model_path = self.int8_path if quantize else self.fp32_path
+
+        num_threads = settings.EMBEDDING_ONNX_THREADS if num_threads is None else num_threads
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = num_threads
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(
+            self.model_path, options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        logger.info(f"ONNX 임베딩 세션 준비: {self.model_path} (threads={num_threads or 'auto'})")
+
+    @staticmethod
+    def export(model_name: str, output_path: str):
+        """torch 모델을 ONNX로 export (batch/sequence 동적 축, 원자적 교체)"""
+        logger.info(f"임베딩 모델 ONNX export 중: {model_name} → {output_path}")
+        start = time.time()
+
+        model = _LastHiddenState(AutoModel.from_pretrained(model_name))
+        model.eval()
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp_path = f"{output_path}.tmp"
+        dummy = torch.ones((1, 8), dtype=torch.long)
+        dynamic_axes = {"input_ids": {0: "batch", 1: "sequence"}, "attention_mask": {0: "batch", 1: "sequence"}}
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (dummy, dummy),
+                tmp_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["last_hidden_state"],
+                dynamic_axes={**dynamic_axes, "last_hidden_state": {0: "batch", 1: "sequence"}},
+                opset_version=17,
+                dynamo=False,
+            )
+        os.replace(tmp_path, output_path)
+        logger.info(f"ONNX export 완료 ({time.time() - start:.1f}초)")
+
+    @staticmethod
+    def quantize_model(input_path: str, output_path: str):
+        """동적 int8 양자화 (가중치 int8, 활성값은 실행 시 양자화)"""
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(f"ONNX 모델 동적 int8 양자화 중: {output_path}")
+        tmp_path = f"{output_path}.tmp"
+        quantize_dynamic(input_path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, output_path)
+
+    def forward(self, encoded_input) -> np.ndarray:
+        """
+        토크나이즈된 배치를 한 번의 세션 실행으로 임베딩합니다.
+
+        Returns:
+            L2 정규화된 (batch, dim) float32 배열
+        """
+        feeds = {name: np.asarray(encoded_input[name], dtype=np.int64) for name in self.input_names}
+        token_embeddings = self.session.run(None, feeds)[0]
+        return mean_pool_and_normalize(token_embeddings, feeds["attention_mask"])
+
+
+def create_embedding_backend(model_name: str, backend_type: Optional[str] = None) -> Any:
+    """
+    설정에 맞는 임베딩 백엔드 생성
+
+    Args:
+        model_name: HuggingFace 모델명 또는 로컬 경로
+        backend_type: torch / onnx / onnx_int8 (None이면 settings.EMBEDDING_BACKEND)
+    """
+    backend_type = backend_type or settings.EMBEDDING_BACKEND
+    if backend_type == "torch":
+        return TorchEmbeddingBackend(model_name)
+    if backend_type in ("onnx", "onnx_int8"):
+        return OnnxEmbeddingBackend(model_name, quantize=backend_type == "onnx_int8")
+    raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend_type} (지원: {BACKEND_TYPES})")
+
@@ -0,0 +1,293 @@
+"""
+임베딩 캐시 모듈
+
+동일한 뉴스 텍스트가 중복 검사 / 유사 뉴스 검색 / 인덱싱 단계에서
+여러 번 임베딩되는 것을 방지합니다.
+
+구조:
+- 키: sha1(모델명 + 정규화된 텍스트) 20바이트 digest
+- 1차 캐시: 프로세스 내 LRU (OrderedDict, float32 벡터)
+- 2차 캐시: 디스크 memmap 파일 (고정 크기 레코드 = key + float32 벡터)
+  - append-only 단일 write로 기록하므로 여러 프로세스가 같은 파일을 공유 가능
+  - 다른 프로세스가 추가한 레코드는 miss 시 파일 증가분만 다시 읽어 반영
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (앞뒤 공백 제거 + 연속 공백 축약)"""
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+class EmbeddingCache:
+    """
+    2단계(메모리 LRU + 디스크 memmap) 임베딩 캐시 (Thread-safe)
+
+    Features:
+    - 정규화된 텍스트 + 모델명 해시를 키로 사용
+    - 디스크 tier는 재시작 후에도 유지
+    - hit/miss 카운터 제공 (get_stats)
+    """
+
+    KEY_BYTES = 20  # sha1 digest 크기
+
+    def __init__(
+        self,
+        model_name: str,
+        dim: int,
+        cache_dir: Optional[str] = None,
+        memory_size: Optional[int] = None,
+        disk_enabled: Optional[bool] = None,
+        max_disk_rows: Optional[int] = None,
+        namespace: str = "",
+    ):
+        """
+        Args:
+            model_name: 임베딩 모델명 (키에 포함)
+            dim: 임베딩 차원
+            cache_dir: 디스크 캐시 디렉토리 (None이면 settings.EMBEDDING_CACHE_DIR)
+            memory_size: 메모리 LRU 최대 항목 수
+            disk_enabled: 디스크 tier 사용 여부
+            max_disk_rows: 디스크 tier 최대 레코드 수 (초과 시 더 이상 기록하지 않음)
+            namespace: 키에 추가할 구분자 (임베딩 텍스트 정책 등, 빈 문자열이면 미포함)
+        """
+        self.model_name = model_name
+        self.namespace = namespace
+        self.dim = dim
+        self.memory_size = (
+            settings.EMBEDDING_CACHE_MEMORY_SIZE if memory_size is None else memory_size
+        )
+        self.disk_enabled = (
+            settings.EMBEDDING_CACHE_DISK_ENABLED if disk_enabled is None else disk_enabled
+        )
+        self.max_disk_rows = (
+            settings.EMBEDDING_CACHE_MAX_DISK_ROWS if max_disk_rows is None else max_disk_rows
+        )
+
+        cache_dir = cache_dir or settings.EMBEDDING_CACHE_DIR
+        safe_model_name = re.sub(r"[^A-Za-z0-9._-]", "_", model_name)
+        self.disk_path = os.path.join(cache_dir, f"{safe_model_name}-{dim}.cache")
+
+        self._record_dtype = np.dtype([
+            ("key", f"S{self.KEY_BYTES}"),
+            ("vector", "<f4", (dim,)),
+        ])
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+        # 디스크 tier 상태
+        self._disk_rows: Dict[bytes, int] = {}
+        self._disk_map: Optional[np.memmap] = None
+        self._disk_scanned_rows = 0
+        self._disk_full_warned = False
+
+        # 통계
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        if self.disk_enabled:
+            self._init_disk()
+
+    # ==================== 키 ====================
+
+    def make_key(self, text: str) -> bytes:
+        """정규화된 텍스트 + 모델명 (+ namespace)으로 캐시 키 생성"""
+        prefix = f"{self.model_name}\x00{self.namespace}" if self.namespace else self.model_name
+        payload = f"{prefix}\x00{normalize_text(text)}".encode("utf-8")
+        return hashlib.sha1(payload).digest()
+
+    # ==================== 디스크 tier ====================
+
+    def _init_disk(self):
+        """디스크 캐시 파일 준비 (불완전한 마지막 레코드 정리)"""
+        try:
+            os.makedirs(os.path.dirname(self.disk_path) or ".", exist_ok=True)
+
+            if os.path.exists(self.disk_path):
+                size = os.path.getsize(self.disk_path)
+                remainder = size % self._record_dtype.itemsize
+                if remainder:
+                    # 기록 도중 중단된 레코드 제거
+                    with open(self.disk_path, "r+b") as f:
+                        f.truncate(size - remainder)
+                    logger.warning(f"임베딩 캐시 파일의 불완전한 레코드 정리: {self.disk_path}")
+
+            self._refresh_disk_rows()
+            logger.info(f"💾 임베딩 디스크 캐시 로드: {len(self._disk_rows)}건 ({self.disk_path})")
+
+        except Exception as e:
+            logger.warning(f"임베딩 디스크 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+            self.disk_enabled = False
+
+    def _refresh_disk_rows(self):
+        """파일 증가분(다른 프로세스 기록 포함)을 memmap으로 다시 읽어 키 인덱스 갱신"""
+        if not os.path.exists(self.disk_path):
+            return
+
+        total_rows = os.path.getsize(self.disk_path) // self._record_dtype.itemsize
+        if total_rows == self._disk_scanned_rows:
+            return
+
+        if total_rows == 0:
+            self._disk_map = None
+            return
+
+        self._disk_map = np.memmap(
+            self.disk_path, dtype=self._record_dtype, mode="r", shape=(total_rows,)
+        )
+        new_keys = self._disk_map["key"][self._disk_scanned_rows:total_rows]
+        for offset, key in enumerate(new_keys):
+            # S20 필드는 읽을 때 끝의 \x00을 잘라내므로 원래 길이로 복원
+            self._disk_rows.setdefault(bytes(key).ljust(self.KEY_BYTES, b"\0"), self._disk_scanned_rows + offset)
+        self._disk_scanned_rows = total_rows
+
+    def _disk_get(self, key: bytes) -> Optional[np.ndarray]:
+        """디스크 tier 조회 (호출자가 _lock을 잡고 있어야 함)"""
+        row = self._disk_rows.get(key)
+        if row is None:
+            self._refresh_disk_rows()
+            row = self._disk_rows.get(key)
+            if row is None:
+                return None
+
+        return np.array(self._disk_map["vector"][row], dtype=np.float32)
+
+    def _disk_put(self, key: bytes, vector: np.ndarray):
+        """디스크 tier 기록 (호출자가 _lock을 잡고 있어야 함)"""
+        if key in self._disk_rows:
+            return
+
+        if self._disk_scanned_rows >= self.max_disk_rows:
+            if not self._disk_full_warned:
+                logger.warning(
+                    f"임베딩 디스크 캐시 최대 크기 도달 ({self.max_disk_rows}건), 디스크 기록 중단"
+                )
+                self._disk_full_warned = True
+            return
+
+        record = np.zeros(1, dtype=self._record_dtype)
+        record["key"][0] = key
+        record["vector"][0] = vector
+
+        # O_APPEND + 단일 write → 다른 프로세스와 레코드가 섞이지 않음
+        fd = os.open(self.disk_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, record.tobytes())
+        finally:
+            os.close(fd)
+
+        self._refresh_disk_rows()
+
+    # ==================== 공개 API ====================
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """
+        캐시된 임베딩 조회
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            임베딩 벡터 또는 None (miss)
+        """
+        key = self.make_key(text)
+
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector.tolist()
+
+            if self.disk_enabled:
+                try:
+                    vector = self._disk_get(key)
+                except Exception as e:
+                    logger.warning(f"임베딩 디스크 캐시 조회 실패: {e}")
+                    vector = None
+
+                if vector is not None:
+                    self._memory_put(key, vector)
+                    self.disk_hits += 1
+                    return vector.tolist()
+
+            self.misses += 1
+            return None
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """여러 텍스트의 캐시 조회 (miss는 None)"""
+        return [self.get(text) for text in texts]
+
+    def put(self, text: str, embedding: List[float]):
+        """
+        임베딩을 메모리 및 디스크 tier에 저장
+
+        Args:
+            text: 원본 텍스트
+            embedding: 임베딩 벡터
+        """
+        if embedding is None:
+            return
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            logger.warning(f"임베딩 차원 불일치로 캐시 저장 생략: {vector.shape}")
+            return
+
+        key = self.make_key(text)
+
+        with self._lock:
+            self._memory_put(key, vector)
+            self.writes += 1
+
+            if self.disk_enabled:
+                try:
+                    self._disk_put(key, vector)
+                except Exception as e:
+                    logger.warning(f"임베딩 디스크 캐시 기록 실패: {e}")
+
+    def _memory_put(self, key: bytes, vector: np.ndarray):
+        """메모리 LRU 저장 (호출자가 _lock을 잡고 있어야 함)"""
+        if self.memory_size <= 0:
+            return
+
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환 (hit rate 포함)"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk_rows),
+                "disk_enabled": self.disk_enabled,
+            }
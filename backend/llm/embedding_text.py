@@ -0,0 +1,108 @@
+"""
+임베딩 입력 텍스트 정책 모듈
+
+긴 기사 본문이 항상 512 토큰 attention 비용을 치르지 않도록,
+임베딩 전에 입력을 줄이는 정책을 제공합니다 (settings.EMBEDDING_TEXT_POLICY).
+
+정책:
+- full: 제목 + 본문 전체, max_length(512) 토큰에서 절단 (기존 동작)
+- lead_sentences: 제목 + 본문 앞 N문장
+- token_budget: 앞쪽 토큰 예산만큼만 사용
+- head_tail: 예산 초과 시 앞부분 + 뒷부분 토큰 결합 (결론/전망 문단 보존)
+
+입력 텍스트는 "제목\\n본문" 형식을 가정합니다 (첫 줄 = 제목).
+정책이 바뀌면 같은 텍스트라도 벡터가 달라지므로 signature를 임베딩 캐시 키에 포함합니다.
+"""
+import re
+from typing import Dict, List, Optional
+
+from backend.config import settings
+
+
+TEXT_POLICIES = ("full", "lead_sentences", "token_budget", "head_tail")
+
+# 문장 끝: 마침표/물음표/느낌표 (한국어 '다.' 포함) 또는 줄바꿈
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """본문을 문장 단위로 분리 (빈 문장 제외)"""
+    return [sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(text or "") if sentence.strip()]
+
+
+class EmbeddingTextPolicy:
+    """
+    임베딩 입력 절단 정책
+
+    encode()는 패딩 없는 토크나이저 출력(dict of lists)을 반환하므로
+    embed_batch의 길이 버킷팅/tokenizer.pad에서 그대로 재사용됩니다.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[str] = None,
+        max_length: Optional[int] = None,
+        lead_sentences: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        tail_tokens: Optional[int] = None,
+    ):
+        """
+        Args:
+            policy: 정책 이름 (None이면 settings.EMBEDDING_TEXT_POLICY)
+            max_length: 모델 최대 토큰 수 (None이면 settings.EMBEDDING_MAX_LENGTH)
+            lead_sentences: lead_sentences 정책의 본문 문장 수
+            token_budget: token_budget / head_tail 정책의 토큰 예산 (특수 토큰 포함)
+            tail_tokens: head_tail 정책에서 뒷부분에 배정할 토큰 수
+        """
+        self.policy = policy or settings.EMBEDDING_TEXT_POLICY
+        if self.policy not in TEXT_POLICIES:
+            raise ValueError(f"지원하지 않는 임베딩 텍스트 정책: {self.policy} (지원: {TEXT_POLICIES})")
+
+        self.max_length = max_length or settings.EMBEDDING_MAX_LENGTH
+        self.lead_sentences = lead_sentences or settings.EMBEDDING_LEAD_SENTENCES
+        self.token_budget = min(token_budget or settings.EMBEDDING_TOKEN_BUDGET, self.max_length)
+        self.tail_tokens = min(
+            settings.EMBEDDING_TAIL_TOKENS if tail_tokens is None else tail_tokens,
+            self.token_budget - 2,
+        )
+
+    @property
+    def signature(self) -> str:
+        """캐시 키용 정책 식별자 (full은 기존 캐시와 호환되도록 빈 문자열)"""
+        if self.policy == "full":
+            return "" if self.max_length == 512 else f"full:{self.max_length}"
+        if self.policy == "lead_sentences":
+            return f"lead_sentences:{self.lead_sentences}:{self.max_length}"
+        if self.policy == "token_budget":
+            return f"token_budget:{self.token_budget}"
+        return f"head_tail:{self.token_budget}:{self.tail_tokens}"
+
+    def prepare_text(self, text: str) -> str:
+        """텍스트 단계 정책 적용 (lead_sentences: 제목 + 본문 앞 N문장)"""
+        if self.policy != "lead_sentences":
+            return text
+        title, _, body = (text or "").partition("\n")
+        lead = " ".join(split_sentences(body)[:self.lead_sentences])
+        return f"{title}\n{lead}" if lead else title
+
+    def encode(self, tokenizer, text: str) -> Dict[str, List[int]]:
+        """
+        정책에 따라 패딩 없이 토크나이징
+
+        Returns:
+            tokenizer 출력 (input_ids, attention_mask 등, 특수 토큰 포함)
+        """
+        if self.policy == "token_budget":
+            return dict(tokenizer(text, truncation=True, max_length=self.token_budget))
+
+        if self.policy != "head_tail":
+            return dict(tokenizer(self.prepare_text(text), truncation=True, max_length=self.max_length))
+
+        encoded = dict(tokenizer(text, truncation=False, verbose=False))
+        length = len(encoded["input_ids"])
+        if length <= self.token_budget:
+            return encoded
+
+        # 앞부분은 시작 특수 토큰, 뒷부분은 끝 특수 토큰을 포함하도록 그대로 잘라 결합
+        head = self.token_budget - self.tail_tokens
+        return {key: values[:head] + values[length - self.tail_tokens:] for key, values in encoded.items()}
@@ -0,0 +1,282 @@
+"""
+FAISS 인덱스 라이프사이클 관리 모듈
+
+코퍼스 규모에 맞춰 메인 인덱스 구조와 검색 파라미터를 자동으로 조정합니다.
+
+작업:
+- 승격: Flat 인덱스가 FAISS_IVF_MIN_VECTORS를 넘으면 IVF로 변환
+- 재학습: nlist가 sqrt(N)에서 FAISS_IVF_NLIST_DRIFT 배 이상 벗어나면 centroid 재학습
+- nprobe 튜닝: held-out 쿼리 샘플의 recall@k가 FAISS_IVF_RECALL_TARGET을 넘는 최소 nprobe 선택
+- 인덱스 타입: FAISS_INDEX_TYPE(ivf_flat / ivf_sq8 / ivf_pq)이 바뀌면 재구성
+  - 압축 타입은 원본 벡터 재정렬을 포함한 recall로 nprobe를 튜닝
+- 교체: FaissSegmentStore.rebuild_main_index로 검색을 막지 않고 원자적으로 교체
+"""
+import logging
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from backend.config import settings
+from backend.llm.faiss_store import FaissSegmentStore, get_faiss_store, rerank_exact
+
+
+logger = logging.getLogger(__name__)
+
+
+ACTION_PROMOTE = "promote"
+ACTION_RETRAIN = "retrain"
+ACTION_TUNE = "tune"
+
+INDEX_TYPES = ("ivf_flat", "ivf_sq8", "ivf_pq")
+
+
+def create_ivf_index(
+    index_type: str, dim: int, nlist: int, metric_type: int, pq_m: Optional[int] = None
+) -> faiss.Index:
+    """
+    빈 IVF 인덱스 생성
+
+    Args:
+        index_type: ivf_flat / ivf_sq8 (int8 스칼라 양자화) / ivf_pq (8bit PQ)
+        dim: 벡터 차원
+        nlist: 클러스터 수
+        metric_type: faiss.METRIC_INNER_PRODUCT 또는 faiss.METRIC_L2
+        pq_m: PQ 서브벡터 수 (None이면 settings.FAISS_PQ_M)
+    """
+    if metric_type == faiss.METRIC_INNER_PRODUCT:
+        quantizer = faiss.IndexFlatIP(dim)
+    else:
+        quantizer = faiss.IndexFlatL2(dim)
+
+    if index_type == "ivf_sq8":
+        return faiss.IndexIVFScalarQuantizer(
+            quantizer, dim, nlist, faiss.ScalarQuantizer.QT_8bit, metric_type
+        )
+    if index_type == "ivf_pq":
+        m = pq_m or settings.FAISS_PQ_M
+        if dim % m != 0:
+            raise ValueError(f"FAISS_PQ_M({m})은 임베딩 차원({dim})의 약수여야 합니다")
+        return faiss.IndexIVFPQ(quantizer, dim, nlist, m, 8, metric_type)
+    if index_type == "ivf_flat":
+        return faiss.IndexIVFFlat(quantizer, dim, nlist, metric_type)
+    raise ValueError(f"지원하지 않는 FAISS 인덱스 타입: {index_type} (지원: {INDEX_TYPES})")
+
+
+def index_type_of(index: faiss.Index) -> str:
+    """IVF 인덱스의 타입 이름 (INDEX_TYPES 중 하나)"""
+    ivf = faiss.downcast_index(faiss.extract_index_ivf(index))
+    if isinstance(ivf, faiss.IndexIVFPQ):
+        return "ivf_pq"
+    if isinstance(ivf, faiss.IndexIVFScalarQuantizer):
+        return "ivf_sq8"
+    return "ivf_flat"
+
+
+class IndexLifecycleManager:
+    """
+    FAISS 메인 인덱스 라이프사이클 관리자
+
+    Features:
+    - Flat → IVF 승격 / IVF centroid 재학습 / nprobe recall 튜닝
+    - IVF-Flat / IVF-SQ8 / IVF-PQ 인덱스 타입 전환
+    - 학습 및 직렬화는 Lock 밖에서 수행 (검색 비블로킹)
+    """
+
+    NPROBE_CANDIDATES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+    TRAIN_POINTS_PER_CENTROID = 256  # FAISS 권장 학습 샘플 상한 (nlist당)
+    RETUNE_GROWTH = 0.2  # 마지막 튜닝 이후 20% 이상 증가하면 nprobe 재튜닝
+
+    def __init__(
+        self,
+        store: Optional[FaissSegmentStore] = None,
+        min_vectors_for_ivf: Optional[int] = None,
+        nlist_drift: Optional[float] = None,
+        recall_target: Optional[float] = None,
+        tune_queries: Optional[int] = None,
+        recall_k: int = 10,
+        seed: int = 42,
+        index_type: Optional[str] = None,
+    ):
+        """
+        Args:
+            store: 대상 세그먼트 저장소 (None이면 get_faiss_store())
+            min_vectors_for_ivf: IVF 승격 기준 벡터 수 (None이면 settings.FAISS_IVF_MIN_VECTORS)
+            nlist_drift: 재학습 기준 nlist/sqrt(N) 배율 (None이면 settings.FAISS_IVF_NLIST_DRIFT)
+            recall_target: nprobe 튜닝 목표 recall@k (None이면 settings.FAISS_IVF_RECALL_TARGET)
+            tune_queries: held-out 쿼리 샘플 수 (None이면 settings.FAISS_IVF_TUNE_QUERIES)
+            recall_k: recall 측정 k
+            seed: 샘플링 난수 시드
+            index_type: IVF 인덱스 타입 (None이면 settings.FAISS_INDEX_TYPE)
+        """
+        self.store = store or get_faiss_store()
+        self.min_vectors_for_ivf = min_vectors_for_ivf or settings.FAISS_IVF_MIN_VECTORS
+        self.nlist_drift = nlist_drift or settings.FAISS_IVF_NLIST_DRIFT
+        self.recall_target = recall_target or settings.FAISS_IVF_RECALL_TARGET
+        self.tune_queries = tune_queries or settings.FAISS_IVF_TUNE_QUERIES
+        self.recall_k = recall_k
+        self.seed = seed
+        self.index_type = index_type or settings.FAISS_INDEX_TYPE
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(f"지원하지 않는 FAISS 인덱스 타입: {self.index_type} (지원: {INDEX_TYPES})")
+
+    @staticmethod
+    def target_nlist(ntotal: int) -> int:
+        """코퍼스 크기에 맞는 클러스터 수 (sqrt(N))"""
+        return max(1, int(round(math.sqrt(ntotal))))
+
+    # ==================== 계획 ====================
+
+    def plan(self) -> Optional[str]:
+        """
+        현재 인덱스 상태에서 필요한 작업 판단
+
+        Returns:
+            ACTION_PROMOTE / ACTION_RETRAIN / ACTION_TUNE 또는 None (작업 불필요)
+        """
+        self.store.load()
+        ntotal = self.store.ntotal
+
+        if not self.store.is_ivf:
+            return ACTION_PROMOTE if ntotal >= self.min_vectors_for_ivf else None
+
+        if self.store.index_params.get("index_type", "ivf_flat") != self.index_type:
+            return ACTION_RETRAIN
+
+        ratio = self.store.main_index.nlist / self.target_nlist(ntotal)
+        if ratio > self.nlist_drift or ratio < 1 / self.nlist_drift:
+            return ACTION_RETRAIN
+
+        tuned_ntotal = self.store.index_params.get("ntotal")
+        if not tuned_ntotal or ntotal > tuned_ntotal * (1 + self.RETUNE_GROWTH):
+            return ACTION_TUNE
+
+        return None
+
+    def run(self, action: Optional[str] = None) -> Dict[str, Any]:
+        """
+        필요한 라이프사이클 작업 실행
+
+        delta를 먼저 컴팩션하여 메인 인덱스가 전체 코퍼스를 포함하도록 합니다.
+
+        Args:
+            action: 강제 실행할 작업 (None이면 plan() 결과)
+
+        Returns:
+            {"action": ..., **params} 실행 결과
+        """
+        action = action or self.plan()
+        if action is None:
+            return {"action": None}
+
+        start = time.time()
+        self.store.compact()
+
+        if action in (ACTION_PROMOTE, ACTION_RETRAIN):
+            params = self.store.rebuild_main_index(self._build_ivf)
+        elif action == ACTION_TUNE:
+            params = self.store.tune_main_index(self._tune)
+        else:
+            raise ValueError(f"알 수 없는 라이프사이클 작업: {action}")
+
+        elapsed = time.time() - start
+        logger.info(
+            f"🔧 FAISS 인덱스 {action} 완료 ({elapsed:.1f}s): "
+            f"nlist={params.get('nlist')}, nprobe={params.get('nprobe')}, "
+            f"recall@{self.recall_k}={params.get('recall')}"
+        )
+        return {"action": action, "elapsed_seconds": round(elapsed, 2), **params}
+
+    # ==================== 학습 / 튜닝 ====================
+
+    def _split_held_out(self, ntotal: int) -> Tuple[np.ndarray, np.ndarray]:
+        """held-out 쿼리 행과 학습용 행 분리"""
+        rng = np.random.default_rng(self.seed)
+        order = rng.permutation(ntotal)
+        n_queries = min(self.tune_queries, max(1, ntotal // 10))
+        return order[:n_queries], order[n_queries:]
+
+    def _build_ivf(self, vectors: np.ndarray, metric_type: int) -> Tuple[faiss.Index, Dict[str, Any]]:
+        """IVF 인덱스 학습 + 전체 벡터 추가 + nprobe 튜닝"""
+        ntotal, dim = vectors.shape
+        nlist = self.target_nlist(ntotal)
+        query_rows, train_rows = self._split_held_out(ntotal)
+
+        # 학습 샘플은 held-out 쿼리를 제외하고 nlist당 최대 256개
+        max_train = nlist * self.TRAIN_POINTS_PER_CENTROID
+        train_vectors = vectors[train_rows[:max_train]]
+
+        index = create_ivf_index(self.index_type, dim, nlist, metric_type)
+        index.train(np.ascontiguousarray(train_vectors))
+        index.add(vectors)
+
+        params = self._tune_nprobe(index, vectors, query_rows)
+        index.nprobe = params["nprobe"]
+        return index, params
+
+    def _tune(self, index: faiss.Index, vectors: np.ndarray) -> Dict[str, Any]:
+        """기존 IVF 인덱스의 nprobe만 튜닝"""
+        query_rows, _ = self._split_held_out(len(vectors))
+        return self._tune_nprobe(index, vectors, query_rows)
+
+    def _tune_nprobe(
+        self, index: faiss.Index, vectors: np.ndarray, query_rows: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        recall@k가 목표를 넘는 최소 nprobe 탐색
+
+        정답은 동일 벡터에 대한 Flat 정확 검색 결과입니다. 인덱스 상태를 바꾸지 않도록
+        SearchParametersIVF로 nprobe를 지정합니다. 압축 인덱스는 검색 경로와 동일하게
+        top_k x rerank_factor 후보를 원본 벡터로 재정렬한 결과로 recall을 측정합니다.
+        쿼리 벡터도 인덱스에 들어 있으므로 k+1개를 검색해 쿼리 자신의 행은 정답과
+        검색 결과 양쪽에서 제외합니다 (자기 자신 매칭으로 recall이 부풀지 않도록).
+        """
+        k = max(1, min(self.recall_k, len(vectors) - 1))
+        search_k = min(k + 1, len(vectors))
+        queries = np.ascontiguousarray(vectors[query_rows])
+
+        exact = faiss.IndexFlat(vectors.shape[1], index.metric_type)
+        exact.add(vectors)
+        _, truth = exact.search(queries, search_k)
+        truth = [self._without_row(rows, row, k) for rows, row in zip(truth, query_rows)]
+
+        compressed = index_type_of(index) != "ivf_flat"
+        fetch_k = min(search_k * self.store.rerank_factor, len(vectors)) if compressed else search_k
+        inner_product = index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+        nlist = index.nlist
+        candidates = [p for p in self.NPROBE_CANDIDATES if p < nlist] + [nlist]
+
+        best_nprobe, best_recall = nlist, 0.0
+        for nprobe in candidates:
+            _, found = index.search(
+                queries, fetch_k, params=faiss.SearchParametersIVF(nprobe=nprobe)
+            )
+            if compressed:
+                _, found = rerank_exact(queries, found, vectors, search_k, inner_product)
+            recall = float(np.mean([
+                len(np.intersect1d(self._without_row(found[q], row, k), truth[q])) / k
+                for q, row in enumerate(query_rows)
+            ]))
+            best_nprobe, best_recall = nprobe, recall
+            if recall >= self.recall_target:
+                break
+
+        return {
+            "index_type": index_type_of(index),
+            "nlist": int(nlist),
+            "nprobe": int(best_nprobe),
+            "recall": round(best_recall, 4),
+            "recall_k": k,
+            "recall_target": self.recall_target,
+            "ntotal": int(len(vectors)),
+            "tuned_at": int(time.time()),
+        }
+
+    @staticmethod
+    def _without_row(rows: np.ndarray, row: int, k: int) -> np.ndarray:
+        """검색 결과에서 쿼리 자신의 행과 빈 슬롯(-1)을 빼고 상위 k개만 남김"""
+        rows = np.asarray(rows)
+        return rows[(rows != row) & (rows >= 0)][:k]
@@ -0,0 +1,252 @@
+"""
+FAISS 컬럼형 메타데이터 모듈
+
+pickle된 dict 리스트 대신 NumPy 컬럼으로 FAISS 메타데이터를 관리합니다.
+
+컬럼:
+- news_id: int64
+- stock_code: int32 (StockCodeVocab의 카테고리 코드)
+- published_at: int64 (Unix timestamp, 없으면 -1)
+
+디스크 포맷 (FAISS_METADATA_DIR):
+- manifest.json: 현재 세대(generation), 행 수, 종목 코드 사전
+- {column}.{generation}.npy: 컬럼별 .npy 파일 (np.load mmap_mode='r'로 메모리 매핑)
+
+manifest.json을 os.replace로 교체하는 방식으로 여러 컬럼 파일을 원자적으로 전환합니다.
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import faiss
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+NO_TIMESTAMP = -1  # published_at 없음 (기존 인덱스 호환)
+NO_STOCK_CODE = -1  # 사전에 없는 종목 코드 (필터 결과 없음)
+
+COLUMNS = ("news_id", "stock_code", "published_at")
+COLUMN_DTYPES = {
+    "news_id": np.int64,
+    "stock_code": np.int32,
+    "published_at": np.int64,
+}
+
+
+class StockCodeVocab:
+    """종목 코드 문자열 ↔ 카테고리 정수 코드 사전"""
+
+    def __init__(self, codes: Optional[List[str]] = None):
+        self.codes: List[str] = list(codes or [])
+        self._index: Dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+
+    def encode(self, stock_code: Optional[str]) -> int:
+        """종목 코드를 정수 코드로 변환 (없으면 사전에 추가)"""
+        stock_code = stock_code or ""
+        code_id = self._index.get(stock_code)
+        if code_id is None:
+            code_id = len(self.codes)
+            self.codes.append(stock_code)
+            self._index[stock_code] = code_id
+        return code_id
+
+    def lookup(self, stock_code: Optional[str]) -> int:
+        """종목 코드 조회 (사전에 없으면 NO_STOCK_CODE, 사전에 추가하지 않음)"""
+        return self._index.get(stock_code or "", NO_STOCK_CODE)
+
+    def decode(self, code_id: int) -> str:
+        """정수 코드를 종목 코드로 변환"""
+        return self.codes[code_id]
+
+
+class ColumnarMetadata:
+    """
+    FAISS 세그먼트 메타데이터 컬럼 (행 번호 = FAISS 내부 ID)
+
+    Features:
+    - 디스크에서 memmap으로 lazy 로드
+    - 종목/기간 조건을 벡터화된 마스크로 계산
+    - 마스크를 FAISS IDSelectorBitmap으로 변환하여 검색 전 필터링
+    """
+
+    def __init__(
+        self,
+        vocab: StockCodeVocab,
+        news_id: Optional[np.ndarray] = None,
+        stock_code: Optional[np.ndarray] = None,
+        published_at: Optional[np.ndarray] = None,
+    ):
+        self.vocab = vocab
+        self.news_id = news_id if news_id is not None else np.empty(0, dtype=np.int64)
+        self.stock_code = stock_code if stock_code is not None else np.empty(0, dtype=np.int32)
+        self.published_at = (
+            published_at if published_at is not None else np.empty(0, dtype=np.int64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.news_id)
+
+    # ==================== 생성 ====================
+
+    @classmethod
+    def from_records(
+        cls, vocab: StockCodeVocab, records: Iterable[Dict[str, Any]]
+    ) -> "ColumnarMetadata":
+        """기존 pickle 메타데이터(dict 리스트)에서 변환"""
+        records = list(records)
+        published = [meta.get("published_at") for meta in records]
+        return cls(
+            vocab,
+            news_id=np.array([meta["news_article_id"] for meta in records], dtype=np.int64),
+            stock_code=np.array(
+                [vocab.encode(meta.get("stock_code")) for meta in records], dtype=np.int32
+            ),
+            published_at=np.array(
+                [NO_TIMESTAMP if ts is None else int(ts) for ts in published], dtype=np.int64
+            ),
+        )
+
+    def extend(
+        self,
+        news_ids: np.ndarray,
+        stock_code_ids: np.ndarray,
+        published_at: np.ndarray,
+    ):
+        """행 추가 (memmap 컬럼은 메모리 배열로 전환됨)"""
+        self.news_id = np.concatenate([self.news_id, np.asarray(news_ids, dtype=np.int64)])
+        self.stock_code = np.concatenate(
+            [self.stock_code, np.asarray(stock_code_ids, dtype=np.int32)]
+        )
+        self.published_at = np.concatenate(
+            [self.published_at, np.asarray(published_at, dtype=np.int64)]
+        )
+
+    def concat(self, other: "ColumnarMetadata") -> "ColumnarMetadata":
+        """두 세그먼트 메타데이터를 이어붙인 새 객체 반환 (동일 vocab 전제)"""
+        return ColumnarMetadata(
+            self.vocab,
+            news_id=np.concatenate([self.news_id, other.news_id]),
+            stock_code=np.concatenate([self.stock_code, other.stock_code]),
+            published_at=np.concatenate([self.published_at, other.published_at]),
+        )
+
+    # ==================== 조회 ====================
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """FAISS 내부 ID(행 번호)의 메타데이터를 dict로 반환"""
+        published_at = int(self.published_at[position])
+        return {
+            "news_article_id": int(self.news_id[position]),
+            "stock_code": self.vocab.decode(int(self.stock_code[position])),
+            "published_at": None if published_at == NO_TIMESTAMP else published_at,
+        }
+
+    def mask(
+        self,
+        stock_code: Optional[str] = None,
+        published_after: Optional[int] = None,
+        published_before: Optional[int] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        조건에 맞는 행의 boolean 마스크 (조건이 없으면 None)
+
+        Args:
+            stock_code: 종목 코드
+            published_after: 이 시각(포함) 이후 발행
+            published_before: 이 시각(미포함) 이전 발행
+        """
+        if stock_code is None and published_after is None and published_before is None:
+            return None
+
+        mask = np.ones(len(self), dtype=bool)
+        if stock_code is not None:
+            mask &= self.stock_code == self.vocab.lookup(stock_code)
+        if published_after is not None:
+            mask &= self.published_at >= published_after
+        if published_before is not None:
+            mask &= (self.published_at < published_before) & (self.published_at != NO_TIMESTAMP)
+        return mask
+
+    @staticmethod
+    def selector_from_mask(mask: np.ndarray):
+        """
+        boolean 마스크를 FAISS IDSelectorBitmap으로 변환
+
+        Returns:
+            (selector, bitmap) 튜플 - bitmap은 검색이 끝날 때까지 참조를 유지해야 함
+        """
+        bitmap = np.packbits(mask, bitorder="little")
+        selector = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap))
+        return selector, bitmap
+
+    # ==================== 저장 / 로드 ====================
+
+    def save(self, directory: str):
+        """
+        새 세대(generation)로 컬럼 파일을 쓰고 manifest.json을 원자적으로 교체
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = read_manifest(directory)
+        generation = (manifest["generation"] + 1) if manifest else 1
+
+        for column in COLUMNS:
+            path = os.path.join(directory, f"{column}.{generation}.npy")
+            np.save(path, np.ascontiguousarray(getattr(self, column), dtype=COLUMN_DTYPES[column]))
+
+        new_manifest = {
+            "generation": generation,
+            "rows": len(self),
+            "stock_codes": self.vocab.codes,
+        }
+        tmp_path = os.path.join(directory, "manifest.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(new_manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(directory, "manifest.json"))
+
+        # 이전 세대 파일 정리 (이미 memmap 중인 프로세스는 inode가 유지되어 안전)
+        if manifest:
+            for column in COLUMNS:
+                old_path = os.path.join(directory, f"{column}.{manifest['generation']}.npy")
+                try:
+                    os.remove(old_path)
+                except FileNotFoundError:
+                    pass
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> Optional["ColumnarMetadata"]:
+        """
+        컬럼 파일 로드 (manifest가 없으면 None)
+
+        Args:
+            directory: 메타데이터 디렉토리
+            mmap: True면 np.load(mmap_mode='r')로 메모리 매핑
+        """
+        manifest = read_manifest(directory)
+        if manifest is None:
+            return None
+
+        generation = manifest["generation"]
+        columns = {}
+        for column in COLUMNS:
+            path = os.path.join(directory, f"{column}.{generation}.npy")
+            columns[column] = np.load(path, mmap_mode="r" if mmap else None)
+
+        metadata = cls(StockCodeVocab(manifest["stock_codes"]), **columns)
+        if len(metadata) != manifest["rows"]:
+            raise ValueError(
+                f"메타데이터 행 수 불일치: manifest={manifest['rows']}, columns={len(metadata)}"
+            )
+        return metadata
+
+
+def read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+    """manifest.json 읽기 (없으면 None)"""
+    path = os.path.join(directory, "manifest.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,226 @@
+"""
+종목별 FAISS 파티션 모듈
+
+유사 뉴스 검색은 대부분 단일 종목으로 한정되므로, 활성 종목마다 작은 Flat 인덱스를
+두고 종목 필터 검색을 해당 파티션으로 바로 라우팅합니다 (over-fetch 없는 정확 검색).
+
+디스크 포맷 (FAISS_PARTITION_DIR):
+- partitions.json: 파티션이 존재하는 종목 코드 목록
+- {stock_code}.npz: news_id / published_at 컬럼
+- {stock_code}.index: 파티션 FAISS 인덱스 (IndexFlatIP 또는 IndexFlatL2)
+
+파티션은 리밸런싱(scripts/rebalance_faiss_partitions.py) 시 전체 재구성되고,
+이후 append된 벡터는 WAL 재생 시 메모리 파티션에도 반영되어 컴팩션 때 저장됩니다.
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from backend.llm.faiss_metadata import NO_TIMESTAMP, ColumnarMetadata
+
+
+logger = logging.getLogger(__name__)
+
+
+class StockPartition:
+    """단일 종목 파티션 (Flat 인덱스 + news_id/published_at 컬럼)"""
+
+    def __init__(self, stock_code: str, dim: int, inner_product: bool = True):
+        self.stock_code = stock_code
+        self.index: faiss.Index = faiss.IndexFlatIP(dim) if inner_product else faiss.IndexFlatL2(dim)
+        self.news_id = np.empty(0, dtype=np.int64)
+        self.published_at = np.empty(0, dtype=np.int64)
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.news_id)
+
+    def add(self, news_ids: np.ndarray, published_at: np.ndarray, vectors: np.ndarray) -> int:
+        """
+        벡터 추가 (이미 포함된 news_id는 건너뜀)
+
+        Returns:
+            추가된 벡터 수
+        """
+        news_ids = np.asarray(news_ids, dtype=np.int64)
+        fresh = ~np.isin(news_ids, self.news_id)
+        if not fresh.any():
+            return 0
+
+        self.index.add(np.ascontiguousarray(vectors[fresh], dtype=np.float32))
+        self.news_id = np.concatenate([self.news_id, news_ids[fresh]])
+        self.published_at = np.concatenate(
+            [self.published_at, np.asarray(published_at, dtype=np.int64)[fresh]]
+        )
+        self.dirty = True
+        return int(fresh.sum())
+
+    def search(
+        self,
+        query_vectors: np.ndarray,
+        k: int,
+        published_after: Optional[int] = None,
+        published_before: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        파티션 내 정확 검색 (기간 조건은 IDSelector로 사전 필터링)
+
+        Returns:
+            (distances, indices) - FAISS search 결과와 동일한 형태
+        """
+        mask = None
+        if published_after is not None or published_before is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if published_after is not None:
+                mask &= self.published_at >= published_after
+            if published_before is not None:
+                mask &= (self.published_at < published_before) & (self.published_at != NO_TIMESTAMP)
+
+        if mask is None:
+            return self.index.search(query_vectors, min(k, self.index.ntotal))
+
+        candidates = int(mask.sum())
+        if candidates == 0:
+            empty = np.empty((len(query_vectors), 0))
+            return empty, empty.astype(np.int64)
+
+        selector, bitmap = ColumnarMetadata.selector_from_mask(mask)
+        params = faiss.SearchParameters(sel=selector)
+        result = self.index.search(query_vectors, min(k, candidates), params=params)
+        del bitmap
+        return result
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """파티션 내 행 번호의 메타데이터를 dict로 반환"""
+        published_at = int(self.published_at[position])
+        return {
+            "news_article_id": int(self.news_id[position]),
+            "stock_code": self.stock_code,
+            "published_at": None if published_at == NO_TIMESTAMP else published_at,
+        }
+
+    # ==================== 저장 / 로드 ====================
+
+    def save(self, directory: str):
+        """컬럼 → 인덱스 순서로 원자적 저장"""
+        base = os.path.join(directory, self.stock_code)
+
+        tmp_columns = f"{base}.tmp.npz"
+        np.savez(tmp_columns, news_id=self.news_id, published_at=self.published_at)
+        os.replace(tmp_columns, f"{base}.npz")
+
+        tmp_index = f"{base}.index.tmp"
+        faiss.write_index(self.index, tmp_index)
+        os.replace(tmp_index, f"{base}.index")
+
+        self.dirty = False
+
+    @classmethod
+    def load(cls, directory: str, stock_code: str, dim: int) -> Optional["StockPartition"]:
+        """파티션 파일 로드 (파일 누락/불일치 시 None)"""
+        base = os.path.join(directory, stock_code)
+        if not os.path.exists(f"{base}.npz") or not os.path.exists(f"{base}.index"):
+            return None
+
+        partition = cls(stock_code, dim)
+        partition.index = faiss.read_index(f"{base}.index")
+        with np.load(f"{base}.npz") as columns:
+            partition.news_id = columns["news_id"]
+            partition.published_at = columns["published_at"]
+
+        if partition.index.ntotal != len(partition):
+            logger.warning(
+                f"FAISS 파티션 불일치로 무시 (종목={stock_code}, "
+                f"index={partition.index.ntotal}, rows={len(partition)}) - 리밸런싱 필요"
+            )
+            return None
+
+        return partition
+
+
+class PartitionSet:
+    """종목 코드 → StockPartition 라우팅 테이블"""
+
+    MANIFEST = "partitions.json"
+
+    def __init__(self, directory: str, dim: int):
+        self.directory = directory
+        self.dim = dim
+        self.partitions: Dict[str, StockPartition] = {}
+
+    def __len__(self) -> int:
+        return len(self.partitions)
+
+    def route(self, stock_code: Optional[str]) -> Optional[StockPartition]:
+        """종목 코드에 해당하는 파티션 (없으면 None → 전역 인덱스 사용)"""
+        if not stock_code:
+            return None
+        return self.partitions.get(stock_code)
+
+    def load(self):
+        """partitions.json에 등록된 파티션 로드"""
+        self.partitions = {}
+        manifest_path = os.path.join(self.directory, self.MANIFEST)
+        if not os.path.exists(manifest_path):
+            return
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            stock_codes = json.load(f)["stock_codes"]
+
+        for stock_code in stock_codes:
+            partition = StockPartition.load(self.directory, stock_code, self.dim)
+            if partition is not None:
+                self.partitions[stock_code] = partition
+
+        logger.info(f"📂 FAISS 종목 파티션 로드: {len(self.partitions)}개")
+
+    def add(
+        self,
+        stock_codes: List[str],
+        news_ids: np.ndarray,
+        published_at: np.ndarray,
+        vectors: np.ndarray,
+    ):
+        """신규 벡터를 해당 종목 파티션에 추가 (파티션이 없는 종목은 무시)"""
+        stock_codes = np.asarray(stock_codes)
+        for stock_code in np.unique(stock_codes):
+            partition = self.partitions.get(str(stock_code))
+            if partition is None:
+                continue
+            rows = stock_codes == stock_code
+            partition.add(news_ids[rows], published_at[rows], vectors[rows])
+
+    def save_dirty(self) -> int:
+        """변경된 파티션만 저장"""
+        saved = 0
+        for partition in self.partitions.values():
+            if partition.dirty:
+                partition.save(self.directory)
+                saved += 1
+        return saved
+
+    def replace_all(self, partitions: Dict[str, StockPartition]):
+        """리밸런싱 결과로 전체 파티션 교체 (파일 저장 후 manifest 교체)"""
+        os.makedirs(self.directory, exist_ok=True)
+
+        for partition in partitions.values():
+            partition.save(self.directory)
+
+        tmp_path = os.path.join(self.directory, f"{self.MANIFEST}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"stock_codes": sorted(partitions)}, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(self.directory, self.MANIFEST))
+
+        # 더 이상 사용하지 않는 파티션 파일 정리
+        for stock_code in set(self.partitions) - set(partitions):
+            for suffix in (".npz", ".index"):
+                try:
+                    os.remove(os.path.join(self.directory, f"{stock_code}{suffix}"))
+                except FileNotFoundError:
+                    pass
+
+        self.partitions = partitions
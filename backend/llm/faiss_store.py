@@ -0,0 +1,1078 @@
+"""
+FAISS 세그먼트 저장소 모듈
+
+메인 인덱스 + append-only delta 세그먼트 구조로 FAISS 인덱스를 관리합니다.
+
+구조:
+- 메인 세그먼트: FAISS_INDEX_PATH + 컬럼형 메타데이터(FAISS_METADATA_DIR, memmap)
+  - 기존 pickle 메타데이터(FAISS_METADATA_PATH)는 최초 로드 시 컬럼형으로 변환
+- delta 세그먼트: WAL(FAISS_WAL_PATH)에 고정 크기 레코드로 append
+  - 신규 임베딩 k건 추가 시 O(k) 디스크 I/O (메인 인덱스 재작성 없음)
+  - 로드 시 WAL을 재생하여 메모리 내 Flat 인덱스로 복원
+- 컴팩션: 백그라운드 작업이 delta를 메인 인덱스로 병합 후 WAL 정리
+- 검색: 메인 + delta 세그먼트 결과를 유사도 기준으로 병합
+  - 종목/기간 필터는 컬럼 마스크 → IDSelectorBitmap으로 검색 전에 적용
+  - 파티션 모드(FAISS_PARTITIONED_SEARCH)에서는 종목 필터 검색을 종목별 파티션으로 라우팅
+
+압축 인덱스(IVF-SQ8/IVF-PQ):
+- 원본 float32 벡터는 FAISS_VECTORS_PATH에 행 순서대로 저장 (memmap, 상주 메모리 아님)
+- 검색 시 top_k x FAISS_RERANK_FACTOR 후보를 원본 벡터로 정확히 재정렬
+
+IVF 파라미터(nlist/nprobe 튜닝 결과)는 {index_path}.params.json에 저장되며,
+인덱스 승격/재학습/nprobe 튜닝 정책은 faiss_lifecycle.IndexLifecycleManager가 담당합니다.
+
+다른 프로세스(API 서버)는 검색 시 WAL 증가분/메인 인덱스 교체를 감지하여 반영합니다.
+- 디스크 확인은 FAISS_SYNC_INTERVAL_SECONDS마다 한 번만 수행
+- 메인 인덱스 교체에 따른 전체 재로드는 백그라운드 스레드에서 수행하며, 그동안 검색은 이전 스냅샷 사용
+"""
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from backend.config import settings
+from backend.llm.faiss_metadata import (
+    NO_TIMESTAMP,
+    ColumnarMetadata,
+    StockCodeVocab,
+)
+from backend.llm.faiss_partitions import PartitionSet, StockPartition
+
+
+logger = logging.getLogger(__name__)
+
+
+def rerank_exact(
+    query_vectors: np.ndarray,
+    candidates: np.ndarray,
+    vectors: np.ndarray,
+    k: int,
+    inner_product: bool = True,
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """
+    압축 인덱스 후보를 원본 벡터로 재정렬
+
+    Args:
+        query_vectors: (n, dim) 쿼리 벡터
+        candidates: (n, k') 후보 행 번호 (-1은 무시)
+        vectors: 원본 벡터 (memmap 가능, 행 번호로 조회)
+        k: 반환할 결과 수
+        inner_product: True면 내적 내림차순, False면 L2 제곱거리 오름차순
+
+    Returns:
+        (쿼리별 거리 배열, 쿼리별 행 번호 배열) - FAISS search 결과와 같은 의미의 거리값
+    """
+    distances_out, indices_out = [], []
+    for query, row_candidates in zip(query_vectors, candidates):
+        rows = np.unique(row_candidates[row_candidates >= 0])  # 정렬된 순서로 memmap 접근
+        candidate_vectors = np.asarray(vectors[rows], dtype=np.float32)
+        if inner_product:
+            scores = candidate_vectors @ query
+            order = np.argsort(-scores)[:k]
+        else:
+            scores = ((candidate_vectors - query) ** 2).sum(axis=1)
+            order = np.argsort(scores)[:k]
+        distances_out.append(scores[order])
+        indices_out.append(rows[order])
+    return distances_out, indices_out
+
+
+class FaissSegmentStore:
+    """
+    메인 인덱스 + WAL 기반 delta 세그먼트 저장소 (Thread-safe)
+
+    Features:
+    - append-only WAL로 O(k) 증분 저장
+    - 메인/delta 결과 병합 검색
+    - 검색을 막지 않는 컴팩션 (직렬화는 Lock 밖에서 수행)
+    """
+
+    STOCK_CODE_BYTES = 16
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        metadata_path: Optional[str] = None,
+        wal_path: Optional[str] = None,
+        dim: Optional[int] = None,
+        nprobe: int = 10,
+        metadata_dir: Optional[str] = None,
+        partitioned: Optional[bool] = None,
+        partition_dir: Optional[str] = None,
+        vectors_path: Optional[str] = None,
+        rerank_factor: Optional[int] = None,
+        mmap: Optional[bool] = None,
+        sync_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            index_path: 메인 인덱스 경로 (None이면 settings.FAISS_INDEX_PATH)
+            metadata_path: 기존 pickle 메타데이터 경로 (None이면 settings.FAISS_METADATA_PATH)
+            wal_path: delta WAL 경로 (None이면 settings.FAISS_WAL_PATH)
+            dim: 임베딩 차원 (None이면 settings.EMBEDDING_DIM)
+            nprobe: IVF 인덱스 검색 시 탐색할 클러스터 수 (튜닝된 params.json이 없을 때 기본값)
+            metadata_dir: 컬럼형 메타데이터 디렉토리 (None이면 settings.FAISS_METADATA_DIR)
+            partitioned: 종목별 파티션 사용 여부 (None이면 settings.FAISS_PARTITIONED_SEARCH)
+            partition_dir: 파티션 디렉토리 (None이면 settings.FAISS_PARTITION_DIR)
+            vectors_path: 원본 벡터 파일 경로 (None이면 settings.FAISS_VECTORS_PATH)
+            rerank_factor: 압축 인덱스 재정렬 후보 배수 (None이면 settings.FAISS_RERANK_FACTOR)
+            mmap: 메인 인덱스 memory-map 로드 여부 (None이면 settings.FAISS_MMAP_INDEX)
+            sync_interval: 검색 시 디스크 변경 확인 간격 (초, None이면 settings.FAISS_SYNC_INTERVAL_SECONDS)
+        """
+        self.index_path = index_path or settings.FAISS_INDEX_PATH
+        self.metadata_path = metadata_path or settings.FAISS_METADATA_PATH
+        self.metadata_dir = metadata_dir or settings.FAISS_METADATA_DIR
+        self.wal_path = wal_path or settings.FAISS_WAL_PATH
+        self.dim = dim or settings.EMBEDDING_DIM
+        self.nprobe = nprobe
+        self.partitioned = (
+            settings.FAISS_PARTITIONED_SEARCH if partitioned is None else partitioned
+        )
+        self.partition_dir = partition_dir or settings.FAISS_PARTITION_DIR
+        self.params_path = f"{self.index_path}.params.json"
+        self.vectors_path = vectors_path or settings.FAISS_VECTORS_PATH
+        self.rerank_factor = rerank_factor or settings.FAISS_RERANK_FACTOR
+        self.mmap = settings.FAISS_MMAP_INDEX if mmap is None else mmap
+        self.sync_interval = (
+            settings.FAISS_SYNC_INTERVAL_SECONDS if sync_interval is None else sync_interval
+        )
+
+        self._record_dtype = np.dtype([
+            ("news_id", "<i8"),
+            ("published_at", "<i8"),
+            ("stock_code", f"S{self.STOCK_CODE_BYTES}"),
+            ("vector", "<f4", (self.dim,)),
+        ])
+
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._loaded = False
+        self._last_sync_check = 0.0  # 검색 경로의 마지막 디스크 확인 시각 (monotonic)
+        self._reload_thread: Optional[threading.Thread] = None
+
+        # 종목 코드 카테고리 사전 (메인/delta 공유)
+        self._vocab = StockCodeVocab()
+
+        # 메인 세그먼트
+        self._main_index: Optional[faiss.Index] = None
+        self._main_metadata = ColumnarMetadata(self._vocab)
+        self._main_mtime: Optional[float] = None
+        self._main_mmapped = False  # 메인 인덱스가 읽기 전용 memmap인지 (컴팩션 전 메모리 로드 필요)
+        self._full_vectors: Optional[np.ndarray] = None  # 원본 벡터 memmap (메인 행 순서)
+
+        # IVF 튜닝 파라미터 (params.json)
+        self._index_params: Dict[str, Any] = {}
+        self._params_mtime: Optional[float] = None
+
+        # delta 세그먼트 (WAL 재생 결과)
+        self._delta_index: Optional[faiss.Index] = None
+        self._delta_metadata = ColumnarMetadata(self._vocab)
+        self._delta_vectors: List[np.ndarray] = []
+        self._wal_offset = 0  # 재생 완료한 WAL 바이트 위치
+
+        # 종목별 파티션 (메인 + delta 벡터를 종목 단위로 복제)
+        self._partitions = PartitionSet(self.partition_dir, self.dim)
+        self._partition_mtime: Optional[float] = None
+
+    # ==================== 상태 ====================
+
+    @property
+    def main_index(self) -> Optional[faiss.Index]:
+        """메인 세그먼트 FAISS 인덱스"""
+        return self._main_index
+
+    @property
+    def ntotal(self) -> int:
+        """전체 벡터 수 (메인 + delta)"""
+        with self._lock:
+            main_total = self._main_index.ntotal if self._main_index is not None else 0
+            return main_total + len(self._delta_metadata)
+
+    @property
+    def delta_count(self) -> int:
+        """컴팩션 대기 중인 delta 벡터 수"""
+        return len(self._delta_metadata)
+
+    @property
+    def index_params(self) -> Dict[str, Any]:
+        """메인 인덱스 튜닝 파라미터 (nlist, nprobe, recall 등)"""
+        return dict(self._index_params)
+
+    @property
+    def is_ivf(self) -> bool:
+        """메인 인덱스가 IVF 타입인지 여부"""
+        return self._main_index is not None and self._is_index_ivf(self._main_index)
+
+    @property
+    def is_compressed(self) -> bool:
+        """메인 인덱스가 압축(IVF-SQ8/IVF-PQ) 타입인지 여부"""
+        return self._main_index is not None and self._is_index_compressed(self._main_index)
+
+    @property
+    def uses_inner_product(self) -> bool:
+        """메인 인덱스가 Inner Product 메트릭인지 여부"""
+        return (
+            self._main_index is None
+            or self._main_index.metric_type == faiss.METRIC_INNER_PRODUCT
+        )
+
+    @staticmethod
+    def _is_index_ivf(index: faiss.Index) -> bool:
+        """인덱스가 IVF 타입인지 확인"""
+        try:
+            # IVF 인덱스는 nprobe 속성을 가짐
+            _ = index.nprobe
+            return True
+        except AttributeError:
+            return False
+
+    @classmethod
+    def _is_index_compressed(cls, index: faiss.Index) -> bool:
+        """인덱스가 원본 벡터를 보관하지 않는 압축 IVF 타입인지 확인"""
+        if not cls._is_index_ivf(index):
+            return False
+        ivf = faiss.downcast_index(faiss.extract_index_ivf(index))
+        return isinstance(ivf, (faiss.IndexIVFPQ, faiss.IndexIVFScalarQuantizer))
+
+    def _create_empty_index(self, inner_product: bool = True) -> faiss.Index:
+        """빈 Flat 인덱스 생성"""
+        if inner_product:
+            return faiss.IndexFlatIP(self.dim)
+        return faiss.IndexFlatL2(self.dim)
+
+    def to_similarity(self, distance: float) -> float:
+        """
+        FAISS 거리값을 유사도로 변환
+
+        - Inner Product: 정규화된 벡터는 IP = cosine similarity
+        - L2 distance (legacy): 1 / (1 + L2) 근사
+        """
+        if self.uses_inner_product:
+            return float(distance)
+        return 1 / (1 + float(distance))
+
+    # ==================== 로드 ====================
+
+    def load(self, force: bool = False):
+        """
+        메인 인덱스 로드 + WAL 재생
+
+        Args:
+            force: True면 이미 로드된 경우에도 디스크에서 다시 로드
+        """
+        with self._lock:
+            if self._loaded and not force:
+                return
+            self._install_main(*self._read_main())
+
+    def _install_main(
+        self, main_index: faiss.Index, main_metadata: ColumnarMetadata, main_mtime: Optional[float]
+    ):
+        """읽어 둔 메인 세그먼트로 교체하고 WAL 재생 (호출자가 _lock을 잡고 있어야 함)"""
+        self._main_index = main_index
+        self._main_mmapped = self.mmap and main_mtime is not None
+        self._main_metadata = main_metadata
+        self._main_mtime = main_mtime
+        self._vocab = main_metadata.vocab
+        self._full_vectors = self._open_full_vectors(main_index.ntotal)
+        self._apply_index_params(self._read_index_params())
+
+        if self.partitioned:
+            self._partition_mtime = self._get_partition_mtime()
+            self._partitions.load()
+
+        self._reset_delta()
+        self._wal_offset = 0
+        self._replay_wal()
+
+        self._loaded = True
+
+        index_type = self._index_params.get("index_type", "ivf") if self.is_ivf else "flat"
+        metric = "IP" if self.uses_inner_product else "L2(legacy)"
+        logger.info(
+            f"✅ FAISS 세그먼트 로드: 메인 {self._main_index.ntotal}개 ({index_type}+{metric}), "
+            f"delta {self.delta_count}개, 파티션 {len(self._partitions)}개"
+        )
+
+    def _open_full_vectors(self, rows: int) -> Optional[np.ndarray]:
+        """원본 벡터 파일을 메인 행 수만큼 memmap (파일이 없거나 짧으면 None)"""
+        if rows == 0 or not os.path.exists(self.vectors_path):
+            return None
+
+        available = os.path.getsize(self.vectors_path) // (self.dim * 4)
+        if available < rows:
+            logger.warning(
+                f"FAISS 원본 벡터 파일 행 수 부족 (필요 {rows}, 존재 {available}) - 재정렬 비활성화"
+            )
+            return None
+
+        return np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+
+    def _append_full_vectors(self, vectors: np.ndarray, base_rows: int):
+        """원본 벡터 파일에 컴팩션 벡터 추가 (중단된 이전 추가분은 base_rows로 잘라냄)"""
+        with open(self.vectors_path, "r+b") as f:
+            f.truncate(base_rows * self.dim * 4)
+            f.seek(0, os.SEEK_END)
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_full_vectors(self, vectors: np.ndarray):
+        """원본 벡터 파일 전체를 원자적으로 작성"""
+        os.makedirs(os.path.dirname(self.vectors_path) or ".", exist_ok=True)
+        tmp_path = f"{self.vectors_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.vectors_path)
+
+    def _read_index_params(self) -> Dict[str, Any]:
+        """params.json 읽기 (없으면 빈 dict)"""
+        if not os.path.exists(self.params_path):
+            self._params_mtime = None
+            return {}
+        self._params_mtime = os.path.getmtime(self.params_path)
+        with open(self.params_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _apply_index_params(self, params: Dict[str, Any]):
+        """튜닝 파라미터를 메인 인덱스에 적용 (호출자가 _lock을 잡고 있어야 함)"""
+        self._index_params = params
+        if self._main_index is not None and self._is_index_ivf(self._main_index):
+            self._main_index.nprobe = int(params.get("nprobe", self.nprobe))
+
+    def _write_index_params(self, params: Dict[str, Any]):
+        """params.json 원자적 저장"""
+        os.makedirs(os.path.dirname(self.params_path) or ".", exist_ok=True)
+        tmp_path = f"{self.params_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(params, f, ensure_ascii=False)
+        os.replace(tmp_path, self.params_path)
+
+    def _get_partition_mtime(self) -> Optional[float]:
+        """파티션 manifest 수정 시각 (리밸런싱 감지용)"""
+        path = os.path.join(self.partition_dir, PartitionSet.MANIFEST)
+        return os.path.getmtime(path) if os.path.exists(path) else None
+
+    def _read_main(self) -> Tuple[faiss.Index, ColumnarMetadata, Optional[float]]:
+        """메인 인덱스 및 컬럼형 메타데이터 읽기"""
+        if not os.path.exists(self.index_path):
+            logger.warning("FAISS 메인 인덱스 파일 없음, 빈 인덱스 초기화")
+            return self._create_empty_index(), ColumnarMetadata(StockCodeVocab()), None
+
+        try:
+            mtime = os.path.getmtime(self.index_path)
+            index = self._read_index_file()
+
+            metadata = self._read_main_metadata()
+            if len(metadata) != index.ntotal:
+                logger.warning(
+                    f"FAISS 메타데이터 행 수 불일치: index={index.ntotal}, metadata={len(metadata)}"
+                )
+
+            return index, metadata, mtime
+
+        except Exception as e:
+            logger.error(f"❌ FAISS 메인 인덱스 로드 실패: {e}")
+            return self._create_empty_index(), ColumnarMetadata(StockCodeVocab()), None
+
+    def _read_index_file(self, mmap: Optional[bool] = None) -> faiss.Index:
+        """
+        메인 인덱스 파일 읽기
+
+        memory-map 모드에서는 인덱스 본문을 페이지 캐시에 매핑하여 시작 시 전체 읽기를 피합니다.
+        Flat(IxF*)은 IO_FLAG_MMAP_IFC로 벡터 배열을, IVF는 IO_FLAG_MMAP으로 역리스트를 매핑합니다.
+        매핑된 인덱스는 읽기 전용이므로 add 전에 mmap=False로 다시 읽어야 합니다.
+
+        Args:
+            mmap: memory-map 여부 (None이면 self.mmap)
+        """
+        if not (self.mmap if mmap is None else mmap):
+            return faiss.read_index(self.index_path)
+
+        with open(self.index_path, "rb") as f:
+            fourcc = f.read(4)
+        flags = faiss.IO_FLAG_MMAP_IFC if fourcc.startswith(b"IxF") else faiss.IO_FLAG_MMAP
+        return faiss.read_index(self.index_path, flags | faiss.IO_FLAG_READ_ONLY)
+
+    def _read_main_metadata(self) -> ColumnarMetadata:
+        """
+        컬럼형 메타데이터 로드 (memmap)
+
+        컬럼형 파일이 없고 기존 pickle 메타데이터만 있으면 컬럼형으로 변환하여 저장합니다.
+        """
+        metadata = ColumnarMetadata.load(self.metadata_dir)
+        if metadata is not None:
+            return metadata
+
+        vocab = StockCodeVocab()
+        if not os.path.exists(self.metadata_path):
+            return ColumnarMetadata(vocab)
+
+        with open(self.metadata_path, 'rb') as f:
+            records = pickle.load(f)
+
+        metadata = ColumnarMetadata.from_records(vocab, records)
+        metadata.save(self.metadata_dir)
+        logger.info(f"🔄 FAISS 메타데이터 컬럼형 변환 완료: {len(metadata)}행 → {self.metadata_dir}")
+        return ColumnarMetadata.load(self.metadata_dir)
+
+    def _reset_delta(self):
+        """delta 세그먼트 초기화 (메인 인덱스와 동일한 메트릭 사용)"""
+        self._delta_index = self._create_empty_index(self.uses_inner_product)
+        self._delta_metadata = ColumnarMetadata(self._vocab)
+        self._delta_vectors = []
+
+    def _replay_wal(self):
+        """WAL의 미재생 구간을 delta 세그먼트에 반영 (호출자가 _lock을 잡고 있어야 함)"""
+        if not os.path.exists(self.wal_path):
+            return
+
+        size = os.path.getsize(self.wal_path)
+        record_size = self._record_dtype.itemsize
+        end = size - (size % record_size)  # 기록 중인 마지막 레코드 제외
+        if end <= self._wal_offset:
+            return
+
+        with open(self.wal_path, 'rb') as f:
+            f.seek(self._wal_offset)
+            raw = f.read(end - self._wal_offset)
+
+        records = np.frombuffer(raw, dtype=self._record_dtype)
+        # 이미 메인으로 컴팩션된 레코드는 건너뜀 (컴팩션 중 중단 대비)
+        records = records[~self._contains(records["news_id"])]
+        self._add_to_delta(records)
+        self._wal_offset = end
+
+    def _add_to_delta(self, records: np.ndarray):
+        """WAL 레코드를 delta 인덱스/메타데이터에 추가"""
+        if len(records) == 0:
+            return
+
+        vectors = np.ascontiguousarray(records["vector"], dtype=np.float32)
+        self._delta_index.add(vectors)
+        self._delta_vectors.append(vectors)
+
+        stock_code_ids = [
+            self._vocab.encode(code.decode("utf-8")) for code in records["stock_code"]
+        ]
+        self._delta_metadata.extend(records["news_id"], stock_code_ids, records["published_at"])
+
+        if self.partitioned:
+            self._partitions.add(
+                [code.decode("utf-8") for code in records["stock_code"]],
+                records["news_id"], records["published_at"], vectors,
+            )
+
+    def _contains(self, news_ids: np.ndarray) -> np.ndarray:
+        """뉴스 ID별 인덱싱 여부 (벡터화, 호출자가 _lock을 잡고 있어야 함)"""
+        news_ids = np.asarray(news_ids, dtype=np.int64)
+        return (
+            np.isin(news_ids, self._main_metadata.news_id)
+            | np.isin(news_ids, self._delta_metadata.news_id)
+        )
+
+    def _needs_reload(self) -> bool:
+        """
+        전체 재로드가 필요한지 확인 (호출자가 _lock을 잡고 있어야 함)
+
+        - 메인 인덱스 파일이 교체됨(컴팩션)
+        - 파티션 manifest가 교체됨(리밸런싱)
+        - WAL이 줄어듦(컴팩션 후 정리)
+        """
+        main_mtime = (
+            os.path.getmtime(self.index_path) if os.path.exists(self.index_path) else None
+        )
+        wal_size = os.path.getsize(self.wal_path) if os.path.exists(self.wal_path) else 0
+        partition_changed = (
+            self.partitioned and self._get_partition_mtime() != self._partition_mtime
+        )
+        return main_mtime != self._main_mtime or wal_size < self._wal_offset or partition_changed
+
+    def sync_from_disk(self, background: bool = False):
+        """
+        다른 프로세스의 변경 사항 반영
+
+        - 메인 인덱스/파티션 교체, WAL 축소 → 전체 재로드
+        - params.json만 교체됨(nprobe 튜닝) → 파라미터만 재적용
+        - WAL이 늘어남(신규 append) → 증가분만 재생
+
+        Args:
+            background: True면 전체 재로드를 백그라운드 스레드에서 수행하고 즉시 반환
+                (재로드가 끝날 때까지 이전 스냅샷으로 검색)
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+                return
+
+            if self._needs_reload():
+                if background:
+                    self._start_background_reload()
+                    return
+                self.load(force=True)
+            else:
+                self._replay_wal()
+
+            params_mtime = (
+                os.path.getmtime(self.params_path) if os.path.exists(self.params_path) else None
+            )
+            if params_mtime != self._params_mtime:
+                self._apply_index_params(self._read_index_params())
+
+    def _sync_if_due(self):
+        """검색 경로의 디스크 확인 (sync_interval마다 한 번, 전체 재로드는 백그라운드)"""
+        now = time.monotonic()
+        if self._loaded and now - self._last_sync_check < self.sync_interval:
+            return
+        self._last_sync_check = now
+        self.sync_from_disk(background=True)
+
+    def _start_background_reload(self):
+        """전체 재로드 스레드 시작 (이미 실행 중이면 무시, 호출자가 _lock을 잡고 있어야 함)"""
+        if self._reload_thread is not None and self._reload_thread.is_alive():
+            return
+        self._reload_thread = threading.Thread(
+            target=self._reload_in_background, name="faiss-reload", daemon=True
+        )
+        self._reload_thread.start()
+
+    def _reload_in_background(self):
+        """메인 세그먼트를 Lock 밖에서 읽은 뒤 Lock 안에서 교체"""
+        try:
+            # 이 프로세스의 컴팩션/재구성이 파일을 쓰는 중에는 읽지 않음
+            with self._compaction_lock:
+                main_index, main_metadata, main_mtime = self._read_main()
+
+                with self._lock:
+                    if not self._needs_reload():
+                        return  # 그사이 동기 sync/컴팩션이 이미 반영
+                    current_mtime = (
+                        os.path.getmtime(self.index_path) if os.path.exists(self.index_path) else None
+                    )
+                    if main_mtime != current_mtime:
+                        return  # 읽는 사이 다시 교체됨 (다음 확인에서 재시도)
+                    self._install_main(main_index, main_metadata, main_mtime)
+
+        except Exception as e:
+            logger.error(f"❌ FAISS 백그라운드 재로드 실패: {e}", exc_info=True)
+
+    # ==================== 추가 ====================
+
+    def append(
+        self,
+        news_ids: List[int],
+        embeddings: List[List[float]],
+        stock_codes: List[str],
+        published_timestamps: List[Optional[int]],
+    ) -> int:
+        """
+        임베딩을 WAL에 append하고 delta 세그먼트에 추가 (O(k) I/O)
+
+        이미 인덱싱된 뉴스 ID는 건너뜁니다.
+
+        Returns:
+            추가된 벡터 수
+        """
+        with self._lock:
+            self.load()
+
+            records = np.zeros(len(news_ids), dtype=self._record_dtype)
+            keep = ~self._contains(news_ids)
+            seen = set()
+
+            for i, (news_id, embedding, stock_code, timestamp) in enumerate(
+                zip(news_ids, embeddings, stock_codes, published_timestamps)
+            ):
+                if not keep[i] or news_id in seen:
+                    keep[i] = False
+                    continue
+                seen.add(news_id)
+                records[i]["news_id"] = news_id
+                records[i]["published_at"] = NO_TIMESTAMP if timestamp is None else int(timestamp)
+                records[i]["stock_code"] = (stock_code or "").encode("utf-8")[:self.STOCK_CODE_BYTES]
+                records[i]["vector"] = np.asarray(embedding, dtype=np.float32)
+
+            records = records[keep]
+            if len(records) == 0:
+                return 0
+
+            os.makedirs(os.path.dirname(self.wal_path) or ".", exist_ok=True)
+
+            # 다른 프로세스가 추가한 레코드를 먼저 반영한 뒤 append
+            self._replay_wal()
+            self._repair_wal_tail()
+            with open(self.wal_path, 'ab') as f:
+                f.write(records.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._add_to_delta(records)
+            self._wal_offset += records.nbytes
+            return len(records)
+
+    def _repair_wal_tail(self):
+        """기록 도중 중단된 마지막 레코드 제거 (writer 측에서만 호출)"""
+        if not os.path.exists(self.wal_path):
+            return
+
+        size = os.path.getsize(self.wal_path)
+        remainder = size % self._record_dtype.itemsize
+        if remainder:
+            with open(self.wal_path, 'r+b') as f:
+                f.truncate(size - remainder)
+            logger.warning(f"FAISS WAL의 불완전한 레코드 정리: {remainder} bytes")
+
+    # ==================== 검색 ====================
+
+    def search(
+        self,
+        query_vectors: np.ndarray,
+        k: int,
+        stock_code: Optional[str] = None,
+        published_after: Optional[int] = None,
+        published_before: Optional[int] = None,
+    ) -> List[List[Tuple[float, Dict[str, Any]]]]:
+        """
+        메인 + delta 세그먼트 병합 검색
+
+        필터가 있으면 컬럼 마스크를 IDSelectorBitmap으로 변환하여 FAISS 검색 단계에서
+        대상 벡터를 제한합니다 (over-fetch 및 Python 후처리 필터링 없음).
+        IVF 인덱스는 필터 검색 시 모든 클러스터를 탐색하여 정확한 결과를 반환합니다.
+        압축 인덱스는 top_k x rerank_factor 후보를 원본 벡터로 재정렬합니다.
+        파티션 모드에서 해당 종목 파티션이 있으면 파티션(Flat)만 검색합니다.
+
+        Args:
+            query_vectors: (n, dim) float32 쿼리 벡터
+            k: 반환할 최대 결과 수
+            stock_code: 종목 코드 필터
+            published_after: 발행 시각 하한 (Unix timestamp, 포함)
+            published_before: 발행 시각 상한 (Unix timestamp, 미포함)
+
+        Returns:
+            쿼리별 [(similarity, metadata), ...] (유사도 내림차순)
+        """
+        self._sync_if_due()
+
+        results: List[List[Tuple[float, Dict[str, Any]]]] = [[] for _ in range(len(query_vectors))]
+
+        # FAISS는 add와 search의 동시 실행을 보장하지 않으므로 Lock 안에서 검색
+        with self._lock:
+            partition = self._partitions.route(stock_code) if self.partitioned else None
+            if partition is not None:
+                return self._search_partition(
+                    partition, query_vectors, k, published_after, published_before
+                )
+
+            segments = (
+                (self._main_index, self._main_metadata),
+                (self._delta_index, self._delta_metadata),
+            )
+            for index, metadata in segments:
+                if index is None or index.ntotal == 0:
+                    continue
+
+                rerank = (
+                    index is self._main_index
+                    and self._full_vectors is not None
+                    and self.is_compressed
+                )
+                hits = self._search_segment(
+                    index, metadata, query_vectors, k,
+                    metadata.mask(stock_code, published_after, published_before),
+                    rerank=rerank,
+                )
+                for q, segment_hits in enumerate(hits):
+                    results[q].extend(segment_hits)
+
+        for q in range(len(results)):
+            results[q].sort(key=lambda item: item[0], reverse=True)
+            results[q] = results[q][:k]
+
+        return results
+
+    def _search_segment(
+        self,
+        index: faiss.Index,
+        metadata: ColumnarMetadata,
+        query_vectors: np.ndarray,
+        k: int,
+        mask: Optional[np.ndarray],
+        rerank: bool = False,
+    ) -> List[List[Tuple[float, Dict[str, Any]]]]:
+        """단일 세그먼트 검색 (mask가 있으면 IDSelector로 사전 필터링, rerank면 원본 벡터로 재정렬)"""
+        fetch_k = k * self.rerank_factor if rerank else k
+
+        if mask is None:
+            distances, indices = index.search(query_vectors, min(fetch_k, index.ntotal))
+        else:
+            candidates = int(mask[:index.ntotal].sum())
+            if candidates == 0:
+                return [[] for _ in range(len(query_vectors))]
+
+            selector, bitmap = ColumnarMetadata.selector_from_mask(mask)
+            if self._is_index_ivf(index):
+                params = faiss.SearchParametersIVF(sel=selector, nprobe=index.nlist)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            distances, indices = index.search(query_vectors, min(fetch_k, candidates), params=params)
+            del bitmap  # 검색 완료 후 해제
+
+        if rerank:
+            distances, indices = rerank_exact(
+                query_vectors, indices, self._full_vectors, k, self.uses_inner_product
+            )
+
+        results = []
+        for row_distances, row_indices in zip(distances, indices):
+            row = []
+            for dist, idx in zip(row_distances, row_indices):
+                if idx < 0 or idx >= len(metadata):
+                    continue
+                row.append((self.to_similarity(dist), metadata.row(int(idx))))
+            results.append(row)
+        return results
+
+    def _search_partition(
+        self,
+        partition: StockPartition,
+        query_vectors: np.ndarray,
+        k: int,
+        published_after: Optional[int],
+        published_before: Optional[int],
+    ) -> List[List[Tuple[float, Dict[str, Any]]]]:
+        """종목 파티션 검색 (메인 + delta 벡터가 모두 포함되어 있어 병합 불필요)"""
+        if len(partition) == 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        distances, indices = partition.search(
+            query_vectors, k, published_after, published_before
+        )
+        return [
+            [
+                (self.to_similarity(dist), partition.row(int(idx)))
+                for dist, idx in zip(row_distances, row_indices)
+                if idx >= 0
+            ]
+            for row_distances, row_indices in zip(distances, indices)
+        ]
+
+    def indexed_stock_codes(self) -> List[str]:
+        """인덱스에 벡터가 있는 종목 코드 목록 (빈 코드 제외)"""
+        self.sync_from_disk()
+        with self._lock:
+            used = np.unique(
+                np.concatenate([self._main_metadata.stock_code, self._delta_metadata.stock_code])
+            )
+            codes = [self._vocab.decode(int(code_id)) for code_id in used]
+            return [code for code in codes if code]
+
+    def indexed_news_id_array(self) -> np.ndarray:
+        """인덱싱된 뉴스 ID 배열 (메인 + delta, int64)"""
+        self.sync_from_disk()
+        with self._lock:
+            return np.concatenate([self._main_metadata.news_id, self._delta_metadata.news_id])
+
+    # ==================== 컴팩션 ====================
+
+    def compact(self) -> int:
+        """
+        delta 세그먼트를 메인 인덱스로 병합하고 WAL을 정리합니다.
+
+        메모리 병합(O(delta))만 Lock 안에서 수행하고, 메인 인덱스 직렬화(O(N))는
+        Lock 밖에서 수행하므로 컴팩션 중에도 검색/추가가 블로킹되지 않습니다.
+
+        Returns:
+            병합된 벡터 수
+        """
+        with self._compaction_lock:
+            with self._lock:
+                self.load()
+                merged_count = len(self._delta_metadata)
+                if merged_count == 0:
+                    return 0
+
+                vectors = np.vstack(self._delta_vectors)
+                if self.is_ivf and not self._main_index.is_trained:
+                    logger.warning("IVF 인덱스가 학습되지 않아 컴팩션 생략")
+                    return 0
+
+                if self._main_mmapped:
+                    # memmap 인덱스는 읽기 전용 → 병합 전에 메모리로 다시 로드 (컴팩션 후 재매핑)
+                    self._main_index = self._read_index_file(mmap=False)
+                    self._main_mmapped = False
+                    self._apply_index_params(self._index_params)
+
+                base_rows = self._main_index.ntotal
+                self._main_index.add(vectors)
+                self._main_metadata = self._main_metadata.concat(self._delta_metadata)
+                merged_wal_bytes = self._wal_offset
+                self._reset_delta()
+
+                main_index = self._main_index
+                main_metadata = self._main_metadata
+
+                # delta로 갱신된 파티션만 저장 (파티션은 작으므로 Lock 안에서 수행)
+                if self.partitioned:
+                    self._partitions.save_dirty()
+
+            # 원본 벡터/메타데이터를 먼저 교체해야 다른 프로세스가 인덱스 교체를 감지했을 때 일관됨
+            if os.path.exists(self.vectors_path):
+                self._append_full_vectors(vectors, base_rows)
+            main_metadata.save(self.metadata_dir)
+            self._atomic_write_index(main_index)
+
+            with self._lock:
+                self._truncate_wal(merged_wal_bytes)
+                self._main_mtime = os.path.getmtime(self.index_path)
+                self._full_vectors = self._open_full_vectors(main_index.ntotal)
+                self._remap_main_index()
+
+            logger.info(
+                f"🗜️  FAISS 컴팩션 완료: {merged_count}개 병합 (메인 {main_index.ntotal}개)"
+            )
+            return merged_count
+
+    # ==================== 메인 인덱스 재구성 ====================
+
+    def _main_vectors(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        메인 세그먼트의 원본 벡터 (행 순서 = 메타데이터 순서, 호출자가 _lock을 잡고 있어야 함)
+
+        원본 벡터 파일이 있으면 memmap에서 읽고, 없으면 인덱스에서 복원합니다.
+        압축 인덱스는 복원 시 손실이 있으므로 원본 벡터 파일이 필수입니다.
+
+        Args:
+            rows: 조회할 행 번호 (None이면 전체)
+        """
+        index = self._main_index
+        if index is None or index.ntotal == 0:
+            return np.empty((0, self.dim), dtype=np.float32)
+
+        if self._full_vectors is not None:
+            return self._full_vectors if rows is None else np.asarray(self._full_vectors[rows])
+
+        if self._is_index_compressed(index):
+            raise ValueError(f"압축 인덱스의 원본 벡터 파일이 없습니다: {self.vectors_path}")
+
+        if self._is_index_ivf(index):
+            # IVF 인덱스는 direct map이 있어야 벡터 복원 가능
+            faiss.extract_index_ivf(index).make_direct_map()
+        if rows is None:
+            return index.reconstruct_n(0, index.ntotal)
+        return index.reconstruct_batch(np.asarray(rows, dtype=np.int64))
+
+    def rebuild_main_index(
+        self,
+        builder: Callable[[np.ndarray, int], Tuple[faiss.Index, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        메인 인덱스를 새로 구성하여 원자적으로 교체합니다 (Flat → IVF 승격, IVF 재학습).
+
+        벡터 복원만 Lock 안에서 수행하고, 학습/추가/직렬화는 Lock 밖에서 수행하므로
+        재구성 중에도 검색과 delta append는 블로킹되지 않습니다 (컴팩션만 대기).
+        행 순서가 유지되므로 메타데이터는 그대로 사용합니다.
+        새 인덱스가 압축 타입이면 재정렬용 원본 벡터 파일을 함께 작성합니다.
+
+        Args:
+            builder: (vectors, metric_type) → (새 인덱스, params) 함수
+
+        Returns:
+            새 인덱스 params
+        """
+        with self._compaction_lock:
+            with self._lock:
+                self.load()
+                vectors = self._main_vectors()
+                has_full_vectors = self._full_vectors is not None
+                metric_type = (
+                    self._main_index.metric_type
+                    if self._main_index is not None else faiss.METRIC_INNER_PRODUCT
+                )
+
+            new_index, params = builder(vectors, metric_type)
+            if new_index.ntotal != len(vectors):
+                raise ValueError(
+                    f"재구성 인덱스 벡터 수 불일치: expected={len(vectors)}, actual={new_index.ntotal}"
+                )
+
+            if not has_full_vectors and self._is_index_compressed(new_index):
+                self._write_full_vectors(vectors)
+
+            # params를 먼저 교체해야 인덱스 교체를 감지한 프로세스가 새 nprobe를 적용함
+            self._write_index_params(params)
+            self._atomic_write_index(new_index)
+
+            with self._lock:
+                self._main_index = new_index
+                self._main_mmapped = False
+                self._full_vectors = self._open_full_vectors(new_index.ntotal)
+                self._main_mtime = os.path.getmtime(self.index_path)
+                self._params_mtime = os.path.getmtime(self.params_path)
+                self._apply_index_params(params)
+                self._remap_main_index()
+
+            return params
+
+    def tune_main_index(
+        self,
+        tuner: Callable[[faiss.Index, np.ndarray], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        인덱스 재구성 없이 검색 파라미터(nprobe)만 튜닝하여 params.json을 교체합니다.
+
+        Args:
+            tuner: (메인 인덱스, 전체 원본 벡터) → params 함수 (인덱스를 변경하지 않아야 함)
+
+        Returns:
+            새 params
+        """
+        with self._compaction_lock:
+            with self._lock:
+                self.load()
+                vectors = self._main_vectors()
+                index = self._main_index
+
+            # 메인 인덱스는 컴팩션에서만 변경되므로 Lock 밖에서 검색해도 안전
+            params = tuner(index, vectors)
+            self._write_index_params(params)
+
+            with self._lock:
+                self._params_mtime = os.path.getmtime(self.params_path)
+                self._apply_index_params(params)
+
+            return params
+
+    # ==================== 파티션 리밸런싱 ====================
+
+    def rebalance_partitions(self, stock_codes: List[str], min_vectors: int = 1) -> Dict[str, int]:
+        """
+        메인 + delta 벡터로 종목별 파티션을 재구성합니다.
+
+        Args:
+            stock_codes: 파티션을 만들 종목 코드 목록 (예: 활성 종목)
+            min_vectors: 이 수 미만의 벡터를 가진 종목은 파티션을 만들지 않음 (전역 인덱스 사용)
+
+        Returns:
+            {종목 코드: 파티션 벡터 수}
+        """
+        with self._compaction_lock, self._lock:
+            self.load()
+
+            delta_vectors = (
+                np.vstack(self._delta_vectors)
+                if self._delta_vectors else np.empty((0, self.dim), dtype=np.float32)
+            )
+            partitions: Dict[str, StockPartition] = {}
+            for stock_code in sorted(set(stock_codes)):
+                main_rows = np.flatnonzero(self._main_metadata.mask(stock_code=stock_code))
+                delta_rows = np.flatnonzero(self._delta_metadata.mask(stock_code=stock_code))
+                if len(main_rows) + len(delta_rows) < max(min_vectors, 1):
+                    continue
+
+                partition = StockPartition(stock_code, self.dim, self.uses_inner_product)
+                if len(main_rows):
+                    partition.add(
+                        self._main_metadata.news_id[main_rows],
+                        self._main_metadata.published_at[main_rows],
+                        self._main_vectors(main_rows),
+                    )
+                if len(delta_rows):
+                    partition.add(
+                        self._delta_metadata.news_id[delta_rows],
+                        self._delta_metadata.published_at[delta_rows],
+                        delta_vectors[delta_rows],
+                    )
+                partitions[stock_code] = partition
+
+            self._partitions.replace_all(partitions)
+            self._partition_mtime = self._get_partition_mtime()
+
+            logger.info(
+                f"🧩 FAISS 파티션 리밸런싱 완료: {len(partitions)}개 종목, "
+                f"{sum(len(p) for p in partitions.values())}개 벡터"
+            )
+            return {code: len(partition) for code, partition in partitions.items()}
+
+    def _remap_main_index(self):
+        """방금 저장한 메인 인덱스를 memmap으로 다시 열어 메모리 사본을 해제 (호출자가 _lock을 잡고 있어야 함)"""
+        if not self.mmap or self._main_mmapped:
+            return
+        self._main_index = self._read_index_file()
+        self._main_mmapped = True
+        self._apply_index_params(self._index_params)
+
+    def _atomic_write_index(self, index: faiss.Index):
+        """임시 파일에 쓴 뒤 os.replace로 원자적 교체"""
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        faiss.write_index(index, tmp_path)
+        os.replace(tmp_path, self.index_path)
+
+    def _truncate_wal(self, merged_bytes: int):
+        """병합된 WAL 앞부분 제거 (컴팩션 중 추가된 꼬리 레코드는 유지)"""
+        if not os.path.exists(self.wal_path):
+            self._wal_offset = 0
+            return
+
+        with open(self.wal_path, 'rb') as f:
+            f.seek(merged_bytes)
+            tail = f.read()
+
+        tmp_path = f"{self.wal_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.wal_path)
+
+        self._wal_offset = max(0, self._wal_offset - merged_bytes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """세그먼트 통계 반환"""
+        with self._lock:
+            return {
+                "main_vectors": self._main_index.ntotal if self._main_index is not None else 0,
+                "delta_vectors": len(self._delta_metadata),
+                "wal_bytes": self._wal_offset,
+                "is_ivf": self.is_ivf,
+                "nlist": self._main_index.nlist if self.is_ivf else None,
+                "nprobe": self._main_index.nprobe if self.is_ivf else None,
+                "index_type": self._index_params.get("index_type") if self.is_ivf else "flat",
+                "rerank": self._full_vectors is not None and self.is_compressed,
+                "mmap": self._main_mmapped,
+                "partitioned": self.partitioned,
+                "partitions": len(self._partitions),
+            }
+
+
+# 싱글톤 인스턴스 (Thread-safe)
+_faiss_store: Optional[FaissSegmentStore] = None
+_faiss_store_lock = threading.Lock()
+
+
+def get_faiss_store() -> FaissSegmentStore:
+    """
+    FaissSegmentStore 싱글톤 인스턴스를 반환합니다 (Thread-safe).
+
+    NewsEmbedder(인덱싱)와 NewsVectorSearch(검색)가 같은 인스턴스를 공유하므로
+    새로 추가된 벡터가 즉시 검색에 반영됩니다.
+
+    Returns:
+        FaissSegmentStore 인스턴스
+    """
+    global _faiss_store
+
+    if _faiss_store is None:
+        with _faiss_store_lock:
+            if _faiss_store is None:
+                _faiss_store = FaissSegmentStore()
+
+    return _faiss_store
@@ -0,0 +1,227 @@
+"""
+임베딩 추론 워커 모듈
+
+NewsEmbedder 모델을 전용 스레드 하나가 소유하고, 여러 호출자의 요청을 묶어
+배치 forward pass로 처리합니다.
+
+동작:
+- 호출자는 텍스트를 asyncio.Queue에 제출하고 Future로 결과를 기다림
+- 워커는 첫 요청 도착 후 EMBEDDING_COALESCE_MS 동안 들어온 요청을 모아
+  (최대 EMBEDDING_COALESCE_MAX_BATCH건) embed_batch 한 번으로 추론
+- 같은 배치 안의 동일 텍스트는 한 번만 추론
+- 동기 코드(스케줄러 임베딩 작업 등)는 embed_sync로 워커 이벤트 루프에 제출
+- 이벤트 루프마다 큐/태스크를 따로 두고 (asyncio.run 등으로 다른 루프에서 호출돼도
+  기존 루프의 워커를 버리지 않음), 닫힌 루프의 항목은 다음 시작 때 정리
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingInferenceWorker:
+    """
+    요청 병합(coalescing) 임베딩 추론 워커
+
+    Features:
+    - 단일 추론 스레드가 모델 소유 (호출자는 Lock 대기 대신 배치 공유)
+    - 이벤트 루프별 lazy 시작 (루프마다 큐/태스크 1개, 추론 스레드는 공유)
+    - 배치/요청 통계 제공 (get_stats)
+    """
+
+    def __init__(
+        self,
+        embedder,
+        coalesce_ms: Optional[float] = None,
+        max_batch: Optional[int] = None,
+    ):
+        """
+        Args:
+            embedder: embed_batch(texts)를 제공하는 임베더 (NewsEmbedder)
+            coalesce_ms: 요청 병합 대기 시간 (None이면 settings.EMBEDDING_COALESCE_MS)
+            max_batch: 병합 배치 최대 텍스트 수 (None이면 settings.EMBEDDING_COALESCE_MAX_BATCH)
+        """
+        self.embedder = embedder
+        self.coalesce_ms = settings.EMBEDDING_COALESCE_MS if coalesce_ms is None else coalesce_ms
+        self.max_batch = max(1, max_batch or settings.EMBEDDING_COALESCE_MAX_BATCH)
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-worker")
+        self._start_lock = threading.Lock()
+        # embed_sync가 제출할 기본 루프 (처음 시작한 루프, 닫히면 다음 루프로 교체)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 루프별 (큐, 워커 태스크)
+        self._workers: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Queue, asyncio.Task]] = {}
+
+        # 통계
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    # ==================== 제출 ====================
+
+    def start(self):
+        """현재 이벤트 루프에서 워커 시작 (실행 중인 루프 안에서 호출)"""
+        self._ensure_started()
+
+    async def embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        텍스트를 워커에 제출하고 임베딩을 기다립니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            임베딩 벡터 리스트 (입력 순서 유지, 실패한 항목은 None)
+        """
+        if not texts:
+            return []
+
+        queue = self._ensure_started()
+        loop = asyncio.get_running_loop()
+
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.put_nowait((text, future))
+            futures.append(future)
+
+        self.requests += 1
+        self.texts += len(texts)
+        return list(await asyncio.gather(*futures))
+
+    def embed_sync(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        동기 코드에서 워커에 제출합니다.
+
+        워커 이벤트 루프가 다른 스레드에서 실행 중이면 그 루프에 제출하여 배치를 공유하고,
+        그렇지 않으면 (루프 미시작 또는 루프 스레드에서 호출) embed_batch를 직접 호출합니다.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running() and not self._in_loop_thread(loop):
+            future = asyncio.run_coroutine_threadsafe(self.embed(texts), loop)
+            return future.result()
+        return self.embedder.embed_batch(texts)
+
+    @staticmethod
+    def _in_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+        """현재 스레드가 loop를 실행 중인지 확인"""
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """현재 이벤트 루프의 워커 태스크 시작 (이미 실행 중이면 재사용)"""
+        loop = asyncio.get_running_loop()
+        with self._start_lock:
+            # 닫힌 루프의 항목 정리 (태스크가 루프를 참조하므로 약한 참조로는 풀리지 않음)
+            for closed in [other for other in self._workers if other.is_closed()]:
+                del self._workers[closed]
+
+            entry = self._workers.get(loop)
+            if entry is None or entry[1].done():
+                queue = asyncio.Queue()
+                entry = (queue, loop.create_task(self._run(queue)))
+                self._workers[loop] = entry
+                logger.info(
+                    f"🧵 임베딩 추론 워커 시작 "
+                    f"(coalesce={self.coalesce_ms}ms, max_batch={self.max_batch}, 루프 {len(self._workers)}개)"
+                )
+
+            if self._loop is None or self._loop.is_closed() or not self._loop.is_running():
+                self._loop = loop
+            return entry[0]
+
+    # ==================== 워커 루프 ====================
+
+    async def _run(self, queue: asyncio.Queue):
+        """요청 병합 → 배치 추론 반복"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+
+            # 첫 요청 이후 coalesce 창 안에 도착한 요청을 함께 처리
+            deadline = loop.time() + self.coalesce_ms / 1000
+            while len(batch) < self.max_batch:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._process(batch)
+
+    async def _process(self, batch: List[Tuple[str, asyncio.Future]]):
+        """병합된 요청을 embed_batch 한 번으로 추론하고 Future에 결과 전달"""
+        pending = [(text, future) for text, future in batch if not future.done()]
+        if not pending:
+            return
+
+        unique_texts = list(dict.fromkeys(text for text, _ in pending))
+
+        try:
+            loop = asyncio.get_running_loop()
+            embeddings = await loop.run_in_executor(
+                self._executor, self.embedder.embed_batch, unique_texts
+            )
+        except Exception as e:
+            logger.error(f"❌ 병합 배치 임베딩 실패 ({len(unique_texts)}건): {e}")
+            embeddings = [None] * len(unique_texts)
+
+        self.batches += 1
+        self.batched_texts += len(unique_texts)
+        logger.debug(f"임베딩 워커 배치: 요청 텍스트 {len(pending)}건 → 추론 {len(unique_texts)}건")
+
+        results = dict(zip(unique_texts, embeddings))
+        for text, future in pending:
+            if not future.done():
+                future.set_result(results.get(text))
+
+    # ==================== 통계 ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커 통계"""
+        return {
+            "running": any(not task.done() for _, task in list(self._workers.values())),
+            "loops": len(self._workers),
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_texts / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+# Singleton 인스턴스
+_inference_worker: Optional[EmbeddingInferenceWorker] = None
+_inference_worker_lock = threading.Lock()
+
+
+def get_inference_worker() -> EmbeddingInferenceWorker:
+    """
+    EmbeddingInferenceWorker 싱글톤 인스턴스 반환 (NewsEmbedder 싱글톤 공유)
+
+    Returns:
+        EmbeddingInferenceWorker 인스턴스
+    """
+    global _inference_worker
+
+    if _inference_worker is None:
+        with _inference_worker_lock:
+            if _inference_worker is None:
+                from backend.llm.embedder import get_news_embedder
+
+                _inference_worker = EmbeddingInferenceWorker(get_news_embedder())
+
+    return _inference_worker
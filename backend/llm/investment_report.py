@@ -16,8 +16,7 @@ from backend.db.models.stock import StockPrice
 from backend.utils.stock_mapping import get_stock_mapper
 from backend.db.session import SessionLocal
 from backend.db.models.market_data import (
-    StockOrderbook,
-    StockCurrentPrice,
+    StockMarketSnapshot,
     InvestorTrading,
 )
 
@@ -168,44 +167,42 @@ class InvestmentReportGenerator:
         try:
             kis_data = {}
 
-            # 1. 호가 데이터 (최신)
-            orderbook = db.query(StockOrderbook).filter(
-                StockOrderbook.stock_code == stock_code
-            ).order_by(StockOrderbook.datetime.desc()).first()
+            # 최신 시장 스냅샷 (현재가 + 호가 요약, 종목당 1행)
+            snapshot = db.query(StockMarketSnapshot).filter(
+                StockMarketSnapshot.stock_code == stock_code
+            ).first()
+            snapshot_time = snapshot.snapshot_at.strftime("%Y-%m-%d %H:%M:%S") if snapshot and snapshot.snapshot_at else None
 
-            if orderbook:
+            # 1. 호가 데이터
+            if snapshot and snapshot.askp1 is not None:
                 kis_data["orderbook"] = {
-                    "ask_total": orderbook.total_askp_rsqn,  # 총 매도 잔량
-                    "bid_total": orderbook.total_bidp_rsqn,  # 총 매수 잔량
-                    "ask1": orderbook.askp1,  # 매도 1호가
-                    "bid1": orderbook.bidp1,  # 매수 1호가
-                    "ask1_qty": orderbook.askp_rsqn1,  # 매도 1호가 잔량
-                    "bid1_qty": orderbook.bidp_rsqn1,  # 매수 1호가 잔량
-                    "spread": orderbook.askp1 - orderbook.bidp1 if orderbook.askp1 and orderbook.bidp1 else 0,  # 호가 스프레드
-                    "datetime": orderbook.datetime.strftime("%Y-%m-%d %H:%M:%S") if orderbook.datetime else None,
+                    "ask_total": snapshot.total_askp_rsqn,  # 총 매도 잔량
+                    "bid_total": snapshot.total_bidp_rsqn,  # 총 매수 잔량
+                    "ask1": snapshot.askp1,  # 매도 1호가
+                    "bid1": snapshot.bidp1,  # 매수 1호가
+                    "ask1_qty": snapshot.askp_rsqn1,  # 매도 1호가 잔량
+                    "bid1_qty": snapshot.bidp_rsqn1,  # 매수 1호가 잔량
+                    "spread": snapshot.askp1 - snapshot.bidp1 if snapshot.askp1 and snapshot.bidp1 else 0,  # 호가 스프레드
+                    "datetime": snapshot_time,
                 }
 
-            # 2. 현재가 데이터 (최신)
-            current = db.query(StockCurrentPrice).filter(
-                StockCurrentPrice.stock_code == stock_code
-            ).order_by(StockCurrentPrice.datetime.desc()).first()
-
-            if current:
+            # 2. 현재가 데이터
+            if snapshot:
                 kis_data["current_price"] = {
-                    "price": current.stck_prpr,
-                    "change": current.prdy_vrss,
-                    "change_rate": current.prdy_ctrt,
-                    "volume": current.acml_vol,
-                    "trade_value": current.acml_tr_pbmn,
+                    "price": snapshot.stck_prpr,
+                    "change": snapshot.prdy_vrss,
+                    "change_rate": snapshot.prdy_ctrt,
+                    "volume": snapshot.acml_vol,
+                    "trade_value": snapshot.acml_tr_pbmn,
                     "open": None,  # 현재가 API에서는 시가/고가/저가 없음
                     "high": None,
                     "low": None,
-                    "market_cap": current.hts_avls,
-                    "per": current.per,
-                    "pbr": current.pbr,
-                    "eps": current.eps,
-                    "bps": current.bps,
-                    "datetime": current.datetime.strftime("%Y-%m-%d %H:%M:%S") if current.datetime else None,
+                    "market_cap": snapshot.hts_avls,
+                    "per": snapshot.per,
+                    "pbr": snapshot.pbr,
+                    "eps": snapshot.eps,
+                    "bps": snapshot.bps,
+                    "datetime": snapshot_time,
                 }
 
             # 3. 투자자별 매매동향 (최근 5일)
@@ -14,20 +14,29 @@ FAISS에서 유사한 과거 뉴스를 검색하고, 해당 뉴스의 주가 변
 - IndexIVFFlat + Inner Product 사용 (10,000건 이상 최적)
 - Inner Product = Cosine Similarity (L2 정규화된 벡터)
 - 클러스터 기반 검색으로 O(N) → O(√N) 성능 개선
+- IndexLifecycleManager가 Flat → IVF 승격, nlist 재학습, nprobe recall 튜닝 수행
+
+증분 저장:
+- 신규 벡터는 WAL 기반 delta 세그먼트에 append (O(k) I/O)
+- 검색은 메인 + delta 세그먼트 결과 병합
+- 컴팩션 작업이 주기적으로 delta를 메인 인덱스에 병합
 """
 import logging
-import os
-import pickle
 import asyncio
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
-import faiss
 import numpy as np
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from backend.config import settings
 from backend.llm.embedder import get_news_embedder
+from backend.llm.inference_worker import get_inference_worker
+from backend.llm.faiss_store import get_faiss_store
 from backend.db.models.news import NewsArticle
 from backend.db.models.match import NewsStockMatch
 from backend.llm.model_lock import ModelLoadLock
@@ -46,15 +55,15 @@ class NewsVectorSearch:
     - 초기화 시 FAISS 인덱스 한 번만 로드
     - 모든 메서드 async/await
     - IndexIVFFlat + Inner Product (Issue #19)
+    - FaissSegmentStore 기반 append-only 증분 저장
     """
 
     _instance: Optional['NewsVectorSearch'] = None
     _initialized: bool = False
 
-    # IVF 인덱스 설정
-    IVF_NLIST = 100  # 클러스터 수 (sqrt(N) 권장, 10000건 → 100)
-    IVF_NPROBE = 10  # 검색 시 탐색할 클러스터 수
-    MIN_VECTORS_FOR_IVF = 1000  # IVF 학습에 필요한 최소 벡터 수
+    # IVF 인덱스 설정 (nlist/nprobe는 IndexLifecycleManager가 코퍼스 크기에 맞춰 조정)
+    IVF_NPROBE = 10  # 튜닝 결과(params.json)가 없을 때 기본 탐색 클러스터 수
+    MIN_VECTORS_FOR_IVF = settings.FAISS_IVF_MIN_VECTORS  # Flat → IVF 승격 기준
 
     def __new__(cls):
         """Singleton 패턴 구현"""
@@ -68,95 +77,40 @@ class NewsVectorSearch:
             return
 
         self.embedder = get_news_embedder()
-        self.index_path = settings.FAISS_INDEX_PATH
-        self.metadata_path = settings.FAISS_METADATA_PATH
-        self._index: Optional[faiss.Index] = None
-        self._metadata: List[Dict[str, Any]] = []
-        self._is_ivf: bool = False  # IVF 인덱스 여부
+        self.inference_worker = get_inference_worker()  # 모델 소유 추론 스레드 (요청 병합)
+        self.store = get_faiss_store()  # 메인 + delta 세그먼트 (NewsEmbedder와 공유)
+        self.store.nprobe = self.IVF_NPROBE
+        self.index_path = self.store.index_path
+        self.metadata_path = self.store.metadata_path
 
         NewsVectorSearch._initialized = True
         logger.info("🔍 NewsVectorSearch 초기화 완료 (Singleton)")
 
-    def _ensure_index_dir(self):
-        """인덱스 디렉토리 생성"""
-        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
-        os.makedirs(os.path.dirname(self.metadata_path), exist_ok=True)
-
-    def _create_empty_index(self) -> faiss.Index:
-        """빈 IndexFlatIP 인덱스 생성 (Inner Product)"""
-        return faiss.IndexFlatIP(settings.EMBEDDING_DIM)
-
-    def _is_index_ivf(self, index: faiss.Index) -> bool:
-        """인덱스가 IVF 타입인지 확인"""
-        try:
-            # IVF 인덱스는 nprobe 속성을 가짐
-            _ = index.nprobe
-            return True
-        except AttributeError:
-            return False
-
     async def load_index(self):
         """
         FAISS 인덱스 및 메타데이터 로드 (ModelLoadLock 적용)
 
         PyTorch Segmentation Fault 방지를 위해 Lock 사용
-        기존 IndexFlatL2와 새로운 IndexIVFFlat 모두 지원
+        메인 인덱스(IndexFlatL2/IndexIVFFlat) 로드 후 delta WAL을 재생합니다.
         """
         async with ModelLoadLock.get_lock():
-            if self._index is not None:
-                logger.debug("FAISS 인덱스 이미 로드됨 (재사용)")
-                return
-
-            if not os.path.exists(self.index_path) or not os.path.exists(self.metadata_path):
-                logger.warning("FAISS 인덱스 파일 없음, 빈 인덱스 초기화")
-                self._index = self._create_empty_index()
-                self._metadata = []
-                self._is_ivf = False
-                return
-
             try:
-                # FAISS 인덱스 로드
-                self._index = faiss.read_index(self.index_path)
-                self._is_ivf = self._is_index_ivf(self._index)
-
-                # IVF 인덱스면 nprobe 설정
-                if self._is_ivf:
-                    self._index.nprobe = self.IVF_NPROBE
-                    logger.info(f"📊 IVF 인덱스 로드됨 (nprobe={self.IVF_NPROBE})")
-
-                # 메타데이터 로드
-                with open(self.metadata_path, 'rb') as f:
-                    self._metadata = pickle.load(f)
-
-                index_type = "IVFFlat+IP" if self._is_ivf else "FlatL2(legacy)"
-                logger.info(f"✅ FAISS 인덱스 로드 완료: {self._index.ntotal}개 벡터 ({index_type})")
-
+                self.store.load()
             except Exception as e:
                 logger.error(f"❌ FAISS 인덱스 로드 실패: {e}")
-                self._index = self._create_empty_index()
-                self._metadata = []
-                self._is_ivf = False
 
-    def save_index(self):
+    async def compact_index(self) -> int:
         """
-        FAISS 인덱스 및 메타데이터 저장
+        delta 세그먼트를 메인 인덱스로 병합 (비동기)
 
-        Note: 동기 함수 (파일 I/O는 CPU-bound 작업이므로 동기 처리)
-        """
-        try:
-            self._ensure_index_dir()
-
-            # FAISS 인덱스 저장
-            faiss.write_index(self._index, self.index_path)
-
-            # 메타데이터 저장
-            with open(self.metadata_path, 'wb') as f:
-                pickle.dump(self._metadata, f)
+        메인 인덱스 직렬화는 O(N)이므로 executor에서 실행합니다.
 
-            logger.info(f"💾 FAISS 인덱스 저장 완료: {self._index.ntotal}개 벡터")
-
-        except Exception as e:
-            logger.error(f"❌ FAISS 인덱스 저장 실패: {e}")
+        Returns:
+            병합된 벡터 수
+        """
+        await self.load_index()
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.store.compact)
 
     async def add_embeddings(
         self,
@@ -166,7 +120,9 @@ class NewsVectorSearch:
         published_timestamps: List[int],
     ) -> int:
         """
-        임베딩을 FAISS 인덱스에 추가 (비동기)
+        임베딩을 FAISS delta 세그먼트에 추가 (비동기)
+
+        WAL에 append만 수행하므로 추가 건수에 비례하는 I/O만 발생합니다.
 
         Args:
             news_ids: 뉴스 ID 리스트
@@ -177,55 +133,36 @@ class NewsVectorSearch:
         Returns:
             추가된 벡터 수
         """
-        if len(news_ids) != len(embeddings) != len(stock_codes) != len(published_timestamps):
+        if not (len(news_ids) == len(embeddings) == len(stock_codes) == len(published_timestamps)):
             logger.error("입력 리스트 길이 불일치")
             return 0
 
         try:
             await self.load_index()  # ← Lock으로 보호
 
-            # numpy 배열로 변환
-            embeddings_np = np.array(embeddings, dtype=np.float32)
-
-            # FAISS 인덱스에 추가
-            self._index.add(embeddings_np)
-
-            # 메타데이터 추가
-            for news_id, stock_code, timestamp in zip(news_ids, stock_codes, published_timestamps):
-                self._metadata.append({
-                    "news_article_id": news_id,
-                    "stock_code": stock_code,
-                    "published_at": timestamp,
-                })
+            added = self.store.append(news_ids, embeddings, stock_codes, published_timestamps)
 
-            # 저장
-            self.save_index()
-
-            logger.info(f"✅ FAISS 인덱스에 {len(news_ids)}개 벡터 추가")
-            return len(news_ids)
+            logger.info(f"✅ FAISS delta 세그먼트에 {added}개 벡터 추가")
+            return added
 
         except Exception as e:
             logger.error(f"❌ 임베딩 추가 실패: {e}")
             return 0
 
-    async def get_indexed_news_ids(self) -> set:
+    async def get_indexed_news_ids(self) -> np.ndarray:
         """
-        FAISS에 이미 인덱싱된 뉴스 ID 목록 반환 (비동기)
+        FAISS에 이미 인덱싱된 뉴스 ID 배열 반환 (비동기)
 
         Returns:
-            인덱싱된 뉴스 ID 집합
+            인덱싱된 뉴스 ID 배열 (int64, 멤버십 검사는 np.isin 사용)
         """
         try:
             await self.load_index()  # ← Lock으로 보호
-
-            if not self._metadata:
-                return set()
-
-            return set(meta["news_article_id"] for meta in self._metadata)
+            return self.store.indexed_news_id_array()  # 컬럼 배열 그대로 (Python set 변환 없음)
 
         except Exception as e:
             logger.error(f"❌ 인덱싱된 뉴스 ID 조회 실패: {e}")
-            return set()
+            return np.empty(0, dtype=np.int64)
 
     async def search_similar_news(
         self,
@@ -233,15 +170,21 @@ class NewsVectorSearch:
         stock_code: Optional[str] = None,
         top_k: int = 5,
         similarity_threshold: float = 0.7,
+        published_after: Optional[int] = None,
+        published_before: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         유사한 과거 뉴스 검색 (비동기)
 
+        종목/기간 필터는 FAISS IDSelector로 검색 전에 적용되므로 over-fetch가 없습니다.
+
         Args:
             news_text: 검색할 뉴스 텍스트
             stock_code: 종목 코드 필터 (None이면 전체 검색)
             top_k: 반환할 최대 결과 수
             similarity_threshold: 유사도 임계값 (0.0 ~ 1.0)
+            published_after: 발행 시각 하한 (Unix timestamp, 포함)
+            published_before: 발행 시각 상한 (Unix timestamp, 미포함)
 
         Returns:
             유사 뉴스 리스트 [
@@ -254,65 +197,116 @@ class NewsVectorSearch:
                 ...
             ]
         """
+        results = await self.search_similar_news_batch(
+            texts=[news_text],
+            stock_codes=[stock_code],
+            top_k=top_k,
+            similarity_threshold=similarity_threshold,
+            published_after=published_after,
+            published_before=published_before,
+        )
+        return results[0]
+
+    async def search_similar_news_batch(
+        self,
+        texts: List[str],
+        stock_codes: Optional[List[Optional[str]]] = None,
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+        published_after: Optional[int] = None,
+        published_before: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 뉴스의 유사 과거 뉴스 일괄 검색 (비동기)
+
+        모든 쿼리를 추론 워커로 한 번에 임베딩하고, 같은 종목 필터를 가진 쿼리끼리 묶어
+        (n, dim) 행렬 하나로 FAISS 검색합니다 (필터가 없는 쿼리는 한 번의 검색).
+
+        Args:
+            texts: 검색할 뉴스 텍스트 리스트
+            stock_codes: 쿼리별 종목 코드 필터 (None이면 전체 검색)
+            top_k: 쿼리별 반환할 최대 결과 수
+            similarity_threshold: 유사도 임계값 (0.0 ~ 1.0)
+            published_after: 발행 시각 하한 (Unix timestamp, 포함)
+            published_before: 발행 시각 상한 (Unix timestamp, 미포함)
+
+        Returns:
+            입력 순서대로 쿼리별 유사 뉴스 리스트 (search_similar_news와 같은 형식,
+            임베딩 실패 또는 오류 시 빈 리스트)
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in texts]
+        if not texts:
+            return results
+
+        stock_codes = stock_codes or [None] * len(texts)
+        if len(stock_codes) != len(texts):
+            logger.error("입력 리스트 길이 불일치")
+            return results
+
         try:
             await self.load_index()  # ← Lock으로 보호
 
-            if self._index.ntotal == 0:
+            if self.store.ntotal == 0:
                 logger.warning("FAISS 인덱스 비어있음")
-                return []
-
-            # 임베딩 생성 (CPU 집약적 작업이므로 executor에서 실행)
-            loop = asyncio.get_event_loop()
-            query_embedding = await loop.run_in_executor(
-                None, self.embedder.embed_text, news_text
-            )
-            query_vector = np.array([query_embedding], dtype=np.float32)
-
-            # FAISS 검색
-            search_k = top_k * 10 if stock_code else top_k
-            logger.debug(f"FAISS 검색 시작: query_vector shape={query_vector.shape}, k={search_k}")
-            distances, indices = self._index.search(query_vector, search_k)
-            logger.debug(f"FAISS 검색 완료: found {len(indices[0])} items")
-
-            # 결과 필터링 및 변환
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < 0 or idx >= len(self._metadata):
-                    continue
+                return results
 
-                meta = self._metadata[idx]
+            # 임베딩 생성 (추론 워커가 동시 요청과 병합하여 배치 forward pass)
+            embeddings = await self.inference_worker.embed(texts)
 
-                # 종목 코드 필터
-                if stock_code and meta["stock_code"] != stock_code:
+            # 종목 필터별 쿼리 그룹 (임베딩 실패 쿼리는 제외)
+            groups: Dict[Optional[str], List[int]] = {}
+            for i, embedding in enumerate(embeddings):
+                if embedding is None:
+                    logger.warning(f"쿼리 임베딩 실패 (index={i}) → 검색 생략")
                     continue
+                groups.setdefault(stock_codes[i] or None, []).append(i)
 
-                # 유사도 계산
-                # - Inner Product (IVF): 정규화된 벡터는 IP = cosine similarity
-                # - L2 distance (legacy): 근사 변환
-                if self._is_ivf:
-                    similarity = float(dist)  # IP는 바로 similarity
-                else:
-                    similarity = 1 / (1 + dist)  # L2 → similarity 근사
-
-                if similarity < similarity_threshold:
-                    continue
+            for stock_code, rows in groups.items():
+                query_vectors = np.array([embeddings[i] for i in rows], dtype=np.float32)
 
-                results.append({
-                    "news_id": meta["news_article_id"],
-                    "similarity": round(similarity, 4),
-                    "stock_code": meta["stock_code"],
-                    "published_at": meta.get("published_at"),  # 기존 인덱스 호환성 (None 허용)
-                })
+                # FAISS 검색 (메인 + delta 세그먼트 병합, 종목/기간 사전 필터링)
+                logger.debug(
+                    f"FAISS 검색 시작: query_vectors shape={query_vectors.shape}, "
+                    f"k={top_k}, stock_code={stock_code}"
+                )
+                group_hits = self.store.search(
+                    query_vectors,
+                    top_k,
+                    stock_code=stock_code,
+                    published_after=published_after,
+                    published_before=published_before,
+                )
 
-                if len(results) >= top_k:
-                    break
+                for i, hits in zip(rows, group_hits):
+                    results[i] = self._to_results(hits, similarity_threshold)
 
-            logger.debug(f"🔍 유사 뉴스 검색 완료: {len(results)}건")
+            logger.debug(
+                f"🔍 유사 뉴스 일괄 검색 완료: 쿼리 {len(texts)}건, "
+                f"FAISS 검색 {len(groups)}회, 결과 {sum(len(r) for r in results)}건"
+            )
             return results
 
         except Exception as e:
             logger.error(f"❌ 유사 뉴스 검색 실패: {e}")
-            return []
+            return [[] for _ in texts]
+
+    @staticmethod
+    def _to_results(
+        hits: List[Tuple[float, Dict[str, Any]]], similarity_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """FAISS 검색 결과를 응답 형식으로 변환 (유사도 내림차순이므로 임계값 미만이면 종료)"""
+        results = []
+        for similarity, meta in hits:
+            if similarity < similarity_threshold:
+                break
+
+            results.append({
+                "news_id": meta["news_article_id"],
+                "similarity": round(similarity, 4),
+                "stock_code": meta["stock_code"],
+                "published_at": meta.get("published_at"),  # 기존 인덱스 호환성 (None 허용)
+            })
+        return results
 
     async def get_news_with_price_changes(
         self,
@@ -353,55 +347,77 @@ class NewsVectorSearch:
                 ...
             ]
         """
+        similar_news = await self.search_similar_news(
+            news_text=news_text,
+            stock_code=stock_code,
+            top_k=top_k,
+            similarity_threshold=similarity_threshold,
+        )
+        return self.attach_price_changes(similar_news, db)
+
+    def attach_price_changes(
+        self, similar_news: List[Dict[str, Any]], db: Optional[Session]
+    ) -> List[Dict[str, Any]]:
+        """
+        유사 뉴스 검색 결과(search_similar_news 형식)에 뉴스 상세 정보 및 주가 변동률 추가
+
+        뉴스와 매칭 정보는 IN 목록 한 번의 조회로 가져오며 (캐시 hit 뉴스는 매칭 조인 생략),
+        결과는 유사도 순서를 유지합니다.
+        """
+        if not similar_news or not db:
+            return similar_news
+
         try:
-            # 유사 뉴스 검색
-            similar_news = await self.search_similar_news(
-                news_text=news_text,
-                stock_code=stock_code,
-                top_k=top_k,
-                similarity_threshold=similarity_threshold,
+            news_ids = [news["news_id"] for news in similar_news]
+            price_changes_by_id = _price_change_cache.get_many(news_ids)
+            uncached_ids = [news_id for news_id in news_ids if news_id not in price_changes_by_id]
+
+            # DB에서 상세 정보 및 (캐시 miss 뉴스의) 주가 변동률 조회
+            article_columns = (
+                NewsArticle.id,
+                NewsArticle.title,
+                NewsArticle.content,
+                NewsArticle.stock_code,
+                NewsArticle.published_at,
             )
+            if uncached_ids:
+                rows = (
+                    db.query(*article_columns, *PRICE_CHANGE_COLUMNS.values())
+                    .outerjoin(
+                        NewsStockMatch,
+                        and_(
+                            NewsStockMatch.news_id == NewsArticle.id,
+                            NewsStockMatch.news_id.in_(uncached_ids),
+                        ),
+                    )
+                    .filter(NewsArticle.id.in_(news_ids))
+                    .order_by(NewsArticle.id, NewsStockMatch.id)
+                    .all()
+                )
+            else:
+                rows = db.query(*article_columns).filter(NewsArticle.id.in_(news_ids)).all()
+
+            articles: Dict[int, Any] = {}
+            fetched: Dict[int, Dict[str, Optional[float]]] = {}
+            for row in rows:
+                if row.id in articles:
+                    continue  # 매칭이 여러 건이면 첫 번째만 사용
+                articles[row.id] = row
+                if uncached_ids and row.id not in price_changes_by_id:
+                    fetched[row.id] = {
+                        period: getattr(row, column.key) for period, column in PRICE_CHANGE_COLUMNS.items()
+                    }
 
-            if not similar_news or not db:
-                return similar_news
+            _price_change_cache.put_many(fetched)
+            price_changes_by_id.update(fetched)
 
-            # DB에서 상세 정보 및 주가 변동률 조회
             result = []
             for news in similar_news:
                 news_id = news["news_id"]
-
-                # 뉴스 상세 정보
-                news_article = db.query(NewsArticle).filter(NewsArticle.id == news_id).first()
+                news_article = articles.get(news_id)
                 if not news_article:
                     continue
 
-                # 주가 변동률 조회
-                match = (
-                    db.query(NewsStockMatch)
-                    .filter(NewsStockMatch.news_id == news_id)
-                    .first()
-                )
-
-                price_changes = {}
-                if match:
-                    price_changes = {
-                        "1d": match.price_change_1d,
-                        "2d": match.price_change_2d,
-                        "3d": match.price_change_3d,
-                        "5d": match.price_change_5d,
-                        "10d": match.price_change_10d,
-                        "20d": match.price_change_20d,
-                    }
-                else:
-                    price_changes = {
-                        "1d": None,
-                        "2d": None,
-                        "3d": None,
-                        "5d": None,
-                        "10d": None,
-                        "20d": None,
-                    }
-
                 result.append({
                     "news_id": news_id,
                     "similarity": news["similarity"],
@@ -409,10 +425,13 @@ class NewsVectorSearch:
                     "news_content": news_article.content,
                     "stock_code": news_article.stock_code,
                     "published_at": news_article.published_at,
-                    "price_changes": price_changes,
+                    "price_changes": dict(price_changes_by_id[news_id]),
                 })
 
-            logger.debug(f"📊 주가 변동률 포함 검색 완료: {len(result)}건")
+            logger.debug(
+                f"📊 주가 변동률 포함 검색 완료: {len(result)}건 "
+                f"(주가 변동률 캐시 hit {len(news_ids) - len(uncached_ids)}건)"
+            )
             return result
 
         except Exception as e:
@@ -420,6 +439,85 @@ class NewsVectorSearch:
             return []
 
 
+# 뉴스별 주가 변동률 컬럼 (응답 키 → NewsStockMatch 컬럼)
+PRICE_CHANGE_COLUMNS = {
+    "1d": NewsStockMatch.price_change_1d,
+    "2d": NewsStockMatch.price_change_2d,
+    "3d": NewsStockMatch.price_change_3d,
+    "5d": NewsStockMatch.price_change_5d,
+    "10d": NewsStockMatch.price_change_10d,
+    "20d": NewsStockMatch.price_change_20d,
+}
+
+
+class PriceChangeCache:
+    """
+    뉴스별 주가 변동률 read-through 캐시 (LRU + TTL, Thread-safe)
+
+    주가 변동률은 뉴스-주가 매칭 작업에서만 바뀌므로 매칭 작업 후 invalidate()로 비웁니다.
+    매칭 작업이 다른 프로세스에서 실행되는 경우를 위해 TTL로도 만료합니다.
+    매칭이 아직 없는 뉴스(모든 값 None)도 캐시합니다.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        """
+        Args:
+            max_size: 최대 항목 수 (None이면 settings.PRICE_CHANGE_CACHE_SIZE)
+            ttl_seconds: 항목 유효 시간 (None이면 settings.PRICE_CHANGE_CACHE_TTL_SECONDS)
+        """
+        self.max_size = settings.PRICE_CHANGE_CACHE_SIZE if max_size is None else max_size
+        self.ttl_seconds = (
+            settings.PRICE_CHANGE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Optional[float]]]]" = OrderedDict()
+
+    def get_many(self, news_ids: List[int]) -> Dict[int, Dict[str, Optional[float]]]:
+        """캐시된 주가 변동률 조회 (만료 항목은 제거, miss는 결과에서 제외)"""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for news_id in news_ids:
+                entry = self._entries.get(news_id)
+                if entry is None:
+                    continue
+                cached_at, price_changes = entry
+                if now - cached_at > self.ttl_seconds:
+                    del self._entries[news_id]
+                    continue
+                self._entries.move_to_end(news_id)
+                found[news_id] = price_changes
+        return found
+
+    def put_many(self, price_changes_by_id: Dict[int, Dict[str, Optional[float]]]):
+        """주가 변동률 저장 (초과 시 가장 오래 사용되지 않은 항목부터 제거)"""
+        if self.max_size <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for news_id, price_changes in price_changes_by_id.items():
+                self._entries[news_id] = (now, price_changes)
+                self._entries.move_to_end(news_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_price_change_cache = PriceChangeCache()
+
+
+def invalidate_price_change_cache():
+    """주가 변동률 캐시 비우기 (뉴스-주가 매칭 작업 후 호출)"""
+    _price_change_cache.invalidate()
+
+
 # Singleton 인스턴스
 _vector_search_instance: Optional[NewsVectorSearch] = None
 
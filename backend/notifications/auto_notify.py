@@ -68,14 +68,23 @@ async def process_new_news_notifications(
         failed_count = 0
         skipped_count = 0
 
-        for news in recent_news:
+        # 전체 뉴스를 한 번에 임베딩/검색 (예측용 유사 뉴스, 중복 후보는 이 결과에서 추림)
+        news_texts = [f"{news.title}\n{news.content}" for news in recent_news]
+        stock_codes = [news.stock_code for news in recent_news]
+        similar_news_batch = await vector_search.search_similar_news_batch(
+            texts=news_texts,
+            stock_codes=stock_codes,
+            top_k=5,
+            similarity_threshold=min(0.5, embedding_deduplicator.high_similarity_threshold),
+        )
+
+        for news, similar_hits in zip(recent_news, similar_news_batch):
             try:
                 logger.info(f"처리 중: {news.title[:50]}... (종목: {news.stock_code})")
 
-                # 0. 임베딩 기반 알림 중복 검사
-                news_text = f"{news.title}\n{news.content}"
-                should_skip, similar_id, similarity = await embedding_deduplicator.should_skip_notification(
-                    news_text=news_text,
+                # 0. 임베딩 기반 알림 중복 검사 (DB 이력은 처리 시점에 확인)
+                should_skip, similar_id, similarity = embedding_deduplicator.check_notification_candidates(
+                    similar_news=embedding_deduplicator.select_notification_candidates(similar_hits),
                     stock_code=news.stock_code,
                     db=db,
                     notification_lookback_hours=4,
@@ -93,16 +102,8 @@ async def process_new_news_notifications(
                     skipped_count += 1
                     continue
 
-                # 1. 유사 뉴스 검색
-                similar_news = await vector_search.get_news_with_price_changes(
-                    news_text=news_text,
-                    stock_code=news.stock_code,
-                    db=db,
-                    top_k=5,
-                    similarity_threshold=0.5,
-                )
-
-                # 2. 예측 수행
+                # 1. 예측 수행 (유사 뉴스는 루프 전에 일괄 검색, 주가 변동률은 중복 검사를 통과한 뉴스만 조회)
+                similar_news = vector_search.attach_price_changes(similar_hits, db)
                 current_news_data = {
                     "title": news.title,
                     "content": news.content,
@@ -123,7 +124,7 @@ async def process_new_news_notifications(
                 news.predicted_at = datetime.utcnow()
                 db.commit()
 
-                # 3. 텔레그램 알림 전송 (임시 비활성화)
+                # 2. 텔레그램 알림 전송 (임시 비활성화)
                 # TODO: 텔레그램 알림 재활성화 시 주석 해제
                 # if notifier.send_prediction(
                 #     news_title=news.title,
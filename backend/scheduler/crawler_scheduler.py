@@ -5,7 +5,8 @@ APScheduler를 사용하여 주기적으로 뉴스 및 주가 데이터를 크
 """
 import logging
 import asyncio
-from typing import Optional
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -15,18 +16,21 @@ from backend.crawlers.naver_crawler import NaverNewsCrawler
 from backend.crawlers.hankyung_crawler import HankyungNewsCrawler
 from backend.crawlers.maeil_crawler import MaeilNewsCrawler
 from backend.crawlers.naver_search_crawler import NaverNewsSearchCrawler
-from backend.crawlers.dart_crawler import DartCrawler
+from backend.crawlers.dart_crawler import DartCrawler, get_dart_cursor, last_saved_rcept_no
 from backend.crawlers.news_saver import NewsSaver
+from backend.crawlers.base_crawler import NewsArticleData
+from backend.crawlers.crawl_pipeline import run_crawl_pipeline
+from backend.crawlers.http_cache import get_http_cache
 from backend.crawlers.kis_daily_crawler import get_kis_daily_crawler
 from backend.crawlers.kis_minute_collector import run_minute_collector
 from backend.crawlers.kis_market_data_collector import (
-    OrderbookCollector,
-    CurrentPriceCollector,
     InvestorTradingCollector,
-    SectorIndexCollector,
+    MarketSnapshotCollector,
 )
 from backend.crawlers.news_stock_matcher import run_daily_matching
 from backend.llm.embedder import run_daily_embedding
+from backend.llm.faiss_store import get_faiss_store
+from backend.llm.faiss_lifecycle import IndexLifecycleManager
 from backend.utils.market_time import is_market_open
 from backend.db.session import SessionLocal
 from backend.db.models.stock import Stock
@@ -50,6 +54,40 @@ def safe_close_db(db) -> None:
         logger.warning(f"DB 세션 종료 중 경고 (무시): {e}")
 
 
+async def _fetch_source_news(crawler_cls, limit: int) -> List[NewsArticleData]:
+    """언론사 크롤러 하나로 최신 뉴스 수집 (크롤링 파이프라인 작업)"""
+    async with crawler_cls() as crawler:
+        return await crawler.fetch_news(limit=limit)
+
+
+async def _search_stock_news(
+    search_crawler: NaverNewsSearchCrawler, stock_name: str, priority: int
+) -> List[NewsArticleData]:
+    """종목명으로 뉴스 검색 (크롤링 파이프라인 작업)"""
+    # 우선순위별 수집량 결정
+    if priority <= 2:
+        limit = 10  # 높은 우선순위
+    elif priority == 3:
+        limit = 5   # 중간 우선순위
+    else:
+        limit = 3   # 낮은 우선순위
+
+    logger.info(f"🔍 {stock_name} 검색 중... (최대 {limit}건)")
+
+    # 종목명으로 뉴스 검색
+    # NAVER는 한글로 검색 (영문 "NAVER"로 검색하면 출처 "네이버"가 모두 검색됨)
+    search_query = "네이버" if stock_name == "NAVER" else stock_name
+
+    news_list = await search_crawler.search_news(query=search_query, limit=limit)
+
+    # 뉴스에 종목코드 명시적 설정
+    for news in news_list:
+        news.company_name = stock_name
+        # stock_code는 news_saver에서 자동 매칭되지만 명시적으로 설정 가능
+
+    return news_list
+
+
 class CrawlerScheduler:
     """크롤러 스케줄러 클래스"""
 
@@ -71,6 +109,10 @@ class CrawlerScheduler:
         self.news_total_saved = 0
         self.news_total_skipped = 0
         self.news_total_errors = 0
+        self.news_last_cycle_seconds: Optional[float] = None  # 언론사 크롤링 사이클 wall-clock
+        self.stock_news_last_cycle_seconds: Optional[float] = None  # 종목별 검색 사이클 wall-clock
+        self.dart_last_requests: int = 0  # 마지막 공시 수집의 DART API 요청 수
+        self.market_snapshot_last_result: Optional[Dict[str, Any]] = None  # 마지막 시장 스냅샷 수집 결과
 
         # 주가 수집 통계
         self.stock_total_crawls = 0
@@ -115,6 +157,8 @@ class CrawlerScheduler:
     async def _crawl_all_sources(self) -> None:
         """
         모든 언론사에서 뉴스를 크롤링하고 저장합니다 (비동기).
+
+        언론사별 수집은 동시에 실행하고, 저장은 단일 저장 단계에서 순차 처리합니다.
         """
         logger.info("=" * 40)
         logger.info(f"🔄 뉴스 크롤링 시작 (#{self.news_total_crawls + 1})")
@@ -123,79 +167,33 @@ class CrawlerScheduler:
         db = SessionLocal()
         saver = NewsSaver(db, auto_predict=False)  # 뉴스 저장 시 자동 예측 비활성화 (PyTorch Segmentation Fault 방지)
 
-        saved_total = 0
-        skipped_total = 0
-
         try:
-            # 1. 네이버 뉴스 크롤링
-            try:
-                logger.info("📰 네이버 뉴스 크롤링...")
-                async with NaverNewsCrawler() as naver:
-                    news_list = await naver.fetch_news(limit=10)
-                    if news_list:
-                        saved, skipped = await saver.save_news_batch(news_list)
-                        saved_total += saved
-                        skipped_total += skipped
-                        logger.info(f"   ✅ 네이버: {saved}건 저장, {skipped}건 스킵")
-                    else:
-                        logger.warning("   ⚠️  네이버: 뉴스 없음")
-            except Exception as e:
-                self.news_total_errors += 1
-                logger.error(f"   ❌ 네이버 크롤링 실패: {e}")
-
-            # 2. 한국경제 뉴스 크롤링
-            try:
-                logger.info("📰 한국경제 뉴스 크롤링...")
-                async with HankyungNewsCrawler() as hankyung:
-                    news_list = await hankyung.fetch_news(limit=10)
-                    if news_list:
-                        saved, skipped = await saver.save_news_batch(news_list)
-                        saved_total += saved
-                        skipped_total += skipped
-                        logger.info(f"   ✅ 한국경제: {saved}건 저장, {skipped}건 스킵")
-                    else:
-                        logger.warning("   ⚠️  한국경제: 뉴스 없음")
-            except Exception as e:
-                self.news_total_errors += 1
-                logger.error(f"   ❌ 한국경제 크롤링 실패: {e}")
-
-            # 3. 매일경제 뉴스 크롤링
-            try:
-                logger.info("📰 매일경제 뉴스 크롤링...")
-                async with MaeilNewsCrawler() as maeil:
-                    news_list = await maeil.fetch_news(limit=10)
-                    if news_list:
-                        saved, skipped = await saver.save_news_batch(news_list)
-                        saved_total += saved
-                        skipped_total += skipped
-                        logger.info(f"   ✅ 매일경제: {saved}건 저장, {skipped}건 스킵")
-                    else:
-                        logger.warning("   ⚠️  매일경제: 뉴스 없음")
-            except Exception as e:
-                self.news_total_errors += 1
-                logger.error(f"   ❌ 매일경제 크롤링 실패: {e}")
-
-            # 4. Reddit 크롤링
-            try:
-                logger.info("📰 Reddit 크롤링...")
-                from backend.crawlers.reddit_crawler import RedditCrawler
-                async with RedditCrawler() as reddit:
-                    news_list = await reddit.fetch_news(limit=50)
-                    if news_list:
-                        saved, skipped = await saver.save_news_batch(news_list)
-                        saved_total += saved
-                        skipped_total += skipped
-                        logger.info(f"   ✅ Reddit: {saved}건 저장, {skipped}건 스킵")
-                    else:
-                        logger.warning("   ⚠️  Reddit: 뉴스 없음")
-            except Exception as e:
-                self.news_total_errors += 1
-                logger.error(f"   ❌ Reddit 크롤링 실패: {e}")
+            # 0. 제목 중복 검사 LSH 인덱스 재구성 (사이클당 1회 DB 조회)
+            #    + API 서버에서 종목이 바뀌었으면 기업명 매칭 오토마톤 재구성
+            saver.deduplicator.rebuild_index(db)
+            saver.stock_mapper.refresh_if_changed()
+
+            from backend.crawlers.reddit_crawler import RedditCrawler
+
+            # 1. 네이버 / 한국경제 / 매일경제 / Reddit 동시 수집 → 단일 저장 단계
+            logger.info("📰 네이버 · 한국경제 · 매일경제 · Reddit 동시 크롤링...")
+            result = await run_crawl_pipeline(
+                [
+                    ("네이버", partial(_fetch_source_news, NaverNewsCrawler, 10)),
+                    ("한국경제", partial(_fetch_source_news, HankyungNewsCrawler, 10)),
+                    ("매일경제", partial(_fetch_source_news, MaeilNewsCrawler, 10)),
+                    ("Reddit", partial(_fetch_source_news, RedditCrawler, 50)),
+                ],
+                saver,
+            )
+            saved_total, skipped_total = result.saved, result.skipped
 
             # 통계 업데이트
             self.news_total_crawls += 1
             self.news_total_saved += saved_total
             self.news_total_skipped += skipped_total
+            self.news_total_errors += len(result.failed_jobs)
+            self.news_last_cycle_seconds = result.elapsed_seconds
 
             # 성공률 계산
             success_rate = (
@@ -205,7 +203,10 @@ class CrawlerScheduler:
             )
 
             logger.info("=" * 40)
-            logger.info(f"✅ 뉴스 크롤링 완료: {saved_total}건 저장, {skipped_total}건 스킵")
+            logger.info(
+                f"✅ 뉴스 크롤링 완료: {saved_total}건 저장, {skipped_total}건 스킵 "
+                f"({result.elapsed_seconds:.1f}초)"
+            )
             logger.info(
                 f"📊 뉴스 전체 통계: 실행 {self.news_total_crawls}회, "
                 f"저장 {self.news_total_saved}건, "
@@ -226,6 +227,9 @@ class CrawlerScheduler:
         """
         종목별로 뉴스를 검색하여 수집합니다 (비동기).
         우선순위에 따라 수집량 차등 적용.
+
+        종목별 검색은 동시에 실행하되, 검색 크롤러 하나를 공유하므로
+        네이버 검색 호스트의 동시 요청 수/요청 간격 제한은 그대로 유지됩니다.
         """
         logger.info("=" * 40)
         logger.info("🎯 종목별 뉴스 검색 시작")
@@ -234,9 +238,6 @@ class CrawlerScheduler:
         db = SessionLocal()
         saver = NewsSaver(db, auto_predict=False)  # 뉴스 저장 시 자동 예측 비활성화 (PyTorch Segmentation Fault 방지)
 
-        saved_total = 0
-        skipped_total = 0
-
         try:
             async with NaverNewsSearchCrawler() as search_crawler:
                 # DB에서 활성화된 종목 가져오기
@@ -244,49 +245,22 @@ class CrawlerScheduler:
 
                 logger.info(f"📊 검색 대상 종목: {len(stocks)}개")
 
-                for stock in stocks:
-                    try:
-                        # 우선순위별 수집량 결정
-                        if stock.priority <= 2:
-                            limit = 10  # 높은 우선순위
-                        elif stock.priority == 3:
-                            limit = 5   # 중간 우선순위
-                        else:
-                            limit = 3   # 낮은 우선순위
-
-                        logger.info(f"🔍 {stock.name} ({stock.code}) 검색 중... (최대 {limit}건)")
-
-                        # 종목명으로 뉴스 검색
-                        # NAVER는 한글로 검색 (영문 "NAVER"로 검색하면 출처 "네이버"가 모두 검색됨)
-                        search_query = "네이버" if stock.name == "NAVER" else stock.name
-
-                        news_list = await search_crawler.search_news(
-                            query=search_query,
-                            limit=limit
-                        )
-
-                        if news_list:
-                            # 뉴스에 종목코드 명시적 설정
-                            for news in news_list:
-                                news.company_name = stock.name
-                                # stock_code는 news_saver에서 자동 매칭되지만 명시적으로 설정 가능
-
-                            saved, skipped = await saver.save_news_batch(news_list)
-                            saved_total += saved
-                            skipped_total += skipped
-
-                            if saved > 0:
-                                logger.info(f"   ✅ {saved}건 저장, {skipped}건 스킵")
-                            else:
-                                logger.debug(f"   ⏭️  전부 중복 ({skipped}건)")
-                        else:
-                            logger.debug(f"   ℹ️  검색 결과 없음")
+                jobs = [
+                    (
+                        f"{stock.name} ({stock.code})",
+                        partial(_search_stock_news, search_crawler, stock.name, stock.priority),
+                    )
+                    for stock in stocks
+                ]
+                result = await run_crawl_pipeline(jobs, saver)
 
-                    except Exception as e:
-                        logger.error(f"   ❌ {stock.name} 검색 실패: {e}")
+            self.stock_news_last_cycle_seconds = result.elapsed_seconds
 
             logger.info("=" * 40)
-            logger.info(f"✅ 종목별 검색 완료: {saved_total}건 저장, {skipped_total}건 스킵")
+            logger.info(
+                f"✅ 종목별 검색 완료: {result.saved}건 저장, {result.skipped}건 스킵, "
+                f"실패 {len(result.failed_jobs)}개 종목 ({result.elapsed_seconds:.1f}초)"
+            )
             logger.info("=" * 40)
 
         except Exception as e:
@@ -299,6 +273,9 @@ class CrawlerScheduler:
         """
         DART 공시 정보를 수집합니다 (비동기).
         Priority 1-2 종목만 대상 (중요 종목만)
+
+        전체 시장 공시 목록을 커서(마지막 접수번호) 이후만 조회해 대상 종목 공시를 거릅니다.
+        저장에 성공해야 커서를 이동하므로, 실패한 조회나 저장은 다음 주기에 다시 가져옵니다.
         """
         logger.info("=" * 40)
         logger.info("📋 DART 공시 수집 시작")
@@ -306,9 +283,7 @@ class CrawlerScheduler:
 
         db = SessionLocal()
         saver = NewsSaver(db, auto_predict=False)  # 뉴스 저장 시 자동 예측 비활성화 (PyTorch Segmentation Fault 방지)
-
-        saved_total = 0
-        skipped_total = 0
+        cursor = get_dart_cursor()
 
         try:
             async with DartCrawler() as dart_crawler:
@@ -324,41 +299,29 @@ class CrawlerScheduler:
                     Stock.priority <= 2
                 ).all()
 
-                logger.info(f"📊 공시 수집 대상: {len(stocks)}개 (Priority 1-2만)")
+                logger.info(f"📊 공시 수집 대상: {len(stocks)}개 (Priority 1-2만), 커서: {cursor.rcept_no or '없음'}")
 
-                for stock in stocks:
-                    try:
-                        logger.info(f"📋 {stock.name} ({stock.code}) 공시 검색 중...")
-
-                        # 최근 3일간 공시 검색
-                        from datetime import datetime, timedelta
-                        disclosures = await dart_crawler.fetch_disclosures_by_stock_code(
-                            stock_code=stock.code,
-                            start_date=datetime.now() - timedelta(days=3),
-                            end_date=datetime.now(),
-                        )
+                disclosures, latest = await dart_crawler.fetch_new_disclosures(
+                    since_rcept_no=cursor.rcept_no,
+                    stocks={stock.code: stock.name for stock in stocks},
+                )
 
-                        if disclosures:
-                            # 공시에 종목 정보 설정
-                            for disclosure in disclosures:
-                                disclosure.company_name = stock.name
-
-                            saved, skipped = await saver.save_news_batch(disclosures)
-                            saved_total += saved
-                            skipped_total += skipped
-
-                            if saved > 0:
-                                logger.info(f"   ✅ {saved}건 저장, {skipped}건 스킵")
-                            else:
-                                logger.debug(f"   ⏭️  전부 중복 ({skipped}건)")
-                        else:
-                            logger.debug(f"   ℹ️  공시 없음")
+                saved_total = skipped_total = 0
+                if disclosures:
+                    await dart_crawler.attach_company_details(disclosures)
+                    saved_total, skipped_total = await saver.save_news_batch(disclosures)
+                    if saver.failed_urls:
+                        logger.warning(f"⚠️  공시 {len(saver.failed_urls)}건 저장 실패, 실패 공시 이전까지만 커서 이동")
+                    latest = last_saved_rcept_no(latest, disclosures, saver.failed_urls)
 
-                    except Exception as e:
-                        logger.error(f"   ❌ {stock.name} 공시 수집 실패: {e}")
+                cursor.advance(latest)
+                self.dart_last_requests = dart_crawler.request_count
 
             logger.info("=" * 40)
-            logger.info(f"✅ DART 공시 수집 완료: {saved_total}건 저장, {skipped_total}건 스킵")
+            logger.info(
+                f"✅ DART 공시 수집 완료: {saved_total}건 저장, {skipped_total}건 스킵 "
+                f"(API 요청 {self.dart_last_requests}회)"
+            )
             logger.info("=" * 40)
 
         except Exception as e:
@@ -451,6 +414,33 @@ class CrawlerScheduler:
         except Exception as e:
             logger.error(f"❌ 뉴스 임베딩 중 예상치 못한 에러: {e}")
 
+    def _compact_vector_index(self) -> None:
+        """
+        FAISS delta 세그먼트를 메인 인덱스로 병합합니다.
+
+        임베딩 작업은 WAL에 append만 하므로, 메인 인덱스 재작성(O(N))은
+        이 작업에서 하루 한 번만 수행합니다. 병합 후 인덱스 라이프사이클
+        (Flat → IVF 승격, nlist 재학습, nprobe 튜닝)을 점검합니다.
+        """
+        try:
+            merged = get_faiss_store().compact()
+            if merged:
+                logger.info(f"🗜️  FAISS 컴팩션 완료: {merged}개 벡터 병합")
+            else:
+                logger.debug("FAISS 컴팩션 대상 없음")
+
+        except Exception as e:
+            logger.error(f"❌ FAISS 컴팩션 중 에러: {e}", exc_info=True)
+            return
+
+        try:
+            result = IndexLifecycleManager().run()
+            if result["action"] is None:
+                logger.debug("FAISS 인덱스 라이프사이클 작업 없음")
+
+        except Exception as e:
+            logger.error(f"❌ FAISS 인덱스 라이프사이클 작업 중 에러: {e}", exc_info=True)
+
     async def _auto_notify(self) -> None:
         """
         AI 시장 분석 자동 생성 및 알림
@@ -605,7 +595,8 @@ class CrawlerScheduler:
 
     async def _collect_market_data(self) -> None:
         """
-        KIS API로 시장 데이터 수집 (호가, 현재가, 종목정보, 업종지수).
+        KIS API로 시장 스냅샷 수집 (현재가, 호가, 업종지수).
+        종목별로 현재가·호가를 함께 조회하고 한 트랜잭션으로 저장합니다.
         장 시간(09:00~15:30)에만 실행됩니다.
         """
         # 장 시간 체크
@@ -618,20 +609,8 @@ class CrawlerScheduler:
         logger.info("=" * 40)
 
         try:
-            # 호가 데이터 수집
-            logger.info("📈 호가 데이터 수집 시작...")
-            orderbook_collector = OrderbookCollector(batch_size=10)
-            await orderbook_collector.collect_all()
-
-            # 현재가 데이터 수집
-            logger.info("💰 현재가 데이터 수집 시작...")
-            current_price_collector = CurrentPriceCollector(batch_size=10)
-            await current_price_collector.collect_all()
-
-            # 업종 지수 수집
-            logger.info("📊 업종 지수 수집 시작...")
-            sector_index_collector = SectorIndexCollector()
-            await sector_index_collector.collect_all()
+            # 현재가 + 호가 + 업종 지수를 한 번의 순회로 수집
+            self.market_snapshot_last_result = await MarketSnapshotCollector().collect_all()
 
             logger.info("=" * 40)
             logger.info("✅ 시장 데이터 수집 완료")
@@ -953,6 +932,16 @@ class CrawlerScheduler:
             replace_existing=True,
         )
 
+        # FAISS 컴팩션 작업 등록 (매일 03:30 - delta 세그먼트 → 메인 인덱스 병합)
+        compaction_trigger = CronTrigger(hour=3, minute=30)
+        self.scheduler.add_job(
+            func=self._compact_vector_index,
+            trigger=compaction_trigger,
+            id="faiss_compaction_job",
+            name="FAISS 인덱스 컴팩션",
+            replace_existing=True,
+        )
+
         # AI 시장 분석 자동 생성 작업 등록 (매시 5, 15, 25, 35, 45, 55분 - 뉴스 크롤링과 5분 간격 분리)
         # 최근 뉴스에 대해 AI 예측을 수행하여 시장 분석을 자동 생성하고 텔레그램 알림 전송
         # CronTrigger 사용으로 뉴스 크롤링(0, 10, 20, 30, 40, 50분)과 절대 겹치지 않음 (PyTorch Segmentation Fault 방지)
@@ -1101,6 +1090,7 @@ class CrawlerScheduler:
         logger.info("   - KIS 시장 데이터: 매 5분 (호가, 현재가, 업종지수 - 장 시간만)")
         logger.info("   - 투자자별 매매동향: 매일 16:00 (장 마감 후)")
         logger.info("   - 뉴스 임베딩: 매 시간 7분 (1시간마다)")
+        logger.info("   - FAISS 컴팩션: 매일 03:30 (delta 세그먼트 병합 + IVF 승격/재학습/nprobe 튜닝)")
         logger.info("   - 모델 평가 생성: 매일 16:30 (리포트 생성 후 30분)")
         logger.info("   - KIS 업종/지수 일자별: 매일 18:00 (시간외 거래 종료 후)")
         logger.info("   - 시간외 거래 가격: 매일 18:10 (업종/지수 수집 후 10분)")
@@ -1191,7 +1181,15 @@ class CrawlerScheduler:
                 "total_skipped": self.news_total_skipped,
                 "total_errors": self.news_total_errors,
                 "success_rate": round(news_success_rate, 2),
+                "last_cycle_seconds": self.news_last_cycle_seconds,
+                "stock_search_last_cycle_seconds": self.stock_news_last_cycle_seconds,
+                "http_cache": get_http_cache().get_stats(),  # 크롤러별 304/절약 바이트/생략 요청
+            },
+            "dart": {
+                "cursor": get_dart_cursor().rcept_no,  # 마지막으로 확인한 접수번호
+                "last_requests": self.dart_last_requests,
             },
+            "market_snapshot": self.market_snapshot_last_result,  # 스냅샷 시각, 저장 종목 수, 소요 시간
             "stock": {
                 "total_crawls": self.stock_total_crawls,
                 "total_stocks": self.stock_total_stocks,
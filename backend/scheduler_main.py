@@ -15,7 +15,12 @@ os.environ["MKL_NUM_THREADS"] = "1"
 os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
 os.environ["NUMEXPR_NUM_THREADS"] = "1"
 
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -55,43 +60,133 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """스케줄러 서버 시작 이벤트"""
-    logger.info(f"🤖 Azak 스케줄러 서버 시작")
+# 시작 단계별 소요 시간 (/health로 노출)
+_startup_state: Dict[str, Any] = {
+    "mode": "warm" if settings.SCHEDULER_WARM_START else "eager",
+    "ready": False,
+    "phases": {},
+    "total_seconds": None,
+    "error": None,
+}
+_warm_start_task = None  # 백그라운드 warm-up 태스크 (GC 방지용 참조)
+
+
+def _load_tokenizer():
+    """임베딩 토크나이저 로드"""
+    from backend.llm.embedder import get_news_embedder
+    _ = get_news_embedder().tokenizer
+
+
+def _load_embedding_model():
+    """임베딩 모델(백엔드) 로드"""
+    from backend.llm.embedder import get_news_embedder
+    _ = get_news_embedder().model
+
+
+def _load_faiss_index():
+    """FAISS 메인 인덱스 로드 + WAL 재생 (FAISS_MMAP_INDEX면 memmap)"""
+    from backend.llm.faiss_store import get_faiss_store
+    get_faiss_store().load()
+
 
-    # 1️⃣ ML 모델 사전 로드 (Eager Loading) - Segmentation Fault 방지
-    # 메인 스레드에서 안전하게 모델을 로드한 후 스케줄러 시작
+def _load_predictor():
+    """예측 모델 로드"""
+    from backend.llm.predictor import get_predictor
+    get_predictor()
+
+
+# (단계명, 로더) - 순서대로 실행
+_STARTUP_PHASES: List[Tuple[str, Callable[[], None]]] = [
+    ("tokenizer", _load_tokenizer),
+    ("embedding_model", _load_embedding_model),
+    ("faiss_index", _load_faiss_index),
+    ("predictor", _load_predictor),
+]
+
+
+def _run_phase(name: str, loader: Callable[[], None]):
+    """시작 단계 하나를 실행하고 소요 시간 기록"""
+    start = time.perf_counter()
     try:
-        logger.info("📦 ML 모델 로드 시작...")
+        loader()
+    finally:
+        _startup_state["phases"][name] = round(time.perf_counter() - start, 3)
+    logger.info(f"✅ 시작 단계 완료: {name} ({_startup_state['phases'][name]:.2f}초)")
 
-        from backend.llm.embedder import get_news_embedder
-        from backend.llm.predictor import get_predictor
 
-        embedder = get_news_embedder()
-        # Lazy loading 트리거 - 실제로 모델을 메모리에 로드
-        _ = embedder.tokenizer
-        _ = embedder.model
-        logger.info("✅ 임베딩 모델 로드 완료 (메인 스레드)")
+async def _run_startup(in_background: bool):
+    """
+    ML 모델/FAISS 인덱스 로드 후 추론 워커와 크롤러 스케줄러 시작
 
-        predictor = get_predictor()
-        logger.info("✅ 예측 모델 로드 완료 (메인 스레드)")
+    Args:
+        in_background: True면 로드 단계를 전용 스레드 하나에서 순차 실행 (이벤트 루프 비차단)
+    """
+    start = time.perf_counter()
+
+    # 1️⃣ ML 모델 사전 로드 - Segmentation Fault 방지
+    # 스케줄러 작업이 시작되기 전에 한 스레드에서 모델을 모두 로드
+    try:
+        logger.info("📦 ML 모델 로드 시작...")
+
+        if in_background:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="warm-start") as executor:
+                for name, loader in _STARTUP_PHASES:
+                    await loop.run_in_executor(executor, _run_phase, name, loader)
+        else:
+            for name, loader in _STARTUP_PHASES:
+                _run_phase(name, loader)
+
+        # 추론 워커를 메인 이벤트 루프에서 시작 (스케줄러 스레드의 임베딩 작업도 배치 공유)
+        from backend.llm.inference_worker import get_inference_worker
+        get_inference_worker().start()
 
     except Exception as e:
         logger.error(f"❌ ML 모델 로드 실패: {e}", exc_info=True)
+        _startup_state["error"] = str(e)
         # 모델 로드 실패 시에도 앱은 계속 실행 (예측 기능만 비활성화)
 
     # 2️⃣ APScheduler 시작 (뉴스: 10분, 주가: 1분)
+    _run_phase("scheduler", _start_crawler_scheduler)
+
+    _startup_state["total_seconds"] = round(time.perf_counter() - start, 3)
+    _startup_state["ready"] = True
+    logger.info(f"🚀 스케줄러 서버 준비 완료 ({_startup_state['total_seconds']:.2f}초)")
+
+
+def _start_crawler_scheduler():
+    """크롤러 스케줄러 시작"""
     scheduler = get_crawler_scheduler(news_interval_minutes=10, stock_interval_minutes=1)
     scheduler.start()
     logger.info("✅ 크롤러 스케줄러 시작 (뉴스 + 주가)")
 
 
+@app.on_event("startup")
+async def startup_event():
+    """
+    스케줄러 서버 시작 이벤트
+
+    SCHEDULER_WARM_START=True면 모델/인덱스 로드를 백그라운드 태스크로 넘기고 즉시 반환하여
+    로드 중에도 /health가 응답합니다 (startup.ready로 준비 여부 확인).
+    """
+    global _warm_start_task
+
+    logger.info(f"🤖 Azak 스케줄러 서버 시작 (mode={_startup_state['mode']})")
+
+    if settings.SCHEDULER_WARM_START:
+        _warm_start_task = asyncio.create_task(_run_startup(in_background=True))
+    else:
+        await _run_startup(in_background=False)
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """스케줄러 서버 종료 이벤트"""
     logger.info(f"🛑 Azak 스케줄러 서버 종료")
 
+    if _warm_start_task is not None and not _warm_start_task.done():
+        _warm_start_task.cancel()
+
     # APScheduler 종료
     scheduler = get_crawler_scheduler()
     scheduler.shutdown()
@@ -114,12 +209,25 @@ async def root():
 @app.get("/health")
 async def health_check():
     """헬스체크 엔드포인트"""
+    from backend.llm.embedder import get_news_embedder
+    from backend.llm.inference_worker import get_inference_worker
+    from backend.crawlers.kis_client import get_rate_limiter_stats, get_request_stats
+    from backend.crawlers.collector_executor import get_sweep_stats
+
     scheduler = get_crawler_scheduler()
+    # 헬스체크가 캐시를 만들지 않도록 (디스크 캐시 로드가 이벤트 루프를 막음) 이미 생성된 캐시만 조회
+    embedding_cache = get_news_embedder().loaded_cache
 
     return {
         "status": "healthy",
         "scheduler_running": scheduler.is_running if scheduler else False,
         "active_jobs": len(scheduler.scheduler.get_jobs()) if scheduler and scheduler.scheduler else 0,
+        "embedding_cache": embedding_cache.get_stats() if embedding_cache else None,
+        "embedding_worker": get_inference_worker().get_stats(),
+        "kis_rate_limiter": get_rate_limiter_stats(),  # 우선순위별 대기 시간 히스토그램
+        "kis_requests": get_request_stats(),  # 동시 요청 합치기/응답 캐시로 아낀 호출 수
+        "kis_collector_sweeps": get_sweep_stats(),  # 수집 작업별 마지막 전체 순회 소요 시간
+        "startup": _startup_state,
     }
 
 
@@ -16,7 +16,7 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from backend.db.models.stock import StockPrice
-from backend.db.models.market_data import StockCurrentPrice, StockOvertimePrice
+from backend.db.models.market_data import StockMarketSnapshot, StockOvertimePrice
 from backend.crawlers.kis_client import KISClient
 from backend.config import settings
 
@@ -155,7 +155,7 @@ class PriceService:
         """실시간 현재가 조회 (KIS API 직접 호출)"""
         try:
             # KIS API 호출 (async)
-            kis_client = get_kis_client()
+            kis_client = await get_kis_client()
             response = await kis_client.get_current_price(stock_code)
 
             # 응답 파싱
@@ -196,12 +196,12 @@ class PriceService:
         except Exception as e:
             logger.error(f"KIS API 호출 실패 ({stock_code}): {e}", exc_info=True)
 
-        # API 실패 시 DB에서 조회 (fallback)
-        current_price = db.query(StockCurrentPrice).filter(
-            StockCurrentPrice.stock_code == stock_code,
-            StockCurrentPrice.datetime >= datetime.combine(today, time.min),
-            StockCurrentPrice.datetime < datetime.combine(today, time.max)
-        ).order_by(StockCurrentPrice.datetime.desc()).first()
+        # API 실패 시 오늘자 시장 스냅샷 사용 (fallback, 종목당 1행)
+        current_price = db.query(StockMarketSnapshot).filter(
+            StockMarketSnapshot.stock_code == stock_code,
+            StockMarketSnapshot.snapshot_at >= datetime.combine(today, time.min),
+            StockMarketSnapshot.snapshot_at < datetime.combine(today, time.max)
+        ).first()
 
         if current_price:
             logger.info(f"KIS API 실패, DB 데이터 사용: {stock_code}")
@@ -216,7 +216,7 @@ class PriceService:
                 "change_sign": current_price.prdy_vrss_sign,
                 "volume": current_price.acml_vol,
                 "trading_value": current_price.acml_tr_pbmn,
-                "datetime": current_price.datetime.isoformat() if current_price.datetime else None,
+                "datetime": current_price.snapshot_at.isoformat() if current_price.snapshot_at else None,
                 "source": "db_fallback",
                 "market_status": "market",
             }
@@ -244,7 +244,7 @@ class PriceService:
         """
         try:
             # KIS API 호출 (async)
-            kis_client = get_kis_client()
+            kis_client = await get_kis_client()
 
             # inquire-overtime-price API 호출 (실시간 시간외 현재가)
             response = await kis_client.get_overtime_price(stock_code)
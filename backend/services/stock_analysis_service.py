@@ -37,7 +37,7 @@ from backend.db.models.stock_analysis import StockAnalysisSummary
 from backend.db.models.stock import StockPrice, Stock
 from backend.db.models.model import Model
 from backend.db.models.ab_test_config import ABTestConfig
-from backend.db.models.market_data import StockCurrentPrice, InvestorTrading
+from backend.db.models.market_data import StockMarketSnapshot, InvestorTrading
 from backend.db.models.financial import FinancialRatio, ProductInfo
 from backend.db.models.news import NewsArticle
 from backend.llm.investment_report import get_report_generator
@@ -426,10 +426,10 @@ async def build_analysis_context_from_db(stock_code: str, db: Session) -> Dict[s
 
     # Tier 1: DB 쿼리 (API 호출 없음)
 
-    # 1. 현재가
-    current_price = db.query(StockCurrentPrice).filter(
-        StockCurrentPrice.stock_code == stock_code
-    ).order_by(StockCurrentPrice.created_at.desc()).first()
+    # 1. 현재가 (시장 스냅샷, 종목당 1행이므로 PK 조회)
+    current_price = db.query(StockMarketSnapshot).filter(
+        StockMarketSnapshot.stock_code == stock_code
+    ).first()
 
     if current_price:
         context["current_price"] = {
@@ -441,6 +441,7 @@ async def build_analysis_context_from_db(stock_code: str, db: Session) -> Dict[s
             "eps": current_price.eps,
             "bps": current_price.bps,
             "market_cap": current_price.hts_avls,
+            "snapshot_at": current_price.snapshot_at.isoformat() if current_price.snapshot_at else None,
         }
     else:
         context["current_price"] = None
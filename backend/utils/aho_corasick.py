@@ -0,0 +1,105 @@
+"""
+Aho–Corasick 다중 문자열 매칭
+
+여러 패턴(기업명 등)을 하나의 오토마톤으로 컴파일하여 텍스트를 한 번만 스캔합니다.
+스캔 비용은 패턴 수와 무관하게 O(텍스트 길이 + 매칭 수)입니다.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasickMatcher:
+    """
+    Aho–Corasick 오토마톤 (순수 Python, 생성 후 읽기 전용)
+
+    상태는 정수 인덱스이며 전이(goto)는 상태별 dict, 실패 링크(fail)는 리스트로 보관합니다.
+    출력(out)에는 실패 링크를 따라 도달하는 접미사 패턴까지 미리 합쳐 둡니다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 찾을 문자열 목록 (빈 문자열/중복은 무시)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[Tuple[str, ...]] = [()]
+        self.pattern_count = 0
+
+        for pattern in dict.fromkeys(patterns):
+            if pattern:
+                self._insert(pattern)
+                self.pattern_count += 1
+
+        self._fail: List[int] = [0] * len(self._goto)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return self.pattern_count
+
+    def _insert(self, pattern: str):
+        """trie에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._out.append(())
+            state = next_state
+        self._out[state] = self._out[state] + (pattern,)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크 계산 및 접미사 패턴 출력 병합"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+
+                if out[fail[next_state]]:
+                    out[next_state] = out[next_state] + out[fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        텍스트의 모든 매칭 (겹침 포함)
+
+        Yields:
+            (시작 위치, 패턴) - 끝 위치 순서
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text or ""):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for pattern in out[state]:
+                    yield index - len(pattern) + 1, pattern
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """
+        겹치지 않는 leftmost-longest 매칭
+
+        "삼성전자우"가 있으면 같은 위치의 "삼성전자"는 제외하고 더 긴 패턴만 남깁니다.
+
+        Returns:
+            (시작 위치, 패턴) 리스트 (위치 순)
+        """
+        matches = sorted(self.iter_matches(text), key=lambda match: (match[0], -len(match[1])))
+
+        selected = []
+        covered_until = 0
+        for start, pattern in matches:
+            if start >= covered_until:
+                selected.append((start, pattern))
+                covered_until = start + len(pattern)
+        return selected
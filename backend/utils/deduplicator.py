@@ -2,15 +2,25 @@
 뉴스 중복 검사 유틸리티
 
 제목 유사도 기반으로 중복 뉴스를 필터링합니다.
+
+최근 제목은 MinHash/LSH 인덱스(minhash_lsh.MinHashLSHIndex)로 관리하여,
+전체 제목과 비교하는 대신 LSH 후보에 대해서만 정확한 유사도(SequenceMatcher)를 계산합니다.
+- 인덱스는 크롤링 사이클마다 1회 DB에서 재구성 (rebuild_index)
+- 저장된 제목은 add_title로 즉시 반영 (같은 배치 내 중복도 감지)
+- DEDUP_INDEX_TTL_SECONDS가 지나면 다음 조회 시 자동 재구성 (다른 프로세스 저장분 반영)
 """
 import logging
-from typing import List
+import threading
+import time
+from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from backend.config import settings
 from backend.db.models.news import NewsArticle
+from backend.utils.minhash_lsh import MinHashLSHIndex
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +38,17 @@ class NewsDuplicator:
         self.similarity_threshold = similarity_threshold
         self.lookback_hours = lookback_hours
 
+        # 최근 제목 LSH 인덱스 (news_id → 제목/생성 시각)
+        self._lock = threading.Lock()
+        self._index = MinHashLSHIndex(
+            num_perm=settings.DEDUP_MINHASH_PERMUTATIONS,
+            bands=settings.DEDUP_LSH_BANDS,
+            shingle_size=settings.DEDUP_SHINGLE_SIZE,
+        )
+        self._titles: Dict[int, str] = {}
+        self._created_at: Dict[int, datetime] = {}
+        self._built_at: Optional[float] = None
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         두 텍스트의 유사도를 계산합니다.
@@ -62,7 +83,7 @@ class NewsDuplicator:
         similarity = self.calculate_similarity(title1, title2)
         return similarity >= self.similarity_threshold
 
-    def get_recent_news_titles(self, db: Session) -> List[tuple[int, str]]:
+    def get_recent_news_titles(self, db: Session) -> List[tuple[int, str, datetime]]:
         """
         최근 뉴스 제목을 가져옵니다.
 
@@ -70,33 +91,103 @@ class NewsDuplicator:
             db: 데이터베이스 세션
 
         Returns:
-            (뉴스 ID, 제목) 튜플 리스트
+            (뉴스 ID, 제목, 생성 시각) 튜플 리스트
         """
         cutoff_time = datetime.now() - timedelta(hours=self.lookback_hours)
 
         recent_news = (
-            db.query(NewsArticle.id, NewsArticle.title)
+            db.query(NewsArticle.id, NewsArticle.title, NewsArticle.created_at)
             .filter(NewsArticle.created_at >= cutoff_time)
             .all()
         )
 
-        return [(news.id, news.title) for news in recent_news]
+        return [(news.id, news.title, news.created_at) for news in recent_news]
 
-    def find_duplicate_in_db(self, title: str, db: Session) -> tuple[bool, int | None]:
+    # ==================== LSH 인덱스 ====================
+
+    def rebuild_index(self, db: Session) -> int:
         """
-        데이터베이스에서 중복 뉴스를 찾습니다.
+        최근 제목으로 LSH 인덱스를 재구성합니다 (크롤링 사이클 시작 시 1회).
 
         Args:
-            title: 검사할 뉴스 제목
             db: 데이터베이스 세션
 
         Returns:
-            (중복 여부, 중복 뉴스 ID) 튜플
-            중복이 아니면 (False, None) 반환
+            인덱싱된 제목 수
         """
+        start = time.perf_counter()
         recent_news = self.get_recent_news_titles(db)
+        self.load_titles(recent_news)
+
+        logger.info(
+            f"🔎 제목 중복 LSH 인덱스 재구성: {len(recent_news)}건 "
+            f"({time.perf_counter() - start:.2f}초)"
+        )
+        return len(recent_news)
+
+    def load_titles(self, recent_news: List[tuple[int, str, datetime | None]]):
+        """
+        인덱스를 주어진 제목 목록으로 교체합니다.
+
+        Args:
+            recent_news: (뉴스 ID, 제목, 생성 시각) 튜플 리스트
+        """
+        with self._lock:
+            self._index.clear()
+            self._titles.clear()
+            self._created_at.clear()
+            for news_id, title, created_at in recent_news:
+                self._add_locked(news_id, title, created_at)
+            self._built_at = time.monotonic()
+
+    def add_title(self, news_id: int, title: str, created_at: Optional[datetime] = None):
+        """
+        저장된 뉴스 제목을 인덱스에 추가합니다 (인덱스가 아직 없으면 무시).
+
+        Args:
+            news_id: 뉴스 ID
+            title: 뉴스 제목
+            created_at: 생성 시각 (None이면 현재 UTC 시각, NewsArticle.created_at 기본값과 동일)
+        """
+        with self._lock:
+            if self._built_at is not None:
+                self._add_locked(news_id, title, created_at)
+
+    def _add_locked(self, news_id: int, title: str, created_at: Optional[datetime]):
+        """인덱스에 제목 추가 (호출자가 _lock을 잡고 있어야 함)"""
+        if not title:
+            return
+        self._index.add(news_id, title)
+        self._titles[news_id] = title
+        self._created_at[news_id] = created_at or datetime.utcnow()
+
+    def _ensure_index(self, db: Session):
+        """인덱스가 없거나 TTL이 지났으면 재구성"""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > settings.DEDUP_INDEX_TTL_SECONDS:
+            self.rebuild_index(db)
+
+    def find_duplicate_in_index(self, title: str) -> tuple[bool, int | None]:
+        """
+        LSH 후보에 대해서만 정확한 유사도를 계산하여 중복을 찾습니다.
+
+        Args:
+            title: 검사할 뉴스 제목
 
-        for news_id, existing_title in recent_news:
+        Returns:
+            (중복 여부, 중복 뉴스 ID) 튜플
+        """
+        # get_recent_news_titles와 같은 기준으로 lookback 밖의 항목 제외
+        cutoff_time = datetime.now() - timedelta(hours=self.lookback_hours)
+
+        with self._lock:
+            candidates = [
+                (news_id, self._titles[news_id])
+                for news_id in sorted(self._index.query(title))
+                if self._created_at[news_id] >= cutoff_time
+            ]
+
+        for news_id, existing_title in candidates:
             if self.is_duplicate(title, existing_title):
                 logger.info(
                     f"중복 뉴스 발견 (유사도: {self.calculate_similarity(title, existing_title):.2f})"
@@ -107,6 +198,25 @@ class NewsDuplicator:
 
         return (False, None)
 
+    # ==================== 중복 검사 ====================
+
+    def find_duplicate_in_db(self, title: str, db: Session) -> tuple[bool, int | None]:
+        """
+        데이터베이스에서 중복 뉴스를 찾습니다.
+
+        최근 제목은 LSH 인덱스에서 조회하며, DB는 인덱스 (재)구성 시에만 조회합니다.
+
+        Args:
+            title: 검사할 뉴스 제목
+            db: 데이터베이스 세션
+
+        Returns:
+            (중복 여부, 중복 뉴스 ID) 튜플
+            중복이 아니면 (False, None) 반환
+        """
+        self._ensure_index(db)
+        return self.find_duplicate_in_index(title)
+
     def filter_duplicates(
         self, titles: List[str], db: Session
     ) -> List[tuple[str, bool]]:
@@ -120,14 +230,25 @@ class NewsDuplicator:
         Returns:
             (제목, 중복 여부) 튜플 리스트
         """
+        self._ensure_index(db)
+
         results = []
 
         for title in titles:
-            is_dup, _ = self.find_duplicate_in_db(title, db)
+            is_dup, _ = self.find_duplicate_in_index(title)
             results.append((title, is_dup))
 
         return results
 
+    def get_stats(self) -> Dict[str, float]:
+        """LSH 인덱스 통계"""
+        with self._lock:
+            stats = self._index.get_stats()
+        stats["age_seconds"] = (
+            round(time.monotonic() - self._built_at, 1) if self._built_at is not None else None
+        )
+        return stats
+
 
 # 싱글톤 인스턴스
 _deduplicator: NewsDuplicator | None = None
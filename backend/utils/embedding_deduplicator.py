@@ -4,7 +4,7 @@
 유사한 뉴스를 임베딩 유사도로 판별하여 중복 예측 및 알림을 방지합니다.
 """
 import logging
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
@@ -63,7 +63,7 @@ class EmbeddingDeduplicator:
             if self.vector_search is None:
                 self.vector_search = await get_vector_search()
 
-            # 1. 최근 뉴스 중 유사도가 높은 뉴스 검색
+            # 최근 뉴스 중 유사도가 높은 뉴스 검색
             similar_news = await self.vector_search.search_similar_news(
                 news_text=news_text,
                 stock_code=stock_code,
@@ -71,16 +71,44 @@ class EmbeddingDeduplicator:
                 similarity_threshold=self.medium_similarity_threshold,
             )
 
-            if not similar_news:
-                logger.debug(f"유사 뉴스 없음 → 예측 진행 (종목: {stock_code})")
-                return False, None, None
+        except Exception as e:
+            logger.error(f"임베딩 중복 검사 실패: {e}", exc_info=True)
+            # 오류 발생 시 안전하게 예측 진행
+            return False, None, None
+
+        return self.check_prediction_candidates(similar_news, stock_code, db)
+
+    def check_prediction_candidates(
+        self,
+        similar_news: List[Dict[str, Any]],
+        stock_code: str,
+        db: Session,
+    ) -> Tuple[bool, Optional[int], Optional[float]]:
+        """
+        유사 뉴스 검색 결과로 예측 skip 여부를 판단합니다.
+
+        검색 결과는 유사도 내림차순이므로, 더 낮은 임계값으로 검색한 예측용 결과를
+        그대로 넘겨도 should_skip_prediction과 같은 판단이 나옵니다.
+
+        Args:
+            similar_news: search_similar_news 결과 (뉴스 1건분, 유사도 내림차순)
+            stock_code: 종목 코드
+            db: 데이터베이스 세션
+
+        Returns:
+            (should_skip, similar_news_id, similarity) 튜플
+        """
+        # 1. 가장 유사한 뉴스 선택
+        if not similar_news or similar_news[0]["similarity"] < self.medium_similarity_threshold:
+            logger.debug(f"유사 뉴스 없음 → 예측 진행 (종목: {stock_code})")
+            return False, None, None
 
-            # 2. 가장 유사한 뉴스 선택
+        try:
             most_similar = similar_news[0]
             similarity = most_similar["similarity"]
             news_id = most_similar["news_id"]
 
-            # 3. 시간 범위 내 뉴스인지 확인
+            # 2. 시간 범위 내 뉴스인지 확인
             cutoff_time = datetime.utcnow() - timedelta(hours=self.lookback_hours)
             recent_news = (
                 db.query(NewsArticle)
@@ -97,7 +125,7 @@ class EmbeddingDeduplicator:
                 )
                 return False, None, None
 
-            # 4. 유사도 기반 판단
+            # 3. 유사도 기반 판단
             if similarity >= self.high_similarity_threshold:
                 logger.info(
                     f"🔴 높은 유사도 ({similarity:.3f}) → 예측 skip "
@@ -105,17 +133,12 @@ class EmbeddingDeduplicator:
                 )
                 return True, news_id, similarity
 
-            elif similarity >= self.medium_similarity_threshold:
-                logger.info(
-                    f"🟡 중간 유사도 ({similarity:.3f}) → 낮은 우선순위 "
-                    f"(뉴스 ID={news_id}, 종목={stock_code})"
-                )
-                # 중간 유사도는 skip하지 않고 우선순위만 낮춤
-                return False, news_id, similarity
-
-            else:
-                logger.debug(f"낮은 유사도 ({similarity:.3f}) → 예측 진행")
-                return False, None, similarity
+            logger.info(
+                f"🟡 중간 유사도 ({similarity:.3f}) → 낮은 우선순위 "
+                f"(뉴스 ID={news_id}, 종목={stock_code})"
+            )
+            # 중간 유사도는 skip하지 않고 우선순위만 낮춤
+            return False, news_id, similarity
 
         except Exception as e:
             logger.error(f"임베딩 중복 검사 실패: {e}", exc_info=True)
@@ -149,7 +172,6 @@ class EmbeddingDeduplicator:
             if self.vector_search is None:
                 self.vector_search = await get_vector_search()
 
-            # 1. 최근 알림 전송된 뉴스 중 유사도가 높은 뉴스 검색
             similar_news = await self.vector_search.search_similar_news(
                 news_text=news_text,
                 stock_code=stock_code,
@@ -157,10 +179,61 @@ class EmbeddingDeduplicator:
                 similarity_threshold=self.high_similarity_threshold,
             )
 
-            if not similar_news:
-                return False, None, None
+        except Exception as e:
+            logger.error(f"알림 중복 후보 검색 실패: {e}", exc_info=True)
+            return False, None, None
+
+        return self.check_notification_candidates(
+            similar_news, stock_code, db, notification_lookback_hours
+        )
+
+    def select_notification_candidates(
+        self,
+        similar_news: List[Dict[str, Any]],
+        top_k: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """
+        더 낮은 임계값으로 검색한 유사 뉴스에서 알림 중복 후보만 고릅니다.
+
+        검색 결과는 유사도 내림차순이므로, 예측용 검색 결과를 재사용하면
+        should_skip_notification이 따로 검색한 것과 같은 후보가 나옵니다.
+
+        Args:
+            similar_news: search_similar_news 결과 (뉴스 1건분, 유사도 내림차순)
+            top_k: 최대 후보 수
 
-            # 2. 최근 알림 전송된 뉴스인지 확인
+        Returns:
+            high_similarity_threshold 이상인 상위 top_k개
+        """
+        return [
+            similar for similar in similar_news
+            if similar["similarity"] >= self.high_similarity_threshold
+        ][:top_k]
+
+    def check_notification_candidates(
+        self,
+        similar_news: List[Dict[str, Any]],
+        stock_code: str,
+        db: Session,
+        notification_lookback_hours: int = 4,
+    ) -> Tuple[bool, Optional[int], Optional[float]]:
+        """
+        유사 뉴스 후보 중 최근 알림 전송된 뉴스가 있는지 확인합니다.
+
+        Args:
+            similar_news: 알림 중복 후보 (select_notification_candidates 결과, 뉴스 1건분)
+            stock_code: 종목 코드
+            db: 데이터베이스 세션
+            notification_lookback_hours: 최근 몇 시간 내 알림과 비교할지
+
+        Returns:
+            (should_skip, similar_news_id, similarity) 튜플
+        """
+        if not similar_news:
+            return False, None, None
+
+        try:
+            # 최근 알림 전송된 뉴스인지 확인
             cutoff_time = datetime.utcnow() - timedelta(hours=notification_lookback_hours)
 
             for similar in similar_news:
@@ -0,0 +1,150 @@
+"""
+MinHash / LSH 근사 중복 후보 인덱스
+
+짧은 텍스트(뉴스 제목)의 문자 n-gram shingle 집합으로 MinHash 시그니처를 만들고,
+시그니처를 band로 나눠 버킷에 넣어 Jaccard 유사도가 높은 항목만 후보로 반환합니다.
+후보에 대한 정확한 유사도 판정은 호출자가 수행합니다 (NewsDuplicator).
+
+후보 포함 확률: 1 - (1 - J^rows)^bands (J = shingle Jaccard 유사도)
+"""
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set
+
+import numpy as np
+
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+def char_shingles(text: str, size: int = 2) -> Set[str]:
+    """
+    공백을 정규화한 문자 n-gram 집합
+
+    Args:
+        text: 입력 텍스트
+        size: n-gram 길이 (텍스트가 더 짧으면 텍스트 전체를 하나의 shingle로 사용)
+    """
+    normalized = " ".join((text or "").lower().split())
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+class MinHashLSHIndex:
+    """
+    MinHash + banding LSH 인덱스 (메모리 전용, 스레드 비안전)
+
+    Features:
+    - 문자 shingle MinHash 시그니처 (numpy 벡터화, 결정적 해시)
+    - band 버킷 조회로 전체 비교 없이 후보 검색
+    - 항목 추가/삭제 지원 (크롤링 중 저장된 제목 즉시 반영)
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            num_perm: MinHash 해시 함수 수 (시그니처 길이)
+            bands: LSH band 수 (num_perm의 약수, band당 행 수 = num_perm / bands)
+            shingle_size: 문자 n-gram 길이
+            seed: 해시 함수 계수 시드
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # 범용 해시 h(x) = (a * x + b) mod p (p = 2^31 - 1, a*x < 2^62로 uint64 오버플로 없음)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, Set[Hashable]]] = [defaultdict(set) for _ in range(bands)]
+        self._band_keys: Dict[Hashable, List[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._band_keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._band_keys
+
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트의 MinHash 시그니처 (num_perm,) uint64"""
+        shingles = char_shingles(text, self.shingle_size)
+        if not shingles:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) & 0x7FFFFFFF for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (hashes[:, np.newaxis] * self._a + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+    def _band_keys_of(self, signature: np.ndarray) -> List[bytes]:
+        """시그니처를 band별 버킷 키로 분할"""
+        return [band.tobytes() for band in signature.reshape(self.bands, self.rows)]
+
+    def add(self, key: Hashable, text: str):
+        """항목 추가 (같은 key가 있으면 교체)"""
+        if key in self._band_keys:
+            self.remove(key)
+
+        band_keys = self._band_keys_of(self.signature(text))
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets[band_key].add(key)
+        self._band_keys[key] = band_keys
+
+    def remove(self, key: Hashable):
+        """항목 삭제 (없으면 무시)"""
+        band_keys = self._band_keys.pop(key, None)
+        if band_keys is None:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[band_key]
+
+    def query(self, text: str) -> Set[Hashable]:
+        """text와 같은 버킷을 하나 이상 공유하는 후보 key 집합"""
+        candidates: Set[Hashable] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys_of(self.signature(text))):
+            bucket = buckets.get(band_key)
+            if bucket:
+                candidates |= bucket
+        return candidates
+
+    def clear(self):
+        """모든 항목 삭제"""
+        for buckets in self._buckets:
+            buckets.clear()
+        self._band_keys.clear()
+
+    @staticmethod
+    def candidate_probability(jaccard: float, bands: int, rows: int) -> float:
+        """Jaccard 유사도 jaccard인 쌍이 후보가 될 확률"""
+        return 1.0 - (1.0 - jaccard ** rows) ** bands
+
+    def get_stats(self) -> Dict[str, float]:
+        """인덱스 통계"""
+        bucket_count = sum(len(buckets) for buckets in self._buckets)
+        return {
+            "items": len(self),
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "rows": self.rows,
+            "buckets": bucket_count,
+        }
@@ -2,18 +2,38 @@
 종목코드 매핑 유틸리티
 
 기업명과 종목코드를 매핑하는 기능을 제공합니다.
+
+텍스트 내 기업명 검색은 매핑 전체로 컴파일한 Aho–Corasick 오토마톤으로
+텍스트를 한 번만 스캔합니다 (종목 수와 무관한 스캔 비용).
+종목이 추가/비활성화되면 reload() 또는 refresh_if_changed()로 오토마톤을 재구성합니다.
 """
 import json
 import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
 
+from backend.config import settings
 from backend.db.session import SessionLocal
 from backend.db.models.stock import Stock
+from backend.utils.aho_corasick import AhoCorasickMatcher
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StockMatch:
+    """텍스트 내 종목 매칭 결과"""
+
+    stock_code: str
+    company_name: str  # 처음 매칭된 기업명
+    position: int  # 첫 등장 위치 (문자 인덱스)
+    count: int  # 등장 횟수 (겹치지 않는 매칭 기준)
+
+
 class StockMapper:
     """종목코드 매퍼 클래스"""
 
@@ -26,9 +46,63 @@ class StockMapper:
         self.use_db = use_db
         self.mapping_file = mapping_file
         self._mapping: Dict[str, str] = {}
+        self._matcher = AhoCorasickMatcher([])
+        self._signature: Any = None  # 마지막 로드 시점의 종목 변경 감지값
         self._load_mapping()
 
     def _load_mapping(self) -> None:
+        """매핑을 로드하고 기업명 매칭 오토마톤을 재구성합니다."""
+        # 매핑보다 먼저 읽어야 로드 도중의 변경이 다음 refresh_if_changed에서 감지됨
+        signature = self._read_signature()
+        self._read_mapping()
+        self._signature = signature if signature is not None else self._read_signature()
+        self._matcher = AhoCorasickMatcher(self._mapping.keys())
+
+    def _read_signature(self) -> Any:
+        """
+        종목 변경 감지값 (DB: 활성 종목 수 + 최종 수정 시각, JSON: 파일 수정 시각)
+
+        읽기 실패 시 None을 반환하며, 이 경우 refresh_if_changed는 재로드하지 않습니다.
+        """
+        if self.use_db:
+            try:
+                db = SessionLocal()
+                try:
+                    active_count, last_updated = db.query(
+                        func.count(Stock.id).filter(Stock.is_active == True),
+                        func.max(Stock.updated_at),
+                    ).one()
+                    return (active_count, last_updated)
+                finally:
+                    db.close()
+            except Exception as e:
+                logger.debug(f"종목 변경 감지값 조회 실패: {e}")
+                return None
+
+        if self.mapping_file is not None and self.mapping_file.exists():
+            return os.path.getmtime(self.mapping_file)
+        return None
+
+    def reload(self) -> None:
+        """매핑과 오토마톤을 다시 로드합니다 (종목 추가/수정/비활성화 직후 호출)."""
+        self._load_mapping()
+
+    def refresh_if_changed(self) -> bool:
+        """
+        다른 프로세스의 종목 변경을 감지하면 재로드합니다 (크롤링 사이클마다 호출).
+
+        Returns:
+            재로드 여부
+        """
+        signature = self._read_signature()
+        if signature is None or signature == self._signature:
+            return False
+
+        logger.info("종목 변경 감지, 종목 매핑 재로드")
+        self._load_mapping()
+        return True
+
+    def _read_mapping(self) -> None:
         """매핑 파일을 로드합니다 (DB 우선, 없으면 JSON 파일)."""
         if self.use_db:
             # DB에서 활성화된 종목 로드
@@ -103,14 +177,44 @@ class StockMapper:
                 return company_name
         return None
 
-    def find_stock_code_in_text(self, text: str) -> Optional[str]:
+    def find_stock_codes_in_text(self, text: str, rank: bool = False) -> List[StockMatch]:
+        """
+        텍스트에서 모든 기업명을 한 번의 스캔으로 찾습니다.
+
+        같은 위치에서 여러 기업명이 겹치면 가장 긴 이름만 인정합니다 (예: "삼성전자우" > "삼성전자").
+        여러 기업명이 같은 종목코드면 하나로 합산합니다.
+
+        Args:
+            text: 검색할 텍스트 (뉴스 제목/본문 등)
+            rank: True면 등장 횟수 내림차순(동률은 첫 등장 위치), False면 첫 등장 위치 순
+
+        Returns:
+            StockMatch 리스트
+        """
+        matches: Dict[str, StockMatch] = {}
+        for position, company_name in self._matcher.find_all(text):
+            stock_code = self._mapping[company_name]
+            match = matches.get(stock_code)
+            if match is None:
+                matches[stock_code] = StockMatch(stock_code, company_name, position, 1)
+            else:
+                match.count += 1
+
+        results = list(matches.values())
+        if rank:
+            results.sort(key=lambda match: (-match.count, match.position))
+        return results
+
+    def find_stock_code_in_text(self, text: str, rank: Optional[bool] = None) -> Optional[str]:
         """
         텍스트에서 기업명을 찾아 종목코드를 반환합니다.
 
-        여러 기업명이 발견되면 첫 번째 기업의 종목코드를 반환합니다.
+        여러 기업명이 발견되면 가장 먼저 등장한 기업의 종목코드를 반환합니다
+        (rank=True면 가장 많이 등장한 기업).
 
         Args:
             text: 검색할 텍스트 (뉴스 본문 등)
+            rank: 등장 횟수 기준 선택 여부 (None이면 settings.STOCK_MATCH_RANK_BY_FREQUENCY)
 
         Returns:
             종목코드 (6자리 문자열) 또는 None (매칭 실패 시)
@@ -120,10 +224,12 @@ class StockMapper:
             >>> mapper.find_stock_code_in_text("삼성전자가 신규 공정을 개발했다")
             '005930'
         """
-        for company_name, stock_code in self._mapping.items():
-            if company_name in text:
-                return stock_code
-        return None
+        if not text:
+            return None
+
+        rank = settings.STOCK_MATCH_RANK_BY_FREQUENCY if rank is None else rank
+        matches = self.find_stock_codes_in_text(text, rank=rank)
+        return matches[0].stock_code if matches else None
 
     def get_all_companies(self) -> list[str]:
         """
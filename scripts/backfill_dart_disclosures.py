@@ -0,0 +1,115 @@
+"""
+DART 공시 백필 스크립트
+
+과거 기간의 전체 시장 공시 목록을 구간·페이지 단위로 병렬 조회해 대상 종목 공시를 저장합니다.
+동시 요청 수(DART_MAX_CONCURRENCY)와 요청 간격(DART_RATE_LIMIT_SECONDS)을 지키며,
+저장이 끝나면 백필 구간이 기존 커서와 이어질 때만 증분 조회 커서를 앞으로 이동합니다.
+
+Usage:
+    uv run python scripts/backfill_dart_disclosures.py --days 30
+    uv run python scripts/backfill_dart_disclosures.py --start 2025-01-01 --end 2025-03-31 --all-stocks
+"""
+import os
+import sys
+import asyncio
+import logging
+import argparse
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.crawlers.dart_crawler import DartCrawler, get_dart_cursor, last_saved_rcept_no
+from backend.crawlers.news_saver import NewsSaver
+from backend.db.session import SessionLocal
+from backend.db.models.stock import Stock
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def backfill_dart(start_date: datetime, end_date: datetime, all_stocks: bool = False, dry_run: bool = False):
+    """
+    DART 공시 백필
+
+    Args:
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        all_stocks: True면 모든 활성 종목, False면 Priority 1-2 종목만 (스케줄러와 동일)
+        dry_run: True면 저장하지 않고 건수만 출력
+    """
+    logger.info("=" * 80)
+    logger.info(f"🚀 DART 공시 백필 시작: {start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d}")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        query = db.query(Stock).filter(Stock.is_active == True)
+        if not all_stocks:
+            query = query.filter(Stock.priority <= 2)
+        stocks = {stock.code: stock.name for stock in query.all()}
+        logger.info(f"📊 대상 종목: {len(stocks)}개")
+
+        async with DartCrawler() as dart_crawler:
+            if not dart_crawler.api_key:
+                logger.error("❌ DART_API_KEY가 설정되지 않았습니다")
+                return False
+
+            disclosures = await dart_crawler.backfill(start_date, end_date, stocks=stocks)
+            if dry_run:
+                logger.info(f"🔍 dry-run: {len(disclosures)}건 (저장 안 함)")
+                return True
+
+            await dart_crawler.attach_company_details(disclosures)
+            saver = NewsSaver(db, auto_predict=False)
+            saved, skipped = await saver.save_news_batch(disclosures)
+
+            # 커서 이후 구간과 이어질 때만 이동 (커서와 백필 시작일 사이의 미조회 구간을 건너뛰지 않도록)
+            cursor = get_dart_cursor()
+            if dart_crawler.failed_requests == 0 and cursor.rcept_no and f"{start_date:%Y%m%d}" <= cursor.rcept_no[:8]:
+                latest = max((d.metadata["rcept_no"] for d in disclosures), default=None)
+                cursor.advance(last_saved_rcept_no(latest, disclosures, saver.failed_urls))
+
+        logger.info("=" * 80)
+        logger.info(
+            f"✅ 백필 완료: {saved}건 저장, {skipped}건 스킵 "
+            f"(API 요청 {dart_crawler.request_count}회, 실패 {dart_crawler.failed_requests}회)"
+        )
+        logger.info("=" * 80)
+        return dart_crawler.failed_requests == 0
+
+    except Exception as e:
+        logger.error(f"❌ 백필 중 에러 발생: {e}", exc_info=True)
+        return False
+
+    finally:
+        db.close()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="DART 공시 백필 (구간·페이지 병렬 조회)")
+    parser.add_argument("--days", type=int, default=30, help="오늘부터 거슬러 올라갈 기간 (기본값: 30일)")
+    parser.add_argument("--start", type=str, default=None, help="시작 날짜 (YYYY-MM-DD, 지정 시 --days 무시)")
+    parser.add_argument("--end", type=str, default=None, help="종료 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--all-stocks", action="store_true", help="모든 활성 종목 (기본값: Priority 1-2)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 건수만 출력")
+
+    args = parser.parse_args()
+    end_date = datetime.strptime(args.end, "%Y-%m-%d") if args.end else datetime.now()
+    start_date = (
+        datetime.strptime(args.start, "%Y-%m-%d") if args.start else end_date - timedelta(days=args.days)
+    )
+
+    success = asyncio.run(backfill_dart(start_date, end_date, all_stocks=args.all_stocks, dry_run=args.dry_run))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
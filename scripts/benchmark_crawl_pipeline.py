@@ -0,0 +1,183 @@
+"""
+뉴스 크롤링 사이클 벤치마크 스크립트
+
+기존 방식(언론사 → 종목별 검색을 하나씩 순차 실행)과 동시 크롤링 파이프라인
+(run_crawl_pipeline)의 사이클당 wall-clock 시간을 비교합니다.
+
+- 기본(시뮬레이션): BaseNewsCrawler를 상속한 가짜 크롤러가 httpx MockTransport로
+  고정 지연(--latency)을 흉내냅니다. 호스트별 요청 간격(rate_limit_seconds)과
+  동시 요청 수 제한은 실제 크롤러와 같은 코드 경로로 적용됩니다.
+- --live: 실제 네이버/한국경제/매일경제/Reddit + 네이버 종목 검색으로 측정 (네트워크 필요)
+
+저장 단계는 건수만 세는 저장기로 대체하여 수집 시간만 비교합니다.
+
+사용법:
+    python scripts/benchmark_crawl_pipeline.py --stocks 10 --latency 0.3
+    python scripts/benchmark_crawl_pipeline.py --live --stocks 5
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from datetime import datetime
+from functools import partial
+from typing import List, Tuple
+
+import httpx
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.crawlers.base_crawler import BaseNewsCrawler, NewsArticleData
+from backend.crawlers.crawl_pipeline import CrawlJob, run_crawl_pipeline
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+SOURCES = [("네이버", 10), ("한국경제", 10), ("매일경제", 10), ("Reddit", 50)]
+STOCKS = ["삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "기아", "NAVER", "카카오",
+          "셀트리온", "포스코홀딩스", "KB금융", "신한지주", "LG화학", "삼성SDI", "한미반도체"]
+
+
+class CountingSaver:
+    """저장 대신 건수만 세는 저장기 (수집 시간만 측정)"""
+
+    async def save_news_batch(self, news_list: List[NewsArticleData]) -> Tuple[int, int]:
+        return len(news_list), 0
+
+
+class SimulatedCrawler(BaseNewsCrawler):
+    """
+    고정 지연으로 응답하는 가짜 크롤러
+
+    fetch_news: 목록 페이지 1회 + 기사 페이지 pages회 요청
+    search_news: 검색 결과 페이지 1회 요청
+    """
+
+    def __init__(self, source_name: str, latency: float, pages: int, rate_limit_seconds: float):
+        super().__init__(source_name=source_name, rate_limit_seconds=rate_limit_seconds)
+        self.latency = latency
+        self.pages = pages
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            async def handler(request: httpx.Request) -> httpx.Response:
+                await asyncio.sleep(self.latency)
+                return httpx.Response(200, text="<html></html>", headers={"content-type": "text/html; charset=utf-8"})
+
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return self._client
+
+    async def fetch_news(self, limit: int = 10) -> List[NewsArticleData]:
+        await self.fetch_html(f"https://{self.source_name}.example/list")
+        for page in range(self.pages):
+            await self.fetch_html(f"https://{self.source_name}.example/article/{page}")
+        return [
+            NewsArticleData(title=f"{self.source_name} {i}", content="", published_at=datetime.now(), source=self.source_name)
+            for i in range(limit)
+        ]
+
+    async def search_news(self, query: str, limit: int = 10) -> List[NewsArticleData]:
+        await self.fetch_html(f"https://{self.source_name}.example/search?query={query}")
+        return [
+            NewsArticleData(title=f"{query} {i}", content="", published_at=datetime.now(), source=self.source_name)
+            for i in range(limit)
+        ]
+
+
+async def _fetch_source(make_crawler, limit: int) -> List[NewsArticleData]:
+    async with make_crawler() as crawler:
+        return await crawler.fetch_news(limit=limit)
+
+
+def build_crawlers(args):
+    """(언론사 작업 팩토리 리스트, 종목 검색 크롤러 팩토리)"""
+    if args.live:
+        from backend.crawlers.naver_crawler import NaverNewsCrawler
+        from backend.crawlers.hankyung_crawler import HankyungNewsCrawler
+        from backend.crawlers.maeil_crawler import MaeilNewsCrawler
+        from backend.crawlers.reddit_crawler import RedditCrawler
+        from backend.crawlers.naver_search_crawler import NaverNewsSearchCrawler
+
+        classes = [NaverNewsCrawler, HankyungNewsCrawler, MaeilNewsCrawler, RedditCrawler]
+        sources = [(name, cls, limit) for (name, limit), cls in zip(SOURCES, classes)]
+        return sources, NaverNewsSearchCrawler
+
+    def simulated(name):
+        return partial(SimulatedCrawler, name, args.latency, args.pages, args.rate_limit)
+
+    sources = [(name, simulated(name), limit) for name, limit in SOURCES]
+    return sources, simulated("네이버검색")
+
+
+async def run_cycle(sources, make_search_crawler, stocks: List[str], concurrent: bool) -> float:
+    """언론사 + 종목별 검색 1사이클 wall-clock (초)"""
+    saver = CountingSaver()
+    start = time.perf_counter()
+
+    source_jobs: List[CrawlJob] = [
+        (name, partial(_fetch_source, make_crawler, limit)) for name, make_crawler, limit in sources
+    ]
+
+    async with make_search_crawler() as search_crawler:
+        stock_jobs: List[CrawlJob] = [
+            (stock, partial(search_crawler.search_news, query=stock, limit=3)) for stock in stocks
+        ]
+
+        if concurrent:
+            await run_crawl_pipeline(source_jobs, saver)
+            await run_crawl_pipeline(stock_jobs, saver)
+        else:
+            # 기존 스케줄러: 작업 하나씩 수집 → 저장
+            for _, fetch in source_jobs + stock_jobs:
+                try:
+                    await saver.save_news_batch(await fetch())
+                except Exception as e:
+                    logger.error(f"수집 실패: {e}")
+
+    return time.perf_counter() - start
+
+
+async def run_benchmark(args):
+    """순차 vs 동시 파이프라인 비교"""
+    sources, make_search_crawler = build_crawlers(args)
+    stocks = (STOCKS * (args.stocks // len(STOCKS) + 1))[:args.stocks]
+
+    sequential = await run_cycle(sources, make_search_crawler, stocks, concurrent=False)
+    pipelined = await run_cycle(sources, make_search_crawler, stocks, concurrent=True)
+
+    mode = "실제 네트워크" if args.live else (
+        f"시뮬레이션: 지연 {args.latency}s, 기사 {args.pages}건/소스, 요청 간격 {args.rate_limit}s"
+    )
+    print("=" * 72)
+    print(f"📊 뉴스 크롤링 사이클 비교 (언론사 {len(sources)}곳 + 종목 {len(stocks)}개, {mode})")
+    print("=" * 72)
+    print(f"   순차 실행:          {sequential:8.2f}초/사이클")
+    print(f"   동시 파이프라인:    {pipelined:8.2f}초/사이클 (x{sequential / max(pipelined, 1e-9):.1f})")
+    print("=" * 72)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="뉴스 크롤링 사이클 (순차 vs 동시 파이프라인) 벤치마크")
+    parser.add_argument("--stocks", type=int, default=10, help="종목별 검색 종목 수 (기본값: 10)")
+    parser.add_argument("--latency", type=float, default=0.3, help="시뮬레이션 응답 지연 (초, 기본값: 0.3)")
+    parser.add_argument("--pages", type=int, default=5, help="시뮬레이션 소스당 기사 페이지 요청 수 (기본값: 5)")
+    parser.add_argument("--rate-limit", type=float, default=0.5, help="시뮬레이션 호스트별 요청 간격 (초, 기본값: 0.5)")
+    parser.add_argument("--live", action="store_true", help="실제 크롤러로 측정 (네트워크 필요)")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
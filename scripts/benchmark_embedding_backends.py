@@ -0,0 +1,125 @@
+"""
+임베딩 백엔드 벤치마크 스크립트
+
+torch(float32) / onnx(float32) / onnx_int8(동적 양자화) 백엔드의
+배치 지연(ms/batch), 처리량(articles/sec), torch 대비 cosine 일치도를 비교합니다.
+
+사용법:
+    python scripts/benchmark_embedding_backends.py --count 200 --batch-size 16
+    python scripts/benchmark_embedding_backends.py --from-db --backends torch onnx_int8
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+from typing import Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# scheduler_main과 동일한 스레드 설정으로 측정
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import numpy as np
+from transformers import AutoTokenizer
+
+from backend.config import settings
+from backend.llm.embedding_backends import BACKEND_TYPES, create_embedding_backend
+from scripts.benchmark_embedding_batch import build_synthetic_texts, load_db_texts
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def embed_all(backend, tokenizer, texts: List[str], batch_size: int) -> np.ndarray:
+    """길이 정렬 micro-batch로 전체 텍스트 임베딩 (NewsEmbedder.embed_batch와 동일한 버킷팅)"""
+    encoded = [tokenizer(text, truncation=True, max_length=512) for text in texts]
+    order = sorted(range(len(texts)), key=lambda i: len(encoded[i]["input_ids"]))
+
+    vectors = np.zeros((len(texts), settings.EMBEDDING_DIM), dtype=np.float32)
+    for start in range(0, len(order), batch_size):
+        bucket = order[start:start + batch_size]
+        batch = tokenizer.pad(
+            [encoded[i] for i in bucket], padding=True, return_tensors=backend.tensor_type
+        )
+        vectors[bucket] = backend.forward(batch)
+    return vectors
+
+
+def run_benchmark(texts: List[str], backend_types: List[str], batch_size: int):
+    """백엔드별 지연/처리량/일치도 측정"""
+    tokenizer = AutoTokenizer.from_pretrained(settings.EMBEDDING_MODEL_NAME)
+    n_batches = -(-len(texts) // batch_size)
+
+    results: Dict[str, Dict[str, float]] = {}
+    reference = None
+    for backend_type in backend_types:
+        logger.info(f"{backend_type} 백엔드 로드 중...")
+        backend = create_embedding_backend(settings.EMBEDDING_MODEL_NAME, backend_type)
+
+        # warm-up (측정에서 제외)
+        embed_all(backend, tokenizer, texts[:batch_size], batch_size)
+
+        logger.info(f"{backend_type} 측정 중... ({len(texts)}건, batch_size={batch_size})")
+        start = time.perf_counter()
+        vectors = embed_all(backend, tokenizer, texts, batch_size)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = vectors
+        cosines = (vectors * reference).sum(axis=1)
+        results[backend_type] = {
+            "ms_per_batch": elapsed * 1000 / n_batches,
+            "rate": len(texts) / elapsed,
+            "min_cosine": float(cosines.min()),
+            "mean_cosine": float(cosines.mean()),
+        }
+
+    baseline_rate = results[backend_types[0]]["rate"]
+    print("=" * 72)
+    print(f"📊 임베딩 백엔드 비교 (CPU, OMP_NUM_THREADS={os.environ.get('OMP_NUM_THREADS')}, "
+          f"ONNX threads={settings.EMBEDDING_ONNX_THREADS or 'auto'})")
+    print("=" * 72)
+    print(f"   문서 수: {len(texts)}, batch_size: {batch_size}, 기준: {backend_types[0]}")
+    print(f"   {'백엔드':<10} {'ms/batch':>9} {'articles/sec':>13} {'속도':>7} "
+          f"{'min cos':>9} {'mean cos':>9}")
+    for backend_type, r in results.items():
+        print(f"   {backend_type:<10} {r['ms_per_batch']:9.1f} {r['rate']:13.2f} "
+              f"x{r['rate'] / baseline_rate:5.2f} {r['min_cosine']:9.5f} {r['mean_cosine']:9.5f}")
+    print("=" * 72)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="임베딩 백엔드(torch/onnx/onnx_int8) 벤치마크")
+    parser.add_argument("--count", type=int, default=200, help="측정할 문서 수 (기본값: 200)")
+    parser.add_argument(
+        "--batch-size", type=int, default=None,
+        help="micro-batch 크기 (기본값: settings.EMBEDDING_BATCH_SIZE)"
+    )
+    parser.add_argument(
+        "--backends", nargs="+", default=list(BACKEND_TYPES), choices=BACKEND_TYPES,
+        help="비교할 백엔드 (첫 번째가 일치도 기준, 기본값: torch onnx onnx_int8)"
+    )
+    parser.add_argument("--from-db", action="store_true", help="DB의 최근 뉴스로 측정")
+
+    args = parser.parse_args()
+
+    texts = load_db_texts(args.count) if args.from_db else build_synthetic_texts(args.count)
+    if not texts:
+        logger.error("측정할 텍스트가 없습니다")
+        return
+
+    run_benchmark(texts, args.backends, max(1, args.batch_size or settings.EMBEDDING_BATCH_SIZE))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+임베딩 배치 추론 벤치마크 스크립트
+
+NewsEmbedder.embed_text 개별 호출과 embed_batch 배치 호출의
+CPU 처리량(articles/sec)을 비교합니다.
+
+사용법:
+    python scripts/benchmark_embedding_batch.py --count 200 --batch-size 16
+    python scripts/benchmark_embedding_batch.py --from-db --count 300
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# scheduler_main과 동일한 스레드 설정으로 측정
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import numpy as np
+
+from backend.config import settings
+from backend.llm.embedder import NewsEmbedder
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_SENTENCES = [
+    "삼성전자가 3나노 공정 기반 신규 파운드리 고객사를 확보했다.",
+    "SK하이닉스는 HBM3E 양산 확대로 2분기 영업이익이 시장 예상치를 웃돌았다.",
+    "외국인 투자자는 이날 코스피에서 반도체 대형주를 중심으로 순매수했다.",
+    "현대차는 전기차 전용 공장 가동을 앞두고 생산 계획을 조정한다고 밝혔다.",
+    "증권가는 금리 인하 기대감에 성장주 비중 확대를 권고했다.",
+    "LG에너지솔루션은 북미 배터리 합작법인의 추가 투자를 검토 중이다.",
+    "카카오는 인공지능 서비스 출시 일정을 공개하며 주가가 반등했다.",
+    "원·달러 환율은 미국 고용지표 발표 이후 하락 마감했다.",
+]
+
+
+def build_synthetic_texts(count: int, seed: int = 42) -> List[str]:
+    """길이가 다양한 합성 뉴스 텍스트 생성 (제목 + 본문)"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        title = rng.choice(SAMPLE_SENTENCES)
+        body = " ".join(rng.choice(SAMPLE_SENTENCES) for _ in range(rng.randint(2, 40)))
+        texts.append(f"{title}\n{body}")
+    return texts
+
+
+def load_db_texts(count: int) -> List[str]:
+    """DB에서 최근 뉴스 텍스트 로드"""
+    from backend.db.session import SessionLocal
+    from backend.db.models.news import NewsArticle
+
+    db = SessionLocal()
+    try:
+        news_list = (
+            db.query(NewsArticle)
+            .order_by(NewsArticle.published_at.desc())
+            .limit(count)
+            .all()
+        )
+        return [f"{news.title}\n{news.content}" for news in news_list]
+    finally:
+        db.close()
+
+
+def run_benchmark(texts: List[str], batch_size: int):
+    """개별 vs 배치 처리량 측정"""
+    # 임베딩 캐시가 두 번째 측정을 가리지 않도록 비활성화
+    settings.EMBEDDING_CACHE_ENABLED = False
+    embedder = NewsEmbedder()
+
+    # 모델 로드 및 warm-up (측정에서 제외)
+    _ = embedder.tokenizer
+    _ = embedder.model
+    embedder.embed_batch(texts[:4], batch_size=batch_size)
+
+    logger.info(f"개별 추론 측정 중... ({len(texts)}건)")
+    start = time.perf_counter()
+    per_item = [embedder.embed_text(text) for text in texts]
+    per_item_sec = time.perf_counter() - start
+
+    logger.info(f"배치 추론 측정 중... ({len(texts)}건, batch_size={batch_size})")
+    start = time.perf_counter()
+    batched = embedder.embed_batch(texts, batch_size=batch_size)
+    batched_sec = time.perf_counter() - start
+
+    # 결과 일치 확인 (패딩 차이로 인한 미세 오차만 허용)
+    pairs = [(a, b) for a, b in zip(per_item, batched) if a is not None and b is not None]
+    min_cosine = min(
+        (float(np.dot(np.asarray(a), np.asarray(b))) for a, b in pairs),
+        default=float("nan"),
+    )
+
+    per_item_rate = len(texts) / per_item_sec
+    batched_rate = len(texts) / batched_sec
+
+    print("=" * 60)
+    print(f"📊 임베딩 처리량 (CPU, OMP_NUM_THREADS={os.environ.get('OMP_NUM_THREADS')})")
+    print("=" * 60)
+    print(f"   문서 수:        {len(texts)}")
+    print(f"   개별 추론:      {per_item_sec:8.2f}초  ({per_item_rate:7.2f} articles/sec)")
+    print(f"   배치 추론:      {batched_sec:8.2f}초  ({batched_rate:7.2f} articles/sec)")
+    print(f"   속도 향상:      x{batched_rate / per_item_rate:.2f}")
+    print(f"   최소 cosine:    {min_cosine:.6f} (개별 vs 배치)")
+    print(f"   실패(None):     개별 {per_item.count(None)}건 / 배치 {batched.count(None)}건")
+    print("=" * 60)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="임베딩 개별 vs 배치 추론 벤치마크")
+    parser.add_argument("--count", type=int, default=200, help="측정할 문서 수 (기본값: 200)")
+    parser.add_argument(
+        "--batch-size", type=int, default=None,
+        help="micro-batch 크기 (기본값: settings.EMBEDDING_BATCH_SIZE)"
+    )
+    parser.add_argument("--from-db", action="store_true", help="DB의 최근 뉴스로 측정")
+
+    args = parser.parse_args()
+
+    texts = load_db_texts(args.count) if args.from_db else build_synthetic_texts(args.count)
+    if not texts:
+        logger.error("측정할 텍스트가 없습니다")
+        return
+
+    run_benchmark(texts, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+임베딩 텍스트 정책 벤치마크 스크립트
+
+EMBEDDING_TEXT_POLICY(full / lead_sentences / token_budget / head_tail)별로
+임베딩 지연과 중복 뉴스 판별 품질을 비교합니다.
+
+품질은 라벨링된 뉴스 쌍(중복 1 / 비중복 0)의 cosine 유사도로 측정합니다:
+- ROC-AUC
+- EmbeddingDeduplicator 임계값(0.90 / 0.95)에서의 precision / recall
+
+라벨 파일 형식 (JSONL, 한 줄에 한 쌍):
+    {"text_a": "제목\\n본문", "text_b": "제목\\n본문", "label": 1}
+
+사용법:
+    python scripts/benchmark_embedding_text_policy.py --pairs data/eval/duplicate_pairs.jsonl
+    python scripts/benchmark_embedding_text_policy.py --count 100   # 합성 쌍
+"""
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# scheduler_main과 동일한 스레드 설정으로 측정
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import numpy as np
+
+from backend.config import settings
+from backend.llm.embedder import NewsEmbedder
+from backend.llm.embedding_text import TEXT_POLICIES, EmbeddingTextPolicy, split_sentences
+from scripts.benchmark_embedding_batch import build_synthetic_texts
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+DEDUP_THRESHOLDS = (0.90, 0.95)  # EmbeddingDeduplicator medium / high
+
+
+def load_pairs(path: str) -> List[Tuple[str, str, int]]:
+    """라벨링된 뉴스 쌍 로드"""
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                pairs.append((row["text_a"], row["text_b"], int(row["label"])))
+    return pairs
+
+
+def build_synthetic_pairs(count: int, seed: int = 42) -> List[Tuple[str, str, int]]:
+    """
+    합성 라벨 쌍 생성
+
+    중복: 같은 기사의 본문 문장 일부를 다른 문장으로 바꾼 재작성본 (타 매체 전재 근사)
+    비중복: 서로 다른 기사
+    """
+    rng = random.Random(seed)
+    texts = build_synthetic_texts(count * 2, seed=seed)
+    filler = build_synthetic_texts(count, seed=seed + 1)
+
+    pairs = []
+    for i in range(count):
+        title, _, body = texts[i].partition("\n")
+        sentences = split_sentences(body)
+        extra = split_sentences(filler[i].partition("\n")[2])
+        rewritten = [
+            rng.choice(extra) if extra and rng.random() < 0.3 else sentence
+            for sentence in sentences
+        ]
+        pairs.append((texts[i], f"{title}\n{' '.join(rewritten)}", 1))
+        pairs.append((texts[i], texts[count + i], 0))
+    return pairs
+
+
+def roc_auc(scores: np.ndarray, labels: np.ndarray) -> float:
+    """ROC-AUC (Mann-Whitney U)"""
+    positives, negatives = scores[labels == 1], scores[labels == 0]
+    if len(positives) == 0 or len(negatives) == 0:
+        return float("nan")
+    wins = (positives[:, None] > negatives[None, :]).sum()
+    ties = (positives[:, None] == negatives[None, :]).sum()
+    return float((wins + 0.5 * ties) / (len(positives) * len(negatives)))
+
+
+def evaluate_policy(
+    embedder: NewsEmbedder, policy: str, pairs: List[Tuple[str, str, int]]
+) -> Dict[str, float]:
+    """정책 하나의 지연/토큰 수/판별 품질 측정"""
+    embedder.text_policy = EmbeddingTextPolicy(policy)
+    texts = list(dict.fromkeys(text for a, b, _ in pairs for text in (a, b)))
+
+    tokens = [len(embedder.text_policy.encode(embedder.tokenizer, text)["input_ids"]) for text in texts]
+
+    start = time.perf_counter()
+    vectors = dict(zip(texts, embedder.embed_batch(texts)))
+    elapsed = time.perf_counter() - start
+
+    scores, labels = [], []
+    for text_a, text_b, label in pairs:
+        if vectors[text_a] is None or vectors[text_b] is None:
+            continue
+        scores.append(float(np.dot(vectors[text_a], vectors[text_b])))
+        labels.append(label)
+    scores, labels = np.array(scores), np.array(labels)
+
+    result = {
+        "seconds": elapsed,
+        "ms_per_article": elapsed * 1000 / len(texts),
+        "mean_tokens": float(np.mean(tokens)),
+        "auc": roc_auc(scores, labels),
+    }
+    for threshold in DEDUP_THRESHOLDS:
+        predicted = scores >= threshold
+        true_positive = int((predicted & (labels == 1)).sum())
+        result[f"precision@{threshold}"] = true_positive / max(1, int(predicted.sum()))
+        result[f"recall@{threshold}"] = true_positive / max(1, int((labels == 1).sum()))
+    return result
+
+
+def run_benchmark(pairs: List[Tuple[str, str, int]], policies: List[str]):
+    """정책별 결과 비교 출력"""
+    # 임베딩 캐시가 정책 간 측정을 가리지 않도록 비활성화
+    settings.EMBEDDING_CACHE_ENABLED = False
+    embedder = NewsEmbedder()
+
+    # 모델 로드 및 warm-up (측정에서 제외)
+    _ = embedder.tokenizer
+    _ = embedder.model
+    embedder.embed_batch([pairs[0][0]])
+
+    results = {}
+    for policy in policies:
+        logger.info(f"{policy} 정책 측정 중... ({len(pairs)}쌍)")
+        results[policy] = evaluate_policy(embedder, policy, pairs)
+
+    baseline = results[policies[0]]["ms_per_article"]
+    n_positive = sum(label for _, _, label in pairs)
+    print("=" * 96)
+    print(f"📊 임베딩 텍스트 정책 비교 (쌍 {len(pairs)}개: 중복 {n_positive} / 비중복 {len(pairs) - n_positive}, "
+          f"budget={settings.EMBEDDING_TOKEN_BUDGET}, tail={settings.EMBEDDING_TAIL_TOKENS}, "
+          f"lead={settings.EMBEDDING_LEAD_SENTENCES})")
+    print("=" * 96)
+    print(f"   {'정책':<15} {'토큰':>6} {'ms/기사':>8} {'절감':>7} {'AUC':>7} "
+          + " ".join(f"{'P@' + str(t):>7} {'R@' + str(t):>7}" for t in DEDUP_THRESHOLDS))
+    for policy, r in results.items():
+        saving = 1 - r["ms_per_article"] / baseline
+        print(f"   {policy:<15} {r['mean_tokens']:6.0f} {r['ms_per_article']:8.1f} {saving:7.1%} {r['auc']:7.4f} "
+              + " ".join(f"{r[f'precision@{t}']:7.3f} {r[f'recall@{t}']:7.3f}" for t in DEDUP_THRESHOLDS))
+    print("=" * 96)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="임베딩 텍스트 정책 지연/중복 판별 품질 벤치마크")
+    parser.add_argument("--pairs", type=str, default=None, help="라벨링된 쌍 JSONL 파일 (없으면 합성 쌍)")
+    parser.add_argument("--count", type=int, default=100, help="합성 중복 쌍 수 (기본값: 100)")
+    parser.add_argument(
+        "--policies", nargs="+", default=list(TEXT_POLICIES), choices=TEXT_POLICIES,
+        help="비교할 정책 (첫 번째가 지연 절감 기준, 기본값: 전체)"
+    )
+
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs) if args.pairs else build_synthetic_pairs(args.count)
+    if not pairs:
+        logger.error("측정할 뉴스 쌍이 없습니다")
+        return
+
+    run_benchmark(pairs, args.policies)
+
+
+if __name__ == "__main__":
+    main()
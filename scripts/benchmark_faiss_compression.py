@@ -0,0 +1,157 @@
+"""
+FAISS 압축 인덱스 벤치마크 스크립트
+
+IVF-Flat(현재 인덱스)과 압축 인덱스(IVF-SQ8 / IVF-PQ + 원본 벡터 재정렬)의
+recall@k, 검색 지연, 상주 메모리(인덱스 크기)를 비교합니다.
+정답은 Flat 정확 검색 결과입니다.
+
+사용법:
+    python scripts/benchmark_faiss_compression.py --count 50000 --k 10
+    python scripts/benchmark_faiss_compression.py --from-index --pq-m 96 --rerank-factor 8
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import math
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import faiss
+import numpy as np
+
+from backend.config import settings
+from backend.llm.faiss_lifecycle import INDEX_TYPES, create_ivf_index
+from backend.llm.faiss_store import rerank_exact
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def build_synthetic_vectors(count: int, dim: int, seed: int = 42) -> np.ndarray:
+    """클러스터 구조를 가진 L2 정규화 합성 벡터 생성 (뉴스 임베딩 분포 근사)"""
+    rng = np.random.default_rng(seed)
+    n_topics = max(8, int(math.sqrt(count)))
+    topics = rng.standard_normal((n_topics, dim)).astype(np.float32)
+    vectors = topics[rng.integers(0, n_topics, count)]
+    vectors += 0.5 * rng.standard_normal((count, dim)).astype(np.float32)
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def load_index_vectors() -> np.ndarray:
+    """현재 메인 인덱스의 원본 벡터 로드 (원본 벡터 파일 우선)"""
+    from backend.llm.faiss_store import get_faiss_store
+
+    store = get_faiss_store()
+    store.load()
+    with store._lock:
+        return np.ascontiguousarray(store._main_vectors(), dtype=np.float32)
+
+
+def index_bytes(index: faiss.Index) -> int:
+    """직렬화된 인덱스 크기 (검색 시 상주하는 메모리와 동일)"""
+    return int(faiss.serialize_index(index).nbytes)
+
+
+def recall_at_k(found: list, truth: np.ndarray, k: int) -> float:
+    """쿼리별 recall@k 평균"""
+    return float(np.mean([
+        len(np.intersect1d(found[q], truth[q])) / k for q in range(len(truth))
+    ]))
+
+
+def run_benchmark(
+    vectors: np.ndarray, k: int, n_queries: int, nprobe: int, pq_m: int, rerank_factor: int
+):
+    """인덱스 타입별 recall@k / 지연 / 메모리 측정"""
+    ntotal, dim = vectors.shape
+    nlist = max(1, min(int(round(math.sqrt(ntotal))), ntotal // 39))
+    rng = np.random.default_rng(0)
+    queries = np.ascontiguousarray(vectors[rng.choice(ntotal, min(n_queries, ntotal), replace=False)])
+
+    exact = faiss.IndexFlatIP(dim)
+    exact.add(vectors)
+    _, truth = exact.search(queries, k)
+
+    rows = []
+    for index_type in INDEX_TYPES:
+        logger.info(f"{index_type} 학습 중... (N={ntotal}, nlist={nlist})")
+        index = create_ivf_index(index_type, dim, nlist, faiss.METRIC_INNER_PRODUCT, pq_m=pq_m)
+        index.train(vectors[:nlist * 256])
+        index.add(vectors)
+        index.nprobe = min(nprobe, nlist)
+
+        compressed = index_type != "ivf_flat"
+        fetch_k = k * rerank_factor if compressed else k
+
+        start = time.perf_counter()
+        _, found = index.search(queries, fetch_k)
+        raw_recall = recall_at_k([f[:k] for f in found], truth, k)
+        if compressed:
+            # 원본 벡터는 memmap으로 필요한 행만 읽으므로 상주 메모리에 포함하지 않음
+            _, found = rerank_exact(queries, found, vectors, k)
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        rows.append((index_type, index_bytes(index), raw_recall, recall_at_k(found, truth, k), latency_ms))
+
+    baseline_bytes = rows[0][1]
+    print("=" * 78)
+    print(f"📊 FAISS 압축 인덱스 (N={ntotal}, dim={dim}, nlist={nlist}, nprobe={min(nprobe, nlist)}, "
+          f"PQ m={pq_m}, rerank x{rerank_factor})")
+    print("=" * 78)
+    print(f"   {'타입':<10} {'메모리(MB)':>11} {'절감':>7} {'recall@' + str(k):>10} "
+          f"{'재정렬 후':>10} {'ms/query':>9}")
+    for index_type, size, raw_recall, recall, latency_ms in rows:
+        saving = 1 - size / baseline_bytes
+        print(f"   {index_type:<10} {size / 1024 ** 2:11.1f} {saving:7.1%} "
+              f"{raw_recall:10.4f} {recall:10.4f} {latency_ms:9.3f}")
+    print("=" * 78)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="FAISS IVF-Flat vs 압축 인덱스 벤치마크")
+    parser.add_argument("--count", type=int, default=50000, help="합성 벡터 수 (기본값: 50000)")
+    parser.add_argument("--from-index", action="store_true", help="현재 FAISS 인덱스의 벡터로 측정")
+    parser.add_argument("--k", type=int, default=10, help="recall 측정 k (기본값: 10)")
+    parser.add_argument("--queries", type=int, default=500, help="쿼리 수 (기본값: 500)")
+    parser.add_argument("--nprobe", type=int, default=16, help="IVF nprobe (기본값: 16)")
+    parser.add_argument(
+        "--pq-m", type=int, default=None, help="PQ 서브벡터 수 (기본값: settings.FAISS_PQ_M)"
+    )
+    parser.add_argument(
+        "--rerank-factor", type=int, default=None,
+        help="재정렬 후보 배수 (기본값: settings.FAISS_RERANK_FACTOR)"
+    )
+
+    args = parser.parse_args()
+
+    vectors = (
+        load_index_vectors() if args.from_index
+        else build_synthetic_vectors(args.count, settings.EMBEDDING_DIM)
+    )
+    if len(vectors) < 1000:
+        logger.error(f"벡터 수가 너무 적습니다 ({len(vectors)}개, 최소 1000개)")
+        return
+
+    run_benchmark(
+        vectors,
+        k=args.k,
+        n_queries=args.queries,
+        nprobe=args.nprobe,
+        pq_m=args.pq_m or settings.FAISS_PQ_M,
+        rerank_factor=args.rerank_factor or settings.FAISS_RERANK_FACTOR,
+    )
+
+
+if __name__ == "__main__":
+    main()
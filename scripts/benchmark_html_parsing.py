@@ -0,0 +1,156 @@
+"""
+뉴스 목록 HTML 파싱 벤치마크 스크립트
+
+기존 방식(BeautifulSoup html.parser로 전체 DOM 생성 후 CSS 선택)과
+html_extract 백엔드(streaming, selectolax)의 목록 페이지당 파싱 시간과 최대 메모리를 비교합니다.
+저장된 HTML(tests/fixtures/html)에 대해 크롤러별 추출 결과가 기존 방식과 같은지도 확인합니다
+(다른 필드는 이름으로 표시. 기존 방식은 href의 `&section_id`를 `§ion_id`로 잘못 해석하므로
+네이버 url은 다르게 나오는 것이 정상입니다).
+
+- 시간: 페이지당 평균 ms (--repeat회 반복)
+- 메모리: tracemalloc 최대 할당량 (파싱 1회, Python 할당만 집계 → selectolax의 C 트리는 미포함)
+
+사용법:
+    python scripts/benchmark_html_parsing.py --repeat 50
+    python scripts/benchmark_html_parsing.py --fixtures /path/to/saved_pages --limit 10
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from bs4 import BeautifulSoup
+
+from backend.crawlers.hankyung_crawler import HankyungNewsCrawler
+from backend.crawlers.html_extract import LexborHTMLParser, extract_items
+from backend.crawlers.maeil_crawler import MaeilNewsCrawler
+from backend.crawlers.naver_crawler import NaverNewsCrawler
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _text(elem) -> Optional[str]:
+    return elem.get_text(strip=True) if elem else None
+
+
+def legacy_naver(html: str, limit: Optional[int]) -> List[Dict[str, Optional[str]]]:
+    """기존 NaverNewsCrawler 파싱 (BeautifulSoup)"""
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
+    for article_dd in soup.select(".newsList .articleSubject")[:limit]:
+        link_elem = article_dd.select_one("a")
+        summary_dd = article_dd.find_next_sibling("dd", class_="articleSummary")
+        items.append({
+            "title": _text(link_elem),
+            "url": link_elem.get("href") if link_elem else None,
+            "summary": _text(summary_dd),
+            "wdate": _text(summary_dd.select_one(".wdate")) if summary_dd else None,
+            "press": _text(summary_dd.select_one(".press")) if summary_dd else None,
+        })
+    return items
+
+
+def make_legacy_list_parser(spec) -> Callable[[str, Optional[int]], List[Dict[str, Optional[str]]]]:
+    """기존 HankyungNewsCrawler / MaeilNewsCrawler 파싱 (BeautifulSoup)"""
+    def parse(html: str, limit: Optional[int]):
+        soup = BeautifulSoup(html, "html.parser")
+        items = []
+        for item in soup.select(spec.item_selector)[:limit]:
+            link_elem = item.select_one("a")
+            items.append({
+                "title": _text(item.select_one(spec.fields["title"].selector)),
+                "url": link_elem.get("href") if link_elem else None,
+                "summary": _text(item.select_one(spec.fields["summary"].selector)),
+                "date": _text(item.select_one(spec.fields["date"].selector)),
+            })
+        return items
+    return parse
+
+
+CRAWLERS = {
+    "naver_news_list": (NaverNewsCrawler.NEWS_ITEM_SPEC, legacy_naver),
+    "hankyung_stock": (HankyungNewsCrawler.NEWS_ITEM_SPEC, make_legacy_list_parser(HankyungNewsCrawler.NEWS_ITEM_SPEC)),
+    "maeil_stock": (MaeilNewsCrawler.NEWS_ITEM_SPEC, make_legacy_list_parser(MaeilNewsCrawler.NEWS_ITEM_SPEC)),
+}
+
+
+def diff_fields(items: list, expected: list) -> str:
+    """기존 방식과 다른 필드 이름 (같으면 ✅)"""
+    if len(items) != len(expected):
+        return f"{len(items)}건"
+    fields = sorted({name for got, want in zip(items, expected) for name in want if got[name] != want[name]})
+    return ",".join(fields) if fields else "✅"
+
+
+def measure(parse: Callable[[], list], repeat: int):
+    """(페이지당 ms, 최대 메모리 KB, 결과)"""
+    tracemalloc.start()
+    result = parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse()
+    return (time.perf_counter() - start) * 1000 / repeat, peak / 1024, result
+
+
+def run_benchmark(fixtures_dir: Path, repeat: int, limit: Optional[int]):
+    """fixture별 기존 방식 vs html_extract 백엔드 비교"""
+    backends = ["streaming"] + (["selectolax"] if LexborHTMLParser is not None else [])
+
+    print("=" * 80)
+    print(f"📊 목록 페이지 파싱 비교 (반복 {repeat}회, limit={limit or '전체'})")
+    print("=" * 80)
+    print(f"   {'페이지':<18} {'크기(KB)':>8} {'방식':<12} {'시간(ms)':>9} {'최대 메모리(KB)':>15} {'속도':>7} {'일치':>4}")
+
+    for name, (spec, legacy_parse) in CRAWLERS.items():
+        path = fixtures_dir / f"{name}.html"
+        if not path.exists():
+            logger.warning(f"fixture 없음: {path}")
+            continue
+        html = path.read_text(encoding="utf-8")
+        size_kb = len(html.encode("utf-8")) / 1024
+
+        legacy_ms, legacy_kb, expected = measure(lambda: legacy_parse(html, limit), repeat)
+        print(f"   {name:<18} {size_kb:8.0f} {'bs4 (기존)':<12} {legacy_ms:9.2f} {legacy_kb:15.0f} {'':>7} {len(expected):>3}건")
+
+        for backend in backends:
+            elapsed_ms, peak_kb, items = measure(
+                lambda: extract_items(html, spec, limit=limit, backend=backend), repeat
+            )
+            print(f"   {'':<18} {'':>8} {backend:<12} {elapsed_ms:9.2f} {peak_kb:15.0f} "
+                  f"x{legacy_ms / elapsed_ms:5.1f} {diff_fields(items, expected):>4}")
+    print("=" * 80)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="뉴스 목록 HTML 파싱 (BeautifulSoup vs 추출 백엔드) 벤치마크")
+    parser.add_argument(
+        "--fixtures", type=Path, default=Path(project_root) / "tests" / "fixtures" / "html",
+        help="저장된 목록 페이지 디렉토리 (naver_news_list.html, hankyung_stock.html, maeil_stock.html)",
+    )
+    parser.add_argument("--repeat", type=int, default=30, help="반복 횟수 (기본값: 30)")
+    parser.add_argument("--limit", type=int, default=None, help="추출할 최대 기사 수 (기본값: 전체)")
+
+    args = parser.parse_args()
+    run_benchmark(args.fixtures, args.repeat, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+KIS Rate Limiter 우선순위 벤치마크 스크립트
+
+배치 작업(low)이 대기열을 채운 상태에서 사용자 요청(high)이 들어올 때의 대기 시간을
+기존 Sliding Window 방식과 Token Bucket + 우선순위 대기열 방식으로 비교합니다.
+실제 API는 호출하지 않고 limiter의 acquire만 측정합니다.
+
+사용법:
+    python scripts/benchmark_kis_rate_limiter.py --rate 20 --batch 200 --high 20
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.crawlers.kis_client import RateLimiter
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class LegacySlidingWindowLimiter:
+    """기존 RateLimiter (Sliding Window, 단일 Lock, priority는 로그 레벨에만 사용)"""
+
+    def __init__(self, max_requests: int, window_seconds: float = 1.0):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.requests: List[float] = []
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, priority: str = "normal"):
+        async with self._lock:
+            now = time.time()
+            self.requests = [t for t in self.requests if now - t < self.window_seconds]
+            if len(self.requests) >= self.max_requests:
+                wait_time = self.window_seconds - (now - self.requests[0])
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+                now = time.time()
+                self.requests = [t for t in self.requests if now - t < self.window_seconds]
+            self.requests.append(now)
+
+
+async def run_scenario(limiter, batch: int, high: int, rate: int):
+    """low 배치를 먼저 넣고, 이후 high 요청을 1/rate초 간격으로 넣어 대기 시간 측정"""
+    waits = {"high": [], "low": []}
+
+    async def call(priority: str):
+        started = time.perf_counter()
+        await limiter.acquire(priority)
+        waits[priority].append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    low_tasks = [asyncio.create_task(call("low")) for _ in range(batch)]
+    await asyncio.sleep(0)
+
+    high_tasks = []
+    for _ in range(high):
+        high_tasks.append(asyncio.create_task(call("high")))
+        await asyncio.sleep(1 / rate)
+
+    await asyncio.gather(*low_tasks, *high_tasks)
+    return waits, time.perf_counter() - started
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+def print_result(name: str, waits: dict, elapsed: float, total: int):
+    for priority in ("high", "low"):
+        values = waits[priority]
+        print(
+            f"   {name:<16} {priority:<5} p50 {percentile(values, 0.5):8.1f} ms  "
+            f"p99 {percentile(values, 0.99):8.1f} ms  max {max(values):8.1f} ms  "
+            f"avg {statistics.mean(values):8.1f} ms"
+        )
+    print(f"   {'':<16} 처리량 {total / elapsed:.1f} req/s ({elapsed:.1f}초)")
+
+
+async def run_benchmark(rate: int, batch: int, high: int):
+    print("=" * 80)
+    print(f"📊 KIS Rate Limiter 비교 (초당 {rate}건, low {batch}건 대기 중 high {high}건 도착)")
+    print("=" * 80)
+
+    legacy = LegacySlidingWindowLimiter(max_requests=rate)
+    waits, elapsed = await run_scenario(legacy, batch, high, rate)
+    print_result("sliding window", waits, elapsed, batch + high)
+
+    RateLimiter._instance = None
+    limiter = RateLimiter(max_requests=rate, window_seconds=1.0, burst=1, shared_path="")
+    waits, elapsed = await run_scenario(limiter, batch, high, rate)
+    print_result("token bucket", waits, elapsed, batch + high)
+    print("=" * 80)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="KIS Rate Limiter (Sliding Window vs Token Bucket 우선순위) 벤치마크")
+    parser.add_argument("--rate", type=int, default=20, help="초당 최대 요청 수 (기본값: 20)")
+    parser.add_argument("--batch", type=int, default=200, help="먼저 대기열에 넣을 low 요청 수 (기본값: 200)")
+    parser.add_argument("--high", type=int, default=20, help="이후 도착하는 high 요청 수 (기본값: 20)")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rate, args.batch, args.high))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+종목 기업명 매칭 벤치마크 스크립트
+
+기존 방식(기업명마다 `in` 검사)과 Aho–Corasick 오토마톤 1회 스캔의
+기사당 지연을 종목 수(50 → 2,500)별로 비교합니다.
+NewsSaver._extract_stock_code와 같이 제목 → 본문 순서로 검색합니다.
+
+사용법:
+    python scripts/benchmark_stock_matching.py --sizes 50 500 2500 --articles 300
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.utils.stock_mapping import StockMapper
+from scripts.benchmark_embedding_batch import build_synthetic_texts
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+BASE_COMPANIES = {
+    "삼성전자": "005930", "SK하이닉스": "000660", "현대차": "005380",
+    "LG에너지솔루션": "373220", "카카오": "035720",
+}
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초구누두루무부수우주기니디리미비시이지경공관국금대동명문반발분산상성세신실업연영원유의인일장전정제조중증진천체출투판평표품한합해행현협화확회"
+
+
+def build_mapping(size: int, seed: int = 42) -> Dict[str, str]:
+    """실제 대형주 + 합성 기업명으로 size개 종목 매핑 생성 (합성명은 본문에 등장하지 않음)"""
+    rng = random.Random(seed)
+    mapping = {}
+    while len(mapping) < size - len(BASE_COMPANIES):
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 6)))
+        mapping[name] = f"9{len(mapping):05d}"
+    # 실제 기업명을 뒤에 두어 기존 방식의 조기 종료 이점을 배제 (매핑 순서 = DB 조회 순서)
+    mapping.update(BASE_COMPANIES)
+    return mapping
+
+
+def legacy_find(mapping: Dict[str, str], text: str) -> Optional[str]:
+    """기존 find_stock_code_in_text (기업명마다 부분 문자열 검사)"""
+    for company_name, stock_code in mapping.items():
+        if company_name in text:
+            return stock_code
+    return None
+
+
+def time_per_article(fn, articles: List[Tuple[str, str]]) -> float:
+    """기사당 평균 ms (제목에서 못 찾으면 본문 검색)"""
+    start = time.perf_counter()
+    for title, content in articles:
+        fn(title) or fn(content)
+    return (time.perf_counter() - start) * 1000 / len(articles)
+
+
+def run_benchmark(sizes: List[int], n_articles: int):
+    """종목 수별 기존 방식 vs 오토마톤 비교"""
+    articles = []
+    for text in build_synthetic_texts(n_articles):
+        title, _, content = text.partition("\n")
+        articles.append(("시장 동향 점검", f"{content} {title}"))
+
+    print("=" * 72)
+    print(f"📊 기업명 매칭 비교 (기사 {n_articles}건, 평균 본문 "
+          f"{sum(len(c) for _, c in articles) / n_articles:.0f}자)")
+    print("=" * 72)
+    print(f"   {'종목 수':>8} {'로드(ms)':>10} {'기존(ms/기사)':>14} {'오토마톤(ms/기사)':>18} {'속도':>7}")
+
+    for size in sizes:
+        mapping = build_mapping(size)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mapping_file = Path(tmp_dir) / "stock_codes.json"
+            mapping_file.write_text(json.dumps(mapping, ensure_ascii=False), encoding="utf-8")
+
+            start = time.perf_counter()
+            mapper = StockMapper(mapping_file=mapping_file, use_db=False)
+            build_ms = (time.perf_counter() - start) * 1000
+
+        legacy_ms = time_per_article(lambda text: legacy_find(mapping, text), articles)
+        automaton_ms = time_per_article(lambda text: mapper.find_stock_code_in_text(text, rank=False), articles)
+
+        print(f"   {size:>8} {build_ms:10.1f} {legacy_ms:14.3f} {automaton_ms:18.3f} "
+              f"x{legacy_ms / automaton_ms:5.1f}")
+    print("=" * 72)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="종목 기업명 매칭 (in 검사 vs Aho–Corasick) 벤치마크")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 500, 2500], help="종목 수 (기본값: 50 500 2500)")
+    parser.add_argument("--articles", type=int, default=300, help="기사 수 (기본값: 300)")
+
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.articles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+제목 중복 검사 벤치마크 스크립트
+
+NewsDuplicator의 기존 방식(최근 제목 전체와 SequenceMatcher 비교)과
+MinHash/LSH 후보 조회 + 후보 정확 비교 방식의 지연과 recall을 비교합니다.
+
+- 인덱스: 최근 제목 N건 (기본 10,000건)
+- 쿼리: 인덱스 제목의 변형(속보 태그, 꼬리말, 단어 교체/삭제) + 무관한 신규 제목
+- recall: 전체 비교로 찾은 중복(유사도 >= 임계값) 중 LSH가 찾은 비율
+
+사용법:
+    python scripts/benchmark_title_dedup.py --count 10000 --queries 200
+    python scripts/benchmark_title_dedup.py --from-db --queries 200
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.config import settings
+from backend.utils.deduplicator import NewsDuplicator
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+COMPANIES = [
+    "삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "기아", "NAVER", "카카오",
+    "셀트리온", "포스코홀딩스", "KB금융", "신한지주", "LG화학", "삼성SDI", "한미반도체",
+]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초구누두루무부수우주기니디리미비시이지경공관국금대동명문반발분산상성세신실업연영원유의인일장전정제조중증진천체출투판평표품한합해행현협화확회"
+PREFIXES = ["[속보] ", "[종합] ", "(상보) "]
+SUFFIXES = [" (종합)", " …주가 영향은", " 발표"]
+
+
+def build_synthetic_titles(count: int, seed: int = 42) -> List[str]:
+    """회사명 + 무작위 단어 조합의 합성 제목 생성"""
+    rng = random.Random(seed)
+    words = list({
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(3000)
+    })
+    titles = []
+    for _ in range(count):
+        body = " ".join(rng.choice(words) for _ in range(rng.randint(3, 7)))
+        suffix = f" {rng.randint(1, 30)}%" if rng.random() < 0.3 else ""
+        titles.append(f"{rng.choice(COMPANIES)}, {body}{suffix}")
+    return titles
+
+
+def make_variant(title: str, rng: random.Random) -> str:
+    """타 매체 전재/수정 제목 근사 (태그, 꼬리말, 단어 교체/삭제)"""
+    op = rng.choice(["prefix", "suffix", "swap", "drop"])
+    words = title.split()
+    if op == "prefix":
+        return rng.choice(PREFIXES) + title
+    if op == "suffix":
+        return title + rng.choice(SUFFIXES)
+    index = rng.randrange(1, len(words))
+    if op == "swap":
+        words[index] = words[index][::-1]
+    else:
+        del words[index]
+    return " ".join(words)
+
+
+def load_db_titles(count: int) -> List[str]:
+    """DB에서 최근 뉴스 제목 로드"""
+    from backend.db.session import SessionLocal
+    from backend.db.models.news import NewsArticle
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(NewsArticle.title)
+            .order_by(NewsArticle.created_at.desc())
+            .limit(count)
+            .all()
+        )
+        return [row.title for row in rows if row.title]
+    finally:
+        db.close()
+
+
+def run_benchmark(titles: List[str], n_queries: int, seed: int = 7):
+    """전체 비교 vs LSH 지연/recall 측정"""
+    rng = random.Random(seed)
+    queries = [make_variant(rng.choice(titles), rng) for _ in range(n_queries // 2)]
+    queries += build_synthetic_titles(n_queries - len(queries), seed=seed + 1)
+    recent_news = list(enumerate(titles))
+
+    duplicator = NewsDuplicator()
+
+    # 인덱스 구성 (rebuild_index의 DB 조회를 제외한 순수 구성 시간)
+    start = time.perf_counter()
+    duplicator.load_titles([(news_id, title, None) for news_id, title in recent_news])
+    build_seconds = time.perf_counter() - start
+
+    # 기존 방식: 최근 제목 전체와 순차 비교 (첫 중복에서 중단)
+    start = time.perf_counter()
+    expected = [
+        any(duplicator.is_duplicate(query, title) for _, title in recent_news)
+        for query in queries
+    ]
+    brute_seconds = time.perf_counter() - start
+
+    # LSH: 후보 조회 + 후보 정확 비교
+    start = time.perf_counter()
+    detected = [duplicator.find_duplicate_in_index(query)[0] for query in queries]
+    lsh_seconds = time.perf_counter() - start
+
+    n_duplicates = sum(expected)
+    recovered = sum(1 for truth, hit in zip(expected, detected) if truth and hit)
+    false_positives = sum(1 for truth, hit in zip(expected, detected) if hit and not truth)
+    stats = duplicator.get_stats()
+
+    print("=" * 72)
+    print(f"📊 제목 중복 검사 비교 (최근 제목 {len(titles)}건, 쿼리 {len(queries)}건, "
+          f"임계값 {duplicator.similarity_threshold})")
+    print(f"   LSH: num_perm={stats['num_perm']}, bands={stats['bands']}, rows={stats['rows']}, "
+          f"shingle={settings.DEDUP_SHINGLE_SIZE}")
+    print("=" * 72)
+    print(f"   인덱스 구성:        {build_seconds:8.2f}초 (사이클당 1회)")
+    print(f"   전체 비교:          {brute_seconds * 1000 / len(queries):8.2f} ms/제목")
+    print(f"   LSH + 후보 비교:    {lsh_seconds * 1000 / len(queries):8.3f} ms/제목 "
+          f"(x{brute_seconds / max(lsh_seconds, 1e-9):.0f})")
+    print(f"   중복 판정 recall:   {recovered / max(1, n_duplicates):8.4f} ({recovered}/{n_duplicates})")
+    print(f"   오탐:               {false_positives:8d}건")
+    print("=" * 72)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="제목 중복 검사 (전체 비교 vs MinHash/LSH) 벤치마크")
+    parser.add_argument("--count", type=int, default=10000, help="최근 제목 수 (기본값: 10000)")
+    parser.add_argument("--queries", type=int, default=200, help="검사할 제목 수 (기본값: 200)")
+    parser.add_argument("--from-db", action="store_true", help="DB의 최근 뉴스 제목으로 측정")
+
+    args = parser.parse_args()
+
+    titles = load_db_titles(args.count) if args.from_db else build_synthetic_titles(args.count)
+    if not titles:
+        logger.error("측정할 제목이 없습니다")
+        return
+
+    run_benchmark(titles, args.queries)
+
+
+if __name__ == "__main__":
+    main()
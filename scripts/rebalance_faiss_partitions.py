@@ -0,0 +1,79 @@
+"""
+FAISS 종목별 파티션 리밸런싱 스크립트
+
+기존 news_embeddings.index(메인) + WAL(delta) 벡터를 종목별 Flat 파티션으로 재구성합니다.
+파티션 검색을 사용하려면 FAISS_PARTITIONED_SEARCH=true로 설정하세요.
+
+사용법:
+    python scripts/rebalance_faiss_partitions.py                 # 활성 종목(stocks.is_active)
+    python scripts/rebalance_faiss_partitions.py --all-indexed   # 인덱스에 있는 모든 종목
+    python scripts/rebalance_faiss_partitions.py --min-vectors 50
+"""
+import os
+import sys
+import logging
+import argparse
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.db.session import SessionLocal
+from backend.db.models.stock import Stock
+from backend.llm.faiss_store import FaissSegmentStore
+
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def get_active_stock_codes() -> List[str]:
+    """DB에서 활성 종목 코드 조회"""
+    db = SessionLocal()
+    try:
+        rows = db.query(Stock.code).filter(Stock.is_active == True).all()  # noqa: E712
+        return [row.code for row in rows]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAISS 종목별 파티션 리밸런싱")
+    parser.add_argument(
+        "--all-indexed", action="store_true",
+        help="DB 활성 종목 대신 인덱스에 존재하는 모든 종목으로 파티션 생성",
+    )
+    parser.add_argument(
+        "--min-vectors", type=int, default=1,
+        help="파티션을 만들 최소 벡터 수 (미만 종목은 전역 인덱스 검색)",
+    )
+    args = parser.parse_args()
+
+    store = FaissSegmentStore(partitioned=True)
+    store.load()
+
+    if args.all_indexed:
+        stock_codes = store.indexed_stock_codes()
+    else:
+        stock_codes = get_active_stock_codes()
+
+    logger.info(f"📋 파티션 대상 종목: {len(stock_codes)}개 (전체 벡터 {store.ntotal}개)")
+
+    sizes = store.rebalance_partitions(stock_codes, min_vectors=args.min_vectors)
+
+    print("\n" + "=" * 60)
+    print(f"🧩 파티션 {len(sizes)}개 생성 → {store.partition_dir}")
+    for stock_code, size in sorted(sizes.items(), key=lambda item: -item[1])[:20]:
+        print(f"   {stock_code}: {size:,}개")
+    if len(sizes) > 20:
+        print(f"   ... 외 {len(sizes) - 20}개")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
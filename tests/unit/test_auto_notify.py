@@ -0,0 +1,105 @@
+"""
+Unit tests for automatic news notification processing
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import backend.notifications.auto_notify as auto_notify
+from backend.utils.embedding_deduplicator import EmbeddingDeduplicator
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def order_by(self, *columns):
+        return self
+
+    def limit(self, count):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """처리할 뉴스 목록만 조회되는 세션 (알림 이력 조회는 deduplicator에서 대체)"""
+
+    def __init__(self, recent_news):
+        self.recent_news = recent_news
+
+    def query(self, model):
+        return FakeQuery(self.recent_news)
+
+    def commit(self):
+        pass
+
+
+class FakeVectorSearch:
+    def __init__(self, results):
+        self.results = results
+        self.search_calls = 0
+        self.attached = []
+
+    async def search_similar_news_batch(self, texts, stock_codes, top_k, similarity_threshold):
+        self.search_calls += 1
+        return self.results
+
+    def attach_price_changes(self, similar_news, db):
+        self.attached.append([hit["news_id"] for hit in similar_news])
+        return similar_news
+
+
+class FakePredictor:
+    def __init__(self):
+        self.news_ids = []
+
+    def predict_all_models(self, current_news, similar_news, news_id):
+        self.news_ids.append(news_id)
+        return {"model": {}}
+
+    def get_ab_predictions(self, news_id):
+        return {}
+
+
+def _news(news_id):
+    return SimpleNamespace(
+        id=news_id, title=f"title {news_id}", content="content", stock_code="005930",
+        predicted_at=None, notified_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_price_changes_are_attached_only_after_dedup(monkeypatch):
+    """한 번의 검색 결과로 중복 검사 후, 통과한 뉴스만 주가 변동률을 조회하는지 확인"""
+    duplicate_hit = {"news_id": 100, "similarity": 0.99, "stock_code": "005930", "published_at": None}
+    loose_hit = {"news_id": 200, "similarity": 0.6, "stock_code": "005930", "published_at": None}
+    vector_search = FakeVectorSearch([[duplicate_hit], [loose_hit]])
+    predictor = FakePredictor()
+    deduplicator = EmbeddingDeduplicator()
+    # 100번 뉴스는 최근에 알림된 것으로 간주
+    monkeypatch.setattr(
+        deduplicator, "check_notification_candidates",
+        lambda similar_news, stock_code, db, notification_lookback_hours: (
+            (True, 100, 0.99) if similar_news else (False, None, None)
+        ),
+    )
+
+    async def get_vector_search():
+        return vector_search
+
+    monkeypatch.setattr(auto_notify, "get_vector_search", get_vector_search)
+    monkeypatch.setattr(auto_notify, "get_predictor", lambda: predictor)
+    monkeypatch.setattr(auto_notify, "get_telegram_notifier", lambda: None)
+    monkeypatch.setattr(auto_notify, "get_embedding_deduplicator", lambda: deduplicator)
+
+    stats = await auto_notify.process_new_news_notifications(FakeSession([_news(1), _news(2)]))
+
+    assert stats == {"processed": 2, "success": 1, "failed": 0, "skipped": 1}
+    assert vector_search.search_calls == 1
+    assert vector_search.attached == [[200]]
+    assert predictor.news_ids == [2]
@@ -0,0 +1,122 @@
+"""
+Unit tests for the KIS collector work-queue executor
+"""
+import asyncio
+import time
+
+import pytest
+
+from backend.crawlers import collector_executor as executor_module
+from backend.crawlers.collector_executor import CollectorExecutor
+from backend.crawlers.kis_market_data_collector import CurrentPriceCollector
+
+
+@pytest.mark.asyncio
+async def test_slow_item_does_not_stall_other_workers():
+    """느린 종목 하나가 다른 워커의 처리를 막지 않음"""
+    finished = []
+
+    async def task(code):
+        await asyncio.sleep(0.2 if code == "slow" else 0.01)
+        finished.append(code)
+        return {"stock_code": code, "status": "success"}
+
+    executor = CollectorExecutor(workers=3, max_attempts=1)
+    codes = ["slow"] + [f"{n:06d}" for n in range(20)]
+    started = time.monotonic()
+    sweep = await executor.run("test_slow", codes, task)
+
+    # 배치(3개) + 고정 sleep 방식이면 느린 종목이 첫 배치를 0.2초 붙잡음
+    assert time.monotonic() - started < 0.2 + 0.1
+    assert finished[-1] == "slow"
+    assert sweep.success == len(codes)
+    assert sweep.elapsed_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_workers():
+    """동시 실행 수는 워커 수를 넘지 않음"""
+    in_flight = 0
+    peak = 0
+
+    async def task(code):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return {"status": "skipped" if code.endswith("0") else "success"}
+
+    sweep = await CollectorExecutor(workers=4).run("test_bound", [f"{n:06d}" for n in range(30)], task)
+
+    assert peak == 4
+    assert (sweep.success, sweep.skipped, sweep.failed) == (27, 3, 0)
+
+
+@pytest.mark.asyncio
+async def test_failures_are_requeued_with_backoff_then_given_up():
+    """실패 종목은 백오프 후 재시도하고 최대 시도 후 포기"""
+    attempts = {}
+
+    async def task(code):
+        attempts[code] = attempts.get(code, 0) + 1
+        if code == "flaky" and attempts[code] < 2:
+            return {"stock_code": code, "status": "failed", "error": "timeout"}
+        if code == "broken":
+            raise RuntimeError("boom")
+        return {"stock_code": code, "status": "success"}
+
+    executor = CollectorExecutor(workers=2, max_attempts=3, retry_base_seconds=0.01)
+    sweep = await executor.run("test_retry", ["flaky", "broken", "ok"], task)
+
+    assert attempts == {"flaky": 2, "broken": 3, "ok": 1}
+    assert (sweep.success, sweep.failed, sweep.retried) == (2, 1, 3)
+    assert {"item": "broken", "status": "failed", "error": "boom"} in sweep.results
+    assert executor_module.get_sweep_stats()["test_retry"]["total"] == 3
+
+
+def test_retry_delay_grows_with_jitter():
+    """재시도 대기 시간은 지수적으로 늘고 jitter 범위 안에 있음"""
+    executor = CollectorExecutor(workers=1, retry_base_seconds=1.0)
+
+    first = [executor._retry_delay(1) for _ in range(50)]
+    third = [executor._retry_delay(3) for _ in range(50)]
+
+    assert all(0.5 <= delay <= 1.5 for delay in first)
+    assert all(2.0 <= delay <= 6.0 for delay in third)
+    assert len(set(first)) > 1
+
+
+@pytest.mark.asyncio
+async def test_collector_counts_only_final_failures(monkeypatch):
+    """수집기 실패 수에는 재시도 후 최종 실패만 집계"""
+    calls = {}
+
+    class FakeClient:
+        async def get_current_price(self, stock_code, priority="normal"):
+            calls[stock_code] = calls.get(stock_code, 0) + 1
+            if stock_code == "000001" and calls[stock_code] == 1:
+                raise RuntimeError("일시 오류")
+            if stock_code == "000002":
+                raise RuntimeError("계속 실패")
+            return {"output": {"stck_prpr": "1000"}}
+
+    async def fake_get_client():
+        return FakeClient()
+
+    async def fake_save(stock_code, data):
+        return None
+
+    from backend.crawlers import kis_market_data_collector as collector_module
+    monkeypatch.setattr(collector_module, "get_kis_client", fake_get_client)
+
+    collector = CurrentPriceCollector(max_concurrent=2)
+    collector.executor.retry_base_seconds = 0.01
+    monkeypatch.setattr(collector, "_save_to_db", fake_save)
+
+    result = await collector.collect_all(stock_codes=["000001", "000002", "000003"])
+
+    assert result["collected"] == 2
+    assert result["failed"] == 1
+    assert result["retried"] == 1 + (collector.executor.max_attempts - 1)
+    assert collector.last_sweep.total == 3
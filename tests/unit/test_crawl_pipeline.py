@@ -0,0 +1,106 @@
+"""
+Unit tests for the concurrent crawl pipeline and BaseNewsCrawler host limits
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from backend.crawlers.base_crawler import BaseNewsCrawler, NewsArticleData
+from backend.crawlers.crawl_pipeline import run_crawl_pipeline
+
+
+def make_news(title):
+    return NewsArticleData(title=title, content="", published_at=datetime.now(), source="test")
+
+
+class RecordingSaver:
+    """저장 호출을 기록하고 동시 호출 여부를 검사하는 저장기"""
+
+    def __init__(self):
+        self.batches = []
+        self.active = 0
+        self.max_active = 0
+
+    async def save_news_batch(self, news_list):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.batches.append([news.title for news in news_list])
+        return len(news_list), 0
+
+
+class DummyCrawler(BaseNewsCrawler):
+    async def fetch_news(self, limit: int = 10):
+        return []
+
+
+def sleeping_job(title, delay, counter=None):
+    async def fetch():
+        if counter is not None:
+            counter["active"] += 1
+            counter["max"] = max(counter["max"], counter["active"])
+        await asyncio.sleep(delay)
+        if counter is not None:
+            counter["active"] -= 1
+        return [make_news(title)]
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_concurrently_into_single_saver():
+    """크롤링 작업은 동시에 실행되고 저장은 하나의 saver로 모임"""
+    saver = RecordingSaver()
+    jobs = [(f"job{i}", sleeping_job(f"news{i}", 0.1)) for i in range(5)]
+
+    start = time.perf_counter()
+    result = await run_crawl_pipeline(jobs, saver, max_concurrency=5)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.3  # 순차 실행이면 0.5초 이상
+    assert result.saved == 5
+    assert len(saver.batches) == 5
+    assert saver.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_running_jobs():
+    """max_concurrency가 동시 실행 작업 수를 제한"""
+    counter = {"active": 0, "max": 0}
+    jobs = [(f"job{i}", sleeping_job(f"news{i}", 0.02, counter)) for i in range(6)]
+
+    await run_crawl_pipeline(jobs, RecordingSaver(), max_concurrency=2)
+
+    assert counter["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_stop_others():
+    """실패한 작업이 다른 작업을 멈추지 않음"""
+    async def broken():
+        raise RuntimeError("boom")
+
+    jobs = [("ok1", sleeping_job("a", 0.01)), ("broken", broken), ("ok2", sleeping_job("b", 0.01))]
+    result = await run_crawl_pipeline(jobs, RecordingSaver())
+
+    assert result.failed_jobs == ["broken"]
+    assert result.saved == 2
+    assert set(result.per_job) == {"ok1", "ok2"}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_concurrent_requests():
+    """동시 요청도 rate limit 간격을 지킴"""
+    crawler = DummyCrawler(source_name="test", rate_limit_seconds=0.05, max_concurrency=4)
+    stamps = []
+
+    async def request():
+        await crawler._apply_rate_limit()
+        stamps.append(time.perf_counter())
+
+    await asyncio.gather(*(request() for _ in range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(stamps, stamps[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
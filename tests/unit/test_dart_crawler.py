@@ -0,0 +1,210 @@
+"""
+Unit tests for DART incremental polling, backfill and company lookups
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from backend.crawlers import dart_crawler as dart_module
+from backend.crawlers.dart_crawler import DartCrawler, DartCursor, last_saved_rcept_no
+
+
+TODAY = datetime.now().strftime("%Y%m%d")
+
+
+def make_item(rcept_no, stock_code="005930", corp_code="00126380", corp_name="삼성전자"):
+    return {
+        "rcept_no": rcept_no,
+        "rcept_dt": rcept_no[:8],
+        "report_nm": f"주요사항보고서 {rcept_no}",
+        "corp_name": corp_name,
+        "corp_code": corp_code,
+        "stock_code": stock_code,
+        "corp_cls": "Y",
+        "flr_nm": corp_name,
+    }
+
+
+class FakeDart:
+    """list.json / company.json 응답을 흉내내는 MockTransport 핸들러"""
+
+    def __init__(self, items, page_count=100, delay=0.0):
+        self.items = sorted(items, key=lambda item: item["rcept_no"], reverse=True)
+        self.page_count = page_count
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            params = dict(request.url.params)
+            endpoint = request.url.path.rsplit("/", 1)[-1]
+            self.requests.append((endpoint, params))
+
+            if endpoint == "company.json":
+                return httpx.Response(200, json={
+                    "status": "000", "corp_code": params["corp_code"], "induty_code": "264", "ceo_nm": "대표",
+                })
+
+            items = [
+                item for item in self.items
+                if params["bgn_de"] <= item["rcept_dt"] <= params["end_de"]
+                and params.get("corp_code", item["corp_code"]) == item["corp_code"]
+            ]
+            if not items:
+                return httpx.Response(200, json={"status": "013", "message": "조회된 데이타가 없습니다."})
+
+            page_no = int(params["page_no"])
+            start = (page_no - 1) * self.page_count
+            return httpx.Response(200, json={
+                "status": "000",
+                "page_no": page_no,
+                "total_page": -(-len(items) // self.page_count),
+                "list": items[start:start + self.page_count],
+            })
+        finally:
+            self.in_flight -= 1
+
+    def list_requests(self):
+        return [params for endpoint, params in self.requests if endpoint == "list.json"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(dart_module, "_company_cache", {})
+    monkeypatch.setattr(dart_module, "_corp_codes_by_stock", {})
+
+
+def _crawler(fake, max_concurrency=4):
+    crawler = DartCrawler(api_key="test-key", max_concurrency=max_concurrency, rate_limit_seconds=0)
+    crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    return crawler
+
+
+@pytest.mark.asyncio
+async def test_same_day_poll_stops_at_cursor():
+    """당일 증분 조회는 커서를 만난 페이지에서 멈춤"""
+    items = [make_item(f"{TODAY}{n:06d}", stock_code=f"{n:06d}") for n in range(1, 251)]
+    fake = FakeDart(items)
+
+    async with _crawler(fake) as crawler:
+        disclosures, latest = await crawler.fetch_new_disclosures(
+            since_rcept_no=f"{TODAY}000240",
+            stocks={"000245": "대상종목", "000100": "커서 이전 종목"},
+        )
+
+    # 최신 100건이 담긴 첫 페이지에서 커서를 만나므로 한 번만 요청
+    assert len(fake.list_requests()) == 1
+    assert latest == f"{TODAY}000250"
+    assert [d.metadata["rcept_no"] for d in disclosures] == [f"{TODAY}000245"]
+    assert disclosures[0].company_name == "대상종목"
+    assert disclosures[0].url == f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={TODAY}000245"
+
+
+@pytest.mark.asyncio
+async def test_stale_cursor_fetches_gap_pages_in_parallel():
+    """오래된 커서는 공백 구간 페이지를 병렬 조회"""
+    old_day = (datetime.now() - timedelta(days=2)).strftime("%Y%m%d")
+    items = [make_item(f"{old_day}{n:06d}") for n in range(1, 51)]
+    items += [make_item(f"{TODAY}{n:06d}") for n in range(1, 351)]
+    fake = FakeDart(items, delay=0.01)
+
+    async with _crawler(fake) as crawler:
+        disclosures, latest = await crawler.fetch_new_disclosures(since_rcept_no=f"{old_day}000040")
+
+    assert len(disclosures) == 10 + 350
+    assert latest == f"{TODAY}000350"
+    assert fake.max_in_flight > 1
+
+
+@pytest.mark.asyncio
+async def test_failed_page_keeps_cursor():
+    """페이지 조회가 실패하면 커서를 이동하지 않음"""
+    items = [make_item(f"{TODAY}{n:06d}") for n in range(1, 11)]
+    fake = FakeDart(items)
+
+    async def handler(request):
+        if request.url.params.get("page_no") == "1":
+            return httpx.Response(500)
+        return await fake(request)
+
+    async with _crawler(handler) as crawler:
+        disclosures, latest = await crawler.fetch_new_disclosures(since_rcept_no=None)
+
+    assert disclosures == []
+    assert latest is None
+
+
+@pytest.mark.asyncio
+async def test_backfill_respects_concurrency_and_dedups():
+    """백필은 동시 요청 한도를 지키고 중복 공시를 제거"""
+    start = datetime.now() - timedelta(days=20)
+    items = [
+        make_item((start + timedelta(days=day)).strftime("%Y%m%d") + f"{n:06d}", stock_code=f"{n % 3:06d}")
+        for day in range(21) for n in range(1, 31)
+    ]
+    fake = FakeDart(items, page_count=10, delay=0.005)
+
+    async with _crawler(fake, max_concurrency=3) as crawler:
+        disclosures = await crawler.backfill(start, stocks={"000001": "A", "000002": "B"})
+
+    assert fake.max_in_flight == 3
+    assert len(disclosures) == len([item for item in items if item["stock_code"] != "000000"])
+    assert len({d.metadata["rcept_no"] for d in disclosures}) == len(disclosures)
+    # 전체 시장 조회는 3개월 이내 구간으로 나눔
+    for params in fake.list_requests():
+        assert "corp_code" not in params
+        assert (datetime.strptime(params["end_de"], "%Y%m%d") - datetime.strptime(params["bgn_de"], "%Y%m%d")).days < 90
+
+
+@pytest.mark.asyncio
+async def test_company_lookups_are_batched_and_cached():
+    """기업 정보 조회는 고유번호별 한 번만 요청하고 캐시"""
+    items = [make_item(f"{TODAY}{n:06d}", corp_code=f"0000000{n % 2}") for n in range(1, 5)]
+    fake = FakeDart(items)
+
+    async with _crawler(fake) as crawler:
+        disclosures, _ = await crawler.fetch_new_disclosures(since_rcept_no=None)
+        await crawler.attach_company_details(disclosures)
+        await crawler.attach_company_details(disclosures)
+
+        # 목록에서 학습한 고유번호로 종목코드 조회
+        assert await crawler.search_company_by_stock_code("005930") in {"00000000", "00000001"}
+
+    company_requests = [params for endpoint, params in fake.requests if endpoint == "company.json"]
+    assert sorted(params["corp_code"] for params in company_requests) == ["00000000", "00000001"]
+    assert disclosures[0].metadata["company"] == {"induty_code": "264", "ceo_nm": "대표"}
+
+
+def test_cursor_only_moves_forward_and_persists(tmp_path):
+    """커서는 앞으로만 이동하고 파일에 유지"""
+    path = str(tmp_path / "dart" / "cursor.json")
+    cursor = DartCursor(path=path)
+
+    assert cursor.advance("20250102000010")
+    assert not cursor.advance("20250101000099")
+    assert not cursor.advance(None)
+
+    assert DartCursor(path=path).rcept_no == "20250102000010"
+
+
+def test_cursor_stops_before_first_failed_disclosure():
+    """저장 실패 공시가 있으면 그 이전까지만 커서 이동"""
+    crawler = DartCrawler(api_key="test-key")
+    disclosures = [crawler._parse_item(make_item(f"{TODAY}{n:06d}")) for n in (5, 3, 8, 6)]
+    url = {d.metadata["rcept_no"][-1]: d.url for d in disclosures}
+
+    # 실패 없음 → 조회 결과의 최신 접수번호까지
+    assert last_saved_rcept_no(f"{TODAY}000009", disclosures, []) == f"{TODAY}000009"
+    # 6번, 8번 실패 → 그보다 앞선 5번까지만
+    assert last_saved_rcept_no(f"{TODAY}000009", disclosures, [url["8"], url["6"]]) == f"{TODAY}000005"
+    # 가장 앞선 공시가 실패하면 이동하지 않음
+    assert last_saved_rcept_no(f"{TODAY}000009", disclosures, [url["3"]]) is None
+    # 어느 공시인지 알 수 없는 실패도 이동하지 않음
+    assert last_saved_rcept_no(f"{TODAY}000009", disclosures, [None]) is None
@@ -0,0 +1,96 @@
+"""
+Unit tests for NewsDuplicator MinHash/LSH title index
+"""
+from datetime import datetime, timedelta
+
+from backend.utils.deduplicator import NewsDuplicator
+from backend.utils.minhash_lsh import MinHashLSHIndex, char_shingles
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """get_recent_news_titles 쿼리만 흉내내는 세션 (호출 횟수 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def query(self, *columns):
+        self.queries += 1
+        return FakeQuery(self.rows)
+
+
+class Row:
+    def __init__(self, id, title, created_at=None):
+        self.id = id
+        self.title = title
+        self.created_at = created_at or datetime.now()
+
+
+def test_char_shingles_normalizes_whitespace():
+    """문자 shingle 생성 시 공백을 정규화"""
+    assert char_shingles("삼성  전자", 2) == {"삼성", "성 ", " 전", "전자"}
+    assert char_shingles("A", 2) == {"a"}
+    assert char_shingles("", 2) == set()
+
+
+def test_lsh_returns_near_duplicates_not_unrelated():
+    """LSH 후보에 유사 제목은 포함되고 무관한 제목은 제외"""
+    index = MinHashLSHIndex(num_perm=128, bands=32, shingle_size=2)
+    index.add(1, "삼성전자, 3분기 영업이익 10조원 돌파…반도체 회복")
+    index.add(2, "카카오, 인공지능 서비스 출시 일정 공개")
+
+    assert 1 in index.query("[속보] 삼성전자, 3분기 영업이익 10조원 돌파…반도체 회복")
+    assert 2 not in index.query("[속보] 삼성전자, 3분기 영업이익 10조원 돌파…반도체 회복")
+
+    index.remove(1)
+    assert 1 not in index.query("삼성전자, 3분기 영업이익 10조원 돌파…반도체 회복")
+    assert len(index) == 1
+
+
+def test_find_duplicate_queries_db_once_per_build():
+    """중복 검사는 인덱스 빌드마다 DB를 한 번만 조회"""
+    db = FakeSession([
+        Row(1, "삼성전자, 3분기 영업이익 10조원 돌파"),
+        Row(2, "카카오, 인공지능 서비스 출시 일정 공개"),
+    ])
+    duplicator = NewsDuplicator()
+
+    assert duplicator.find_duplicate_in_db("삼성전자 3분기 영업이익 10조원 돌파", db) == (True, 1)
+    assert duplicator.find_duplicate_in_db("현대차, 전기차 공장 가동 앞두고 생산 조정", db) == (False, None)
+    assert duplicator.filter_duplicates(["카카오, 인공지능 서비스 출시 일정 공개"], db) == [
+        ("카카오, 인공지능 서비스 출시 일정 공개", True)
+    ]
+    assert db.queries == 1
+
+
+def test_added_title_is_detected_in_same_cycle():
+    """추가한 제목은 같은 크롤링 사이클에서 바로 중복으로 감지"""
+    db = FakeSession([])
+    duplicator = NewsDuplicator()
+    duplicator.rebuild_index(db)
+
+    title = "LG에너지솔루션, 북미 배터리 합작법인 추가 투자 검토"
+    assert duplicator.find_duplicate_in_db(title, db) == (False, None)
+
+    duplicator.add_title(10, title)
+    assert duplicator.find_duplicate_in_db(f"[종합] {title}", db) == (True, 10)
+
+
+def test_entries_outside_lookback_are_ignored():
+    """조회 기간 밖의 제목은 중복 검사에서 제외"""
+    db = FakeSession([Row(1, "셀트리온, 신약 임상 3상 성공", datetime.now() - timedelta(hours=30))])
+    duplicator = NewsDuplicator(lookback_hours=24)
+    duplicator.rebuild_index(db)
+
+    assert duplicator.find_duplicate_in_index("셀트리온, 신약 임상 3상 성공") == (False, None)
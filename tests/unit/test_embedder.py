@@ -0,0 +1,131 @@
+"""
+Unit tests for NewsEmbedder.embed_batch - length bucketing and per-bucket fallback
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.llm.embedder import NewsEmbedder
+
+
+class NumberTokenizer:
+    """공백으로 나눈 숫자를 그대로 토큰 ID로 쓰는 토크나이저 (HuggingFace 호출 규약 흉내)"""
+
+    def __call__(self, text, truncation=False, max_length=None, verbose=True):
+        ids = [int(word) for word in text.split()]
+        if truncation and max_length:
+            ids = ids[:max_length]
+        return {"input_ids": ids, "attention_mask": [1] * len(ids)}
+
+    def pad(self, items, padding=True, return_tensors=None):
+        width = max(len(item["input_ids"]) for item in items)
+        return {
+            key: np.array([item[key] + [0] * (width - len(item[key])) for item in items])
+            for key in ("input_ids", "attention_mask")
+        }
+
+
+class LengthBackend:
+    """(첫 토큰, 토큰 수) 벡터를 돌려주고 max_len을 넘는 배치는 실패하는 백엔드"""
+
+    tensor_type = "np"
+
+    def __init__(self, max_len=None):
+        self.max_len = max_len
+        self.batches = []
+
+    def forward(self, encoded_input):
+        input_ids = encoded_input["input_ids"]
+        self.batches.append(input_ids[:, 0].tolist())
+        if self.max_len is not None and input_ids.shape[1] > self.max_len:
+            raise RuntimeError("out of memory")
+        lengths = encoded_input["attention_mask"].sum(axis=1)
+        return np.stack([input_ids[:, 0], lengths], axis=1).astype(np.float32)
+
+
+@pytest.fixture(autouse=True)
+def no_embedding_cache(monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_CACHE_ENABLED", False)
+
+
+def _embedder(backend):
+    """모델 다운로드 없이 스텁 토크나이저/백엔드를 쓰는 임베더"""
+    embedder = NewsEmbedder()
+    embedder._tokenizer = NumberTokenizer()
+    embedder._model = backend
+    return embedder
+
+
+def _text(first, length):
+    return " ".join([str(first)] * length)
+
+
+def test_embed_batch_buckets_by_length_and_keeps_input_order():
+    """토큰 길이순으로 버킷을 묶어 추론하되 결과는 입력 순서대로 돌려주는지 확인"""
+    backend = LengthBackend()
+    texts = [_text(1, 9), _text(2, 1), _text(3, 5), _text(4, 2), _text(5, 8)]
+
+    embeddings = _embedder(backend).embed_batch(texts, batch_size=2)
+
+    assert embeddings == [[1.0, 9.0], [2.0, 1.0], [3.0, 5.0], [4.0, 2.0], [5.0, 8.0]]
+    assert backend.batches == [[2, 4], [3, 5], [1]]
+
+
+def test_failed_bucket_returns_none_while_others_succeed():
+    """실패한 버킷 항목만 개별 재시도 후 None이 되고 다른 버킷은 정상 반환되는지 확인"""
+    backend = LengthBackend(max_len=4)
+    texts = [_text(1, 9), _text(2, 1), _text(3, 6), _text(4, 2)]
+
+    embeddings = _embedder(backend).embed_batch(texts, batch_size=2)
+
+    assert embeddings == [None, [2.0, 1.0], None, [4.0, 2.0]]
+    # 긴 버킷은 배치 1회 + 개별 재시도 2회
+    assert backend.batches == [[2, 4], [3, 1], [3], [1]]
+
+
+def test_untokenizable_text_is_none():
+    """토크나이징에 실패한 텍스트는 추론에서 빠지고 None으로 남는지 확인"""
+    backend = LengthBackend()
+
+    embeddings = _embedder(backend).embed_batch([_text(1, 2), "not-a-number"], batch_size=8)
+
+    assert embeddings == [[1.0, 2.0], None]
+    assert backend.batches == [[1]]
+
+
+def test_empty_batch():
+    """빈 입력은 모델을 로드하지 않고 빈 리스트를 돌려주는지 확인"""
+    assert NewsEmbedder().embed_batch([]) == []
+
+
+def test_loaded_cache_does_not_create_cache(monkeypatch, tmp_path):
+    """loaded_cache는 캐시를 만들지 않고 cache 접근 이후에만 값을 돌려주는지 확인"""
+    monkeypatch.setattr(settings, "EMBEDDING_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "EMBEDDING_CACHE_DIR", str(tmp_path / "embedding_cache"))
+    embedder = NewsEmbedder()
+
+    assert embedder.loaded_cache is None
+    cache = embedder.cache
+    assert cache is not None and embedder.loaded_cache is cache
+
+
+def test_select_unembedded_ids_filters_indexed_ids_by_chunk():
+    """인덱싱된 ID를 np.isin으로 걸러 최신순 미임베딩 ID를 limit개까지 돌려주는지 확인"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE news_articles (id INTEGER PRIMARY KEY, published_at DATETIME)"))
+        for news_id in range(1, 2501):
+            conn.execute(
+                text("INSERT INTO news_articles VALUES (:id, :published_at)"),
+                {"id": news_id, "published_at": datetime.fromtimestamp(1_700_000_000 + news_id)},
+            )
+    # 최신 1200건은 이미 인덱싱 → 첫 청크(1000건)에는 후보가 없음
+    indexed = np.arange(1301, 2501, dtype=np.int64)
+
+    with Session(engine) as db:
+        assert NewsEmbedder._select_unembedded_ids(db, indexed, limit=3) == [1300, 1299, 1298]
+        assert NewsEmbedder._select_unembedded_ids(db, np.arange(1, 2501), limit=3) == []
@@ -0,0 +1,96 @@
+"""
+Unit tests for embedding backends - ONNX / int8 parity with the PyTorch backend
+"""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from backend.llm.embedding_backends import (
+    OnnxEmbeddingBackend,
+    TorchEmbeddingBackend,
+    create_embedding_backend,
+    mean_pool_and_normalize,
+)
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    """작은 랜덤 RoBERTa 모델 (다운로드 없이 export/양자화 검증)"""
+    torch.manual_seed(0)
+    config = transformers.RobertaConfig(
+        vocab_size=200,
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        intermediate_size=128,
+        max_position_embeddings=80,
+    )
+    path = tmp_path_factory.mktemp("tiny-roberta")
+    transformers.RobertaModel(config).save_pretrained(str(path))
+    return str(path)
+
+
+def _encoded(tensor_type):
+    rng = np.random.default_rng(0)
+    input_ids = rng.integers(5, 200, size=(3, 12))
+    attention_mask = np.ones_like(input_ids)
+    attention_mask[1, 7:] = 0  # 패딩 포함 배치
+    attention_mask[2, 3:] = 0
+    input_ids[attention_mask == 0] = 1
+    if tensor_type == "pt":
+        return {"input_ids": torch.tensor(input_ids), "attention_mask": torch.tensor(attention_mask)}
+    return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+
+def _cosines(a, b):
+    return (a * b).sum(axis=1)
+
+
+@pytest.mark.parametrize("quantize,tolerance", [(False, 1e-4), (True, 0.02)])
+def test_onnx_backend_matches_torch(model_dir, tmp_path, quantize, tolerance):
+    """ONNX(int8 포함) 백엔드 임베딩이 PyTorch 결과와 일치"""
+    reference = TorchEmbeddingBackend(model_dir).forward(_encoded("pt"))
+    backend = OnnxEmbeddingBackend(model_dir, quantize=quantize, model_dir=str(tmp_path))
+
+    vectors = backend.forward(_encoded(backend.tensor_type))
+
+    assert vectors.shape == reference.shape
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+    assert _cosines(vectors, reference).min() >= 1 - tolerance
+
+
+def test_onnx_export_is_cached(model_dir, tmp_path, monkeypatch):
+    """두 번째 생성은 export/양자화 없이 디스크의 ONNX 파일을 재사용하는지 확인"""
+    first = OnnxEmbeddingBackend(model_dir, quantize=True, model_dir=str(tmp_path))
+    mtimes = {path: os.stat(path).st_mtime_ns for path in (first.fp32_path, first.int8_path)}
+
+    def fail(*args):
+        raise AssertionError("ONNX export/quantization should be cached")
+
+    monkeypatch.setattr(OnnxEmbeddingBackend, "export", staticmethod(fail))
+    monkeypatch.setattr(OnnxEmbeddingBackend, "quantize_model", staticmethod(fail))
+    second = OnnxEmbeddingBackend(model_dir, quantize=True, model_dir=str(tmp_path))
+
+    assert second.model_path == first.model_path
+    assert second.model_path.endswith("model.int8.onnx")
+    assert {path: os.stat(path).st_mtime_ns for path in mtimes} == mtimes
+
+
+def test_mean_pooling_ignores_padding():
+    """mean pooling은 패딩 토큰을 제외"""
+    tokens = np.array([[[1.0, 0.0], [3.0, 0.0], [100.0, 100.0]]], dtype=np.float32)
+    mask = np.array([[1, 1, 0]])
+
+    np.testing.assert_allclose(mean_pool_and_normalize(tokens, mask), [[1.0, 0.0]])
+
+
+def test_unknown_backend_rejected(model_dir):
+    """알 수 없는 백엔드 이름은 거부"""
+    with pytest.raises(ValueError):
+        create_embedding_backend(model_dir, "tensorrt")
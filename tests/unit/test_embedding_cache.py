@@ -0,0 +1,160 @@
+"""
+Unit tests for EmbeddingCache - memory LRU tier + on-disk memmap tier
+"""
+import os
+
+import numpy as np
+import pytest
+
+from backend.llm.embedding_cache import EmbeddingCache, normalize_text
+
+
+DIM = 8
+
+
+def _vector(seed: int):
+    rng = np.random.default_rng(seed)
+    vec = rng.random(DIM).astype(np.float32)
+    return (vec / np.linalg.norm(vec)).tolist()
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "embedding_cache")
+
+
+def _make_cache(cache_dir, **kwargs):
+    options = {
+        "memory_size": 4,
+        "disk_enabled": True,
+        "max_disk_rows": 100,
+    }
+    options.update(kwargs)
+    return EmbeddingCache("test/model", DIM, cache_dir=cache_dir, **options)
+
+
+def test_normalize_text_collapses_whitespace():
+    """캐시 키 정규화 시 공백을 하나로 합침"""
+    assert normalize_text("  삼성전자\n\n  실적  발표 ") == "삼성전자 실적 발표"
+
+
+def test_put_then_get_memory_hit(cache_dir):
+    """저장한 임베딩은 메모리 캐시에서 조회"""
+    cache = _make_cache(cache_dir)
+    cache.put("삼성전자 실적", _vector(1))
+
+    result = cache.get("삼성전자   실적")  # 공백 차이는 동일 키
+
+    assert result == pytest.approx(_vector(1))
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 0
+    assert stats["hit_rate"] == 1.0
+
+
+def test_miss_is_counted(cache_dir):
+    """캐시 miss 횟수 집계"""
+    cache = _make_cache(cache_dir)
+
+    assert cache.get("없는 뉴스") is None
+    assert cache.get_stats()["misses"] == 1
+    assert cache.get_stats()["hit_rate"] == 0.0
+
+
+def test_key_includes_model_name(cache_dir):
+    """모델 이름이 다르면 다른 캐시 키"""
+    cache_a = EmbeddingCache("model-a", DIM, cache_dir=cache_dir, disk_enabled=False)
+    cache_b = EmbeddingCache("model-b", DIM, cache_dir=cache_dir, disk_enabled=False)
+
+    assert cache_a.make_key("같은 텍스트") != cache_b.make_key("같은 텍스트")
+
+
+def test_memory_lru_eviction_falls_back_to_disk(cache_dir):
+    """메모리 LRU에서 밀려난 항목은 디스크 캐시에서 조회"""
+    cache = _make_cache(cache_dir, memory_size=2)
+    for i in range(3):
+        cache.put(f"뉴스 {i}", _vector(i))
+
+    # 가장 오래된 항목은 메모리에서 밀려나고 디스크에서 조회됨
+    assert cache.get("뉴스 0") == pytest.approx(_vector(0))
+    stats = cache.get_stats()
+    assert stats["disk_hits"] == 1
+    assert stats["memory_entries"] == 2
+
+
+def test_disk_tier_persists_across_instances(cache_dir):
+    """디스크 캐시는 새 인스턴스에서도 유지"""
+    writer = _make_cache(cache_dir)
+    writer.put("뉴스 A", _vector(10))
+    writer.put("뉴스 B", _vector(11))
+
+    reader = _make_cache(cache_dir)
+
+    assert reader.get("뉴스 B") == pytest.approx(_vector(11))
+    assert reader.get_stats()["disk_hits"] == 1
+    assert reader.get_stats()["disk_entries"] == 2
+
+
+def test_disk_tier_sees_rows_appended_by_another_instance(cache_dir):
+    """다른 인스턴스가 추가한 디스크 행도 조회"""
+    reader = _make_cache(cache_dir)
+    writer = _make_cache(cache_dir)
+
+    writer.put("다른 프로세스 뉴스", _vector(20))
+
+    assert reader.get("다른 프로세스 뉴스") == pytest.approx(_vector(20))
+
+
+def test_truncated_tail_record_is_discarded(cache_dir):
+    """기록 중 잘린 마지막 레코드는 버림"""
+    writer = _make_cache(cache_dir)
+    writer.put("뉴스 A", _vector(30))
+
+    with open(writer.disk_path, "ab") as f:
+        f.write(b"\x00" * 5)  # 기록 도중 중단된 레코드
+
+    reader = _make_cache(cache_dir)
+
+    assert reader.get("뉴스 A") == pytest.approx(_vector(30))
+    assert os.path.getsize(reader.disk_path) % reader._record_dtype.itemsize == 0
+
+
+def test_max_disk_rows_stops_disk_writes(cache_dir):
+    """디스크 최대 행 수에 도달하면 디스크 기록 중단"""
+    cache = _make_cache(cache_dir, max_disk_rows=1)
+    cache.put("뉴스 A", _vector(40))
+    cache.put("뉴스 B", _vector(41))
+
+    assert cache.get_stats()["disk_entries"] == 1
+
+
+def test_dimension_mismatch_is_ignored(cache_dir):
+    """차원이 다른 임베딩은 캐시하지 않음"""
+    cache = _make_cache(cache_dir)
+    cache.put("잘못된 벡터", [0.1, 0.2])
+
+    assert cache.get("잘못된 벡터") is None
+
+
+def test_namespace_separates_keys(cache_dir):
+    """namespace가 다르면 캐시 키가 분리"""
+    default = _make_cache(cache_dir)
+    namespaced = _make_cache(cache_dir, namespace="head_tail:256:64")
+
+    assert default.make_key("뉴스") != namespaced.make_key("뉴스")
+    assert default.make_key("뉴스") == _make_cache(cache_dir).make_key("뉴스")
+
+
+def test_disk_key_ending_with_nul_byte_hits(cache_dir):
+    """끝이 \\x00인 키도 디스크에서 조회되고 중복 기록되지 않는지 확인"""
+    writer = _make_cache(cache_dir)
+    text = "t130"
+    assert writer.make_key(text).endswith(b"\x00")
+    writer.put(text, _vector(50))
+
+    reader = _make_cache(cache_dir)
+    assert reader.get(text) == pytest.approx(_vector(50))
+    assert reader.get_stats()["disk_hits"] == 1
+
+    reader.put(text, _vector(50))
+    assert os.path.getsize(reader.disk_path) == reader._record_dtype.itemsize
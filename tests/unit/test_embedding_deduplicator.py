@@ -0,0 +1,115 @@
+"""
+Unit tests for EmbeddingDeduplicator prediction/notification candidate checks
+"""
+from datetime import datetime
+
+import pytest
+
+from backend.utils.embedding_deduplicator import EmbeddingDeduplicator
+
+
+class FakeVectorSearch:
+    def __init__(self, results=None, error=None):
+        self.results = results
+        self.error = error
+        self.calls = []
+
+    async def search_similar_news(self, news_text, stock_code, top_k, similarity_threshold):
+        self.calls.append((news_text, stock_code, top_k, similarity_threshold))
+        if self.error:
+            raise self.error
+        return self.results
+
+
+class FakeQuery:
+    def __init__(self, session):
+        self.session = session
+
+    def filter(self, *criteria):
+        # 첫 조건이 NewsArticle.id == news_id
+        self.news_id = criteria[0].right.value
+        return self
+
+    def first(self):
+        self.session.checked.append(self.news_id)
+        return self.news_id if self.news_id in self.session.found_ids else None
+
+
+class FakeSession:
+    """조건(최근 생성/최근 알림)에 맞는 뉴스 ID만 조회되는 세션"""
+
+    def __init__(self, found_ids=()):
+        self.found_ids = set(found_ids)
+        self.checked = []
+
+    def query(self, model):
+        return FakeQuery(self)
+
+
+def _hit(news_id, similarity):
+    return {"news_id": news_id, "similarity": similarity, "stock_code": "005930", "published_at": None}
+
+
+@pytest.mark.asyncio
+async def test_skip_notification_searches_once_with_high_threshold():
+    """알림 중복 검사는 높은 임계값으로 한 번 검색한 후보의 알림 이력을 확인하는지 확인"""
+    deduplicator = EmbeddingDeduplicator()
+    deduplicator.vector_search = FakeVectorSearch([_hit(1, 0.97)])
+
+    result = await deduplicator.should_skip_notification("a", "005930", FakeSession(found_ids={1}))
+
+    assert result == (True, 1, 0.97)
+    assert deduplicator.vector_search.calls == [("a", "005930", 3, 0.95)]
+
+
+@pytest.mark.asyncio
+async def test_skip_notification_sends_on_search_error():
+    """검색 오류 시 알림을 보내는지 확인"""
+    deduplicator = EmbeddingDeduplicator()
+    deduplicator.vector_search = FakeVectorSearch(error=RuntimeError("index broken"))
+
+    assert await deduplicator.should_skip_notification("a", "005930", FakeSession()) == (False, None, None)
+
+
+def test_check_prediction_reuses_lower_threshold_hits():
+    """예측용(0.7) 검색 결과를 그대로 넘겨도 최상위 유사 뉴스로 skip 여부를 판단하는지 확인"""
+    deduplicator = EmbeddingDeduplicator()
+    db = FakeSession(found_ids={1, 2})
+
+    assert deduplicator.check_prediction_candidates([_hit(1, 0.97), _hit(3, 0.8)], "005930", db) == (True, 1, 0.97)
+    assert deduplicator.check_prediction_candidates([_hit(2, 0.92)], "005930", db) == (False, 2, 0.92)
+    assert deduplicator.check_prediction_candidates([_hit(3, 0.8), _hit(1, 0.75)], "005930", db) == (False, None, None)
+    # 시간 범위 밖 뉴스는 skip하지 않음
+    assert deduplicator.check_prediction_candidates([_hit(4, 0.99)], "005930", db) == (False, None, None)
+    assert db.checked == [1, 2, 4]
+
+
+def test_select_candidates_keeps_top_high_similarity_hits():
+    """예측용 검색 결과에서 높은 유사도 상위 3건만 후보로 고르는지 확인"""
+    deduplicator = EmbeddingDeduplicator(high_similarity_threshold=0.9)
+    hits = [_hit(1, 0.99), _hit(2, 0.95), _hit(3, 0.93), _hit(4, 0.91), _hit(5, 0.6)]
+
+    assert [hit["news_id"] for hit in deduplicator.select_notification_candidates(hits)] == [1, 2, 3]
+    assert deduplicator.select_notification_candidates([_hit(5, 0.6)]) == []
+
+
+def test_check_candidates_skips_when_similar_news_was_notified():
+    """후보 중 최근 알림된 뉴스가 있으면 skip하는지 확인"""
+    deduplicator = EmbeddingDeduplicator()
+    db = FakeSession(found_ids={2})
+
+    result = deduplicator.check_notification_candidates([_hit(1, 0.99), _hit(2, 0.96)], "005930", db)
+
+    assert result == (True, 2, 0.96)
+    assert db.checked == [1, 2]
+
+
+def test_check_candidates_without_hits_or_history_sends():
+    """후보가 없거나 알림 이력이 없으면 알림을 보내는지 확인"""
+    deduplicator = EmbeddingDeduplicator()
+    db = FakeSession()
+
+    assert deduplicator.check_notification_candidates([], "005930", db) == (False, None, None)
+    assert deduplicator.check_notification_candidates(None, "005930", db) == (False, None, None)
+    assert deduplicator.check_notification_candidates([_hit(1, 0.99)], "005930", db) == (False, None, None)
+    assert db.checked == [1]
@@ -0,0 +1,85 @@
+"""
+Unit tests for EmbeddingTextPolicy - lead sentences / token budget / head+tail truncation
+"""
+import pytest
+
+from backend.llm.embedding_text import EmbeddingTextPolicy, split_sentences
+
+
+CLS, SEP = 0, 2
+
+
+class WordTokenizer:
+    """공백 단위 토큰화 + [CLS]/[SEP] (HuggingFace 토크나이저 호출 규약 흉내)"""
+
+    def __call__(self, text, truncation=False, max_length=None, verbose=True):
+        ids = [CLS] + [100 + i for i, _ in enumerate(text.split())] + [SEP]
+        if truncation and max_length and len(ids) > max_length:
+            ids = ids[:max_length - 1] + [SEP]
+        return {"input_ids": ids, "attention_mask": [1] * len(ids)}
+
+
+ARTICLE = "삼성전자 실적 발표\n" + " ".join(f"문장{i} 내용이다." for i in range(50))
+
+
+def test_split_sentences():
+    """문장 부호와 줄바꿈 기준 문장 분리"""
+    assert split_sentences("첫 문장이다. 둘째 문장! 셋째?\n넷째") == ["첫 문장이다.", "둘째 문장!", "셋째?", "넷째"]
+
+
+def test_full_policy_truncates_at_max_length():
+    """full 정책은 최대 길이에서 절단"""
+    encoded = EmbeddingTextPolicy("full", max_length=32).encode(WordTokenizer(), ARTICLE)
+
+    assert len(encoded["input_ids"]) == 32
+    assert encoded["input_ids"][-1] == SEP
+
+
+def test_lead_sentences_keeps_title_and_first_sentences():
+    """lead_sentences 정책은 제목과 앞 문장만 유지"""
+    policy = EmbeddingTextPolicy("lead_sentences", lead_sentences=2)
+
+    assert policy.prepare_text(ARTICLE) == "삼성전자 실적 발표\n문장0 내용이다. 문장1 내용이다."
+    assert policy.prepare_text("제목만") == "제목만"
+
+
+def test_token_budget_policy():
+    """token_budget 정책은 토큰 예산만큼 절단"""
+    encoded = EmbeddingTextPolicy("token_budget", token_budget=16).encode(WordTokenizer(), ARTICLE)
+
+    assert len(encoded["input_ids"]) == 16
+    assert encoded["input_ids"][0] == CLS and encoded["input_ids"][-1] == SEP
+
+
+def test_head_tail_policy_keeps_both_ends():
+    """head_tail 정책은 앞부분과 뒷부분을 함께 유지"""
+    policy = EmbeddingTextPolicy("head_tail", token_budget=20, tail_tokens=5)
+    full = WordTokenizer()(ARTICLE)["input_ids"]
+
+    encoded = policy.encode(WordTokenizer(), ARTICLE)
+
+    assert encoded["input_ids"] == full[:15] + full[-5:]
+    assert len(encoded["attention_mask"]) == 20
+
+
+def test_head_tail_short_text_unchanged():
+    """head_tail 정책에서 예산 이내 텍스트는 그대로"""
+    policy = EmbeddingTextPolicy("head_tail", token_budget=20, tail_tokens=5)
+
+    assert policy.encode(WordTokenizer(), "짧은 제목\n짧은 본문") == WordTokenizer()("짧은 제목\n짧은 본문")
+
+
+def test_signature_distinguishes_policies():
+    """정책/파라미터가 다르면 signature가 다름"""
+    assert EmbeddingTextPolicy("full").signature == ""
+    signatures = {
+        EmbeddingTextPolicy(policy).signature
+        for policy in ("lead_sentences", "token_budget", "head_tail")
+    }
+    assert len(signatures) == 3 and "" not in signatures
+
+
+def test_unknown_policy_rejected():
+    """알 수 없는 정책 이름은 거부"""
+    with pytest.raises(ValueError):
+        EmbeddingTextPolicy("summary")
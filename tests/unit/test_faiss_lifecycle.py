@@ -0,0 +1,173 @@
+"""
+Unit tests for IndexLifecycleManager - Flat → IVF promotion, retraining, nprobe tuning
+"""
+import faiss
+import numpy as np
+import pytest
+
+from backend.llm.faiss_lifecycle import (
+    ACTION_PROMOTE,
+    ACTION_RETRAIN,
+    ACTION_TUNE,
+    IndexLifecycleManager,
+)
+from backend.llm.faiss_store import FaissSegmentStore
+
+
+DIM = 16
+
+
+def _clustered_vectors(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((20, DIM))
+    vectors = centers[rng.integers(0, 20, count)] + 0.3 * rng.standard_normal((count, DIM))
+    vectors = vectors.astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FaissSegmentStore(
+        index_path=str(tmp_path / "news.index"),
+        metadata_path=str(tmp_path / "news_metadata.pkl"),
+        wal_path=str(tmp_path / "news.wal"),
+        metadata_dir=str(tmp_path / "news_metadata"),
+        dim=DIM,
+    )
+
+
+def _fill(store, count, start=1, seed=0):
+    vectors = _clustered_vectors(count, seed)
+    ids = list(range(start, start + count))
+    store.append(ids, vectors.tolist(), ["005930"] * count, [1_700_000_000 + i for i in ids])
+    return vectors
+
+
+def _manager(store, **kwargs):
+    options = {"min_vectors_for_ivf": 400, "recall_target": 0.9, "tune_queries": 50}
+    options.update(kwargs)
+    return IndexLifecycleManager(store=store, **options)
+
+
+def test_no_action_below_threshold(store):
+    """벡터 수가 임계값 미만이면 작업 없음"""
+    _fill(store, 100)
+    assert _manager(store).plan() is None
+
+
+def test_promote_flat_to_ivf(store):
+    """임계값을 넘으면 Flat 인덱스를 IVF로 승격"""
+    vectors = _fill(store, 500)
+    manager = _manager(store)
+
+    assert manager.plan() == ACTION_PROMOTE
+    result = manager.run()
+
+    assert store.is_ivf
+    assert result["nlist"] == manager.target_nlist(500)
+    assert result["recall"] >= 0.9
+    assert store.main_index.nprobe == result["nprobe"]
+    assert store.delta_count == 0
+    # 행 순서가 유지되어 메타데이터와 일치
+    assert store.search(vectors[7:8], k=1)[0][0][1]["news_article_id"] == 8
+
+
+def test_reader_picks_up_rebuilt_index_and_params(store):
+    """다른 인스턴스가 재구성한 인덱스와 nprobe를 반영"""
+    _fill(store, 500)
+    reader = FaissSegmentStore(
+        index_path=store.index_path,
+        metadata_path=store.metadata_path,
+        wal_path=store.wal_path,
+        metadata_dir=store.metadata_dir,
+        dim=DIM,
+    )
+    reader.load()
+
+    result = _manager(store).run()
+    reader.sync_from_disk()
+
+    assert reader.is_ivf
+    assert reader.main_index.nprobe == result["nprobe"]
+
+
+def test_retrain_when_nlist_drifts(store):
+    """nlist가 벡터 수에 비해 어긋나면 재학습"""
+    _fill(store, 500)
+    manager = _manager(store)
+    manager.run()
+    assert manager.plan() is None
+
+    _fill(store, 2000, start=1000, seed=1)  # sqrt(2500)=50 vs nlist=22
+
+    assert manager.plan() == ACTION_RETRAIN
+    result = manager.run()
+    assert result["nlist"] == 50
+    assert store.main_index.ntotal == 2500
+
+
+def test_tune_after_growth(store):
+    """벡터가 크게 늘면 nprobe 재튜닝"""
+    _fill(store, 500)
+    manager = _manager(store)
+    manager.run()
+
+    _fill(store, 200, start=1000, seed=2)  # 40% 증가, nlist 드리프트는 허용 범위
+
+    assert manager.plan() == ACTION_TUNE
+    result = manager.run()
+    assert result["ntotal"] == 700
+    assert store.index_params["nprobe"] == result["nprobe"]
+
+
+@pytest.mark.parametrize("index_type", ["ivf_sq8", "ivf_pq"])
+def test_compressed_index_reranks_with_full_vectors(store, index_type, monkeypatch):
+    """압축 인덱스는 원본 벡터로 재정렬"""
+    monkeypatch.setattr("backend.config.settings.FAISS_PQ_M", 4)
+    vectors = _fill(store, 600)
+    store.vectors_path = store.index_path + ".vectors"
+
+    result = _manager(store, index_type=index_type).run()
+
+    assert result["index_type"] == index_type
+    assert store.is_compressed
+    assert store.get_stats()["rerank"]
+    # 재정렬 후 유사도는 원본 벡터 기준 정확값
+    hit = store.search(vectors[42:43], k=1)[0][0]
+    assert hit[1]["news_article_id"] == 43
+    assert hit[0] == pytest.approx(1.0, abs=1e-5)
+
+    # 컴팩션 시 원본 벡터 파일도 함께 증가
+    more = _fill(store, 10, start=5000, seed=7)
+    store.compact()
+    hit = store.search(more[3:4], k=1)[0][0]
+    assert hit[1]["news_article_id"] == 5003
+    assert hit[0] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_index_type_change_triggers_rebuild(store):
+    """설정된 인덱스 타입이 바뀌면 재구성"""
+    _fill(store, 500)
+    _manager(store).run()
+
+    assert _manager(store, index_type="ivf_sq8").plan() == ACTION_RETRAIN
+
+
+def test_tuning_recall_ignores_query_self_match():
+    """쿼리 자신의 행만 찾는 인덱스는 recall 0으로 측정"""
+    vectors = _clustered_vectors(200)
+    index = faiss.IndexIVFFlat(faiss.IndexFlatIP(DIM), DIM, 4, faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    index.add(vectors)
+    query_rows = np.arange(10)
+
+    def self_only_search(queries, k, params=None):
+        found = np.full((len(queries), k), -1, dtype=np.int64)
+        found[:, 0] = query_rows
+        return np.zeros(found.shape, dtype=np.float32), found
+
+    index.search = self_only_search
+    result = _manager(None, recall_k=5)._tune_nprobe(index, vectors, query_rows)
+
+    assert result["recall"] == 0.0
+    assert result["recall_k"] == 5
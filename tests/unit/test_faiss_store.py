@@ -0,0 +1,363 @@
+"""
+Unit tests for FaissSegmentStore - main index + append-only WAL delta segment
+"""
+import os
+import pickle
+import threading
+
+import faiss
+import numpy as np
+import pytest
+
+from backend.llm import faiss_store as faiss_store_module
+from backend.llm.faiss_store import FaissSegmentStore
+
+
+DIM = 8
+
+
+def _vectors(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def store_paths(tmp_path):
+    return {
+        "index_path": str(tmp_path / "news.index"),
+        "metadata_path": str(tmp_path / "news_metadata.pkl"),
+        "wal_path": str(tmp_path / "news.wal"),
+        "metadata_dir": str(tmp_path / "news_metadata"),
+        "dim": DIM,
+    }
+
+
+def _append(store, ids, vectors, stock_code="005930"):
+    return store.append(
+        news_ids=list(ids),
+        embeddings=[v.tolist() for v in vectors],
+        stock_codes=[stock_code] * len(ids),
+        published_timestamps=[1_700_000_000 + i for i in ids],
+    )
+
+
+def test_append_writes_only_wal(store_paths):
+    """append는 메인 인덱스 없이 WAL만 기록"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(5)
+
+    assert _append(store, range(1, 6), vectors) == 5
+
+    assert not os.path.exists(store_paths["index_path"])
+    assert os.path.getsize(store_paths["wal_path"]) == 5 * store._record_dtype.itemsize
+    assert store.delta_count == 5
+    assert store.ntotal == 5
+
+
+def test_search_returns_delta_hits(store_paths):
+    """delta 세그먼트 벡터도 검색"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(5)
+    _append(store, range(1, 6), vectors)
+
+    hits = store.search(vectors[2:3], k=3)[0]
+
+    assert hits[0][1]["news_article_id"] == 3
+    assert hits[0][0] == pytest.approx(1.0, abs=1e-5)
+    assert hits[0][1]["stock_code"] == "005930"
+
+
+def test_duplicate_news_ids_are_skipped(store_paths):
+    """이미 인덱싱된 뉴스 ID는 건너뜀"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(3)
+    _append(store, [1, 2, 3], vectors)
+
+    assert _append(store, [2, 3, 4], _vectors(3, seed=1)) == 1
+    assert sorted(store.indexed_news_id_array().tolist()) == [1, 2, 3, 4]
+
+
+def test_wal_is_replayed_by_new_instance(store_paths):
+    """새 인스턴스는 로드 시 WAL을 재생"""
+    writer = FaissSegmentStore(**store_paths)
+    vectors = _vectors(4)
+    _append(writer, range(1, 5), vectors)
+
+    reader = FaissSegmentStore(**store_paths)
+    reader.load()
+
+    assert sorted(reader.indexed_news_id_array().tolist()) == [1, 2, 3, 4]
+    assert reader.search(vectors[0:1], k=1)[0][0][1]["news_article_id"] == 1
+
+
+def test_reader_sees_appends_from_other_instance(store_paths):
+    """다른 인스턴스의 append가 검색에 반영"""
+    reader = FaissSegmentStore(**store_paths)
+    reader.load()
+    writer = FaissSegmentStore(**store_paths)
+
+    vectors = _vectors(2)
+    _append(writer, [10, 11], vectors)
+
+    assert reader.search(vectors[1:2], k=1)[0][0][1]["news_article_id"] == 11
+
+
+def test_compact_merges_delta_and_truncates_wal(store_paths):
+    """컴팩션은 delta를 메인으로 병합하고 WAL을 정리"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(6)
+    _append(store, range(1, 4), vectors[:3])
+
+    assert store.compact() == 3
+    assert store.delta_count == 0
+    assert store.main_index.ntotal == 3
+    assert os.path.getsize(store_paths["wal_path"]) == 0
+
+    _append(store, range(4, 7), vectors[3:])
+    hits = store.search(vectors[0:1], k=6)[0]
+
+    # 메인 + delta 결과가 유사도 내림차순으로 병합됨
+    assert len(hits) == 6
+    assert hits[0][1]["news_article_id"] == 1
+    assert [h[0] for h in hits] == sorted((h[0] for h in hits), reverse=True)
+
+
+def test_reader_reloads_after_compaction(store_paths):
+    """다른 인스턴스의 컴팩션 후 메인 인덱스를 재로드"""
+    writer = FaissSegmentStore(**store_paths)
+    vectors = _vectors(3)
+    _append(writer, [1, 2, 3], vectors)
+
+    reader = FaissSegmentStore(**store_paths)
+    reader.load()
+    writer.compact()
+
+    assert sorted(reader.indexed_news_id_array().tolist()) == [1, 2, 3]
+    assert reader.delta_count == 0
+    assert reader.main_index.ntotal == 3
+
+
+def test_search_checks_disk_once_per_interval(store_paths, monkeypatch):
+    """검색 시 디스크 변경 확인은 sync_interval마다 한 번"""
+    now = [1000.0]
+    monkeypatch.setattr(faiss_store_module.time, "monotonic", lambda: now[0])
+    reader = FaissSegmentStore(sync_interval=5.0, **store_paths)
+    writer = FaissSegmentStore(**store_paths)
+    vectors = _vectors(2)
+    _append(writer, [1], vectors[:1])
+    assert reader.search(vectors[0:1], k=1)[0][0][1]["news_article_id"] == 1
+
+    _append(writer, [2], vectors[1:])
+    now[0] += 4.9
+    assert reader.search(vectors[1:2], k=1)[0][0][1]["news_article_id"] == 1  # 확인 간격 전
+    now[0] += 0.1
+    assert reader.search(vectors[1:2], k=1)[0][0][1]["news_article_id"] == 2
+
+
+def test_search_serves_previous_snapshot_during_reload(store_paths):
+    """백그라운드 재로드 중에는 이전 스냅샷으로 검색"""
+    writer = FaissSegmentStore(**store_paths)
+    vectors = _vectors(4)
+    _append(writer, [1, 2, 3], vectors[:3])
+    reader = FaissSegmentStore(sync_interval=0, **store_paths)
+    reader.load()
+    _append(writer, [4], vectors[3:])
+    writer.compact()
+
+    # 메인 인덱스 읽기를 막아 두고 검색
+    release = threading.Event()
+    read_main = reader._read_main
+    reader._read_main = lambda: (release.wait(5), read_main())[1]
+
+    hits = reader.search(vectors[3:4], k=1)[0]
+    assert hits[0][1]["news_article_id"] != 4  # 이전 스냅샷
+    assert reader._reload_thread.is_alive()
+
+    release.set()
+    reader._reload_thread.join(5)
+    assert reader.main_index.ntotal == 4
+    assert reader.search(vectors[3:4], k=1)[0][0][1]["news_article_id"] == 4
+
+
+def test_partial_wal_record_is_ignored(store_paths):
+    """기록 중인 불완전한 WAL 레코드는 무시"""
+    store = FaissSegmentStore(**store_paths)
+    _append(store, [1], _vectors(1))
+
+    with open(store_paths["wal_path"], "ab") as f:
+        f.write(b"\x01" * 7)
+
+    reader = FaissSegmentStore(**store_paths)
+    reader.load()
+    assert sorted(reader.indexed_news_id_array().tolist()) == [1]
+
+    # writer는 꼬리를 정리한 뒤 append
+    _append(reader, [2], _vectors(1, seed=3))
+    assert os.path.getsize(store_paths["wal_path"]) % store._record_dtype.itemsize == 0
+
+
+def test_stock_code_filter_uses_prefilter(store_paths):
+    """종목 필터는 검색 전에 적용"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(6)
+    _append(store, [1, 2, 3], vectors[:3], stock_code="005930")
+    _append(store, [4, 5, 6], vectors[3:], stock_code="000660")
+    store.compact()
+    _append(store, [7], _vectors(1, seed=9), stock_code="000660")
+
+    # 005930 벡터로 검색해도 000660 결과만 반환 (메인 + delta)
+    hits = store.search(vectors[0:1], k=10, stock_code="000660")[0]
+
+    assert {meta["news_article_id"] for _, meta in hits} == {4, 5, 6, 7}
+    assert all(meta["stock_code"] == "000660" for _, meta in hits)
+
+
+def test_unknown_stock_code_returns_nothing(store_paths):
+    """인덱스에 없는 종목 필터는 빈 결과"""
+    store = FaissSegmentStore(**store_paths)
+    _append(store, [1, 2], _vectors(2))
+
+    assert store.search(_vectors(1), k=5, stock_code="999999")[0] == []
+
+
+def test_published_window_filter(store_paths):
+    """발행 시각 구간 필터"""
+    store = FaissSegmentStore(**store_paths)
+    vectors = _vectors(5)
+    _append(store, range(1, 6), vectors)  # published_at = 1_700_000_000 + id
+
+    hits = store.search(
+        vectors[0:1], k=10,
+        published_after=1_700_000_002,
+        published_before=1_700_000_005,
+    )[0]
+
+    assert {meta["news_article_id"] for _, meta in hits} == {2, 3, 4}
+
+
+def test_legacy_pickle_metadata_is_converted(store_paths):
+    """기존 pickle 메타데이터를 컬럼형으로 변환"""
+    vectors = _vectors(3)
+    index = faiss.IndexFlatIP(DIM)
+    index.add(vectors)
+    faiss.write_index(index, store_paths["index_path"])
+    with open(store_paths["metadata_path"], "wb") as f:
+        pickle.dump([
+            {"news_article_id": 11, "stock_code": "005930", "published_at": 100},
+            {"news_article_id": 12, "stock_code": "", "published_at": None},
+            {"news_article_id": 13, "stock_code": "000660"},
+        ], f)
+
+    store = FaissSegmentStore(**store_paths)
+    store.load()
+
+    assert os.path.exists(os.path.join(store_paths["metadata_dir"], "manifest.json"))
+    assert sorted(store.indexed_news_id_array().tolist()) == [11, 12, 13]
+    hits = store.search(vectors[1:2], k=1)[0]
+    assert hits[0][1] == {"news_article_id": 12, "stock_code": "", "published_at": None}
+    assert isinstance(store._main_metadata.news_id, np.memmap)
+
+
+@pytest.fixture
+def partitioned_paths(store_paths, tmp_path):
+    return {**store_paths, "partitioned": True, "partition_dir": str(tmp_path / "partitions")}
+
+
+def test_rebalance_routes_stock_search_to_partition(partitioned_paths):
+    """리밸런싱 후 종목 필터 검색은 파티션으로 라우팅"""
+    store = FaissSegmentStore(**partitioned_paths)
+    vectors = _vectors(6)
+    _append(store, [1, 2, 3], vectors[:3], stock_code="005930")
+    _append(store, [4, 5, 6], vectors[3:], stock_code="000660")
+    store.compact()
+
+    sizes = store.rebalance_partitions(["005930", "000660", "035720"])
+
+    assert sizes == {"005930": 3, "000660": 3}
+    hits = store.search(vectors[0:1], k=10, stock_code="000660")[0]
+    assert {meta["news_article_id"] for _, meta in hits} == {4, 5, 6}
+    assert all(meta["stock_code"] == "000660" for _, meta in hits)
+    assert store.get_stats()["partitions"] == 2
+
+
+def test_partition_receives_appends_and_persists_on_compaction(partitioned_paths):
+    """파티션은 append를 반영하고 컴팩션 시 저장"""
+    store = FaissSegmentStore(**partitioned_paths)
+    vectors = _vectors(4)
+    _append(store, [1, 2], vectors[:2])
+    store.rebalance_partitions(["005930"])
+
+    _append(store, [3, 4], vectors[2:])
+    hits = store.search(vectors[3:4], k=1, stock_code="005930")[0]
+    assert hits[0][1]["news_article_id"] == 4
+    assert hits[0][0] == pytest.approx(1.0, abs=1e-5)
+
+    store.compact()
+    reader = FaissSegmentStore(**partitioned_paths)
+    reader.load()
+    assert len(reader._partitions.route("005930")) == 4
+
+
+def test_partition_time_window_filter(partitioned_paths):
+    """파티션 검색에도 발행 시각 필터 적용"""
+    store = FaissSegmentStore(**partitioned_paths)
+    vectors = _vectors(5)
+    _append(store, range(1, 6), vectors)
+    store.rebalance_partitions(["005930"])
+
+    hits = store.search(
+        vectors[0:1], k=10, stock_code="005930",
+        published_after=1_700_000_002,
+        published_before=1_700_000_005,
+    )[0]
+
+    assert {meta["news_article_id"] for _, meta in hits} == {2, 3, 4}
+
+
+def test_mmap_flat_index_is_reloaded_for_compaction(store_paths):
+    """memmap Flat 인덱스는 컴팩션 전 메모리로 다시 로드"""
+    writer = FaissSegmentStore(**store_paths)
+    vectors = _vectors(6)
+    _append(writer, [1, 2, 3], vectors[:3])
+    writer.compact()
+
+    store = FaissSegmentStore(mmap=True, **store_paths)
+    store.load()
+    assert store.get_stats()["mmap"] is True
+    assert store.search(vectors[1:2], k=1)[0][0][1]["news_article_id"] == 2
+
+    _append(store, [4, 5, 6], vectors[3:])
+    assert store.compact() == 3
+
+    # 컴팩션 후 새 인덱스 파일로 다시 매핑
+    assert store.get_stats()["mmap"] is True
+    assert store.main_index.ntotal == 6
+    hits = store.search(vectors[4:5], k=1)[0]
+    assert hits[0][1]["news_article_id"] == 5
+
+
+def test_mmap_ivf_index_after_rebuild(store_paths):
+    """재구성한 IVF 인덱스도 memmap으로 로드 및 컴팩션"""
+    store = FaissSegmentStore(mmap=True, **store_paths)
+    vectors = _vectors(200, seed=1)
+    _append(store, range(1, 201), vectors)
+    store.compact()
+
+    def build_ivf(main_vectors, metric_type):
+        index = faiss.IndexIVFFlat(faiss.IndexFlatIP(DIM), DIM, 4, metric_type)
+        index.train(main_vectors)
+        index.add(main_vectors)
+        return index, {"index_type": "ivf_flat", "nlist": 4, "nprobe": 4}
+
+    store.rebuild_main_index(build_ivf)
+    assert store.is_ivf and store.get_stats()["mmap"] is True
+
+    reader = FaissSegmentStore(mmap=True, **store_paths)
+    reader.load()
+    assert reader.is_ivf and reader.get_stats()["mmap"] is True
+    assert reader.search(vectors[10:11], k=1)[0][0][1]["news_article_id"] == 11
+
+    _append(reader, [201], _vectors(1, seed=2))
+    assert reader.compact() == 1
+    assert reader.main_index.ntotal == 201
@@ -0,0 +1,116 @@
+"""
+Unit tests for list-page HTML extraction backends
+"""
+from pathlib import Path
+
+import pytest
+
+from backend.crawlers.hankyung_crawler import HankyungNewsCrawler
+from backend.crawlers.html_extract import (
+    HtmlField,
+    HtmlItemSpec,
+    LexborHTMLParser,
+    _extract_streaming,
+    extract_items,
+    parse_selector,
+    unescape_attribute,
+)
+from backend.crawlers.maeil_crawler import MaeilNewsCrawler
+from backend.crawlers.naver_crawler import NaverNewsCrawler
+
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "html"
+
+CRAWLER_FIXTURES = [
+    (NaverNewsCrawler, "naver_news_list.html", 20),
+    (HankyungNewsCrawler, "hankyung_stock.html", 25),
+    (MaeilNewsCrawler, "maeil_stock.html", 25),
+]
+
+LIST_SPEC = HtmlItemSpec(
+    item_selector=".news-list li",
+    fields={"title": HtmlField("h3"), "url": HtmlField("a", attr="href"), "summary": HtmlField("p")},
+)
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("crawler_cls, fixture, count", CRAWLER_FIXTURES)
+def test_streaming_extracts_every_item_from_fixture(crawler_cls, fixture, count):
+    """스트리밍 파서가 fixture의 모든 항목을 추출"""
+    items = extract_items(read_fixture(fixture), crawler_cls.NEWS_ITEM_SPEC, backend="streaming")
+
+    assert len(items) == count
+    assert all(item["title"] and item["url"] for item in items)
+
+
+@pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed")
+@pytest.mark.parametrize("crawler_cls, fixture, count", CRAWLER_FIXTURES)
+def test_backends_agree_on_fixture(crawler_cls, fixture, count):
+    """파서 백엔드 간 추출 결과가 일치"""
+    html = read_fixture(fixture)
+    spec = crawler_cls.NEWS_ITEM_SPEC
+
+    assert extract_items(html, spec, backend="streaming") == extract_items(html, spec, backend="selectolax")
+
+
+def test_naver_item_parses_into_article():
+    """네이버 목록 항목을 기사 데이터로 변환"""
+    crawler = NaverNewsCrawler()
+    fields = extract_items(read_fixture("naver_news_list.html"), crawler.NEWS_ITEM_SPEC, limit=1)[0]
+    news = crawler._parse_news_item(fields)
+
+    assert news.url.startswith("https://finance.naver.com/news/news_read.naver?")
+    assert "&section_id=101" in news.url  # html.unescape는 &sect → § 로 바꿈
+    assert news.source.startswith("네이버(") and news.source != "네이버(네이버)"
+    assert news.published_at.year == 2025
+    assert news.content.endswith(fields["wdate"])  # 요약 + 언론사 + 날짜 (기존 get_text와 동일)
+
+
+def test_limit_stops_parsing_early():
+    """limit에 도달하면 파싱을 조기 종료"""
+    html = read_fixture("hankyung_stock.html")
+
+    assert len(extract_items(html, HankyungNewsCrawler.NEWS_ITEM_SPEC, limit=3)) == 3
+
+
+def test_text_split_across_feed_chunks_is_joined():
+    """청크 경계에서 나뉜 텍스트를 이어 붙임"""
+    html = '<ul class="news-list"><li><h3>삼성전자 3분기 &amp; 실적</h3><a href="/1">link</a></li></ul>'
+
+    items = _extract_streaming(html, LIST_SPEC, None, chunk_size=7)
+
+    assert items == [{"title": "삼성전자 3분기 & 실적", "url": "/1", "summary": None}]
+
+
+def test_implicitly_closed_items_and_nested_matches():
+    """암묵적으로 닫히는 태그와 중첩 매칭 처리"""
+    html = (
+        '<ul class="news-list">'
+        '<li><h3>첫 기사</h3><p>요약 <b>강조</b> 끝<p>둘째 문단'
+        '<li><h3>둘째 기사</h3><ul><li>중첩 항목</li></ul>'
+        '</ul>'
+        '<h3>목록 밖</h3>'
+    )
+
+    assert extract_items(html, LIST_SPEC) == [
+        {"title": "첫 기사", "url": None, "summary": "요약강조끝"},
+        {"title": "둘째 기사", "url": None, "summary": None},
+    ]
+
+
+def test_unsupported_selector_is_rejected():
+    """지원하지 않는 선택자는 거부"""
+    with pytest.raises(ValueError):
+        parse_selector("ul > li")
+    with pytest.raises(ValueError):
+        extract_items("<p></p>", LIST_SPEC, backend="lxml")
+
+
+def test_unescape_attribute_follows_html5_rules():
+    """속성값 unescape는 HTML5 규칙을 따름"""
+    assert unescape_attribute("?a=1&section_id=2&amp;b=3") == "?a=1&section_id=2&b=3"
+    assert unescape_attribute("&copy &lt;&#38;&#x41;") == "© <&A"
+    assert unescape_attribute("&notit;&amp=1") == "&notit;&amp=1"
@@ -0,0 +1,109 @@
+"""
+Unit tests for crawler conditional HTTP cache and seen-URL store
+"""
+from datetime import datetime
+
+import httpx
+import pytest
+
+from backend.crawlers import base_crawler as base_crawler_module
+from backend.crawlers.base_crawler import BaseNewsCrawler, NewsArticleData
+from backend.crawlers.http_cache import SeenUrlStore, get_http_cache
+
+
+PAGE = "<html><body>뉴스 목록</body></html>"
+
+
+class MockCrawler(BaseNewsCrawler):
+    """ETag를 주고 If-None-Match가 맞으면 304로 응답하는 서버를 흉내내는 크롤러"""
+
+    def __init__(self):
+        super().__init__(source_name="테스트", rate_limit_seconds=0)
+        self.requests = []
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            def handler(request: httpx.Request) -> httpx.Response:
+                self.requests.append(request)
+                if request.headers.get("if-none-match") == '"v1"':
+                    return httpx.Response(304)
+                return httpx.Response(
+                    200, content=PAGE.encode("utf-8"),
+                    headers={"content-type": "text/html; charset=utf-8", "etag": '"v1"'},
+                )
+
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return self._client
+
+    async def fetch_news(self, limit: int = 10):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    get_http_cache().clear()
+    seen_urls = SeenUrlStore(path=str(tmp_path / "seen_urls.txt"))
+    monkeypatch.setattr(base_crawler_module, "get_seen_url_store", lambda: seen_urls)
+    yield seen_urls
+    get_http_cache().clear()
+
+
+@pytest.mark.asyncio
+async def test_conditional_request_reuses_cached_body_on_304():
+    """304 응답이면 캐시된 본문을 재사용"""
+    async with MockCrawler() as crawler:
+        assert await crawler.fetch_html("https://news.example/list") == PAGE
+        assert await crawler.fetch_html("https://news.example/list") == PAGE
+
+        assert "if-none-match" not in crawler.requests[0].headers
+        assert crawler.requests[1].headers["if-none-match"] == '"v1"'
+
+    # 통계는 같은 source_name의 새 인스턴스에서도 누적 조회
+    stats = MockCrawler().get_stats()
+    size = len(PAGE.encode("utf-8"))
+    assert stats == {
+        "requests": 2,
+        "not_modified": 1,
+        "bytes_downloaded": size,
+        "bytes_saved": size,
+        "fetches_avoided": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_seen_article_is_dropped(isolated_cache):
+    """저장 완료 기사 URL은 목록에서 제외"""
+    isolated_cache.add_many(["https://news.example/article/1#comments"])
+
+    async with MockCrawler() as crawler:
+        news_list = [
+            NewsArticleData(title=f"기사 {i}", content="", published_at=datetime.now(),
+                            source="test", url=f"https://news.example/article/{i}")
+            for i in (1, 2)
+        ]
+        assert [news.url for news in crawler.drop_seen(news_list)] == ["https://news.example/article/2"]
+        assert crawler.requests == []
+        assert crawler.get_stats()["fetches_avoided"] == 1
+
+
+def test_seen_urls_persist_and_sync_between_instances(tmp_path):
+    """seen URL은 재시작 후 유지되고 인스턴스 간 공유"""
+    path = str(tmp_path / "seen.txt")
+    writer = SeenUrlStore(path=path)
+    reader = SeenUrlStore(path=path)
+
+    assert writer.add_many(["https://a.example/1", "https://a.example/1", None]) == 1
+    assert "https://a.example/1" in reader  # 다른 인스턴스(프로세스)의 추가분 반영
+    assert "https://a.example/1" in SeenUrlStore(path=path)  # 재시작 후 유지
+
+
+def test_seen_urls_compaction_keeps_recent_half(tmp_path):
+    """seen URL이 최대 개수를 넘으면 최근 절반만 남기고 정리"""
+    path = str(tmp_path / "seen.txt")
+    store = SeenUrlStore(path=path, max_urls=4)
+    store.add_many([f"https://a.example/{i}" for i in range(5)])
+
+    assert len(store) == 2
+    assert "https://a.example/4" in store
+    assert "https://a.example/0" not in store
+    assert len(SeenUrlStore(path=path, max_urls=4)) == 2
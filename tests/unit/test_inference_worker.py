@@ -0,0 +1,122 @@
+"""
+Unit tests for EmbeddingInferenceWorker - request coalescing into batched forward passes
+"""
+import asyncio
+import threading
+
+import pytest
+
+from backend.llm.inference_worker import EmbeddingInferenceWorker
+
+
+class FakeEmbedder:
+    """embed_batch 호출을 기록하는 가짜 임베더"""
+
+    def __init__(self, fail_text=None):
+        self.calls = []
+        self.fail_text = fail_text
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_text in texts:
+            raise RuntimeError("forward failed")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    """동시 요청은 하나의 배치로 묶어 추론"""
+    embedder = FakeEmbedder()
+    worker = EmbeddingInferenceWorker(embedder, coalesce_ms=20, max_batch=64)
+
+    results = await asyncio.gather(
+        worker.embed(["a"]),
+        worker.embed(["bb", "ccc"]),
+        worker.embed(["a", "dddd"]),
+    )
+
+    assert results == [[[1.0]], [[2.0], [3.0]], [[1.0], [4.0]]]
+    # 동일 텍스트는 한 번만 추론
+    assert embedder.calls == [["a", "bb", "ccc", "dddd"]]
+    assert worker.get_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_splits_forward_passes():
+    """최대 배치 크기를 넘으면 forward pass를 나눔"""
+    embedder = FakeEmbedder()
+    worker = EmbeddingInferenceWorker(embedder, coalesce_ms=20, max_batch=2)
+
+    results = await worker.embed(["a", "bb", "ccc"])
+
+    assert results == [[1.0], [2.0], [3.0]]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_returns_none():
+    """배치 추론이 실패하면 각 요청에 None 반환"""
+    worker = EmbeddingInferenceWorker(FakeEmbedder(fail_text="bad"), coalesce_ms=1)
+
+    assert await worker.embed(["ok", "bad"]) == [None, None]
+    # 워커는 계속 동작
+    assert await worker.embed(["ok"]) == [[2.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_sync_from_other_thread_joins_loop_batches():
+    """다른 스레드의 embed_sync도 이벤트 루프 배치에 합류"""
+    embedder = FakeEmbedder()
+    worker = EmbeddingInferenceWorker(embedder, coalesce_ms=50)
+    worker.start()
+
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(sync=worker.embed_sync(["sync"])))
+    thread.start()
+    await asyncio.sleep(0.01)
+    async_result = await worker.embed(["async"])
+    await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+    assert result["sync"] == [[4.0]]
+    assert async_result == [[5.0]]
+    assert embedder.calls == [["sync", "async"]]
+
+
+def test_embed_sync_without_running_loop_calls_embedder_directly():
+    """실행 중인 루프가 없으면 embed_sync가 임베더를 직접 호출"""
+    embedder = FakeEmbedder()
+    worker = EmbeddingInferenceWorker(embedder)
+
+    assert worker.embed_sync(["abc"]) == [[3.0]]
+    assert embedder.calls == [["abc"]]
+
+
+def test_alternating_loops_keep_one_worker_per_loop():
+    """루프를 번갈아 호출해도 루프마다 워커 태스크가 하나씩만 남는지 확인"""
+    worker = EmbeddingInferenceWorker(FakeEmbedder(), coalesce_ms=1)
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        for _ in range(3):
+            for loop in loops:
+                assert loop.run_until_complete(worker.embed(["ab"])) == [[2.0]]
+
+        for loop in loops:
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            assert len(pending) == 1
+        assert worker.get_stats()["loops"] == 2
+    finally:
+        for loop in loops:
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+
+def test_closed_loops_are_released():
+    """asyncio.run으로 반복 호출해도 닫힌 루프의 워커 항목이 쌓이지 않는지 확인"""
+    worker = EmbeddingInferenceWorker(FakeEmbedder(), coalesce_ms=1)
+
+    for _ in range(3):
+        assert asyncio.run(worker.embed(["abc"])) == [[3.0]]
+
+    assert worker.get_stats()["loops"] == 1
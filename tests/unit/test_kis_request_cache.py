@@ -0,0 +1,141 @@
+"""
+Unit tests for KISClient request coalescing and short-TTL response cache
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from backend.crawlers import kis_client as kis_module
+from backend.crawlers.kis_client import KISClient, RateLimiter
+
+
+class FakeKIS:
+    """KIS 시세 API 흉내 (호출 수 기록, 응답 지연)"""
+
+    def __init__(self, delay=0.02, rt_cd="0"):
+        self.delay = delay
+        self.rt_cd = rt_cd
+        self.calls = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.headers["tr_id"], dict(request.url.params)))
+        await asyncio.sleep(self.delay)
+        code = request.url.params.get("FID_INPUT_ISCD")
+        return httpx.Response(200, json={
+            "rt_cd": self.rt_cd, "msg1": "정상처리", "output": {"stck_prpr": "70000", "code": code},
+        })
+
+
+@pytest.fixture(autouse=True)
+def trading_session(monkeypatch):
+    """장중으로 고정하고 RateLimiter 싱글톤을 테스트마다 새로 생성"""
+    monkeypatch.setattr(RateLimiter, "_instance", None)
+    monkeypatch.setattr(kis_module, "get_market_phase", lambda: "trading")
+    monkeypatch.setattr(kis_module, "is_market_open", lambda: True)
+
+
+async def _token():
+    return "test-token"
+
+
+def _client(fake, rate=1000):
+    RateLimiter(max_requests=rate, window_seconds=1.0, shared_path="")
+    client = KISClient()
+    client.token_manager.get_access_token = _token
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """동시에 들어온 같은 요청은 한 번만 호출"""
+    fake = FakeKIS()
+    client = _client(fake)
+
+    results = await asyncio.gather(*(client.get_current_price("005930") for _ in range(5)))
+
+    assert len(fake.calls) == 1
+    assert all(result["output"]["stck_prpr"] == "70000" for result in results)
+    stats = client.get_request_stats()
+    assert stats["coalesced"] == 4
+    assert stats["saved"] == 4
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_is_shared_by_current_price_variants():
+    """현재가 조회 변형들이 TTL 캐시를 공유"""
+    fake = FakeKIS(delay=0)
+    client = _client(fake)
+
+    first = await client.get_current_price("005930")
+    first["output"]["stck_prpr"] = "수정됨"  # 호출자가 결과를 바꿔도 캐시는 그대로
+    detailed = await client.get_current_price_detailed("005930")
+    await client.get_current_price("000660")
+
+    assert [call[1]["FID_INPUT_ISCD"] for call in fake.calls] == ["005930", "000660"]
+    assert detailed["output"]["stck_prpr"] == "70000"
+    assert client.get_request_stats()["by_tr_id"]["FHKST01010100"] == {
+        "requests": 3, "cache_hits": 1, "coalesced": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_uncached_tr_only_coalesces(monkeypatch):
+    """캐시는 TTL 후 만료되고 캐시 대상이 아닌 TR은 합치기만 함"""
+    fake = FakeKIS(delay=0)
+    client = _client(fake)
+    monkeypatch.setitem(KISClient.RESPONSE_CACHE_TTL, "FHKST01010100", {"trading": 0.05})
+
+    await client.get_current_price("005930")
+    await asyncio.sleep(0.06)
+    await client.get_current_price("005930")
+    # 투자자 동향은 캐시 대상이 아님
+    await client.get_investor_trading("005930")
+    await client.get_investor_trading("005930")
+
+    assert len(fake.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_waiters_and_are_not_cached():
+    """실패는 대기 중인 요청에 전달되고 캐시하지 않음"""
+    fake = FakeKIS(rt_cd="1")
+    client = _client(fake)
+    params = {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}
+
+    def call():
+        return client.request(
+            "GET", "/uapi/domestic-stock/v1/quotations/inquire-price", "FHKST01010100",
+            params=dict(params), max_retries=1,
+        )
+
+    results = await asyncio.gather(call(), call(), call(), return_exceptions=True)
+    assert all(isinstance(result, Exception) for result in results)
+    assert len(fake.calls) == 1
+
+    with pytest.raises(Exception):
+        await call()
+    assert len(fake.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_high_priority_does_not_wait_behind_queued_batch_call():
+    """high 요청은 대기 중인 low 요청에 합쳐지지 않음"""
+    fake = FakeKIS(delay=0)
+    client = _client(fake, rate=10)
+    finished = []
+
+    async def call(priority):
+        await client.get_orderbook("005930", priority=priority)
+        finished.append(priority)
+
+    await client.rate_limiter.acquire("low")  # 토큰 소진 → 다음 요청은 대기열로
+    low = asyncio.create_task(call("low"))
+    await asyncio.sleep(0)
+    high = asyncio.create_task(call("high"))
+    await asyncio.gather(low, high)
+
+    # high는 rate limit 대기 중인 low 요청에 합쳐지지 않고 먼저 토큰을 받음
+    assert finished[0] == "high"
+    assert len(fake.calls) == 2
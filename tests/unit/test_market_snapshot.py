@@ -0,0 +1,172 @@
+"""
+Unit tests for the combined KIS market snapshot job
+"""
+import threading
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.crawlers import kis_market_data_collector as collector_module
+from backend.crawlers.kis_market_data_collector import MarketSnapshotCollector
+
+
+class FakeSession:
+    """실행된 문장을 기록하는 세션 (SessionLocal 대체)"""
+
+    instances = []
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        FakeSession.instances.append(self)
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        table = stmt.table.name
+        if table == self.fail_on:
+            raise ValueError(f"{table} insert failed")
+        self.statements.append((table, sql, params))
+
+    def commit(self):
+        self.commits += 1
+        self.commit_thread = threading.get_ident()
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def rows(self, table):
+        return next(params for name, _, params in self.statements if name == table)
+
+
+class FakeKIS:
+    def __init__(self, flaky=(), missing_orderbook=()):
+        self.flaky = set(flaky)
+        self.missing_orderbook = set(missing_orderbook)
+        self.calls = []
+
+    async def get_current_price(self, stock_code, priority="normal"):
+        self.calls.append(("price", stock_code))
+        if stock_code in self.flaky:
+            self.flaky.discard(stock_code)
+            raise RuntimeError("일시 오류")
+        return {"output": {"stck_prpr": "70000", "prdy_ctrt": "1.5", "acml_vol": "1000", "per": "12.3"}}
+
+    async def get_orderbook(self, stock_code, priority="normal"):
+        self.calls.append(("orderbook", stock_code))
+        if stock_code in self.missing_orderbook:
+            return {"output1": {}}
+        return {"output1": {"askp1": "70100", "bidp1": "70000", "total_askp_rsqn": "500", "total_bidp_rsqn": "700"}}
+
+    async def get_sector_index(self, sector_code, priority="normal"):
+        self.calls.append(("sector", sector_code))
+        return {"output": {"bstp_nmix_prpr": "2600.5"}}
+
+
+@pytest.fixture
+def kis():
+    return FakeKIS()
+
+
+@pytest.fixture
+def fail_on():
+    """INSERT를 실패시킬 테이블 (테스트에서 parametrize로 지정)"""
+    return None
+
+
+@pytest.fixture
+def collector(monkeypatch, kis, fail_on):
+    """FakeKIS/FakeSession을 쓰는 스냅샷 수집기"""
+    monkeypatch.setattr(FakeSession, "instances", [])
+
+    async def get_client():
+        return kis
+
+    monkeypatch.setattr(collector_module, "get_kis_client", get_client)
+    monkeypatch.setattr(collector_module, "SessionLocal", lambda: FakeSession(fail_on=fail_on))
+    collector = MarketSnapshotCollector(max_concurrent=3, sector_codes=["0001", "1001"])
+    collector.executor.retry_base_seconds = 0.01
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_one_pass_writes_all_records_in_one_transaction(collector, kis):
+    """한 번의 순회 결과를 하나의 트랜잭션으로 저장"""
+    result = await collector.collect_all(stock_codes=["005930", "000660", "035420"])
+
+    assert len(FakeSession.instances) == 1
+    session = FakeSession.instances[0]
+    assert session.commits == 1
+    assert [table for table, _, _ in session.statements] == [
+        "stock_current_price", "stock_orderbook", "sector_index", "stock_market_snapshot",
+    ]
+    # 종목마다 현재가 + 호가 1회씩
+    assert sorted(call for call in kis.calls if call[0] != "sector") == sorted(
+        [(kind, code) for code in ("005930", "000660", "035420") for kind in ("price", "orderbook")]
+    )
+    assert result["collected"] == 3 and result["sectors"] == 2
+
+    # 같은 순회의 모든 행은 같은 스냅샷 시각
+    times = {row["datetime"] for table in ("stock_current_price", "stock_orderbook", "sector_index")
+             for row in session.rows(table)}
+    times |= {row["snapshot_at"] for row in session.rows("stock_market_snapshot")}
+    assert len(times) == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_upsert_combines_price_and_orderbook(collector):
+    """스냅샷 upsert에 현재가와 호가를 함께 기록"""
+    await collector.collect_all(stock_codes=["005930"])
+
+    session = FakeSession.instances[0]
+    _, sql, rows = next(entry for entry in session.statements if entry[0] == "stock_market_snapshot")
+    assert "ON CONFLICT (stock_code) DO UPDATE" in sql
+    assert "datetime" not in rows[0]
+    assert rows[0]["stck_prpr"] == 70000.0
+    assert rows[0]["per"] == 12.3
+    assert (rows[0]["askp1"], rows[0]["bidp1"], rows[0]["total_bidp_rsqn"]) == (70100.0, 70000.0, 700)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kis", [FakeKIS(flaky={"000660"}, missing_orderbook={"035420"})])
+async def test_failed_stock_is_retried_and_missing_orderbook_keeps_price(collector):
+    """실패 종목은 재시도하고 호가가 없는 종목도 현재가는 저장"""
+    result = await collector.collect_all(stock_codes=["005930", "000660", "035420"])
+
+    session = FakeSession.instances[0]
+    snapshots = {row["stock_code"]: row for row in session.rows("stock_market_snapshot")}
+    assert sorted(snapshots) == ["000660", "005930", "035420"]
+    assert sorted(row["stock_code"] for row in session.rows("stock_current_price")) == ["000660", "005930", "035420"]
+    assert sorted(row["stock_code"] for row in session.rows("stock_orderbook")) == ["000660", "005930"]
+    # 호가 요약 컬럼만 NULL
+    assert snapshots["035420"]["stck_prpr"] == 70000.0
+    assert all(snapshots["035420"][field] is None for field in MarketSnapshotCollector.ORDERBOOK_SUMMARY_FIELDS)
+    assert result["retried"] == 1
+    assert result["failed"] == 0
+    assert collector.last_sweep.skipped == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fail_on", ["stock_market_snapshot"])
+async def test_write_failure_rolls_back_whole_snapshot(collector):
+    """저장 실패 시 스냅샷 전체를 롤백"""
+    with pytest.raises(ValueError):
+        await collector.collect_all(stock_codes=["005930", "000660"])
+
+    session = FakeSession.instances[0]
+    assert session.commits == 0
+    assert session.rollbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_written_off_the_event_loop_thread(collector):
+    """스냅샷 DB 쓰기는 이벤트 루프 스레드가 아닌 작업 스레드에서 실행"""
+    await collector.collect_all(stock_codes=["005930"])
+
+    session = FakeSession.instances[0]
+    assert session.commits == 1
+    assert session.commit_thread != threading.get_ident()
@@ -0,0 +1,148 @@
+"""
+Unit tests for NewsSaver bulk insert path
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.crawlers import news_saver as news_saver_module
+from backend.crawlers.base_crawler import NewsArticleData
+from backend.crawlers.http_cache import SeenUrlStore
+from backend.crawlers.news_saver import NewsSaver
+from backend.utils.deduplicator import NewsDuplicator
+from backend.utils.stock_mapping import StockMapper
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """INSERT 문을 기록하고 RETURNING 결과를 흉내내는 세션"""
+
+    def __init__(self, existing_urls=(), failing_title=None):
+        self.existing_urls = set(existing_urls)
+        self.failing_title = failing_title
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.next_id = 100
+
+    def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        params = compiled.params
+        rows = [
+            (params[key], params[key.replace("title", "url")], params[key.replace("title", "created_at")])
+            for key in sorted(params)
+            if key.startswith("title_m")
+        ]
+        self.statements.append((sql, len(rows)))
+
+        if any(title == self.failing_title for title, _, _ in rows):
+            raise ValueError("value too long for type character varying(500)")
+
+        returned = []
+        for title, url, created_at in rows:
+            if url in self.existing_urls:
+                continue  # ON CONFLICT DO NOTHING
+            self.next_id += 1
+            returned.append((self.next_id, title, created_at))
+        return FakeResult(returned)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def isolated_dependencies(tmp_path, monkeypatch):
+    """종목 매핑/중복 검사/seen URL 싱글톤을 테스트 전용 인스턴스로 교체"""
+    mapping_file = tmp_path / "stock_codes.json"
+    mapping_file.write_text('{"삼성전자": "005930", "카카오": "035720"}', encoding="utf-8")
+    mapper = StockMapper(mapping_file=mapping_file, use_db=False)
+    monkeypatch.setattr(news_saver_module, "get_stock_mapper", lambda: mapper)
+    monkeypatch.setattr(news_saver_module, "get_embedding_deduplicator", lambda: None)
+    monkeypatch.setattr(news_saver_module, "get_deduplicator", NewsDuplicator)
+    seen_urls = SeenUrlStore(path="")
+    monkeypatch.setattr(news_saver_module, "get_seen_url_store", lambda: seen_urls)
+
+
+def _saver(db, recent_titles=()):
+    saver = NewsSaver(db, auto_predict=False)
+    saver.deduplicator.load_titles([(news_id, title, None) for news_id, title in recent_titles])
+    return saver
+
+
+def make_news(title, url=None):
+    return NewsArticleData(
+        title=title, content=f"{title} 본문", published_at=datetime(2025, 1, 2, 9, 0),
+        source="naver", url=url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_is_saved_with_one_multi_row_insert():
+    """배치를 다중 행 INSERT 한 번으로 저장"""
+    db = FakeSession()
+    saver = _saver(db)
+    news_list = [make_news(f"삼성전자 {topic}", url=f"https://n.example/{i}") for i, topic in enumerate(
+        ["반도체 투자 확대", "배당 정책 발표", "신규 공장 착공식 개최"]
+    )]
+
+    assert await saver.save_news_batch(news_list) == (3, 0)
+
+    assert len(db.statements) == 1
+    sql, n_rows = db.statements[0]
+    assert n_rows == 3
+    assert "ON CONFLICT DO NOTHING RETURNING" in sql
+    assert db.commits == 1
+
+    # 저장된 URL은 다음 크롤링에서 제외
+    assert "https://n.example/0" in saver.seen_urls
+
+
+@pytest.mark.asyncio
+async def test_batch_dedups_in_memory_against_recent_and_same_batch():
+    """최근 제목과 같은 배치 안의 중복을 메모리에서 제거"""
+    db = FakeSession(existing_urls={"https://n.example/dup-url"})
+    saver = _saver(db, recent_titles=[(1, "카카오, 인공지능 서비스 출시 일정 공개")])
+    news_list = [
+        make_news("[속보] 카카오, 인공지능 서비스 출시 일정 공개"),  # 최근 제목과 중복
+        make_news("삼성전자, 3분기 영업이익 10조원 돌파"),
+        make_news("[종합] 삼성전자, 3분기 영업이익 10조원 돌파"),  # 같은 배치 내 중복
+        make_news("현대차, 전기차 공장 가동 앞두고 생산 조정", url="https://n.example/dup-url"),  # URL 충돌
+    ]
+
+    assert await saver.save_news_batch(news_list) == (1, 3)
+    assert db.statements[0][1] == 2
+
+    # 저장된 제목은 즉시 중복 인덱스에 반영
+    assert saver.deduplicator.find_duplicate_in_index("삼성전자, 3분기 영업이익 10조원 돌파")[0]
+
+
+@pytest.mark.asyncio
+async def test_failing_row_is_isolated():
+    """실패한 행만 제외하고 나머지는 저장"""
+    db = FakeSession(failing_title="카카오뱅크, 대출 금리 인하")
+    saver = _saver(db)
+    news_list = [
+        make_news("삼성전자, 반도체 투자 확대", url="https://n.example/1"),
+        make_news("카카오뱅크, 대출 금리 인하", url="https://n.example/2"),
+        make_news("현대차, 전기차 공장 가동 앞두고 생산 조정", url="https://n.example/3"),
+    ]
+
+    assert await saver.save_news_batch(news_list) == (2, 1)
+    assert [n_rows for _, n_rows in db.statements] == [3, 1, 1, 1]
+    assert db.rollbacks == 2
+    # 실패한 뉴스만 기록 (다음 배치에서 초기화)
+    assert saver.failed_urls == ["https://n.example/2"]
+    assert await saver.save_news_batch([make_news("삼성전자, 배당 정책 발표")]) == (1, 0)
+    assert saver.failed_urls == []
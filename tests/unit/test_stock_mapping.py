@@ -0,0 +1,81 @@
+"""
+Unit tests for StockMapper Aho–Corasick company-name matching
+"""
+import json
+import os
+
+import pytest
+
+from backend.utils.aho_corasick import AhoCorasickMatcher
+from backend.utils.stock_mapping import StockMapper
+
+
+MAPPING = {
+    "삼성전자": "005930",
+    "삼성전자우": "005935",
+    "SK하이닉스": "000660",
+    "현대차": "005380",
+    "카카오": "035720",
+    "카카오뱅크": "323410",
+}
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    path = tmp_path / "stock_codes.json"
+    path.write_text(json.dumps(MAPPING, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def mapper(mapping_file):
+    return StockMapper(mapping_file=mapping_file, use_db=False)
+
+
+def test_automaton_reports_overlapping_matches():
+    """오토마톤이 겹치는 매칭을 모두 찾음"""
+    matcher = AhoCorasickMatcher(["he", "she", "his", "hers"])
+
+    assert sorted(matcher.iter_matches("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+    assert matcher.find_all("ushers") == [(1, "she")]
+
+
+def test_leftmost_longest_name_wins(mapper):
+    """가장 왼쪽에서 시작하는 가장 긴 회사명을 선택"""
+    assert mapper.find_stock_code_in_text("삼성전자우 배당 확대") == "005935"
+    assert mapper.find_stock_code_in_text("카카오뱅크 대출 증가") == "323410"
+
+
+def test_returns_first_occurring_company(mapper):
+    """기본은 처음 등장한 회사, rank=True면 가장 많이 언급된 회사의 종목 코드를 반환"""
+    text = "현대차가 상승한 가운데 SK하이닉스와 SK하이닉스 협력사도 올랐다"
+
+    assert mapper.find_stock_code_in_text(text) == "005380"
+    assert mapper.find_stock_code_in_text(text, rank=True) == "000660"
+    assert mapper.find_stock_code_in_text("관련 종목 없음") is None
+    assert mapper.find_stock_code_in_text("") is None
+
+
+def test_matches_include_position_and_count(mapper):
+    """매칭 결과에 위치와 등장 횟수 포함"""
+    matches = mapper.find_stock_codes_in_text("카카오 실적 발표, 삼성전자 반등, 카카오 신사업", rank=True)
+
+    assert [(m.stock_code, m.position, m.count) for m in matches] == [
+        ("035720", 0, 2),
+        ("005930", 11, 1),
+    ]
+
+
+def test_refresh_rebuilds_after_mapping_change(mapper, mapping_file):
+    """매핑이 바뀌면 refresh 후 오토마톤을 재구성"""
+    assert mapper.find_stock_code_in_text("NAVER 검색 점유율") is None
+    assert mapper.refresh_if_changed() is False
+
+    mapping_file.write_text(
+        json.dumps({**MAPPING, "NAVER": "035420"}, ensure_ascii=False), encoding="utf-8"
+    )
+    stat = os.stat(mapping_file)
+    os.utime(mapping_file, (stat.st_atime, stat.st_mtime + 10))
+
+    assert mapper.refresh_if_changed() is True
+    assert mapper.find_stock_code_in_text("NAVER 검색 점유율") == "035420"
@@ -0,0 +1,260 @@
+"""
+Unit tests for NewsVectorSearch batched search
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+import backend.llm.vector_search as vector_search_module
+from backend.crawlers import news_stock_matcher
+from backend.llm.vector_search import NewsVectorSearch, PriceChangeCache
+
+
+class FakeStore:
+    """쿼리 벡터의 첫 값으로 결과를 만들어 주는 FaissSegmentStore 대역"""
+
+    def __init__(self, ntotal=100):
+        self.ntotal = ntotal
+        self.calls = []
+
+    def load(self):
+        pass
+
+    def search(self, query_vectors, k, stock_code=None, published_after=None, published_before=None):
+        self.calls.append((stock_code, [float(vector[0]) for vector in query_vectors]))
+        return [
+            [
+                (0.99, {"news_article_id": int(vector[0]) * 10 + 1, "stock_code": stock_code, "published_at": 1}),
+                (0.8, {"news_article_id": int(vector[0]) * 10 + 2, "stock_code": stock_code, "published_at": 2}),
+                (0.4, {"news_article_id": int(vector[0]) * 10 + 3, "stock_code": stock_code, "published_at": 3}),
+            ][:k]
+            for vector in query_vectors
+        ]
+
+
+class FakeWorker:
+    """텍스트 "qN"을 [N, 0] 벡터로 임베딩 ("bad"는 실패)"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return [None if text == "bad" else [float(text[1:]), 0.0] for text in texts]
+
+
+def _vector_search(store, worker=None):
+    """싱글톤 초기화(모델/인덱스 로드) 없이 검색기 생성"""
+    vector_search = object.__new__(NewsVectorSearch)
+    vector_search.store = store
+    vector_search.inference_worker = worker or FakeWorker()
+    return vector_search
+
+
+@pytest.mark.asyncio
+async def test_batch_results_follow_input_order():
+    """쿼리별 결과가 입력 순서대로 반환되고 임계값 미만은 잘리는지 확인"""
+    worker = FakeWorker()
+    vector_search = _vector_search(FakeStore(), worker)
+
+    results = await vector_search.search_similar_news_batch(["q3", "q1", "q2"], similarity_threshold=0.5)
+
+    assert [[hit["news_id"] for hit in hits] for hits in results] == [[31, 32], [11, 12], [21, 22]]
+    assert results[0][0] == {"news_id": 31, "similarity": 0.99, "stock_code": None, "published_at": 1}
+    # 임베딩은 한 번에
+    assert worker.calls == [["q3", "q1", "q2"]]
+
+
+@pytest.mark.asyncio
+async def test_queries_are_grouped_by_stock_code():
+    """같은 종목 필터의 쿼리는 한 번의 FAISS 검색으로 묶이는지 확인"""
+    store = FakeStore()
+    vector_search = _vector_search(store)
+
+    results = await vector_search.search_similar_news_batch(
+        ["q1", "q2", "q3", "q4"],
+        stock_codes=["005930", None, "005930", ""],
+        top_k=1,
+    )
+
+    assert sorted(store.calls, key=lambda call: str(call[0])) == [("005930", [1.0, 3.0]), (None, [2.0, 4.0])]
+    assert [hits[0]["news_id"] for hits in results] == [11, 21, 31, 41]
+    assert results[0][0]["stock_code"] == "005930"
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_gets_empty_result():
+    """임베딩에 실패한 쿼리만 빈 결과가 되고 나머지는 검색되는지 확인"""
+    store = FakeStore()
+    vector_search = _vector_search(store)
+
+    results = await vector_search.search_similar_news_batch(["q1", "bad", "q2"], top_k=1)
+
+    assert results[1] == []
+    assert [hits[0]["news_id"] for hits in (results[0], results[2])] == [11, 21]
+    assert store.calls == [(None, [1.0, 2.0])]
+
+
+@pytest.mark.asyncio
+async def test_empty_inputs_and_empty_index():
+    """빈 입력, 빈 인덱스, 길이 불일치에서 검색 없이 빈 결과를 돌려주는지 확인"""
+    store = FakeStore(ntotal=0)
+    vector_search = _vector_search(store)
+
+    assert await vector_search.search_similar_news_batch([]) == []
+    assert await vector_search.search_similar_news_batch(["q1", "q2"]) == [[], []]
+    assert await _vector_search(FakeStore()).search_similar_news_batch(["q1"], stock_codes=["A", "B"]) == [[]]
+    assert store.calls == []
+
+
+@pytest.mark.asyncio
+async def test_single_search_uses_batch_path():
+    """search_similar_news가 배치 검색의 첫 결과를 그대로 반환하는지 확인"""
+    vector_search = _vector_search(FakeStore())
+
+    hits = await vector_search.search_similar_news("q5", stock_code="000660", top_k=2, similarity_threshold=0.5)
+
+    assert [hit["news_id"] for hit in hits] == [51, 52]
+
+
+@pytest.fixture
+def price_db(monkeypatch):
+    """뉴스 3건(1, 2, 3)과 매칭 2건(뉴스 1은 2건)이 있는 SQLite 세션, 실행된 SELECT 기록"""
+    monkeypatch.setattr(vector_search_module, "_price_change_cache", PriceChangeCache(max_size=100, ttl_seconds=60))
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        # JSONB 컬럼이 있는 모델 대신 조회에 쓰는 컬럼만 생성
+        conn.execute(text(
+            "CREATE TABLE news_articles (id INTEGER PRIMARY KEY, title TEXT, content TEXT, "
+            "stock_code TEXT, published_at DATETIME)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE news_stock_matches (id INTEGER PRIMARY KEY, news_id INTEGER, stock_code TEXT, "
+            "price_change_1d FLOAT, price_change_2d FLOAT, price_change_3d FLOAT, price_change_5d FLOAT, "
+            "price_change_10d FLOAT, price_change_20d FLOAT, calculated_at DATETIME)"
+        ))
+        for news_id in (1, 2, 3):
+            conn.execute(
+                text("INSERT INTO news_articles VALUES (:id, :title, 'content', '005930', :published_at)"),
+                {"id": news_id, "title": f"news {news_id}", "published_at": datetime(2024, 1, news_id)},
+            )
+        conn.execute(text(
+            "INSERT INTO news_stock_matches (id, news_id, stock_code, price_change_1d, price_change_5d) VALUES "
+            "(1, 1, '005930', 1.5, 3.0), (2, 1, '005930', 9.9, 9.9), (3, 2, '005930', -2.0, NULL)"
+        ))
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    session = Session(engine)
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def _hits(*news_ids):
+    return [{"news_id": news_id, "similarity": 1.0 - index / 10} for index, news_id in enumerate(news_ids)]
+
+
+def test_attach_price_changes_keeps_similarity_order(price_db):
+    """한 번의 조인 조회로 유사도 순서를 유지하고, 매칭 없는 뉴스도 빈 변동률로 포함하는지 확인"""
+    vector_search = _vector_search(FakeStore())
+
+    results = vector_search.attach_price_changes(_hits(3, 1, 99, 2), price_db)
+
+    assert [result["news_id"] for result in results] == [3, 1, 2]  # 없는 뉴스 99는 제외
+    assert [result["similarity"] for result in results] == [1.0, 0.9, 0.7]
+    assert results[0]["price_changes"] == {"1d": None, "2d": None, "3d": None, "5d": None, "10d": None, "20d": None}
+    # 매칭이 여러 건이면 첫 번째 매칭
+    assert results[1]["price_changes"]["1d"] == 1.5 and results[1]["price_changes"]["5d"] == 3.0
+    assert results[2]["news_title"] == "news 2" and results[2]["price_changes"]["1d"] == -2.0
+    assert len(price_db.statements) == 1 and "LEFT OUTER JOIN news_stock_matches" in price_db.statements[0]
+
+
+def test_attach_price_changes_skips_join_on_cache_hit(price_db):
+    """캐시된 뉴스만 조회하면 매칭 조인 없이 캐시 값을 쓰는지 확인"""
+    vector_search = _vector_search(FakeStore())
+    vector_search.attach_price_changes(_hits(1, 3), price_db)
+    price_db.statements.clear()
+
+    results = vector_search.attach_price_changes(_hits(3, 1), price_db)
+
+    assert [result["price_changes"]["1d"] for result in results] == [None, 1.5]
+    assert len(price_db.statements) == 1 and "news_stock_matches" not in price_db.statements[0]
+
+
+def test_attach_price_changes_returns_input_without_db():
+    """DB 세션이 없거나 결과가 비어 있으면 입력을 그대로 돌려주는지 확인"""
+    vector_search = _vector_search(FakeStore())
+
+    assert vector_search.attach_price_changes(_hits(1), None) == _hits(1)
+    assert vector_search.attach_price_changes([], object()) == []
+
+
+def test_price_change_cache_evicts_least_recently_used():
+    """최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거하는지 확인"""
+    cache = PriceChangeCache(max_size=2, ttl_seconds=60)
+    cache.put_many({1: {"1d": 1.0}, 2: {"1d": 2.0}})
+    cache.get_many([1])  # 1을 최근 사용으로
+
+    cache.put_many({3: {"1d": 3.0}})
+
+    assert cache.get_many([1, 2, 3]) == {1: {"1d": 1.0}, 3: {"1d": 3.0}}
+    assert len(cache) == 2
+
+
+def test_price_change_cache_expires_after_ttl(monkeypatch):
+    """TTL이 지난 항목은 miss로 처리하고 제거하는지 확인"""
+    now = [1000.0]
+    monkeypatch.setattr(vector_search_module.time, "monotonic", lambda: now[0])
+    cache = PriceChangeCache(max_size=10, ttl_seconds=60)
+    cache.put_many({1: {"1d": 1.0}})
+
+    now[0] += 60
+    assert cache.get_many([1]) == {1: {"1d": 1.0}}
+    now[0] += 1
+    assert cache.get_many([1]) == {}
+    assert len(cache) == 0
+
+
+def test_price_change_cache_disabled_with_zero_size():
+    """max_size가 0이면 아무것도 저장하지 않는지 확인"""
+    cache = PriceChangeCache(max_size=0, ttl_seconds=60)
+    cache.put_many({1: {"1d": 1.0}})
+
+    assert cache.get_many([1]) == {}
+
+
+class FakeNewsQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def order_by(self, *columns):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_daily_matching_invalidates_price_change_cache(monkeypatch, fails):
+    """일일 매칭이 끝나면 (중간에 실패해도) 주가 변동률 캐시를 비우는지 확인"""
+    cache = PriceChangeCache(max_size=10, ttl_seconds=60)
+    cache.put_many({1: {"1d": 0.0}})
+    monkeypatch.setattr(vector_search_module, "_price_change_cache", cache)
+
+    def match_news_with_stock(news_id, db):
+        if fails:
+            raise RuntimeError("price lookup failed")
+        return True
+
+    monkeypatch.setattr(news_stock_matcher, "match_news_with_stock", match_news_with_stock)
+    db = SimpleNamespace(query=lambda model: FakeNewsQuery([SimpleNamespace(id=1)]))
+
+    assert news_stock_matcher.run_daily_matching(db) == ((0, 0) if fails else (1, 0))
+    assert len(cache) == 0